@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark for HostFactory script commands.
+
+HostFactory invokes the plugin as a fresh process per script call, so this
+benchmark measures what it actually pays: wall time and peak RSS of
+``src/run.py`` for getAvailableTemplates, requestMachines, getRequestStatus
+and requestReturnMachines.
+
+For every storage backend and dataset size the harness:
+- Starts a local moto server and points boto3 at it (no real AWS calls)
+- Writes an isolated HF_PROVIDER_CONFDIR/WORKDIR with one RunInstances template
+- Seeds the configured storage with N machines and N/10 requests
+- Runs each command once cold (fresh work cache) and then --runs times warm
+- Records cold start, p50/p95 steady-state latency and peak RSS per command
+
+Results are written as JSON and can be compared against a saved baseline;
+the exit code is 1 when any metric regresses beyond --threshold.
+
+Example:
+    ./dev-tools/testing/benchmark_hf_commands.py --sizes 100 10000 --output bench.json
+    ./dev-tools/testing/benchmark_hf_commands.py --baseline bench.json --threshold 0.2
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+RUN_PY = PROJECT_ROOT / "src" / "run.py"
+
+TEMPLATE_ID = "bench-template"
+# One of the AMIs moto ships in its default image catalogue
+MOTO_AMI_ID = "ami-12c6146b"
+
+COMMANDS = (
+    "getAvailableTemplates",
+    "requestMachines",
+    "getRequestStatus",
+    "requestReturnMachines",
+)
+
+# Metrics compared against the baseline; lower is better for all of them
+COMPARED_METRICS = ("cold_ms", "p50_ms", "p95_ms", "peak_rss_mb")
+
+# Seeding runs inside the benchmark environment so it goes through the
+# configured storage strategy exactly like the CLI does.
+SEED_SCRIPT = r"""
+import asyncio, json, sys, uuid
+from datetime import datetime, timezone
+
+sys.path.insert(0, sys.argv[1])
+count = int(sys.argv[2])
+
+from bootstrap import Application
+from domain.base import UnitOfWorkFactory
+from infrastructure.di.container import get_container
+
+app = Application()
+if not asyncio.run(app.initialize()):
+    raise SystemExit("application failed to initialize")
+uow = get_container().get(UnitOfWorkFactory).create_unit_of_work()
+
+now = datetime.now(timezone.utc).isoformat()
+requests, machines = {}, {}
+request_count = max(1, count // 10)
+request_ids = ["req-" + str(uuid.uuid4()) for _ in range(request_count)]
+for request_id in request_ids:
+    requests[request_id] = {
+        "request_id": request_id, "template_id": "bench-template", "machine_count": 10,
+        "request_type": "acquire", "status": "complete", "status_message": None,
+        "provider_type": "aws", "provider_api": "RunInstances", "resource_ids": [],
+        "machine_ids": [], "successful_count": 10, "failed_count": 0, "metadata": {},
+        "error_details": {}, "provider_data": {}, "created_at": now, "started_at": now,
+        "completed_at": now, "version": 1, "timeout": None, "tags": {},
+        "schema_version": "2.0.0",
+    }
+for index in range(count):
+    instance_id = "i-%017x" % index
+    request_id = request_ids[index % request_count]
+    requests[request_id]["machine_ids"].append(instance_id)
+    machines[instance_id] = {
+        "instance_id": instance_id, "template_id": "bench-template",
+        "request_id": request_id, "provider_type": "aws", "instance_type": "t2.micro",
+        "image_id": "ami-12c6146b", "private_ip": "10.0.%d.%d" % (index // 250 % 250, index % 250),
+        "public_ip": None, "subnet_id": "subnet-12345678", "security_group_ids": [],
+        "status": "running", "status_reason": None, "launch_time": now,
+        "termination_time": None, "tags": {}, "metadata": {}, "provider_data": {},
+        "version": 1, "created_at": now, "updated_at": None, "schema_version": "2.0.0",
+    }
+
+uow.request_repository.storage_port.save_batch(requests)
+uow.machine_repository.storage_port.save_batch(machines)
+print(json.dumps({"requests": len(requests), "machines": len(machines)}))
+"""
+
+
+@dataclass
+class CommandResult:
+    """Measurements for one command against one storage/size combination."""
+
+    command: str
+    storage: str
+    entities: int
+    ok: bool
+    cold_ms: Optional[float] = None
+    p50_ms: Optional[float] = None
+    p95_ms: Optional[float] = None
+    peak_rss_mb: Optional[float] = None
+    samples_ms: List[float] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used to match results against a baseline."""
+        return f"{self.storage}/{self.entities}/{self.command}"
+
+
+@dataclass
+class RunMeasurement:
+    """Wall time, peak RSS and output of a single process run."""
+
+    returncode: int
+    wall_ms: float
+    peak_rss_mb: Optional[float]
+    stdout: str
+    stderr: str
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_moto_server() -> tuple[subprocess.Popen, str]:
+    """
+    Start a moto server in a separate process on a free local port.
+
+    Running moto out of process keeps this harness small: Linux carries the
+    parent's ru_maxrss into forked children, so a large harness would inflate
+    the peak RSS reported for every command.
+    """
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "moto.server", "-H", "127.0.0.1", "-p", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            logger.error("moto[server] is required: pip install 'moto[server]'")
+            sys.exit(2)
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return server, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    logger.error("moto server did not start on port %s", port)
+    sys.exit(2)
+
+
+def run_process(args: List[str], env: Dict[str, str], cwd: Path, timeout: int) -> RunMeasurement:
+    """Run a child process and capture wall time and its own peak RSS."""
+    with tempfile.TemporaryFile("w+") as out, tempfile.TemporaryFile("w+") as err:
+        start = time.perf_counter()
+        proc = subprocess.Popen(args, stdout=out, stderr=err, env=env, cwd=cwd, text=True)
+        deadline = start + timeout
+        peak_rss_mb = None
+        if hasattr(os, "wait4"):
+            # wait4 returns rusage for this child only, unlike RUSAGE_CHILDREN
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+            while pid == 0:
+                if time.perf_counter() >= deadline:
+                    proc.kill()
+                    os.wait4(proc.pid, 0)
+                    raise subprocess.TimeoutExpired(args, timeout)
+                time.sleep(0.01)
+                pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss is KiB on Linux and bytes on macOS
+            divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+            peak_rss_mb = round(usage.ru_maxrss / divisor, 1)
+        else:
+            try:
+                proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise
+        wall_ms = (time.perf_counter() - start) * 1000
+        out.seek(0)
+        err.seek(0)
+        return RunMeasurement(proc.returncode, round(wall_ms, 2), peak_rss_mb, out.read(), err.read())
+
+
+def prepare_environment(root: Path, storage: str, endpoint_url: str) -> Dict[str, str]:
+    """Write isolated HostFactory config/work dirs and return the child environment."""
+    conf_dir = root / "conf"
+    work_dir = root / "work"
+    for directory in (conf_dir, work_dir, root / "logs"):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    storage_config: Dict[str, Any] = {"strategy": storage}
+    if storage == "json":
+        storage_config["json_strategy"] = {"storage_type": "split_files"}
+    elif storage == "sql":
+        storage_config["sql_strategy"] = {"type": "sqlite", "name": str(work_dir / "bench.db")}
+
+    config = {
+        "provider": {
+            "providers": [
+                {
+                    "name": "aws-default",
+                    "type": "aws",
+                    "enabled": True,
+                    "config": {"region": "us-east-1", "profile": "default"},
+                }
+            ]
+        },
+        "storage": storage_config,
+    }
+    templates = {
+        "templates": [
+            {
+                "templateId": TEMPLATE_ID,
+                "providerApi": "RunInstances",
+                "maxNumber": 100,
+                "attributes": {
+                    "type": ["String", "X86_64"],
+                    "ncpus": ["Numeric", "1"],
+                    "nram": ["Numeric", "1024"],
+                },
+                "imageId": MOTO_AMI_ID,
+                "subnetId": "subnet-12345678",
+                "vmType": "t2.micro",
+                "securityGroupIds": ["sg-12345678"],
+            }
+        ]
+    }
+    (conf_dir / "config.json").write_text(json.dumps(config, indent=2))
+    (conf_dir / "awsprov_templates.json").write_text(json.dumps(templates, indent=2))
+    (root / "aws_credentials").write_text(
+        "[default]\naws_access_key_id = testing\naws_secret_access_key = testing\n"
+    )
+    (root / "aws_config").write_text("[default]\nregion = us-east-1\n")
+
+    env = dict(os.environ)
+    env.update(
+        {
+            "AWS_ENDPOINT_URL": endpoint_url,
+            "AWS_SHARED_CREDENTIALS_FILE": str(root / "aws_credentials"),
+            "AWS_CONFIG_FILE": str(root / "aws_config"),
+            "AWS_DEFAULT_REGION": "us-east-1",
+            "HF_PROVIDER_CONFDIR": str(conf_dir),
+            "HF_PROVIDER_WORKDIR": str(work_dir),
+            "HF_PROVIDER_LOGDIR": str(root / "logs"),
+            "HF_LOGGING_CONSOLE_ENABLED": "false",
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH", "")])
+            ),
+        }
+    )
+    return env
+
+
+def seed_storage(env: Dict[str, str], root: Path, count: int, timeout: int) -> None:
+    """Seed the configured storage with ``count`` machines and count/10 requests."""
+    measurement = run_process(
+        [sys.executable, "-c", SEED_SCRIPT, str(PROJECT_ROOT / "src"), str(count)],
+        env,
+        root,
+        timeout,
+    )
+    if measurement.returncode != 0:
+        raise RuntimeError(f"Seeding failed: {measurement.stderr.strip()[-500:]}")
+    logger.info("Seeded storage in %.0fms: %s", measurement.wall_ms, measurement.stdout.strip())
+
+
+def _command_args(command: str, state: Dict[str, Any]) -> List[str]:
+    """Build the run.py arguments HostFactory's script for ``command`` would use."""
+    if command == "getAvailableTemplates":
+        return ["templates", "list"]
+    if command == "requestMachines":
+        payload = {"template": {"templateId": TEMPLATE_ID, "machineCount": 1}}
+        return ["-d", json.dumps(payload), "machines", "request"]
+    if command == "getRequestStatus":
+        payload = {"requests": [{"requestId": state.get("request_id", "")}]}
+        return ["-d", json.dumps(payload), "requests", "status"]
+    if command == "requestReturnMachines":
+        return ["machines", "return", state.get("machine_id", "i-00000000000000000")]
+    raise ValueError(f"Unknown command: {command}")
+
+
+def _capture_state(command: str, stdout: str, state: Dict[str, Any]) -> None:
+    """Remember IDs from requestMachines output for the follow-up commands."""
+    if command != "requestMachines":
+        return
+    try:
+        state["request_id"] = json.loads(stdout).get("requestId", state.get("request_id"))
+    except (ValueError, AttributeError):
+        pass
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return round(ordered[index], 2)
+
+
+def benchmark_command(
+    command: str,
+    storage: str,
+    entities: int,
+    env: Dict[str, str],
+    root: Path,
+    state: Dict[str, Any],
+    runs: int,
+    timeout: int,
+) -> CommandResult:
+    """Measure one cold run followed by ``runs`` warm runs of a command."""
+    result = CommandResult(command=command, storage=storage, entities=entities, ok=True)
+    cache_dir = root / "work" / "cache"
+
+    for attempt in range(runs + 1):
+        if attempt == 0:
+            # Cold start: no template/handler discovery caches in the work dir
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        measurement = run_process(
+            [sys.executable, str(RUN_PY), *_command_args(command, state)], env, root, timeout
+        )
+        if measurement.returncode != 0:
+            result.ok = False
+            result.error = (measurement.stdout + measurement.stderr).strip()[-500:]
+        _capture_state(command, measurement.stdout, state)
+
+        if attempt == 0:
+            result.cold_ms = measurement.wall_ms
+        else:
+            result.samples_ms.append(measurement.wall_ms)
+        if measurement.peak_rss_mb is not None:
+            result.peak_rss_mb = max(result.peak_rss_mb or 0.0, measurement.peak_rss_mb)
+
+    if result.samples_ms:
+        result.p50_ms = round(statistics.median(result.samples_ms), 2)
+        result.p95_ms = _percentile(result.samples_ms, 95)
+    return result
+
+
+def run_benchmarks(args: argparse.Namespace) -> List[CommandResult]:
+    """Run every command for every storage backend and dataset size."""
+    server, endpoint_url = start_moto_server()
+    results: List[CommandResult] = []
+    try:
+        for storage in args.storage:
+            for size in args.sizes:
+                root = Path(tempfile.mkdtemp(prefix=f"ohfp-bench-{storage}-{size}-"))
+                logger.info("Benchmarking storage=%s entities=%s in %s", storage, size, root)
+                env = prepare_environment(root, storage, endpoint_url)
+                try:
+                    seed_storage(env, root, size, args.timeout)
+                except RuntimeError as e:
+                    logger.error("%s", e)
+                    results.extend(
+                        CommandResult(c, storage, size, ok=False, error=str(e)[-500:])
+                        for c in args.commands
+                    )
+                    continue
+
+                state: Dict[str, Any] = {"machine_id": "i-%017x" % 0}
+                for command in args.commands:
+                    result = benchmark_command(
+                        command, storage, size, env, root, state, args.runs, args.timeout
+                    )
+                    results.append(result)
+                    logger.info(
+                        "  %-22s ok=%s cold=%sms p50=%sms p95=%sms rss=%sMB",
+                        command,
+                        result.ok,
+                        result.cold_ms,
+                        result.p50_ms,
+                        result.p95_ms,
+                        result.peak_rss_mb,
+                    )
+                if not args.keep:
+                    shutil.rmtree(root, ignore_errors=True)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    return results
+
+
+def compare_with_baseline(
+    results: List[CommandResult], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Return human-readable regressions relative to a saved baseline."""
+    baseline_by_key = {
+        f"{entry['storage']}/{entry['entities']}/{entry['command']}": entry
+        for entry in baseline.get("results", [])
+    }
+    regressions = []
+    for result in results:
+        previous = baseline_by_key.get(result.key)
+        if not previous:
+            continue
+        if previous.get("ok") and not result.ok:
+            regressions.append(f"{result.key}: command now fails ({result.error})")
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = previous.get(metric), getattr(result, metric)
+            if old and new and new > old * (1 + threshold):
+                regressions.append(
+                    f"{result.key}: {metric} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def _metadata() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+        ).stdout.strip()
+    except OSError:
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "git_commit": commit or None,
+        "run_id": str(uuid.uuid4()),
+    }
+
+
+def main():
+    """Main benchmark function."""
+    parser = argparse.ArgumentParser(description="Benchmark HostFactory script commands")
+    parser.add_argument(
+        "--storage",
+        nargs="+",
+        choices=["json", "sql"],
+        default=["json", "sql"],
+        help="Storage strategies to benchmark (sql uses a local SQLite file)",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[100, 10000, 100000],
+        help="Number of seeded machines per run (requests are seeded at one per ten)",
+    )
+    parser.add_argument(
+        "--commands", nargs="+", choices=COMMANDS, default=list(COMMANDS), help="Commands to run"
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Warm runs per command")
+    parser.add_argument("--timeout", type=int, default=600, help="Per-process timeout in seconds")
+    parser.add_argument("--output", type=str, help="Write results JSON to this file")
+    parser.add_argument("--baseline", type=str, help="Compare against a saved results JSON")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Allowed regression ratio (0.2 = 20%%)"
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep temporary benchmark dirs")
+
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+    report = {"metadata": _metadata(), "results": [asdict(r) for r in results]}
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        logger.info("Results written to %s", args.output)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare_with_baseline(results, baseline, args.threshold)
+        if regressions:
+            logger.error("Regressions against %s:", args.baseline)
+            for regression in regressions:
+                logger.error("  %s", regression)
+            sys.exit(1)
+        logger.info("No regressions against %s (threshold %.0f%%)", args.baseline, args.threshold * 100)
+
+
+if __name__ == "__main__":
+    main()
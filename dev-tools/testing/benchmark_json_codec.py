@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark the pluggable JSON codec on a large machines storage file.
+
+Generates a machines file in the JSON storage strategy layout (id -> record,
+indented) of roughly --size-mb megabytes and, for every available codec,
+measures:
+- load: parse the file contents (JSONStorageStrategy._load_data)
+- dump: serialize the full mapping indented (JSONStorageStrategy._save_data)
+- http: render a machine listing through the API response class
+
+Each operation runs --runs times; the median and best times are reported.
+
+Example:
+    ./dev-tools/testing/benchmark_json_codec.py --size-mb 50 --output codec-bench.json
+"""
+import argparse
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from infrastructure.serialization.json_codec import (  # noqa: E402
+    ORJSON_AVAILABLE,
+    JSONCodec,
+    OrjsonCodec,
+    set_json_codec,
+)
+
+
+def machine_record(index: int) -> Dict[str, Any]:
+    """Build one stored machine record shaped like MachineSerializer.to_dict output."""
+    instance_id = f"i-{index:017x}"
+    return {
+        "instance_id": instance_id,
+        "template_id": "bench-template",
+        "request_id": f"req-{index // 10:08d}-0000-0000-0000-000000000000",
+        "provider_type": "aws",
+        "instance_type": "t3.micro",
+        "image_id": "ami-12c6146b",
+        "private_ip": f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}",
+        "public_ip": None,
+        "subnet_id": "subnet-0123456789abcdef0",
+        "security_group_ids": ["sg-0123456789abcdef0"],
+        "status": "running",
+        "status_reason": None,
+        "launch_time": "2025-01-01T10:00:00.123456+00:00",
+        "termination_time": None,
+        "tags": {"Name": f"bench-{index}", "Environment": "benchmark"},
+        "metadata": {"launched_by": "benchmark", "attempt": 1},
+        "provider_data": {"availability_zone": "us-east-1a", "spot": False},
+        "version": 1,
+        "created_at": "2025-01-01T09:59:58.000001+00:00",
+        "updated_at": "2025-01-01T10:01:00.654321+00:00",
+        "schema_version": "2.0.0",
+    }
+
+
+def build_machines_file(path: Path, size_mb: float) -> Dict[str, Dict[str, Any]]:
+    """Write a machines file of roughly size_mb megabytes and return its contents."""
+    sample = json.dumps({"i": machine_record(0)}, indent=2)
+    count = max(1, int(size_mb * 1024 * 1024 / len(sample)))
+    data = {record["instance_id"]: record for record in map(machine_record, range(count))}
+    path.write_text(JSONCodec().dumps(data, pretty=True), encoding="utf-8")
+    logger.info(
+        "Generated %s machines (%.1f MB) at %s", count, path.stat().st_size / 1e6, path
+    )
+    return data
+
+
+def time_operation(operation: Callable[[], Any], runs: int) -> Dict[str, float]:
+    """Time an operation and return median/best wall time in milliseconds."""
+    samples: List[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        operation()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": round(statistics.median(samples), 1), "best_ms": round(min(samples), 1)}
+
+
+def render_http_response(listing: Dict[str, Any]) -> bytes:
+    """Render a listing through the API response class (codec bytes without FastAPI)."""
+    try:
+        from api.json_response import CodecJSONResponse
+    except ImportError:
+        from infrastructure.serialization.json_codec import get_json_codec
+
+        return get_json_codec().dumps_bytes(listing)
+    return CodecJSONResponse(content=listing).body
+
+
+def benchmark_codec(codec: JSONCodec, path: Path, data: Dict[str, Any], runs: int) -> Dict:
+    """Benchmark load, dump and HTTP rendering for one codec."""
+    set_json_codec(codec)
+    content = path.read_text(encoding="utf-8")
+    listing = {"machines": list(data.values()), "count": len(data)}
+    try:
+        return {
+            "load": time_operation(lambda: codec.loads(content), runs),
+            "dump": time_operation(lambda: codec.dumps(data, pretty=True), runs),
+            "http": time_operation(lambda: render_http_response(listing), runs),
+        }
+    finally:
+        set_json_codec(None)
+
+
+def main() -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON codecs on a machines file")
+    parser.add_argument("--size-mb", type=float, default=50.0, help="Machines file size")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per operation")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    codecs = [JSONCodec()]
+    if ORJSON_AVAILABLE:
+        codecs.append(OrjsonCodec())
+    else:
+        logger.warning("orjson is not installed; benchmarking the stdlib codec only")
+
+    with tempfile.TemporaryDirectory(prefix="codec-bench-") as work_dir:
+        path = Path(work_dir) / "machines.json"
+        data = build_machines_file(path, args.size_mb)
+
+        results = {
+            "file_mb": round(path.stat().st_size / 1e6, 1),
+            "machines": len(data),
+            "codecs": {},
+        }
+        for codec in codecs:
+            logger.info("Benchmarking %s codec", codec.name)
+            results["codecs"][codec.name] = benchmark_codec(codec, path, data, args.runs)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
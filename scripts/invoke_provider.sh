@@ -50,7 +50,7 @@ if [ "$USE_LOCAL_DEV" = "true" ] || [ "$USE_LOCAL_DEV" = "1" ]; then
     while [ $i -lt ${#all_args[@]} ]; do
         arg="${all_args[$i]}"
         case "$arg" in
-            -f|--file|-d|--data|--config|--log-level|--format|--output|--scheduler)
+            -f|--file|-d|--data|--config|--log-level|--format|--output|--scheduler|--deadline)
                 # These flags need a value
                 global_args+=("$arg")
                 i=$((i + 1))
@@ -58,7 +58,7 @@ if [ "$USE_LOCAL_DEV" = "true" ] || [ "$USE_LOCAL_DEV" = "1" ]; then
                     global_args+=("${all_args[$i]}")
                 fi
                 ;;
-            --quiet|--verbose|--dry-run)
+            --quiet|--verbose|--dry-run|--profile-startup)
                 # These are boolean flags
                 global_args+=("$arg")
                 ;;
@@ -0,0 +1,73 @@
+"""JSON response classes rendering through the configured JSON codec."""
+
+from typing import Any, Iterable, Iterator
+
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from infrastructure.serialization.json_codec import get_json_codec
+
+# Lines are buffered into chunks of roughly this size before being sent
+NDJSON_CHUNK_BYTES = 64 * 1024
+
+
+class CodecJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with the process-wide JSON codec.
+
+    Uses orjson when installed and encodes datetimes, enums and UUIDs in
+    response content directly instead of failing on them.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Render response content to JSON bytes."""
+        return get_json_codec().dumps_bytes(content)
+
+
+def iter_ndjson_chunks(items: Iterable[Any]) -> Iterator[bytes]:
+    """
+    Encode items as newline-delimited JSON, yielding buffered chunks.
+
+    When ``items`` is a page with a ``next_cursor``, a final
+    ``{"next_cursor": ...}`` line is written after the items.
+
+    Args:
+        items: Items to encode (consumed lazily)
+
+    Yields:
+        NDJSON byte chunks of roughly NDJSON_CHUNK_BYTES
+    """
+    codec = get_json_codec()
+    buffer = bytearray()
+    for item in items:
+        buffer += codec.dumps_bytes(item)
+        buffer += b"\n"
+        if len(buffer) >= NDJSON_CHUNK_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    next_cursor = getattr(items, "next_cursor", None)
+    if next_cursor:
+        buffer += codec.dumps_bytes({"next_cursor": next_cursor})
+        buffer += b"\n"
+    if buffer:
+        yield bytes(buffer)
+
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    Streaming response writing one JSON document per line.
+
+    The items iterator is consumed in Starlette's thread pool, so
+    repository reads behind a lazy page do not block the event loop.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(self, items: Iterable[Any], **kwargs: Any) -> None:
+        """
+        Initialize the response.
+
+        Args:
+            items: Items to stream, typically an application PageStream
+            **kwargs: Passed to StreamingResponse
+        """
+        super().__init__(iter_ndjson_chunks(items), **kwargs)
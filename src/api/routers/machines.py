@@ -2,11 +2,15 @@
 
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from api.dependencies import get_request_machines_handler, get_return_machines_handler
+from api.json_response import CodecJSONResponse, NDJSONStreamingResponse
+from application.dto.queries import ListMachinesQuery
+from infrastructure.di.buses import QueryBus
+from infrastructure.di.container import get_container
 from infrastructure.error.decorators import handle_rest_exceptions
 
 router = APIRouter(prefix="/machines", tags=["Machines"])
@@ -17,6 +21,8 @@ RETURN_MACHINES_HANDLER = Depends(get_return_machines_handler)
 STATUS_QUERY = Query(None, description="Filter by machine status")
 REQUEST_ID_QUERY = Query(None, description="Filter by request ID")
 LIMIT_QUERY = Query(None, description="Limit number of results")
+CURSOR_QUERY = Query(None, description="Cursor returned by the previous page")
+STREAM_QUERY = Query(False, description="Stream results as NDJSON")
 
 
 class RequestMachinesRequest(BaseModel):
@@ -41,7 +47,7 @@ class ReturnMachinesRequest(BaseModel):
 @handle_rest_exceptions(endpoint="/api/v1/machines/request", method="POST")
 async def request_machines(
     request_data: RequestMachinesRequest, handler=REQUEST_MACHINES_HANDLER
-) -> JSONResponse:
+) -> CodecJSONResponse:
     """
     Request new machines from a template.
 
@@ -56,14 +62,14 @@ async def request_machines(
         context={"endpoint": "/machines/request", "method": "POST"},
     )
 
-    return JSONResponse(content=result)
+    return CodecJSONResponse(content=result)
 
 
 @router.post("/return", summary="Return Machines", description="Return machines to the provider")
 @handle_rest_exceptions(endpoint="/api/v1/machines/return", method="POST")
 async def return_machines(
     request_data: ReturnMachinesRequest, handler=RETURN_MACHINES_HANDLER
-) -> JSONResponse:
+) -> CodecJSONResponse:
     """
     Return machines to the provider.
 
@@ -74,7 +80,7 @@ async def return_machines(
         context={"endpoint": "/machines/return", "method": "POST"},
     )
 
-    return JSONResponse(content=result)
+    return CodecJSONResponse(content=result)
 
 
 @router.get("/", summary="List Machines", description="List machines with optional filtering")
@@ -83,23 +89,37 @@ async def list_machines(
     status: Optional[str] = STATUS_QUERY,
     request_id: Optional[str] = REQUEST_ID_QUERY,
     limit: Optional[int] = LIMIT_QUERY,
-) -> JSONResponse:
+    cursor: Optional[str] = CURSOR_QUERY,
+    stream: bool = STREAM_QUERY,
+) -> Response:
     """
     List machines with optional filtering.
 
     - **status**: Filter by machine status (pending, running, stopped, etc.)
     - **request_id**: Filter by request ID
     - **limit**: Limit number of results
+    - **cursor**: Continue after the page that returned this cursor
+    - **stream**: Stream machines as NDJSON, one per line, in ID order
     """
-    # This would need a dedicated handler for listing machines
-    # For now, return a placeholder response
-    return JSONResponse(
+    query_bus = get_container().get(QueryBus)
+    if not query_bus:
+        raise HTTPException(status_code=500, detail="QueryBus not available")
+
+    query = ListMachinesQuery(
+        status=status, request_id=request_id, limit=limit, cursor=cursor, stream=True
+    )
+    page = await query_bus.execute(query)
+    if stream:
+        return NDJSONStreamingResponse(page)
+
+    machines = await run_in_threadpool(list, page)
+    return CodecJSONResponse(
         content={
             "success": True,
-            "message": "Machine listing not yet implemented",
             "data": {
-                "machines": [],
-                "filters": {"status": status, "request_id": request_id, "limit": limit},
+                "machines": machines,
+                "count": len(machines),
+                "next_cursor": page.next_cursor,
             },
         }
     )
@@ -107,7 +127,7 @@ async def list_machines(
 
 @router.get("/{machine_id}", summary="Get Machine", description="Get specific machine details")
 @handle_rest_exceptions(endpoint="/api/v1/machines/{machine_id}", method="GET")
-async def get_machine(machine_id: str) -> JSONResponse:
+async def get_machine(machine_id: str) -> CodecJSONResponse:
     """
     Get specific machine details.
 
@@ -115,7 +135,7 @@ async def get_machine(machine_id: str) -> JSONResponse:
     """
     # This would need a dedicated handler for getting machine details
     # For now, return a placeholder response
-    return JSONResponse(
+    return CodecJSONResponse(
         content={
             "success": True,
             "message": "Machine details not yet implemented",
@@ -2,10 +2,14 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 
 from api.dependencies import get_request_status_handler, get_return_requests_handler
+from api.json_response import CodecJSONResponse, NDJSONStreamingResponse
+from application.dto.queries import ListReturnRequestsQuery
+from infrastructure.di.buses import QueryBus
+from infrastructure.di.container import get_container
 from infrastructure.error.decorators import handle_rest_exceptions
 
 router = APIRouter(prefix="/requests", tags=["Requests"])
@@ -15,6 +19,8 @@ REQUEST_STATUS_HANDLER = Depends(get_request_status_handler)
 RETURN_REQUESTS_HANDLER = Depends(get_return_requests_handler)
 STATUS_QUERY = Query(None, description="Filter by request status")
 LIMIT_QUERY = Query(None, description="Limit number of results")
+CURSOR_QUERY = Query(None, description="Cursor returned by the previous page")
+STREAM_QUERY = Query(False, description="Stream results as NDJSON")
 
 
 @router.get(
@@ -23,7 +29,7 @@ LIMIT_QUERY = Query(None, description="Limit number of results")
     description="Get status of a specific request",
 )
 @handle_rest_exceptions(endpoint="/api/v1/requests/{request_id}/status", method="GET")
-async def get_request_status(request_id: str, handler=REQUEST_STATUS_HANDLER) -> JSONResponse:
+async def get_request_status(request_id: str, handler=REQUEST_STATUS_HANDLER) -> CodecJSONResponse:
     """
     Get the status of a specific request.
 
@@ -34,7 +40,7 @@ async def get_request_status(request_id: str, handler=REQUEST_STATUS_HANDLER) ->
         context={"endpoint": f"/requests/{request_id}/status", "method": "GET"},
     )
 
-    return JSONResponse(content=result)
+    return CodecJSONResponse(content=result)
 
 
 @router.get("/", summary="List Requests", description="List requests with optional filtering")
@@ -42,19 +48,42 @@ async def get_request_status(request_id: str, handler=REQUEST_STATUS_HANDLER) ->
 async def list_requests(
     status: Optional[str] = STATUS_QUERY,
     limit: Optional[int] = LIMIT_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY,
+    stream: bool = STREAM_QUERY,
     handler=RETURN_REQUESTS_HANDLER,
-) -> JSONResponse:
+) -> Response:
     """
     List requests with optional filtering.
 
     - **status**: Filter by request status (pending, running, complete, failed)
     - **limit**: Limit number of results
+    - **cursor**: Continue after the page that returned this cursor
+    - **stream**: Stream return requests as NDJSON, one per line, in ID order
     """
+    if stream or cursor:
+        query_bus = get_container().get(QueryBus)
+        if not query_bus:
+            raise HTTPException(status_code=500, detail="QueryBus not available")
+
+        query = ListReturnRequestsQuery(status=status, limit=limit, cursor=cursor, stream=True)
+        page = await query_bus.execute(query)
+        if stream:
+            return NDJSONStreamingResponse(page)
+
+        requests = await run_in_threadpool(list, page)
+        return CodecJSONResponse(
+            content={
+                "requests": requests,
+                "count": len(requests),
+                "next_cursor": page.next_cursor,
+            }
+        )
+
     result = await handler.handle(
         status=status, limit=limit, context={"endpoint": "/requests", "method": "GET"}
     )
 
-    return JSONResponse(content=result)
+    return CodecJSONResponse(content=result)
 
 
 @router.get(
@@ -63,7 +92,7 @@ async def list_requests(
     description="Get detailed information about a request",
 )
 @handle_rest_exceptions(endpoint="/api/v1/requests/{request_id}", method="GET")
-async def get_request_details(request_id: str, handler=REQUEST_STATUS_HANDLER) -> JSONResponse:
+async def get_request_details(request_id: str, handler=REQUEST_STATUS_HANDLER) -> CodecJSONResponse:
     """
     Get detailed information about a specific request.
 
@@ -74,4 +103,4 @@ async def get_request_details(request_id: str, handler=REQUEST_STATUS_HANDLER) -
         context={"endpoint": f"/requests/{request_id}", "method": "GET"},
     )
 
-    return JSONResponse(content=result)
+    return CodecJSONResponse(content=result)
@@ -3,9 +3,9 @@
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Body, HTTPException, Query
-from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from api.json_response import CodecJSONResponse
 from application.dto.queries import (
     GetTemplateQuery,
     ListTemplatesQuery,
@@ -65,7 +65,7 @@ class TemplateUpdateRequest(BaseModel):
 async def list_templates(
     provider_api: Optional[str] = PROVIDER_API_QUERY,
     force_refresh: bool = FORCE_REFRESH_QUERY,
-) -> JSONResponse:
+) -> CodecJSONResponse:
     """
     List all available templates.
 
@@ -86,7 +86,7 @@ async def list_templates(
 
         templates = await query_bus.execute(query)
 
-        return JSONResponse(
+        return CodecJSONResponse(
             status_code=200,
             content={
                 "templates": [
@@ -109,7 +109,7 @@ async def list_templates(
 async def get_template(
     template_id: str,
     include_config: bool = INCLUDE_CONFIG_QUERY,
-) -> JSONResponse:
+) -> CodecJSONResponse:
     """
     Get a specific template by ID.
 
@@ -128,7 +128,7 @@ async def get_template(
         template = await query_bus.execute(query)
 
         if template:
-            return JSONResponse(
+            return CodecJSONResponse(
                 status_code=200,
                 content={
                     "template": (
@@ -148,7 +148,7 @@ async def get_template(
 
 @router.post("/", summary="Create Template", description="Create a new template")
 @handle_rest_exceptions(endpoint="/api/v1/templates", method="POST")
-async def create_template(template_data: TemplateCreateRequest) -> JSONResponse:
+async def create_template(template_data: TemplateCreateRequest) -> CodecJSONResponse:
     """
     Create a new template.
 
@@ -186,7 +186,7 @@ async def create_template(template_data: TemplateCreateRequest) -> JSONResponse:
                 detail=f"Template validation failed: {', '.join(response.validation_errors)}",
             )
 
-        return JSONResponse(
+        return CodecJSONResponse(
             status_code=201,
             content={
                 "message": f"Template {template_dict['template_id']} created successfully",
@@ -207,7 +207,9 @@ async def create_template(template_data: TemplateCreateRequest) -> JSONResponse:
     description="Update an existing template",
 )
 @handle_rest_exceptions(endpoint="/api/v1/templates/{template_id}", method="PUT")
-async def update_template(template_id: str, template_data: TemplateUpdateRequest) -> JSONResponse:
+async def update_template(
+    template_id: str, template_data: TemplateUpdateRequest
+) -> CodecJSONResponse:
     """
     Update an existing template.
 
@@ -240,7 +242,7 @@ async def update_template(template_id: str, template_data: TemplateUpdateRequest
                 detail=f"Template validation failed: {', '.join(response.validation_errors)}",
             )
 
-        return JSONResponse(
+        return CodecJSONResponse(
             status_code=200,
             content={
                 "message": f"Template {template_id} updated successfully",
@@ -257,7 +259,7 @@ async def update_template(template_id: str, template_data: TemplateUpdateRequest
 
 @router.delete("/{template_id}", summary="Delete Template", description="Delete a template")
 @handle_rest_exceptions(endpoint="/api/v1/templates/{template_id}", method="DELETE")
-async def delete_template(template_id: str) -> JSONResponse:
+async def delete_template(template_id: str) -> CodecJSONResponse:
     """
     Delete a template.
 
@@ -280,7 +282,7 @@ async def delete_template(template_id: str) -> JSONResponse:
                 detail=f"Template deletion failed: {', '.join(response.validation_errors)}",
             )
 
-        return JSONResponse(
+        return CodecJSONResponse(
             status_code=200,
             content={
                 "message": f"Template {template_id} deleted successfully",
@@ -301,7 +303,9 @@ async def delete_template(template_id: str) -> JSONResponse:
     description="Validate template configuration",
 )
 @handle_rest_exceptions(endpoint="/api/v1/templates/validate", method="POST")
-async def validate_template(template_data: Dict[str, Any] = TEMPLATE_DATA_BODY) -> JSONResponse:
+async def validate_template(
+    template_data: Dict[str, Any] = TEMPLATE_DATA_BODY,
+) -> CodecJSONResponse:
     """
     Validate template configuration.
 
@@ -321,7 +325,7 @@ async def validate_template(template_data: Dict[str, Any] = TEMPLATE_DATA_BODY)
         # Check if validation result has errors
         is_valid = not validation_result.errors if hasattr(validation_result, "errors") else True
 
-        return JSONResponse(
+        return CodecJSONResponse(
             status_code=200,
             content={
                 "valid": is_valid,
@@ -344,7 +348,7 @@ async def validate_template(template_data: Dict[str, Any] = TEMPLATE_DATA_BODY)
 
 @router.post("/refresh", summary="Refresh Templates", description="Refresh template cache")
 @handle_rest_exceptions(endpoint="/api/v1/templates/refresh", method="POST")
-async def refresh_templates() -> JSONResponse:
+async def refresh_templates() -> CodecJSONResponse:
     """
     Refresh template cache and reload from files.
     """
@@ -362,7 +366,7 @@ async def refresh_templates() -> JSONResponse:
         templates = await query_bus.execute(query)
         template_count = len(templates) if templates else 0
 
-        return JSONResponse(
+        return CodecJSONResponse(
             status_code=200,
             content={
                 "message": f"Templates refreshed successfully. Found {template_count} templates.",
@@ -1,18 +1,26 @@
 """FastAPI server factory and application setup."""
 
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse
 
 from _package import __version__
 from api.documentation import configure_openapi
+from api.json_response import CodecJSONResponse
 from api.middleware import AuthMiddleware, LoggingMiddleware
 from config.schemas.server_schema import ServerConfig
 from infrastructure.auth.registry import get_auth_registry
 from infrastructure.error.exception_handler import get_exception_handler
 from infrastructure.logging.logger import get_logger
 
+# Environment variable naming the configuration file of worker processes
+CONFIG_PATH_ENV = "CONFIG_PATH"
+
 
 def create_fastapi_app(server_config: ServerConfig) -> FastAPI:
     """
@@ -29,6 +37,7 @@ def create_fastapi_app(server_config: ServerConfig) -> FastAPI:
         title="Open Host Factory Plugin API",
         description="REST API for Open Host Factory Plugin - Dynamic cloud resource provisioning",
         version=__version__,
+        default_response_class=CodecJSONResponse,
         docs_url=server_config.docs_url if server_config.docs_enabled else None,
         redoc_url=server_config.redoc_url if server_config.docs_enabled else None,
         openapi_url=server_config.openapi_url if server_config.docs_enabled else None,
@@ -76,7 +85,7 @@ def create_fastapi_app(server_config: ServerConfig) -> FastAPI:
         try:
             # Use the existing exception handler infrastructure
             error_response = exception_handler.handle_error_for_http(exc)
-            return JSONResponse(
+            return CodecJSONResponse(
                 status_code=error_response.http_status or 500,
                 content={
                     "success": False,
@@ -96,7 +105,7 @@ def create_fastapi_app(server_config: ServerConfig) -> FastAPI:
         except Exception as handler_error:
             # Fallback error response
             logger.error("Exception handler failed: %s", handler_error)
-            return JSONResponse(
+            return CodecJSONResponse(
                 status_code=500,
                 content={
                     "success": False,
@@ -129,6 +138,16 @@ def create_fastapi_app(server_config: ServerConfig) -> FastAPI:
             "auth_strategy": (server_config.auth.strategy if server_config.auth.enabled else None),
         }
 
+    # Add Prometheus metrics endpoint
+    @app.get("/metrics", tags=["System"], response_class=PlainTextResponse)
+    async def metrics():
+        """Prometheus text exposition of the application metrics."""
+        collector = _get_metrics_collector()
+        return PlainTextResponse(
+            collector.export_prometheus() if collector else "",
+            media_type="text/plain; version=0.0.4",
+        )
+
     # Register API routers
     _register_routers(app)
 
@@ -139,6 +158,37 @@ def create_fastapi_app(server_config: ServerConfig) -> FastAPI:
     return app
 
 
+def create_app() -> FastAPI:
+    """
+    Create the application inside a uvicorn worker process.
+
+    Used as the import-string factory when serving with more than one worker.
+    Each worker bootstraps its own application from the configuration file
+    named by the CONFIG_PATH environment variable and finishes initializing it
+    in the lifespan startup.
+
+    Returns:
+        Configured FastAPI application
+    """
+    from bootstrap import Application
+
+    application = Application(os.environ.get(CONFIG_PATH_ENV) or None)
+    server_config = application.config_manager().get_typed(ServerConfig)
+    app = create_fastapi_app(server_config)
+
+    @asynccontextmanager
+    async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+        if not await application.initialize():
+            raise RuntimeError("Failed to initialize application in worker process")
+        try:
+            yield
+        finally:
+            application.shutdown()
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
 def _create_auth_strategy(auth_config):
     """
     Create authentication strategy based on configuration.
@@ -166,6 +216,7 @@ def _create_auth_strategy(auth_config):
                 algorithm=bearer_config.get("algorithm", "HS256"),
                 token_expiry=bearer_config.get("token_expiry", 3600),
                 enabled=True,
+                token_cache_size=bearer_config.get("token_cache_size", 1024),
             )
 
         elif strategy_name == "iam":
@@ -204,6 +255,8 @@ def _create_auth_strategy(auth_config):
                 client_id=cognito_config.get("client_id", ""),
                 region=cognito_config.get("region", "us-east-1"),
                 enabled=True,
+                jwks_cache_ttl=cognito_config.get("jwks_cache_ttl", 3600),
+                token_cache_size=cognito_config.get("token_cache_size", 1024),
             )
 
         else:
@@ -215,6 +268,23 @@ def _create_auth_strategy(auth_config):
         return None
 
 
+def _get_metrics_collector():
+    """
+    Get the application's metrics collector.
+
+    Returns:
+        MetricsCollector instance or None if metrics are not collected
+    """
+    try:
+        from infrastructure.di.container import get_container
+        from monitoring.metrics import MetricsCollector
+
+        return get_container().get_optional(MetricsCollector)
+    except Exception as e:
+        get_logger(__name__).debug("Metrics collector not available: %s", e)
+        return None
+
+
 def _register_routers(app: FastAPI) -> None:
     """
     Register API routers.
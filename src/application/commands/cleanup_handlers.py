@@ -8,12 +8,18 @@ from typing import Any, Dict
 from application.base.handlers import BaseCommandHandler
 from application.decorators import command_handler
 from application.dto.commands import (
+    ArchiveCompletedRequestsCommand,
     CleanupAllResourcesCommand,
     CleanupOldRequestsCommand,
 )
 from domain.base import UnitOfWorkFactory
 from domain.base.events.infrastructure_events import ResourcesCleanedEvent
-from domain.base.ports import ErrorHandlingPort, EventPublisherPort, LoggingPort
+from domain.base.ports import (
+    ConfigurationPort,
+    ErrorHandlingPort,
+    EventPublisherPort,
+    LoggingPort,
+)
 from domain.machine.repository import MachineRepository
 from domain.request.repository import RequestRepository
 
@@ -98,6 +104,92 @@ class CleanupOldRequestsHandler(BaseCommandHandler[CleanupOldRequestsCommand, Di
             raise
 
 
+# Used when the configuration has no storage.retention.archive_after_hours
+DEFAULT_ARCHIVE_AFTER_HOURS = 72
+
+
+@command_handler(ArchiveCompletedRequestsCommand)
+class ArchiveCompletedRequestsHandler(
+    BaseCommandHandler[ArchiveCompletedRequestsCommand, Dict[str, Any]]
+):
+    """Handler for moving terminal requests and their machines to the archive."""
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        config_port: ConfigurationPort,
+        logger: LoggingPort,
+        event_publisher: EventPublisherPort,
+        error_handler: ErrorHandlingPort,
+    ) -> None:
+        """Initialize the instance."""
+        super().__init__(logger, event_publisher, error_handler)
+        self._uow_factory = uow_factory
+        self._config_port = config_port
+
+    def _archive_after_hours(self, command: ArchiveCompletedRequestsCommand) -> int:
+        """Get the archive age from the command, falling back to the retention config."""
+        if command.older_than_hours is not None:
+            return command.older_than_hours
+        retention = self._config_port.get_storage_config().get("retention") or {}
+        return int(retention.get("archive_after_hours", DEFAULT_ARCHIVE_AFTER_HOURS))
+
+    async def validate_command(self, command: ArchiveCompletedRequestsCommand) -> None:
+        """Validate archive completed requests command."""
+        await super().validate_command(command)
+        if command.older_than_hours is not None and command.older_than_hours < 0:
+            raise ValueError("older_than_hours must not be negative")
+
+    async def execute_command(self, command: ArchiveCompletedRequestsCommand) -> Dict[str, Any]:
+        """Handle archive completed requests command."""
+        older_than_hours = self._archive_after_hours(command)
+        self.logger.info("Archiving requests completed over %s hours ago", older_than_hours)
+        cutoff_date = datetime.utcnow() - timedelta(hours=older_than_hours)
+
+        try:
+            with self._uow_factory.create_unit_of_work() as uow:
+                request_ids = uow.requests.find_archivable(cutoff_date)
+
+                if command.dry_run:
+                    self.logger.info("DRY RUN: Would archive %s requests", len(request_ids))
+                    return {
+                        "dry_run": True,
+                        "requests_found": len(request_ids),
+                        "request_ids": request_ids,
+                        "cutoff_date": cutoff_date.isoformat(),
+                    }
+
+                # Machines first, so an interrupted run never leaves live machines
+                # pointing at an archived request
+                machines_archived = uow.machines.archive_by_request_ids(request_ids)
+                requests_archived = uow.requests.archive(request_ids)
+
+                cleanup_event = ResourcesCleanedEvent(
+                    aggregate_id="archive-operation",
+                    aggregate_type="CleanupOperation",
+                    resource_type="Request",
+                    resource_id="multiple",
+                    provider="system",
+                    resource_count=requests_archived + machines_archived,
+                    cleanup_reason=f"Archive requests completed over {older_than_hours} hours ago",
+                )
+                self.event_publisher.publish(cleanup_event)
+
+                self.logger.info(
+                    "Archived %s requests and %s machines", requests_archived, machines_archived
+                )
+                return {
+                    "success": True,
+                    "requests_archived": requests_archived,
+                    "machines_archived": machines_archived,
+                    "cutoff_date": cutoff_date.isoformat(),
+                }
+
+        except Exception as e:
+            self.logger.error("Failed to archive completed requests: %s", e)
+            raise
+
+
 @command_handler(CleanupAllResourcesCommand)
 class CleanupAllResourcesHandler(BaseCommandHandler[CleanupAllResourcesCommand, Dict[str, Any]]):
     """Handler for cleaning up all resources (requests and machines)."""
@@ -1,6 +1,6 @@
 """Command handlers for request operations."""
 
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from application.base.handlers import BaseCommandHandler
 from application.decorators import command_handler
@@ -128,6 +128,7 @@ class CreateMachineRequestHandler(BaseCommandHandler[CreateRequestCommand, str])
                 provider_instance=selection_result.provider_instance,
                 metadata={
                     **command.metadata,
+                    **({"timeout": command.timeout} if command.timeout else {}),
                     "dry_run": getattr(command, "dry_run", False),
                     "provider_selection_reason": selection_result.selection_reason,
                     "provider_confidence": selection_result.confidence,
@@ -489,7 +490,7 @@ class CreateReturnRequestHandler(BaseCommandHandler[CreateReturnRequestCommand,
                 template_id=template_id,
                 machine_count=len(command.machine_ids),
                 provider_type=provider_type,
-                metadata=command.metadata or {},
+                metadata={**(command.metadata or {}), "timeout": command.timeout},
             )
 
             # Save request and get extracted events
@@ -499,12 +500,51 @@ class CreateReturnRequestHandler(BaseCommandHandler[CreateReturnRequestCommand,
                 self.event_publisher.publish(event)
 
             self.logger.info("Return request created: %s", request.request_id)
+
+            request = await self._release_machines(request, command.machine_ids)
+            for event in self._request_repository.save(request):
+                self.event_publisher.publish(event)
+
             return str(request.request_id)
 
         except Exception as e:
             self.logger.error("Failed to create return request: %s", e)
             raise
 
+    async def _release_machines(self, request, machine_ids: List[str]):
+        """
+        Terminate the returned machines.
+
+        Resources the machines leave behind are still attached while they shut
+        down; their cleanup plan is kept in the request metadata and carried
+        out by later status polls of the return request.
+        """
+        from domain.request.value_objects import RequestStatus
+        from providers.base.strategy import ProviderOperation, ProviderOperationType
+        from providers.base.strategy.provider_context import ProviderContext
+
+        operation = ProviderOperation(
+            operation_type=ProviderOperationType.TERMINATE_INSTANCES,
+            parameters={"instance_ids": list(machine_ids), "cleanup_resources": True},
+            context={
+                "correlation_id": str(request.request_id),
+                "dry_run": request.metadata.get("dry_run", False),
+            },
+        )
+        provider_context = self._container.get(ProviderContext)
+        result = await provider_context.execute_operation(operation)
+
+        if result.success and result.data.get("success", True):
+            self.logger.info("Released %s machines", len(machine_ids))
+            request = request.update_status(RequestStatus.COMPLETED, "Machines terminated")
+            if result.data.get("cleanup_plan"):
+                request.metadata["pending_cleanup"] = result.data["cleanup_plan"]
+            return request
+
+        error_message = result.error_message or "Not all machines could be terminated"
+        self.logger.error("Failed to release machines: %s", error_message)
+        return request.fail(error_message, result.data)
+
 
 @command_handler(UpdateRequestStatusCommand)
 class UpdateRequestStatusHandler(BaseCommandHandler[UpdateRequestStatusCommand, None]):
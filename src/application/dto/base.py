@@ -1,5 +1,6 @@
 """Base DTO class with stable API and clean snake_case format."""
 
+from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional, Union
 
@@ -71,6 +72,23 @@ class BaseDTO(BaseModel):
             return value.value
         return str(value)
 
+    @staticmethod
+    def parse_datetime(value: Union[datetime, str, None]) -> Optional[datetime]:
+        """
+        Parse a stored timestamp.
+
+        Args:
+            value: ISO string (JSON, DynamoDB), datetime (SQL drivers), or None
+
+        Returns:
+            Datetime or None
+        """
+        if not value:
+            return None
+        if isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(value)
+
 
 # CQRS Base Classes
 
@@ -16,7 +16,8 @@ class CreateRequestCommand(BaseCommand):
 
     template_id: str
     requested_count: int
-    timeout: Optional[int] = 3600
+    # Seconds after which an unfulfilled request times out (no deadline when None)
+    timeout: Optional[int] = None
     tags: Optional[Dict[str, Any]] = None
 
 
@@ -55,6 +56,16 @@ class CleanupOldRequestsCommand(Command, BaseModel):
     age_hours: int = 24
 
 
+class ArchiveCompletedRequestsCommand(Command, BaseModel):
+    """Command to move terminal requests and their machines to the archive."""
+
+    model_config = ConfigDict(frozen=True)
+
+    # Defaults to storage.retention.archive_after_hours
+    older_than_hours: Optional[int] = None
+    dry_run: bool = False
+
+
 class CleanupTerminatedMachinesCommand(Command, BaseModel):
     """Command to clean up terminated machines."""
 
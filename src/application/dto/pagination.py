@@ -0,0 +1,110 @@
+"""Cursor pagination for list queries.
+
+List handlers iterate repository read models in key order. A page is a lazy
+iterator over at most ``limit`` results; once it has been consumed it knows
+whether more results follow and exposes the opaque cursor for the next page.
+"""
+
+import base64
+import binascii
+from typing import Callable, Generic, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def encode_cursor(last_key: str) -> str:
+    """
+    Encode the key of the last returned item as an opaque cursor.
+
+    Args:
+        last_key: Sort key (record ID) of the last item on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(last_key.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string, or None for the first page
+
+    Returns:
+        Key after which the next page starts, or None
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return base64.b64decode(padded.encode("ascii"), altchars=b"-_", validate=True).decode(
+            "utf-8"
+        )
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
+
+class PageStream(Generic[T]):
+    """
+    Lazy iterator over one page of list results.
+
+    The source iterator is closed as soon as the page is complete, so a
+    generator holding a unit of work open releases it without being fully
+    consumed. ``next_cursor`` is only meaningful once iteration has finished.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        key: Callable[[T], str],
+        limit: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the page.
+
+        Args:
+            items: Results in ascending key order
+            key: Function returning an item's sort key
+            limit: Maximum number of items on the page (None for all)
+        """
+        self._items = iter(items)
+        self._key = key
+        self._limit = limit
+        self._last: Optional[T] = None
+        self._done = False
+        self.count = 0
+        self.next_cursor: Optional[str] = None
+
+    def __iter__(self) -> Iterator[T]:
+        return self
+
+    def __next__(self) -> T:
+        if self._done:
+            raise StopIteration
+        if self._limit is not None and self.count >= self._limit:
+            # Peek one item ahead to decide whether another page exists
+            has_more = next(self._items, None) is not None
+            if has_more and self._last is not None:
+                self.next_cursor = encode_cursor(self._key(self._last))
+            self.close()
+            raise StopIteration
+        try:
+            item = next(self._items)
+        except StopIteration:
+            self.close()
+            raise
+        self._last = item
+        self.count += 1
+        return item
+
+    def close(self) -> None:
+        """Stop iterating and close the source iterator."""
+        self._done = True
+        close = getattr(self._items, "close", None)
+        if close is not None:
+            close()
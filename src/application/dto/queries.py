@@ -16,6 +16,8 @@ class GetRequestQuery(Query, BaseModel):
 
     request_id: str
     long: bool = False
+    # Instance health costs extra DescribeInstanceStatus calls, so it is opt-in
+    include_health: bool = False
 
 
 class GetRequestStatusQuery(Query, BaseModel):
@@ -31,6 +33,11 @@ class ListActiveRequestsQuery(Query, BaseModel):
 
     model_config = ConfigDict(frozen=True)
 
+    # Pagination: results are ordered by ID; stream returns a lazy PageStream
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    stream: bool = False
+
 
 class ListReturnRequestsQuery(Query, BaseModel):
     """Query to list return requests."""
@@ -40,6 +47,22 @@ class ListReturnRequestsQuery(Query, BaseModel):
     status: Optional[str] = None
     requester_id: Optional[str] = None
 
+    # Pagination: results are ordered by ID; stream returns a lazy PageStream
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    stream: bool = False
+
+
+class ListRequestHistoryQuery(Query, BaseModel):
+    """Query to list archived requests."""
+
+    model_config = ConfigDict(frozen=True)
+
+    request_id: Optional[str] = None
+    status: Optional[str] = None
+    # Newest first, at most limit requests
+    limit: Optional[int] = None
+
 
 class GetTemplateQuery(Query, BaseModel):
     """Query to get template details."""
@@ -81,9 +104,15 @@ class ListMachinesQuery(Query, BaseModel):
     model_config = ConfigDict(frozen=True)
 
     request_id: Optional[str] = None
+    template_id: Optional[str] = None
     status: Optional[str] = None
     active_only: bool = False
 
+    # Pagination: results are ordered by ID; stream returns a lazy PageStream
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    stream: bool = False
+
 
 class GetActiveMachineCountQuery(Query, BaseModel):
     """Query to get count of active machines."""
@@ -5,12 +5,15 @@ These handlers follow the same architectural patterns as BaseCommandHandler and
 BaseQueryHandler, ensuring consistency across all handler types in the CQRS system.
 """
 
-from typing import Optional
+from typing import List, Optional
 
+from application.base.commands import CommandBus
 from application.base.event_handlers import BaseLoggingEventHandler
 from application.events.decorators import event_handler
+from domain.base import UnitOfWorkFactory
 from domain.base.events import DomainEvent
 from domain.base.ports import ErrorHandlingPort, EventPublisherPort, LoggingPort
+from domain.request.value_objects import RequestType
 
 
 @event_handler("RequestCreatedEvent")
@@ -143,16 +146,63 @@ class RequestCancelledHandler(BaseLoggingEventHandler[DomainEvent]):
 
 @event_handler("RequestTimeoutEvent")
 class RequestTimeoutHandler(BaseLoggingEventHandler[DomainEvent]):
-    """Handle request timeout events using BaseEventHandler pattern."""
+    """
+    Handle request timeout events using BaseEventHandler pattern.
+
+    With a command bus and unit of work factory, the machines a timed out
+    acquire request still holds are returned, so they are terminated and
+    their leftover resources cleaned up instead of running unaccounted for.
+    """
 
     def __init__(
         self,
         logger: Optional[LoggingPort] = None,
         error_handler: Optional[ErrorHandlingPort] = None,
         event_publisher: Optional[EventPublisherPort] = None,
+        command_bus: Optional[CommandBus] = None,
+        uow_factory: Optional[UnitOfWorkFactory] = None,
     ) -> None:
         """Initialize request timeout handler."""
         super().__init__(logger, error_handler, event_publisher)
+        self._command_bus = command_bus
+        self._uow_factory = uow_factory
+
+    async def execute_event(self, event: DomainEvent) -> None:
+        """Log the timeout and return the machines of a timed out acquire request."""
+        await super().execute_event(event)
+        if self._command_bus is None or self._uow_factory is None:
+            return
+        if getattr(event, "request_type", None) != RequestType.ACQUIRE.value:
+            return
+
+        request_id = event.request_id
+        machine_ids = self._unreleased_machine_ids(request_id)
+        if not machine_ids:
+            return
+
+        from application.dto.commands import CreateReturnRequestCommand
+
+        if self.logger:
+            self.logger.warning(
+                "Returning %s machines of timed out request %s", len(machine_ids), request_id
+            )
+        await self._command_bus.execute(
+            CreateReturnRequestCommand(
+                machine_ids=machine_ids, metadata={"timed_out_request_id": request_id}
+            )
+        )
+
+    def _unreleased_machine_ids(self, request_id: str) -> List[str]:
+        """Get the instance IDs of the request's machines that are not terminated yet."""
+        with self._uow_factory.create_unit_of_work() as uow:
+            request = uow.requests.find_by_request_id(request_id)
+            machines = uow.machines.find_by_request_id(request_id)
+
+        released = {str(m.instance_id.value) for m in machines if m.status.is_terminal}
+        instance_ids = [str(m.instance_id.value) for m in machines]
+        if request is not None:
+            instance_ids.extend(str(instance_id.value) for instance_id in request.instance_ids)
+        return [i for i in dict.fromkeys(instance_ids) if i not in released]
 
     async def format_log_message(self, event: DomainEvent) -> str:
         """Format request timeout log message."""
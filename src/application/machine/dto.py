@@ -7,6 +7,7 @@ from pydantic import Field
 
 from application.dto.base import BaseDTO
 from domain.machine.aggregate import Machine
+from domain.machine.read_models import MachineSummary
 from domain.machine.value_objects import MachineStatus
 
 
@@ -84,6 +85,37 @@ class MachineDTO(BaseDTO):
 
         return cls(**common_fields)
 
+    @classmethod
+    def from_summary(cls, summary: MachineSummary, long: bool = False) -> "MachineDTO":
+        """
+        Create DTO from a machine read model.
+
+        Args:
+            summary: Machine summary projected from storage
+            long: Whether to include detailed information
+
+        Returns:
+            MachineDTO instance
+        """
+        launch_time = cls.parse_datetime(summary.launch_time)
+
+        common_fields = {
+            "machine_id": summary.instance_id,
+            "name": summary.private_ip or summary.instance_id,
+            "status": summary.status,
+            "instance_type": summary.instance_type or "",
+            "private_ip": summary.private_ip or "",
+            "public_ip": summary.public_ip,
+            "result": cls._get_result_status(summary.status),
+            "launch_time": int(launch_time.timestamp()) if launch_time else 0,
+            "message": summary.status_reason or "",
+        }
+
+        if long:
+            common_fields["metadata"] = summary.metadata
+
+        return cls(**common_fields)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary format - returns snake_case for internal use.
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, TypeVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
 
 from application.base.handlers import BaseQueryHandler
 from application.decorators import query_handler
+from application.dto.pagination import PageStream, decode_cursor
 from application.dto.queries import (
     GetMachineQuery,
     GetRequestQuery,
@@ -13,6 +14,7 @@ from application.dto.queries import (
     GetTemplateQuery,
     ListActiveRequestsQuery,
     ListMachinesQuery,
+    ListRequestHistoryQuery,
     ListReturnRequestsQuery,
     ListTemplatesQuery,
     ValidateTemplateQuery,
@@ -22,13 +24,55 @@ from application.dto.system import ValidationDTO
 from domain.base import UnitOfWorkFactory
 
 # Exception handling through BaseQueryHandler (Clean Architecture compliant)
-from domain.base.exceptions import EntityNotFoundError
+from domain.base.exceptions import EntityNotFoundError, ValidationError
 from domain.base.ports import ContainerPort, ErrorHandlingPort, LoggingPort
 from domain.template.aggregate import Template
 
 T = TypeVar("T")
 
 
+def _summary_page(
+    uow_factory: UnitOfWorkFactory,
+    repository: Callable[[Any], Any],
+    criteria: Optional[Dict[str, Any]],
+    to_dto: Callable[[Any], T],
+    key: Callable[[T], str],
+    limit: Optional[int],
+    cursor: Optional[str],
+) -> PageStream[T]:
+    """
+    Build a lazy page of DTOs projected from repository summaries.
+
+    The unit of work stays open only while the page is being iterated and is
+    released as soon as the page completes.
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        after_id = decode_cursor(cursor)
+    except ValueError as e:
+        raise ValidationError(str(e), details={"cursor": cursor}) from e
+
+    def _dtos() -> Iterator[T]:
+        with uow_factory.create_unit_of_work() as uow:
+            for summary in repository(uow).iter_summaries(criteria, after_id=after_id):
+                yield to_dto(summary)
+
+    return PageStream(_dtos(), key=key, limit=limit)
+
+
+def _health_changed(
+    previous: Optional[Dict[str, Any]], current: Optional[Dict[str, Any]]
+) -> bool:
+    """Check whether a machine's status checks changed, ignoring when they ran."""
+    if current is None:
+        return False
+    if previous is None:
+        return True
+    return any(previous.get(check) != current.get(check) for check in ("system", "instance"))
+
+
 # Query handlers
 @query_handler(GetRequestQuery)
 class GetRequestHandler(BaseQueryHandler[GetRequestQuery, RequestDTO]):
@@ -69,31 +113,36 @@ class GetRequestHandler(BaseQueryHandler[GetRequestQuery, RequestDTO]):
                 if not request:
                     raise EntityNotFoundError("Request", query.request_id)
 
+            if request.metadata.get("pending_cleanup"):
+                await self._run_pending_cleanup(request)
+
             # Get machines from storage
             machines = await self._get_machines_from_storage(query.request_id)
-            self.logger.info(
-                "DEBUG: Found %s machines in storage for request %s",
+            self.logger.debug(
+                "Found %s machines in storage for request %s",
                 len(machines),
                 query.request_id,
             )
 
             # Update machine status if needed
             if not machines and request.resource_ids:
-                self.logger.info(
-                    "DEBUG: No machines in storage but have resource IDs %s, checking provider",
+                self.logger.debug(
+                    "No machines in storage but have resource IDs %s, checking provider",
                     request.resource_ids,
                 )
                 # No machines in storage but we have resource IDs - check provider and
                 # create machines
                 machines = await self._check_provider_and_create_machines(request)
-                self.logger.info("DEBUG: Provider check returned %s machines", len(machines))
+                self.logger.debug("Provider check returned %s machines", len(machines))
             elif machines:
-                self.logger.info("DEBUG: Have %s machines, updating status from AWS", len(machines))
+                self.logger.debug("Have %s machines, updating status from AWS", len(machines))
                 # We have machines - update their status from AWS
-                machines = await self._update_machine_status_from_aws(machines)
+                machines = await self._update_machine_status_from_aws(
+                    machines, include_health=query.include_health
+                )
             else:
-                self.logger.info(
-                    "DEBUG: No machines and no resource IDs for request %s", query.request_id
+                self.logger.debug(
+                    "No machines and no resource IDs for request %s", query.request_id
                 )
 
             # Convert to DTO with machine data
@@ -154,6 +203,34 @@ class GetRequestHandler(BaseQueryHandler[GetRequestQuery, RequestDTO]):
             self.logger.error("Failed to get request: %s", e)
             raise
 
+    async def _run_pending_cleanup(self, request) -> None:
+        """Try once more to delete the resources left behind by returned machines."""
+        from providers.base.strategy import ProviderOperation, ProviderOperationType
+
+        operation = ProviderOperation(
+            operation_type=ProviderOperationType.CLEANUP_RESOURCES,
+            parameters={"cleanup_plan": request.metadata["pending_cleanup"]},
+            context={"correlation_id": str(request.request_id)},
+        )
+        try:
+            result = await self._get_provider_context().execute_operation(operation)
+            if not result.success:
+                self.logger.warning("Resource cleanup failed: %s", result.error_message)
+                return
+
+            # Resources still in use are retried on the next poll
+            remaining = result.data.get("remaining") or {}
+            if any(remaining.values()):
+                request.metadata["pending_cleanup"] = remaining
+            else:
+                request.metadata.pop("pending_cleanup", None)
+            with self.uow_factory.create_unit_of_work() as uow:
+                uow.requests.save(request)
+        except Exception as e:
+            self.logger.warning(
+                "Failed to clean up resources for request %s: %s", request.request_id, e
+            )
+
     async def _get_machines_from_storage(self, request_id: str) -> List:
         """Get machines from storage for the request."""
         try:
@@ -253,8 +330,15 @@ class GetRequestHandler(BaseQueryHandler[GetRequestQuery, RequestDTO]):
             self.logger.error("Failed to check provider and create machines: %s", e)
             return []
 
-    async def _update_machine_status_from_aws(self, machines: List) -> List:
-        """Update machine status from AWS using existing handler methods."""
+    async def _update_machine_status_from_aws(
+        self, machines: List, include_health: bool = False
+    ) -> List:
+        """Update machine status from AWS using existing handler methods.
+
+        Args:
+            machines: Machines of a single request to refresh
+            include_health: Also fetch instance status checks (extra API calls)
+        """
         try:
             # Group machines by request to use existing check_hosts_status methods
             if not machines:
@@ -283,6 +367,7 @@ class GetRequestHandler(BaseQueryHandler[GetRequestQuery, RequestDTO]):
                 parameters={
                     "instance_ids": instance_ids,
                     "template_id": request.template_id,
+                    "include_health": include_health,
                 },
                 context={"correlation_id": str(request.request_id)},
             )
@@ -321,10 +406,12 @@ class GetRequestHandler(BaseQueryHandler[GetRequestQuery, RequestDTO]):
 
                     # Check if we need to update the machine (status or network info
                     # changed)
+                    health = domain_machine.get("health")
                     needs_update = (
                         machine.status != new_status
                         or machine.private_ip != domain_machine.get("private_ip")
                         or machine.public_ip != domain_machine.get("public_ip")
+                        or _health_changed(machine.metadata.get("health"), health)
                     )
 
                     if needs_update:
@@ -336,6 +423,8 @@ class GetRequestHandler(BaseQueryHandler[GetRequestQuery, RequestDTO]):
                         machine_data["launch_time"] = domain_machine.get(
                             "launch_time", machine.launch_time
                         )
+                        if health is not None:
+                            machine_data["metadata"] = {**machine.metadata, "health": health}
                         machine_data["version"] = machine.version + 1
 
                         # Create new machine instance with updated data
@@ -556,39 +645,33 @@ class ListActiveRequestsHandler(BaseQueryHandler[ListActiveRequestsQuery, List[R
         super().__init__(logger, error_handler)
         self.uow_factory = uow_factory
 
-    async def execute_query(self, query: ListActiveRequestsQuery) -> List[RequestDTO]:
+    async def execute_query(
+        self, query: ListActiveRequestsQuery
+    ) -> Union[List[RequestDTO], PageStream[RequestDTO]]:
         """Execute list active requests query."""
         self.logger.info("Listing active requests")
 
         try:
-            with self.uow_factory.create_unit_of_work() as uow:
-                # Get active requests from repository
-                from domain.request.value_objects import RequestStatus
-
-                active_statuses = [
-                    RequestStatus.PENDING,
-                    RequestStatus.IN_PROGRESS,
-                    RequestStatus.PROVISIONING,
-                ]
-
-                active_requests = uow.requests.find_by_statuses(active_statuses)
-
-                # Convert to DTOs
-                request_dtos = []
-                for request in active_requests:
-                    request_dto = RequestDTO(
-                        request_id=str(request.request_id),
-                        template_id=request.template_id,
-                        requested_count=request.requested_count,
-                        status=request.status.value,
-                        created_at=request.created_at,
-                        updated_at=request.updated_at,
-                        metadata=request.metadata or {},
-                    )
-                    request_dtos.append(request_dto)
+            # Project active requests without building aggregates
+            from domain.request.value_objects import RequestStatus
+
+            active_statuses = [status.value for status in RequestStatus if status.is_active()]
+
+            page = _summary_page(
+                self.uow_factory,
+                lambda uow: uow.requests,
+                {"status": {"$in": active_statuses}},
+                RequestDTO.from_summary,
+                key=lambda dto: dto.request_id,
+                limit=query.limit,
+                cursor=query.cursor,
+            )
+            if query.stream:
+                return page
 
-                self.logger.info("Found %s active requests", len(request_dtos))
-                return request_dtos
+            request_dtos = list(page)
+            self.logger.info("Found %s active requests", len(request_dtos))
+            return request_dtos
 
         except Exception as e:
             self.logger.error("Failed to list active requests: %s", e)
@@ -608,39 +691,82 @@ class ListReturnRequestsHandler(BaseQueryHandler[ListReturnRequestsQuery, List[R
         super().__init__(logger, error_handler)
         self.uow_factory = uow_factory
 
-    async def execute_query(self, query: ListReturnRequestsQuery) -> List[RequestDTO]:
+    async def execute_query(
+        self, query: ListReturnRequestsQuery
+    ) -> Union[List[RequestDTO], PageStream[RequestDTO]]:
         """Execute list return requests query."""
         self.logger.info("Listing return requests")
 
         try:
-            with self.uow_factory.create_unit_of_work() as uow:
-                # Get return requests from repository
-                from domain.request.value_objects import RequestType
-
-                return_requests = uow.requests.find_by_type(RequestType.RETURN)
-
-                # Convert to DTOs
-                request_dtos = []
-                for request in return_requests:
-                    request_dto = RequestDTO(
-                        request_id=str(request.request_id),
-                        template_id=request.template_id,
-                        requested_count=request.requested_count,
-                        status=request.status.value,
-                        created_at=request.created_at,
-                        updated_at=request.updated_at,
-                        metadata=request.metadata or {},
-                    )
-                    request_dtos.append(request_dto)
+            # Project return requests without building aggregates
+            from domain.request.value_objects import RequestType
+
+            criteria: Dict[str, Any] = {"request_type": RequestType.RETURN.value}
+            if query.status:
+                criteria["status"] = query.status
+
+            page = _summary_page(
+                self.uow_factory,
+                lambda uow: uow.requests,
+                criteria,
+                RequestDTO.from_summary,
+                key=lambda dto: dto.request_id,
+                limit=query.limit,
+                cursor=query.cursor,
+            )
+            if query.stream:
+                return page
 
-                self.logger.info("Found %s return requests", len(request_dtos))
-                return request_dtos
+            request_dtos = list(page)
+            self.logger.info("Found %s return requests", len(request_dtos))
+            return request_dtos
 
         except Exception as e:
             self.logger.error("Failed to list return requests: %s", e)
             raise
 
 
+@query_handler(ListRequestHistoryQuery)
+class ListRequestHistoryHandler(BaseQueryHandler[ListRequestHistoryQuery, List[RequestDTO]]):
+    """Handler for listing archived requests."""
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        logger: LoggingPort,
+        error_handler: ErrorHandlingPort,
+    ) -> None:
+        super().__init__(logger, error_handler)
+        self.uow_factory = uow_factory
+
+    async def execute_query(self, query: ListRequestHistoryQuery) -> List[RequestDTO]:
+        """Execute list request history query."""
+        self.logger.info("Listing request history")
+
+        try:
+            criteria: Dict[str, Any] = {}
+            if query.request_id:
+                criteria["request_id"] = query.request_id
+            if query.status:
+                criteria["status"] = query.status
+
+            # Archived requests are read only on demand, never by the live queries
+            with self.uow_factory.create_unit_of_work() as uow:
+                requests = uow.requests.find_history(criteria or None)
+
+            requests.sort(key=lambda request: request.created_at, reverse=True)
+            if query.limit is not None:
+                requests = requests[: query.limit]
+
+            request_dtos = [RequestDTO.from_domain(request) for request in requests]
+            self.logger.info("Found %s archived requests", len(request_dtos))
+            return request_dtos
+
+        except Exception as e:
+            self.logger.error("Failed to list request history: %s", e)
+            raise
+
+
 @query_handler(GetTemplateQuery)
 class GetTemplateHandler(BaseQueryHandler[GetTemplateQuery, Template]):
     """Handler for getting template details."""
@@ -897,41 +1023,43 @@ class ListMachinesHandler(BaseQueryHandler[ListMachinesQuery, List[MachineDTO]])
         super().__init__(logger, error_handler)
         self.uow_factory = uow_factory
 
-    async def execute_query(self, query: ListMachinesQuery) -> List[MachineDTO]:
+    async def execute_query(
+        self, query: ListMachinesQuery
+    ) -> Union[List[MachineDTO], PageStream[MachineDTO]]:
         """Execute list machines query."""
         self.logger.info("Listing machines")
 
         try:
-            with self.uow_factory.create_unit_of_work() as uow:
-                # Get machines based on query filters
-                if query.status_filter:
-                    from domain.machine.value_objects import MachineStatus
-
-                    status_enum = MachineStatus(query.status_filter)
-                    machines = uow.machines.find_by_status(status_enum)
-                elif query.request_id:
-                    machines = uow.machines.find_by_request_id(query.request_id)
-                else:
-                    machines = uow.machines.get_all()
-
-                # Convert to DTOs
-                machine_dtos = []
-                for machine in machines:
-                    machine_dto = MachineDTO(
-                        machine_id=str(machine.machine_id),
-                        provider_id=machine.provider_id,
-                        template_id=machine.template_id,
-                        request_id=(str(machine.request_id) if machine.request_id else None),
-                        status=machine.status.value,
-                        instance_type=machine.instance_type,
-                        created_at=machine.created_at,
-                        updated_at=machine.updated_at,
-                        metadata=machine.metadata or {},
-                    )
-                    machine_dtos.append(machine_dto)
+            # Project machines based on query filters without building aggregates
+            from domain.machine.value_objects import MachineStatus
+
+            criteria: Dict[str, Any] = {}
+            if query.request_id:
+                criteria["request_id"] = query.request_id
+            if query.template_id:
+                criteria["template_id"] = query.template_id
+            if query.status:
+                criteria["status"] = MachineStatus(query.status).value
+            elif query.active_only:
+                criteria["status"] = {
+                    "$in": [status.value for status in MachineStatus if status.is_active]
+                }
+
+            page = _summary_page(
+                self.uow_factory,
+                lambda uow: uow.machines,
+                criteria or None,
+                MachineDTO.from_summary,
+                key=lambda dto: dto.machine_id,
+                limit=query.limit,
+                cursor=query.cursor,
+            )
+            if query.stream:
+                return page
 
-                self.logger.info("Found %s machines", len(machine_dtos))
-                return machine_dtos
+            machine_dtos = list(page)
+            self.logger.info("Found %s machines", len(machine_dtos))
+            return machine_dtos
 
         except Exception as e:
             self.logger.error("Failed to list machines: %s", e)
@@ -7,6 +7,7 @@ from pydantic import Field
 
 from application.dto.base import BaseDTO
 from domain.request.aggregate import Request
+from domain.request.read_models import RequestSummary
 from domain.request.value_objects import MachineReference
 
 
@@ -153,6 +154,31 @@ class RequestDTO(BaseDTO):
             long=long,
         )
 
+    @classmethod
+    def from_summary(cls, summary: RequestSummary, long: bool = False) -> "RequestDTO":
+        """
+        Create DTO from a request read model.
+
+        Args:
+            summary: Request summary projected from storage
+            long: Whether to include detailed information
+
+        Returns:
+            RequestDTO instance
+        """
+        return cls(
+            request_id=summary.request_id,
+            status=summary.status,
+            template_id=summary.template_id,
+            requested_count=summary.requested_count,
+            created_at=cls.parse_datetime(summary.created_at),
+            message=summary.status_message or "",
+            provider_api=summary.provider_api,
+            metadata=summary.metadata,
+            request_type=summary.request_type,
+            long=long,
+        )
+
     def to_dict(self, long: Optional[bool] = None) -> Dict[str, Any]:
         """
         Convert to dictionary format - returns snake_case for internal use.
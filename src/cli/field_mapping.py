@@ -100,6 +100,17 @@ def derive_cpu_ram_from_instance_type(instance_type: str) -> tuple[str, str]:
     if instance_type == "N/A":
         return "N/A", "N/A"
 
+    try:
+        from domain.base.ports.instance_type_catalog_port import InstanceTypeCatalogPort
+        from infrastructure.di.container import get_container
+
+        catalog = get_container().get_optional(InstanceTypeCatalogPort)
+        info = catalog.get(instance_type) if catalog is not None else None
+        if info is not None:
+            return str(info.vcpus), str(info.memory_mib)
+    except Exception:
+        pass  # Fall back to the static mapping below
+
     # Simple mapping for common instance types
     cpu_ram_mapping = {
         "t2.micro": ("1", "1024"),
@@ -6,34 +6,106 @@ This module handles presentation formatting for the CLI, including:
 - ASCII table fallbacks
 - List formatting for detailed views
 - Pure dynamic field handling - no hardcoded field mappings
+- Incremental JSON/NDJSON writing for streamed list results
 """
 
-from typing import Any, Dict, List
+from collections.abc import Iterator
+from typing import Any, Dict, List, TextIO
+
+
+def format_json_output(data: Any) -> str:
+    """Format data as indented JSON using the configured JSON codec."""
+    from infrastructure.serialization.json_codec import get_json_codec
+
+    return get_json_codec().dumps(data, pretty=True)
+
+
+def format_ndjson_output(data: Any) -> str:
+    """Format the first list in data as newline-delimited JSON, one item per line."""
+    from infrastructure.serialization.json_codec import get_json_codec
+
+    codec = get_json_codec()
+    if isinstance(data, dict):
+        for items in data.values():
+            if isinstance(items, list):
+                return "\n".join(codec.dumps(item) for item in items)
+    return codec.dumps(data)
+
+
+def is_streaming_output(data: Any) -> bool:
+    """Whether a command result holds a lazy iterator that should be streamed."""
+    return isinstance(data, dict) and any(isinstance(value, Iterator) for value in data.values())
+
+
+def write_streaming_output(data: Dict[str, Any], format_type: str, stream: TextIO) -> None:
+    """
+    Write a result holding a lazy iterator without buffering the whole list.
+
+    NDJSON writes one item per line, followed by a ``{"next_cursor": ...}``
+    line when another page exists. JSON writes the same envelope as the
+    buffered output with the list written item by item, followed by the
+    remaining keys plus ``count`` and ``next_cursor``. Other formats cannot
+    be streamed and are rendered once the iterator is consumed.
+
+    Args:
+        data: Command result with exactly one iterator value
+        format_type: Output format
+        stream: Text stream to write to
+    """
+    from infrastructure.serialization.json_codec import get_json_codec
+
+    codec = get_json_codec()
+    key, items = next((k, v) for k, v in data.items() if isinstance(v, Iterator))
+
+    if format_type not in ("json", "ndjson"):
+        buffered = {k: (list(v) if k == key else v) for k, v in data.items()}
+        stream.write(format_output(buffered, format_type) + "\n")
+        return
+
+    if format_type == "ndjson":
+        for item in items:
+            stream.write(codec.dumps(item) + "\n")
+        next_cursor = getattr(items, "next_cursor", None)
+        if next_cursor:
+            stream.write(codec.dumps({"next_cursor": next_cursor}) + "\n")
+        return
+
+    stream.write("{\n  " + codec.dumps(key) + ": [")
+    count = 0
+    for item in items:
+        stream.write(("," if count else "") + "\n    " + codec.dumps(item))
+        count += 1
+    stream.write("\n  ]" if count else "]")
+
+    trailer = {k: v for k, v in data.items() if k != key}
+    trailer["count"] = count
+    next_cursor = getattr(items, "next_cursor", None)
+    if next_cursor:
+        trailer["next_cursor"] = next_cursor
+    for trailer_key, value in trailer.items():
+        stream.write(",\n  " + codec.dumps(trailer_key) + ": " + codec.dumps(value))
+    stream.write("\n}\n")
 
 
 def format_output(data: Any, format_type: str) -> str:
     """Format data according to the specified format type."""
     if format_type == "json":
-        import json
-
-        return json.dumps(data, indent=2, default=str)
+        return format_json_output(data)
     elif format_type == "yaml":
         try:
             import yaml
 
             return yaml.dump(data, default_flow_style=False, default_style=None)
         except ImportError:
-            import json
-
-            return json.dumps(data, indent=2, default=str)
+            return format_json_output(data)
     elif format_type == "table":
         return format_table_output(data)
     elif format_type == "list":
         return format_list_output(data)
+    elif format_type == "ndjson":
+        return format_ndjson_output(data)
     else:
-        import json
-
-        return json.dumps(data, indent=2, default=str)
+        return format_json_output(data)
 
 
 def format_table_output(data: Any) -> str:
@@ -43,9 +115,7 @@ def format_table_output(data: Any) -> str:
             if isinstance(items, list) and items:
                 return format_generic_table(items, key.title())
     # Fallback to JSON for unknown data structures
-    import json
-
-    return json.dumps(data, indent=2, default=str)
+    return format_json_output(data)
 
 
 def format_list_output(data: Any) -> str:
@@ -55,9 +125,7 @@ def format_list_output(data: Any) -> str:
             if isinstance(items, list) and items:
                 return format_generic_list(items, key.title())
     # Fallback to JSON for unknown data structures
-    import json
-
-    return json.dumps(data, indent=2, default=str)
+    return format_json_output(data)
 
 
 def format_generic_table(items: List[Dict], title: str = "Items") -> str:
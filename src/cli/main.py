@@ -16,12 +16,37 @@ from typing import Any, Dict
 
 from _package import REPO_URL
 from cli.completion import generate_bash_completion, generate_zsh_completion
-from cli.formatters import format_output
+from cli.formatters import format_output, is_streaming_output, write_streaming_output
+from cli.startup_profile import (
+    get_startup_profiler,
+    profile_phase,
+    start_startup_profiler,
+    startup_profiling_requested,
+)
 from domain.base.exceptions import DomainException
 from domain.request.value_objects import RequestStatus
 from infrastructure.logging.logger import get_logger
 
 
+def _positive_int(value: str) -> int:
+    """Parse a command line integer that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _add_pagination_arguments(list_parser: argparse.ArgumentParser) -> None:
+    """Add streaming and cursor pagination options to a list command."""
+    list_parser.add_argument("--limit", type=int, help="Maximum number of results per page")
+    list_parser.add_argument("--cursor", help="Cursor returned as next_cursor by a previous page")
+    list_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write results as they are read instead of buffering the full list",
+    )
+
+
 def parse_args() -> tuple[argparse.Namespace, dict]:
     """Parse command line arguments with resource-action structure.
 
@@ -56,7 +81,7 @@ For more information, visit: {REPO_URL}
     )
     parser.add_argument(
         "--format",
-        choices=["json", "yaml", "table", "list"],
+        choices=["json", "yaml", "table", "list", "ndjson"],
         default="json",
         help="Output format",
     )
@@ -68,6 +93,11 @@ For more information, visit: {REPO_URL}
         action="store_true",
         help="Show what would be done without executing",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print an import-time and startup phase breakdown to stderr",
+    )
     parser.add_argument(
         "--scheduler",
         choices=["default", "hostfactory", "hf"],
@@ -76,6 +106,12 @@ For more information, visit: {REPO_URL}
     parser.add_argument(
         "--completion", choices=["bash", "zsh"], help="Generate shell completion script"
     )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        help="Seconds the command may take; AWS reads stop waiting at the deadline "
+        "(default: HF_TIMEOUT)",
+    )
 
     # HostFactory compatibility flags
     parser.add_argument("-f", "--file", help="Input JSON file path (HostFactory compatibility)")
@@ -166,8 +202,9 @@ For more information, visit: {REPO_URL}
     machines_list.add_argument("--status", help="Filter by machine status")
     machines_list.add_argument("--template-id", help="Filter by template ID")
     machines_list.add_argument(
-        "--format", choices=["json", "yaml", "table", "list"], help="Output format"
+        "--format", choices=["json", "yaml", "table", "list", "ndjson"], help="Output format"
     )
+    _add_pagination_arguments(machines_list)
 
     # Machines show
     machines_show = machines_subparsers.add_parser("show", help="Show machine details")
@@ -195,6 +232,11 @@ For more information, visit: {REPO_URL}
     machines_request.add_argument(
         "--timeout", type=int, default=300, help="Wait timeout in seconds"
     )
+    machines_request.add_argument(
+        "--request-timeout",
+        type=_positive_int,
+        help="Time out the request if it is not fulfilled within this many seconds",
+    )
 
     # Machines return (terminate machines)
     machines_return = machines_subparsers.add_parser("return", help="Return machines")
@@ -223,8 +265,9 @@ For more information, visit: {REPO_URL}
     )
     requests_list.add_argument("--template-id", help="Filter by template ID")
     requests_list.add_argument(
-        "--format", choices=["json", "yaml", "table", "list"], help="Output format"
+        "--format", choices=["json", "yaml", "table", "list", "ndjson"], help="Output format"
     )
+    _add_pagination_arguments(requests_list)
 
     # Requests show
     requests_show = requests_subparsers.add_parser("show", help="Show request details")
@@ -241,6 +284,11 @@ For more information, visit: {REPO_URL}
     # Requests status
     requests_status = requests_subparsers.add_parser("status", help="Check request status")
     requests_status.add_argument("request_ids", nargs="*", help="Request IDs to check")
+    requests_status.add_argument(
+        "--health",
+        action="store_true",
+        help="Include instance status checks (extra DescribeInstanceStatus calls)",
+    )
 
     # System resource
     system_parser = subparsers.add_parser("system", help="System operations")
@@ -398,6 +446,28 @@ For more information, visit: {REPO_URL}
     )
     storage_metrics.add_argument("--strategy", help="Show metrics for specific storage strategy")
 
+    # Storage archive
+    storage_archive = storage_subparsers.add_parser(
+        "archive", help="Move completed requests and their machines to the archive"
+    )
+    storage_archive.add_argument(
+        "--older-than-hours",
+        type=int,
+        help="Archive requests completed this many hours ago (default: retention config)",
+    )
+    storage_archive.add_argument(
+        "--dry-run", action="store_true", help="Show what would be archived"
+    )
+
+    # Storage history
+    storage_history = storage_subparsers.add_parser("history", help="List archived requests")
+    storage_history.add_argument("--request-id", help="Show a specific archived request")
+    storage_history.add_argument("--status", help="Filter by request status")
+    storage_history.add_argument("--limit", type=int, help="Maximum number of requests")
+    storage_history.add_argument(
+        "--format", choices=["json", "yaml", "table", "list"], help="Output format"
+    )
+
     # Scheduler resource
     scheduler_parser = subparsers.add_parser("scheduler", help="Scheduler management")
     resource_parsers["scheduler"] = scheduler_parser
@@ -498,10 +568,85 @@ For more information, visit: {REPO_URL}
         default="INFO",
         help="Logging level for MCP server",
     )
+    mcp_serve.add_argument(
+        "--max-workers",
+        type=_positive_int,
+        default=8,
+        help="Tool calls executed concurrently (default: 8)",
+    )
 
     return parser.parse_args(), resource_parsers
 
 
+# Command handler mapping as "module:function" references. Handler modules are
+# imported only for the command being run, so e.g. `requests status` never loads
+# the MCP, serve (FastAPI/uvicorn) or storage-admin handler modules.
+COMMAND_HANDLERS: Dict[tuple, str] = {
+    # Templates - Complete CRUD operations
+    ("templates", "list"): "interface.template_command_handlers:handle_list_templates",
+    ("templates", "show"): "interface.template_command_handlers:handle_get_template",
+    ("templates", "create"): "interface.template_command_handlers:handle_create_template",
+    ("templates", "update"): "interface.template_command_handlers:handle_update_template",
+    ("templates", "delete"): "interface.template_command_handlers:handle_delete_template",
+    ("templates", "validate"): "interface.template_command_handlers:handle_validate_template",
+    ("templates", "refresh"): "interface.template_command_handlers:handle_refresh_templates",
+    # Machines
+    ("machines", "request"): "interface.request_command_handlers:handle_request_machines",
+    ("machines", "return"): "interface.request_command_handlers:handle_request_return_machines",
+    ("machines", "list"): "interface.request_command_handlers:handle_list_machines",
+    ("machines", "show"): "interface.request_command_handlers:handle_request_machines",
+    # Requests
+    ("requests", "status"): "interface.request_command_handlers:handle_get_request_status",
+    ("requests", "list"): "interface.request_command_handlers:handle_get_return_requests",
+    ("requests", "show"): "interface.request_command_handlers:handle_get_request_status",
+    ("requests", "cancel"): "interface.request_command_handlers:handle_get_request_status",
+    ("requests", "retry"): "interface.request_command_handlers:handle_get_request_status",
+    # Providers
+    ("providers", "health"): "interface.system_command_handlers:handle_provider_health",
+    ("providers", "list"): "interface.system_command_handlers:handle_list_providers",
+    ("providers", "show"): "interface.system_command_handlers:handle_list_providers",
+    ("providers", "select"): "interface.system_command_handlers:handle_select_provider_strategy",
+    ("providers", "exec"): "interface.system_command_handlers:handle_execute_provider_operation",
+    ("providers", "metrics"): "interface.system_command_handlers:handle_provider_metrics",
+    # Storage commands
+    ("storage", "list"): "interface.storage_command_handlers:handle_list_storage_strategies",
+    ("storage", "show"): "interface.storage_command_handlers:handle_show_storage_config",
+    ("storage", "validate"): "interface.storage_command_handlers:handle_validate_storage_config",
+    ("storage", "test"): "interface.storage_command_handlers:handle_test_storage",
+    ("storage", "health"): "interface.storage_command_handlers:handle_storage_health",
+    ("storage", "metrics"): "interface.storage_command_handlers:handle_storage_metrics",
+    ("storage", "archive"): "interface.storage_command_handlers:handle_storage_archive",
+    ("storage", "history"): "interface.storage_command_handlers:handle_storage_history",
+    # Scheduler commands
+    ("scheduler", "list"): "interface.scheduler_command_handlers:handle_list_scheduler_strategies",
+    ("scheduler", "show"): "interface.scheduler_command_handlers:handle_show_scheduler_config",
+    (
+        "scheduler",
+        "validate",
+    ): "interface.scheduler_command_handlers:handle_validate_scheduler_config",
+    # System commands
+    ("system", "serve"): "interface.serve_command_handler:handle_serve_api",
+    # Configuration commands
+    ("config", "show"): "interface.system_command_handlers:handle_provider_config",
+    ("config", "validate"): "interface.system_command_handlers:handle_validate_provider_config",
+    ("config", "reload"): "interface.system_command_handlers:handle_reload_provider_config",
+    # MCP commands - Function handlers
+    ("mcp", "serve"): "interface.mcp.server.handler:handle_mcp_serve",
+    ("mcp", "tools", "list"): "interface.mcp_command_handlers:handle_mcp_tools_list",
+    ("mcp", "tools", "call"): "interface.mcp_command_handlers:handle_mcp_tools_call",
+    ("mcp", "tools", "info"): "interface.mcp_command_handlers:handle_mcp_tools_info",
+    ("mcp", "validate"): "interface.mcp_command_handlers:handle_mcp_validate",
+}
+
+
+def resolve_command_handler(handler_key: tuple):
+    """Import and return the handler function registered for a command key."""
+    import importlib
+
+    module_name, func_name = COMMAND_HANDLERS[handler_key].split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
 async def execute_command(args, app) -> Dict[str, Any]:
     """Execute the appropriate command handler."""
     # Process input data from -f/--file or -d/--data flags (HostFactory compatibility)
@@ -552,118 +697,20 @@ async def execute_command(args, app) -> Dict[str, Any]:
             logger.warning("Failed to override scheduler strategy: %s", e)
 
     try:
-        # Import function handlers - all are now async functions with decorators
-        from interface.mcp.server.handler import handle_mcp_serve
-        from interface.mcp_command_handlers import (
-            handle_mcp_tools_call,
-            handle_mcp_tools_info,
-            handle_mcp_tools_list,
-            handle_mcp_validate,
-        )
-        from interface.request_command_handlers import (
-            handle_get_request_status,
-            handle_get_return_requests,
-            handle_request_machines,
-            handle_request_return_machines,
-        )
-        from interface.scheduler_command_handlers import (
-            handle_list_scheduler_strategies,
-            handle_show_scheduler_config,
-            handle_validate_scheduler_config,
-        )
-        from interface.serve_command_handler import handle_serve_api
-        from interface.storage_command_handlers import (
-            handle_list_storage_strategies,
-            handle_show_storage_config,
-            handle_storage_health,
-            handle_storage_metrics,
-            handle_test_storage,
-            handle_validate_storage_config,
-        )
-        from interface.system_command_handlers import (
-            handle_execute_provider_operation,
-            handle_list_providers,
-            handle_provider_config,
-            handle_provider_health,
-            handle_provider_metrics,
-            handle_reload_provider_config,
-            handle_select_provider_strategy,
-            handle_validate_provider_config,
-        )
-        from interface.template_command_handlers import (
-            handle_create_template,
-            handle_delete_template,
-            handle_get_template,
-            handle_list_templates,
-            handle_refresh_templates,
-            handle_update_template,
-            handle_validate_template,
-        )
-
-        # Command handler mapping - all handlers are now async functions
-        COMMAND_HANDLERS = {
-            # Templates - Complete CRUD operations
-            ("templates", "list"): handle_list_templates,
-            ("templates", "show"): handle_get_template,
-            ("templates", "create"): handle_create_template,
-            ("templates", "update"): handle_update_template,
-            ("templates", "delete"): handle_delete_template,
-            ("templates", "validate"): handle_validate_template,
-            ("templates", "refresh"): handle_refresh_templates,
-            # Machines
-            ("machines", "request"): handle_request_machines,
-            ("machines", "return"): handle_request_return_machines,
-            ("machines", "list"): handle_request_machines,
-            ("machines", "show"): handle_request_machines,
-            # Requests
-            ("requests", "status"): handle_get_request_status,
-            ("requests", "list"): handle_get_return_requests,
-            ("requests", "show"): handle_get_request_status,
-            ("requests", "cancel"): handle_get_request_status,
-            ("requests", "retry"): handle_get_request_status,
-            # Providers
-            ("providers", "health"): handle_provider_health,
-            ("providers", "list"): handle_list_providers,
-            ("providers", "show"): handle_list_providers,
-            ("providers", "select"): handle_select_provider_strategy,
-            ("providers", "exec"): handle_execute_provider_operation,
-            ("providers", "metrics"): handle_provider_metrics,
-            # Storage commands
-            ("storage", "list"): handle_list_storage_strategies,
-            ("storage", "show"): handle_show_storage_config,
-            ("storage", "validate"): handle_validate_storage_config,
-            ("storage", "test"): handle_test_storage,
-            ("storage", "health"): handle_storage_health,
-            ("storage", "metrics"): handle_storage_metrics,
-            # Scheduler commands
-            ("scheduler", "list"): handle_list_scheduler_strategies,
-            ("scheduler", "show"): handle_show_scheduler_config,
-            ("scheduler", "validate"): handle_validate_scheduler_config,
-            # System commands
-            ("system", "serve"): handle_serve_api,
-            # Configuration commands
-            ("config", "show"): handle_provider_config,
-            ("config", "validate"): handle_validate_provider_config,
-            ("config", "reload"): handle_reload_provider_config,
-            # MCP commands - Function handlers
-            ("mcp", "serve"): handle_mcp_serve,
-            ("mcp", "tools", "list"): handle_mcp_tools_list,
-            ("mcp", "tools", "call"): handle_mcp_tools_call,
-            ("mcp", "tools", "info"): handle_mcp_tools_info,
-            ("mcp", "validate"): handle_mcp_validate,
-        }
-
         # All handlers are now async functions - no special handling needed
         if handler_key not in COMMAND_HANDLERS:
             raise ValueError(f"Unknown command: {args.resource} {args.action}")
 
-        handler_func = COMMAND_HANDLERS[handler_key]
+        handler_func = resolve_command_handler(handler_key)
 
         if handler_func is None:
             raise NotImplementedError(f"Command not yet implemented: {args.resource} {args.action}")
 
         # All handlers are async functions with decorators
-        result = await handler_func(args)
+        from infrastructure.resilience.deadline import command_timeout, deadline_scope
+
+        with deadline_scope(command_timeout(getattr(args, "deadline", None))):
+            result = await handler_func(args)
         return result
 
     finally:
@@ -680,6 +727,22 @@ async def execute_command(args, app) -> Dict[str, Any]:
 
 async def main() -> None:
     """Serve as main CLI entry point."""
+    # run.py starts the profiler before importing this module; this covers callers
+    # that invoke main() directly
+    if startup_profiling_requested():
+        start_startup_profiler()
+
+    try:
+        await _run_cli()
+    finally:
+        profiler = get_startup_profiler()
+        if profiler is not None and profiler.active:
+            profiler.stop()
+            profiler.write_report()
+
+
+async def _run_cli() -> None:
+    """Parse arguments, initialize the application and run the command."""
     try:
         # Check if no arguments provided (except program name)
         if len(sys.argv) == 1:
@@ -694,7 +757,8 @@ async def main() -> None:
         sys.stderr = captured_stderr = StringIO()
 
         try:
-            args, resource_parsers = parse_args()
+            with profile_phase("parse_args"):
+                args, resource_parsers = parse_args()
             # Restore stderr on success
             sys.stderr = old_stderr
         except SystemExit as e:
@@ -749,9 +813,10 @@ async def main() -> None:
         try:
             from bootstrap import Application
 
-            app = Application(args.config)
-            if not await app.initialize(dry_run=args.dry_run):
-                raise RuntimeError("Failed to initialize application")
+            with profile_phase("initialize"):
+                app = Application(args.config)
+                if not await app.initialize(dry_run=args.dry_run):
+                    raise RuntimeError("Failed to initialize application")
         except Exception as e:
             logger.error("Failed to initialize application: %s", e)
             if args.verbose:
@@ -766,23 +831,35 @@ async def main() -> None:
             from infrastructure.mocking.dry_run_context import dry_run_context
 
             # Execute command within dry-run context if flag is set
-            if args.dry_run:
-                logger.info("DRY-RUN mode activated - using mocked operations")
-                with dry_run_context(True):
+            with profile_phase("execute"):
+                if args.dry_run:
+                    logger.info("DRY-RUN mode activated - using mocked operations")
+                    with dry_run_context(True):
+                        result = await execute_command(args, app)
+                else:
                     result = await execute_command(args, app)
-            else:
-                result = await execute_command(args, app)
 
             # Format and output result
             output_format = getattr(args, "format", None) or args.format
-            formatted_output = format_output(result, output_format)
+            with profile_phase("format_output"):
+                if is_streaming_output(result):
+                    # Lazy pages are written as results are read, never buffered
+                    if args.output:
+                        with open(args.output, "w") as f:
+                            write_streaming_output(result, output_format, f)
+                    else:
+                        write_streaming_output(result, output_format, sys.stdout)
+                    formatted_output = None
+                else:
+                    formatted_output = format_output(result, output_format)
 
             if args.output:
-                with open(args.output, "w") as f:
-                    f.write(formatted_output)
+                if formatted_output is not None:
+                    with open(args.output, "w") as f:
+                        f.write(formatted_output)
                 if not args.quiet:
                     print(f"Output written to {args.output}")  # noqa: CLI output
-            else:
+            elif formatted_output is not None:
                 print(formatted_output)  # noqa: CLI output
 
         except DomainException as e:
@@ -0,0 +1,196 @@
+"""
+Startup profiling for CLI invocations.
+
+HostFactory calls the plugin as a fresh process for every script command, so
+interpreter start and import cost is paid on every poll. This module provides:
+- An import timer that records per-module import cost without ``-X importtime``
+- Named phase timing (argument parsing, bootstrap, command execution)
+- A report listing the slowest modules and any deferred heavy dependencies
+  that were loaded anyway
+
+The profiler is activated by the ``--profile-startup`` global flag and writes
+its report to stderr so scheduler-facing JSON on stdout is unaffected.
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from typing import Any, Dict, Generator, List, Optional
+
+PROFILE_STARTUP_FLAG = "--profile-startup"
+
+# Third-party packages that no HostFactory script command should need.
+# Each one is imported only by the command or storage strategy that uses it.
+DEFERRED_HEAVY_MODULES = (
+    "fastapi",
+    "starlette",
+    "uvicorn",
+    "sqlalchemy",
+    "moto",
+    "jinja2",
+)
+
+
+class _TimedLoader:
+    """Loader proxy that measures ``exec_module`` for a single module."""
+
+    def __init__(self, loader: Any, profiler: "StartupProfiler") -> None:
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._record_import(module.__name__, time.perf_counter() - start)
+
+
+class _TimingFinder(MetaPathFinder):
+    """Meta path finder that wraps the loader chosen by the remaining finders."""
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self._profiler)
+            return spec
+        return None
+
+
+class StartupProfiler:
+    """Collect import and phase timings for a single CLI invocation."""
+
+    def __init__(self) -> None:
+        """Initialize the profiler without installing any hooks."""
+        self._started_at = time.perf_counter()
+        self._finder: Optional[_TimingFinder] = None
+        self._imports: Dict[str, float] = {}
+        self._phases: List[tuple[str, float]] = []
+        self._preloaded = frozenset(sys.modules)
+
+    @property
+    def active(self) -> bool:
+        """Whether the import hook is installed."""
+        return self._finder is not None
+
+    def start(self) -> "StartupProfiler":
+        """Install the import hook at the front of ``sys.meta_path``."""
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+        return self
+
+    def stop(self) -> None:
+        """Remove the import hook."""
+        if self._finder is not None:
+            try:
+                sys.meta_path.remove(self._finder)
+            except ValueError:
+                pass
+            self._finder = None
+
+    def _record_import(self, module_name: str, seconds: float) -> None:
+        self._imports[module_name] = seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """Time a named startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases.append((name, time.perf_counter() - start))
+
+    def report(self, top: int = 25) -> Dict[str, Any]:
+        """
+        Build the startup report.
+
+        Import times are inclusive: a package's time includes the modules it
+        imported while executing.
+
+        Args:
+            top: Number of slowest modules and packages to include
+
+        Returns:
+            Dictionary with totals, phases, slowest modules and per-package totals
+        """
+        loaded = [name for name in sys.modules if name not in self._preloaded]
+
+        # Sum only top-level package roots to avoid double counting nested imports
+        packages: Dict[str, float] = {}
+        for name, seconds in self._imports.items():
+            root = name.split(".", 1)[0]
+            if name == root:
+                packages[root] = packages.get(root, 0.0) + seconds
+
+        slowest = sorted(self._imports.items(), key=lambda item: item[1], reverse=True)[:top]
+
+        return {
+            "total_ms": _ms(time.perf_counter() - self._started_at),
+            "modules_loaded": len(loaded),
+            "phases": [{"name": name, "ms": _ms(seconds)} for name, seconds in self._phases],
+            "packages": {
+                name: _ms(seconds)
+                for name, seconds in sorted(packages.items(), key=lambda item: -item[1])[:top]
+            },
+            "slowest_imports": [{"module": name, "ms": _ms(seconds)} for name, seconds in slowest],
+            "heavy_modules_loaded": sorted(
+                name for name in DEFERRED_HEAVY_MODULES if name in sys.modules
+            ),
+        }
+
+    def write_report(self, stream=None) -> None:
+        """Write the report as JSON to ``stream`` (stderr by default)."""
+        stream = stream or sys.stderr
+        stream.write(json.dumps({"startup_profile": self.report()}, indent=2) + "\n")
+
+
+_active_profiler: Optional[StartupProfiler] = None
+
+
+def start_startup_profiler() -> StartupProfiler:
+    """Create and install the process-wide startup profiler."""
+    global _active_profiler
+    if _active_profiler is None:
+        _active_profiler = StartupProfiler().start()
+    return _active_profiler
+
+
+def get_startup_profiler() -> Optional[StartupProfiler]:
+    """Get the active startup profiler, if profiling was requested."""
+    return _active_profiler
+
+
+def startup_profiling_requested(argv: Optional[List[str]] = None) -> bool:
+    """Check the raw command line for the profiling flag before argparse runs."""
+    return PROFILE_STARTUP_FLAG in (sys.argv if argv is None else argv)
+
+
+@contextmanager
+def profile_phase(name: str) -> Generator[None, None, None]:
+    """Time a phase on the active profiler; no-op when profiling is off."""
+    if _active_profiler is None:
+        yield
+        return
+    with _active_profiler.phase(name):
+        yield
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
@@ -28,11 +28,12 @@ from .provider_strategy_schema import (
     ProviderInstanceConfig,
     ProviderMode,
 )
-from .server_schema import AuthConfig, CORSConfig, ServerConfig
+from .server_schema import AuthConfig, CORSConfig, ServerConfig, SharedStateConfig
 from .storage_schema import (
     BackoffConfig,
     DynamodbStrategyConfig,
     JsonStrategyConfig,
+    RetentionConfig,
     RetryConfig,
     SqlStrategyConfig,
     StorageConfig,
@@ -59,6 +60,7 @@ __all__: list[str] = [
     "DynamodbStrategyConfig",
     "BackoffConfig",
     "RetryConfig",
+    "RetentionConfig",
     # Logging configuration
     "LoggingConfig",
     # Performance configurations
@@ -80,4 +82,5 @@ __all__: list[str] = [
     "ServerConfig",
     "AuthConfig",
     "CORSConfig",
+    "SharedStateConfig",
 ]
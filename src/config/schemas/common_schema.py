@@ -1,6 +1,6 @@
 """Common configuration schemas."""
 
-from typing import Dict
+from typing import Dict, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
@@ -182,6 +182,12 @@ class RequestConfig(BaseModel):
     """Request configuration."""
 
     max_machines_per_request: int = Field(100, description="Maximum number of machines per request")
+    timeout_sweeper_enabled: bool = Field(
+        True, description="Time out requests past their deadline while the server runs"
+    )
+    timeout_resync_interval: int = Field(
+        300, description="Seconds between reloads of stored request deadlines"
+    )
 
     @field_validator("max_machines_per_request")
     @classmethod
@@ -191,6 +197,14 @@ class RequestConfig(BaseModel):
             raise ValueError("Maximum machines per request must be at least 1")
         return v
 
+    @field_validator("timeout_resync_interval")
+    @classmethod
+    def validate_timeout_resync_interval(cls, v: int) -> int:
+        """Validate deadline resync interval."""
+        if v < 1:
+            raise ValueError("Timeout resync interval must be at least 1 second")
+        return v
+
 
 class DatabaseConfig(BaseModel):
     """Database configuration."""
@@ -222,6 +236,58 @@ class EventsConfig(BaseModel):
     enabled: bool = Field(True, description="Whether events are enabled")
     max_events_per_request: int = Field(1000, description="Maximum number of events per request")
     event_retention_days: int = Field(30, description="Number of days to retain events")
+    publisher_mode: str = Field(
+        "logging", description="Event publishing mode (logging, sync, async)"
+    )
+    queue_size: int = Field(10000, description="Maximum queued events in async mode")
+    batch_size: int = Field(100, description="Maximum events dispatched per batch in async mode")
+    batch_delay_ms: int = Field(
+        10, description="Milliseconds to wait for a dispatch batch to fill (group commit)"
+    )
+    telemetry_sample_rate: float = Field(
+        1.0, description="Fraction of persistence telemetry events kept in async mode"
+    )
+
+    # Durable event log (HF_PROVIDER_EVENTSDIR sets store_path)
+    store_path: Optional[str] = Field(None, description="Events directory")
+    default_events_path: Optional[str] = Field(
+        None, description="Events directory derived from the work directory"
+    )
+    log_enabled: bool = Field(False, description="Append published events to the event log")
+    log_max_bytes: int = Field(
+        64 * 1024 * 1024, description="Rotate event log segments at this size"
+    )
+    log_rotate_seconds: int = Field(3600, description="Rotate event log segments at this age")
+    log_fsync: bool = Field(True, description="Fsync each event log batch")
+
+    @property
+    def events_dir(self) -> str:
+        """Directory holding the event log."""
+        return self.store_path or self.default_events_path or "events"
+
+    @field_validator("publisher_mode")
+    @classmethod
+    def validate_publisher_mode(cls, v: str) -> str:
+        """Validate publisher mode."""
+        if v not in ("logging", "sync", "async"):
+            raise ValueError("Publisher mode must be one of: logging, sync, async")
+        return v
+
+    @field_validator("queue_size", "batch_size", "log_max_bytes", "log_rotate_seconds")
+    @classmethod
+    def validate_pipeline_sizes(cls, v: int) -> int:
+        """Validate async pipeline sizes."""
+        if v < 1:
+            raise ValueError("Event queue, batch and log rotation sizes must be at least 1")
+        return v
+
+    @field_validator("telemetry_sample_rate")
+    @classmethod
+    def validate_sample_rate(cls, v: float) -> float:
+        """Validate telemetry sample rate."""
+        if not 0.0 <= v <= 1.0:
+            raise ValueError("Telemetry sample rate must be between 0.0 and 1.0")
+        return v
 
     @field_validator("max_events_per_request")
     @classmethod
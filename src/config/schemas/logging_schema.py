@@ -1,8 +1,8 @@
 """Logging configuration schemas."""
 
-from typing import Optional
+from typing import Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class LoggingConfig(BaseModel):
@@ -20,3 +20,24 @@ class LoggingConfig(BaseModel):
     accept_propagated_setting: bool = Field(
         False, description="Whether to use HostFactory service log settings"
     )
+    queue_enabled: bool = Field(
+        False, description="Format and write log records on a background thread"
+    )
+    queue_size: int = Field(10000, description="Maximum log records waiting to be written")
+    rate_limit_per_second: float = Field(
+        0.0, description="Records per second each logger may emit below WARNING (0 = unlimited)"
+    )
+    rate_limit_burst: Optional[int] = Field(
+        None, description="Records a logger may emit at once before rate limiting applies"
+    )
+    rate_limits: Dict[str, float] = Field(
+        default_factory=dict, description="Per-logger records-per-second overrides"
+    )
+
+    @field_validator("queue_size")
+    @classmethod
+    def validate_queue_size(cls, v: int) -> int:
+        """Validate log queue size."""
+        if v < 1:
+            raise ValueError("Log queue size must be at least 1")
+        return v
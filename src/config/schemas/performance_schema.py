@@ -103,11 +103,60 @@ class AMIResolutionCacheConfig(BaseModel):
         return v
 
 
+class InstanceTypeCacheConfig(BaseModel):
+    """Instance type catalog caching configuration."""
+
+    enabled: bool = Field(True, description="Persist the instance type catalog in the work dir")
+    ttl_seconds: int = Field(
+        7 * 24 * 3600, description="Instance type catalog TTL in seconds"
+    )
+    retry_seconds: int = Field(
+        3600, description="Seconds before retrying AWS after falling back to the offline snapshot"
+    )
+
+    @field_validator("ttl_seconds", "retry_seconds")
+    @classmethod
+    def validate_ttl_seconds(cls, v: int) -> int:
+        """Validate instance type catalog TTLs."""
+        if v < 0:
+            raise ValueError("Instance type catalog TTL must be non-negative")
+        return v
+
+
+class IAMValidationCacheConfig(BaseModel):
+    """IAM prerequisite validation caching configuration."""
+
+    enabled: bool = Field(True, description="Remember passed IAM validations")
+    ttl_seconds: int = Field(3600, description="Seconds a passed IAM validation is trusted")
+    file: str = Field("iam_validation.json", description="IAM validation cache filename")
+
+    @field_validator("ttl_seconds")
+    @classmethod
+    def validate_ttl_seconds(cls, v: int) -> int:
+        """Validate IAM validation cache TTL."""
+        if v < 0:
+            raise ValueError("IAM validation cache TTL must be non-negative")
+        return v
+
+
 class HandlerDiscoveryCacheConfig(BaseModel):
     """Handler discovery caching configuration."""
 
     enabled: bool = Field(True, description="Enable handler discovery caching")
     file: str = Field("handler_discovery.json", description="Handler discovery cache filename")
+    manifest: bool = Field(
+        True,
+        description="With a fresh cache, import each handler on first dispatch instead of all",
+    )
+
+
+class ResolutionPlanCacheConfig(BaseModel):
+    """DI resolution plan caching configuration."""
+
+    enabled: bool = Field(
+        False, description="Persist compiled DI resolution plans beside the handler cache"
+    )
+    file: str = Field("resolution_plans.json", description="Resolution plan cache filename")
 
 
 class RequestStatusCacheConfig(BaseModel):
@@ -131,14 +180,134 @@ class CachingConfig(BaseModel):
     ami_resolution: AMIResolutionCacheConfig = Field(
         default_factory=lambda: AMIResolutionCacheConfig()
     )
+    instance_types: InstanceTypeCacheConfig = Field(
+        default_factory=lambda: InstanceTypeCacheConfig()
+    )
+    iam_validation: IAMValidationCacheConfig = Field(
+        default_factory=lambda: IAMValidationCacheConfig()
+    )
     handler_discovery: HandlerDiscoveryCacheConfig = Field(
         default_factory=lambda: HandlerDiscoveryCacheConfig()
     )
+    resolution_plans: ResolutionPlanCacheConfig = Field(
+        default_factory=lambda: ResolutionPlanCacheConfig()
+    )
     request_status: RequestStatusCacheConfig = Field(
         default_factory=lambda: RequestStatusCacheConfig()
     )
 
 
+class RateLimitingConfig(BaseModel):
+    """Client-side API rate limiting configuration.
+
+    Limits are keyed by ``service:Action`` and may use ``fnmatch`` patterns;
+    the defaults follow EC2's documented per-account request token buckets.
+    """
+
+    enabled: bool = Field(True, description="Rate limit AWS API calls on the client side")
+    shared: bool = Field(
+        False, description="Share token buckets between processes through the work dir"
+    )
+    state_file: str = Field(
+        "rate_limits.db", description="Shared token bucket file, relative to the work dir cache"
+    )
+    default_rate: float = Field(20.0, description="Requests per second for unlisted actions")
+    default_burst: float = Field(100.0, description="Burst capacity for unlisted actions")
+    min_rate: float = Field(0.5, description="Lowest rate after repeated throttling")
+    decrease_factor: float = Field(0.5, description="Rate multiplier applied on each throttle")
+    increase_step: float = Field(
+        0.05, description="Fraction of the configured rate regained per successful call"
+    )
+    max_wait: float = Field(30.0, description="Longest wait for a token before calling anyway")
+    limits: Dict[str, Dict[str, float]] = Field(
+        default_factory=lambda: {
+            "ec2:Describe*": {"rate": 20.0, "burst": 100.0},
+            "ec2:*": {"rate": 5.0, "burst": 200.0},
+            "ec2:RunInstances": {"rate": 2.0, "burst": 1000.0},
+            "ec2:TerminateInstances": {"rate": 20.0, "burst": 1000.0},
+        },
+        description="Per-action rate and burst overrides",
+    )
+
+    @field_validator("default_rate", "min_rate")
+    @classmethod
+    def validate_rate(cls, v: float) -> float:
+        """Validate rates."""
+        if v <= 0:
+            raise ValueError("Rate must be positive")
+        return v
+
+    @field_validator("decrease_factor")
+    @classmethod
+    def validate_decrease_factor(cls, v: float) -> float:
+        """Validate throttle decrease factor."""
+        if not 0 < v < 1:
+            raise ValueError("Decrease factor must be between 0 and 1")
+        return v
+
+
+class HedgingConfig(BaseModel):
+    """Deadline-bounded and hedged read call configuration.
+
+    Calls of ``read_operations`` return by the running command's deadline
+    (``--deadline`` or ``HF_TIMEOUT``); with hedging enabled, a read slower
+    than its observed ``percentile`` latency gets a second, identical call.
+    Only idempotent reads may be listed.
+    """
+
+    enabled: bool = Field(False, description="Send a hedged second call for slow reads")
+    read_operations: List[str] = Field(
+        default_factory=lambda: [
+            "ec2:Describe*",
+            "autoscaling:Describe*",
+            "ssm:GetParameter*",
+            "sts:GetCallerIdentity",
+        ],
+        description="Idempotent read operations (service:Action, fnmatch patterns)",
+    )
+    percentile: float = Field(0.95, description="Latency percentile after which a read is hedged")
+    initial_delay: float = Field(
+        1.0, description="Hedge delay until enough latencies are recorded"
+    )
+    min_delay: float = Field(0.05, description="Shortest hedge delay in seconds")
+    max_delay: float = Field(5.0, description="Longest hedge delay in seconds")
+    min_samples: int = Field(20, description="Latencies recorded before using the percentile")
+    window: int = Field(500, description="Latencies kept per operation")
+    max_hedge_ratio: float = Field(0.1, description="Largest share of reads that may be hedged")
+
+    @field_validator("percentile", "max_hedge_ratio")
+    @classmethod
+    def validate_fraction(cls, v: float) -> float:
+        """Validate fractions."""
+        if not 0 < v <= 1:
+            raise ValueError("Value must be between 0 and 1")
+        return v
+
+
+class RetryBudgetConfig(BaseModel):
+    """Process-wide retry budget configuration.
+
+    Every call earns ``ratio`` of a retry and every retry spends a whole
+    one, so retries stay below that share of calls while a dependency is
+    failing; ``min_per_second`` keeps rarely made calls retryable.
+    """
+
+    enabled: bool = Field(True, description="Limit retries to a share of calls")
+    ratio: float = Field(0.2, description="Retries allowed per call")
+    min_per_second: float = Field(
+        1.0, description="Retries allowed per second regardless of call volume"
+    )
+    capacity: float = Field(50.0, description="Most retries that can be saved up")
+
+    @field_validator("ratio", "min_per_second", "capacity")
+    @classmethod
+    def validate_non_negative(cls, v: float) -> float:
+        """Validate budget amounts."""
+        if v < 0:
+            raise ValueError("Value must be non-negative")
+        return v
+
+
 class PerformanceConfig(BaseModel):
     """Performance optimization configuration."""
 
@@ -157,6 +326,9 @@ class PerformanceConfig(BaseModel):
         default_factory=lambda: AdaptiveBatchSizingConfig()
     )
     caching: CachingConfig = Field(default_factory=lambda: CachingConfig())
+    rate_limiting: RateLimitingConfig = Field(default_factory=lambda: RateLimitingConfig())
+    hedging: HedgingConfig = Field(default_factory=lambda: HedgingConfig())
+    retry_budget: RetryBudgetConfig = Field(default_factory=lambda: RetryBudgetConfig())
 
     @field_validator("max_workers")
     @classmethod
@@ -178,6 +350,14 @@ class PerformanceConfig(BaseModel):
 class CircuitBreakerConfig(BaseCircuitBreakerConfig):
     """Performance-focused circuit breaker configuration with service-specific settings."""
 
+    # Persist circuit state so consecutive CLI invocations share it
+    persist_state: bool = Field(
+        False, description="Share circuit state between processes through the work dir"
+    )
+    state_file: str = Field(
+        "circuit_breaker.db", description="Circuit state file, relative to the work dir cache"
+    )
+
     # Service-specific configurations
     service_configs: Dict[str, Dict[str, Any]] = Field(
         default_factory=lambda: {
@@ -50,6 +50,17 @@ class CORSConfig(BaseModel):
     credentials: bool = Field(False, description="Allow credentials")
 
 
+class SharedStateConfig(BaseModel):
+    """Cross-worker shared state configuration for multi-worker serving."""
+
+    enabled: bool = Field(
+        True, description="Share caches and circuit breaker state between workers"
+    )
+    path: Optional[str] = Field(
+        None, description="SQLite file for shared state (default: <work_dir>/shared_state.db)"
+    )
+
+
 class ServerConfig(BaseModel):
     """REST API server configuration."""
 
@@ -82,5 +93,11 @@ class ServerConfig(BaseModel):
     request_timeout: int = Field(30, description="Request timeout in seconds")
     max_request_size: int = Field(16 * 1024 * 1024, description="Maximum request size in bytes")
 
+    # Multi-worker shared state
+    shared_state: SharedStateConfig = Field(
+        default_factory=lambda: SharedStateConfig(),
+        description="Shared state used when running more than one worker",
+    )
+
     # Rate limiting (for future implementation)
     rate_limiting: Optional[Dict[str, Any]] = Field(None, description="Rate limiting configuration")
@@ -148,6 +148,36 @@ class RetryConfig(BaseModel):
         return v
 
 
+class RetentionConfig(BaseModel):
+    """Retention of terminal requests and their machines in live storage."""
+
+    archive_after_hours: int = Field(
+        72, description="Hours after completion before a terminal request is archived"
+    )
+    archive_ttl_days: Optional[int] = Field(
+        None, description="Days archived records are kept (DynamoDB TTL, None keeps forever)"
+    )
+    archive_interval: int = Field(
+        3600, description="Seconds between archive runs while the server runs (0 disables)"
+    )
+
+    @field_validator("archive_after_hours")
+    @classmethod
+    def validate_archive_after_hours(cls, v: int) -> int:
+        """Validate archive age."""
+        if v < 0:
+            raise ValueError("Archive age must be non-negative")
+        return v
+
+    @field_validator("archive_interval")
+    @classmethod
+    def validate_archive_interval(cls, v: int) -> int:
+        """Validate archive interval."""
+        if v < 0:
+            raise ValueError("Archive interval must be non-negative")
+        return v
+
+
 class StorageConfig(BaseModel):
     """Storage configuration."""
 
@@ -160,6 +190,7 @@ class StorageConfig(BaseModel):
     dynamodb_strategy: DynamodbStrategyConfig = Field(
         default_factory=lambda: DynamodbStrategyConfig()
     )
+    retention: RetentionConfig = Field(default_factory=lambda: RetentionConfig())
 
     @field_validator("strategy")
     @classmethod
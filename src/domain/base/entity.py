@@ -2,11 +2,14 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, List, Optional, TypeVar
+from typing import Any, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
+from domain.base.trusted_construction import construct_trusted
+
 T = TypeVar("T", bound="Entity")
+A = TypeVar("A", bound="AggregateRoot")
 
 
 class Entity(BaseModel, ABC):
@@ -41,6 +44,19 @@ class AggregateRoot(Entity):
         super().__init__(**data)
         self._domain_events: List[Any] = []
 
+    @classmethod
+    def rehydrate(cls: Type[A], **data: Any) -> A:
+        """
+        Rebuild an aggregate from state the application persisted itself.
+
+        Skips validation and ``__init__`` defaults, so every value must already
+        have its field type (value objects, enums, datetimes). Use the normal
+        constructor for data of unknown origin.
+        """
+        instance = construct_trusted(cls, data)
+        object.__setattr__(instance, "_domain_events", [])
+        return instance
+
     def add_domain_event(self, event: Any) -> None:
         """Add a domain event to be published."""
         self._domain_events.append(event)
@@ -0,0 +1,49 @@
+"""Instance Type Catalog Port - Interface for instance type specifications."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class InstanceTypeInfo:
+    """Hardware specification of a provider instance type."""
+
+    instance_type: str
+    vcpus: int
+    memory_mib: int
+    architectures: Tuple[str, ...] = ("x86_64",)
+    spot_supported: bool = True
+
+
+class InstanceTypeCatalogPort(ABC):
+    """
+    Port interface for looking up instance type specifications.
+
+    Used to derive scheduler attributes (CPU and memory) for templates and
+    to validate configured instance types without coupling to a provider API.
+    """
+
+    @abstractmethod
+    def get(self, instance_type: str) -> Optional[InstanceTypeInfo]:
+        """
+        Get the specification of an instance type.
+
+        Args:
+            instance_type: Instance type name (e.g. "m5.large")
+
+        Returns:
+            Instance type specification, or None if the type is unknown
+        """
+
+    @abstractmethod
+    def is_authoritative(self) -> bool:
+        """
+        Check whether the catalog lists every instance type offered.
+
+        A catalog loaded from the provider API is authoritative, so unknown
+        types are invalid; a partial offline snapshot is not.
+
+        Returns:
+            True if lookups for unknown types mean the type does not exist
+        """
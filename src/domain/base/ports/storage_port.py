@@ -1,7 +1,7 @@
 """Domain port for storage operations."""
 
 from abc import ABC, abstractmethod
-from typing import Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -21,6 +21,15 @@ class StoragePort(ABC, Generic[T]):
     def find_all(self) -> List[T]:
         """Find all entities."""
 
+    @abstractmethod
+    def find_page(
+        self,
+        criteria: Optional[Dict[str, Any]] = None,
+        after_id: Optional[str] = None,
+        limit: int = 500,
+    ) -> Dict[str, T]:
+        """Find one page of matching entities keyed by ID, in ascending ID order."""
+
     @abstractmethod
     def delete(self, entity_id: str) -> None:
         """Delete entity by ID."""
@@ -0,0 +1,85 @@
+"""Construction of domain models from trusted, already-validated state.
+
+Used when rehydrating records the application persisted itself: the data
+passed validation when it was saved, so rebuilding it only needs the field
+defaults filled in. Field defaults are resolved once per model class,
+which makes this cheaper than both validation and ``model_construct``.
+"""
+
+import copy
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+M = TypeVar("M", bound=BaseModel)
+
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, bytes, Enum, tuple, frozenset)
+
+# model class -> (field name, default, default factory, copy default)
+_FieldDefaults = Tuple[Tuple[str, Any, Optional[Callable[[], Any]], bool], ...]
+_field_defaults_cache: Dict[type, _FieldDefaults] = {}
+_field_names_cache: Dict[type, FrozenSet[str]] = {}
+
+_object_setattr = object.__setattr__
+
+
+def _field_defaults(cls: Type[BaseModel]) -> _FieldDefaults:
+    defaults = _field_defaults_cache.get(cls)
+    if defaults is None:
+        defaults = tuple(
+            (
+                name,
+                field.default,
+                field.default_factory,
+                not isinstance(field.default, _IMMUTABLE_DEFAULTS),
+            )
+            for name, field in cls.model_fields.items()
+        )
+        _field_defaults_cache[cls] = defaults
+    return defaults
+
+
+def construct_trusted(cls: Type[M], values: Mapping[str, Any]) -> M:
+    """
+    Build a model instance from field values without validating them.
+
+    Args:
+        cls: Model class
+        values: Field values, already of the declared field types (no other keys)
+
+    Returns:
+        Model instance whose ``model_fields_set`` is the keys of ``values``
+
+    Raises:
+        TypeError: If a required field is missing
+    """
+    if cls.__private_attributes__:
+        return cls.model_construct(**values)
+
+    field_names = _field_names_cache.get(cls)
+    if field_names is None:
+        field_names = _field_names_cache[cls] = frozenset(cls.model_fields)
+
+    if field_names <= values.keys():
+        # Every field supplied (the usual case when rehydrating): no defaults needed
+        state = dict(values)
+    else:
+        state = {}
+        for name, default, default_factory, copy_default in _field_defaults(cls):
+            if name in values:
+                state[name] = values[name]
+            elif default_factory is not None:
+                state[name] = default_factory()
+            elif default is PydanticUndefined:
+                raise TypeError(f"{cls.__name__} is missing required field '{name}'")
+            else:
+                state[name] = copy.deepcopy(default) if copy_default else default
+
+    instance = cls.__new__(cls)
+    _object_setattr(instance, "__dict__", state)
+    _object_setattr(instance, "__pydantic_fields_set__", set(values))
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(instance, "__pydantic_private__", None)
+    return instance
@@ -3,10 +3,12 @@
 import ipaddress
 from abc import ABC
 from enum import Enum
-from typing import ClassVar, Optional, TypeVar
+from typing import Any, ClassVar, Optional, Type, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
+from domain.base.trusted_construction import construct_trusted
+
 T = TypeVar("T", bound="ValueObject")
 
 
@@ -19,6 +21,11 @@ class ValueObject(BaseModel, ABC):
         arbitrary_types_allowed=True,
     )
 
+    @classmethod
+    def rehydrate(cls: Type[T], **values: Any) -> T:
+        """Rebuild a value object from persisted state without running validators."""
+        return construct_trusted(cls, values)
+
 
 class ResourceId(ValueObject):
     """Base class for resource identifiers."""
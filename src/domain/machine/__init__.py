@@ -9,11 +9,13 @@ from .exceptions import (
     MachineValidationError,
 )
 from .machine_status import MachineStatus
+from .read_models import MachineSummary
 from .repository import MachineRepository
 
 __all__: list[str] = [
     "Machine",
     "MachineStatus",
+    "MachineSummary",
     "MachineRepository",
     "MachineException",
     "MachineNotFoundError",
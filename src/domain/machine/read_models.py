@@ -0,0 +1,54 @@
+"""Machine read models - lightweight projections for bulk listings."""
+
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+
+@dataclass(frozen=True)
+class MachineSummary:
+    """
+    Read-only projection of a stored machine record.
+
+    Unlike the Machine aggregate, summaries are built straight from storage
+    records without value-object validation, tags or domain event tracking.
+    They are intended for listing and reporting paths that only read a few
+    fields per machine.
+    """
+
+    __slots__ = (
+        "instance_id",
+        "template_id",
+        "request_id",
+        "status",
+        "status_reason",
+        "instance_type",
+        "image_id",
+        "private_ip",
+        "public_ip",
+        "provider_type",
+        "launch_time",
+        "created_at",
+        "updated_at",
+        "metadata",
+    )
+
+    instance_id: str
+    template_id: Optional[str]
+    request_id: Optional[str]
+    status: str
+    status_reason: Optional[str]
+    instance_type: Optional[str]
+    image_id: Optional[str]
+    private_ip: Optional[str]
+    public_ip: Optional[str]
+    provider_type: Optional[str]
+    # Timestamps as stored: ISO strings, or datetimes from SQL storage
+    launch_time: Optional[Union[str, datetime]]
+    created_at: Optional[Union[str, datetime]]
+    updated_at: Optional[Union[str, datetime]]
+    metadata: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert summary to a dictionary using storage field names."""
+        return asdict(self)
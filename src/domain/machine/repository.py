@@ -1,13 +1,14 @@
 """Machine repository interface - contract for machine data access."""
 
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from domain.base.domain_interfaces import AggregateRepository
 from domain.base.value_objects import InstanceId
 
 from .aggregate import Machine
 from .machine_status import MachineStatus
+from .read_models import MachineSummary
 
 
 class MachineRepository(AggregateRepository[Machine]):
@@ -32,3 +33,21 @@ class MachineRepository(AggregateRepository[Machine]):
     @abstractmethod
     def find_active_machines(self) -> List[Machine]:
         """Find all active (non-terminated) machines."""
+
+    @abstractmethod
+    def find_summaries(self, criteria: Optional[Dict[str, Any]] = None) -> List[MachineSummary]:
+        """Find lightweight machine summaries matching criteria (all when None)."""
+
+    @abstractmethod
+    def iter_summaries(
+        self, criteria: Optional[Dict[str, Any]] = None, after_id: Optional[str] = None
+    ) -> Iterator[MachineSummary]:
+        """Iterate machine summaries in instance ID order, starting after after_id."""
+
+    @abstractmethod
+    def archive_by_request_ids(self, request_ids: List[str]) -> int:
+        """Move machines of the given requests to the archive, returning how many moved."""
+
+    @abstractmethod
+    def find_history(self, criteria: Optional[Dict[str, Any]] = None) -> List[Machine]:
+        """Find archived machines matching criteria (all when None)."""
@@ -9,12 +9,14 @@ from .exceptions import (
     RequestTimeoutError,
     RequestValidationError,
 )
+from .read_models import RequestSummary
 from .repository import RequestRepository
 
 __all__: list[str] = [
     "Request",
     "RequestStatus",
     "RequestType",
+    "RequestSummary",
     "RequestRepository",
     "RequestException",
     "RequestNotFoundError",
@@ -1,6 +1,6 @@
 """Request aggregate - core request domain logic."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from pydantic import ConfigDict, Field
@@ -10,6 +10,7 @@ from domain.base.events import (
     RequestCompletedEvent,
     RequestCreatedEvent,
     RequestStatusChangedEvent,
+    RequestTimeoutEvent,
 )
 from domain.base.value_objects import InstanceId
 from domain.request.request_types import RequestStatus
@@ -201,6 +202,58 @@ class Request(AggregateRoot):
 
         return updated_request
 
+    @property
+    def deadline(self) -> Optional[datetime]:
+        """Time after which an unfinished request times out (None without a timeout)."""
+        timeout = self.metadata.get("timeout")
+        if isinstance(timeout, bool) or not isinstance(timeout, int) or timeout <= 0:
+            return None
+        return self.created_at + timedelta(seconds=timeout)
+
+    def time_out(self) -> "Request":
+        """Mark an unfinished request whose deadline passed as timed out."""
+        if not self.status.can_transition_to(RequestStatus.TIMEOUT):
+            raise ValueError(f"Cannot time out request in status: {self.status}")
+
+        timeout = self.metadata.get("timeout", 0)
+        message = f"Request timed out after {timeout} seconds"
+        data = self.model_dump()
+        data["status"] = RequestStatus.TIMEOUT
+        data["status_message"] = message
+        data["completed_at"] = datetime.utcnow()
+        data["version"] = self.version + 1
+
+        updated_request = Request.model_validate(data)
+
+        request_id = str(self.request_id)
+        updated_request.add_domain_event(
+            RequestStatusChangedEvent(
+                aggregate_id=request_id,
+                aggregate_type="Request",
+                request_id=request_id,
+                request_type=self.request_type.value,
+                old_status=self.status.value,
+                new_status=RequestStatus.TIMEOUT.value,
+                reason=message,
+            )
+        )
+        updated_request.add_domain_event(
+            RequestTimeoutEvent(
+                aggregate_id=request_id,
+                aggregate_type="Request",
+                request_id=request_id,
+                request_type=self.request_type.value,
+                timeout_duration=timeout,
+                partial_results={
+                    "successful_count": self.successful_count,
+                    "failed_count": self.failed_count,
+                    "resource_ids": list(self.resource_ids),
+                },
+            )
+        )
+
+        return updated_request
+
     def fail(self, error_message: str, error_details: Optional[Dict[str, Any]] = None) -> "Request":
         """Mark request as failed."""
         data = self.model_dump()
@@ -0,0 +1,52 @@
+"""Request read models - lightweight projections for bulk listings."""
+
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class RequestSummary:
+    """
+    Read-only projection of a stored request record.
+
+    Summaries are built straight from storage records without constructing
+    the Request aggregate, so machine IDs stay plain strings and timestamps
+    stay as stored (ISO strings, or datetimes from SQL storage).
+    """
+
+    __slots__ = (
+        "request_id",
+        "template_id",
+        "request_type",
+        "status",
+        "status_message",
+        "requested_count",
+        "successful_count",
+        "failed_count",
+        "machine_ids",
+        "provider_api",
+        "created_at",
+        "completed_at",
+        "metadata",
+    )
+
+    request_id: str
+    template_id: Optional[str]
+    request_type: str
+    status: str
+    status_message: Optional[str]
+    requested_count: int
+    successful_count: int
+    failed_count: int
+    machine_ids: Tuple[str, ...]
+    provider_api: Optional[str]
+    created_at: Union[str, datetime]
+    completed_at: Optional[Union[str, datetime]]
+    metadata: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert summary to a dictionary using storage field names."""
+        data = asdict(self)
+        data["machine_ids"] = list(self.machine_ids)
+        return data
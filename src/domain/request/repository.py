@@ -2,11 +2,12 @@
 
 from abc import abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from domain.base.domain_interfaces import AggregateRepository
 
 from .aggregate import Request, RequestStatus, RequestType
+from .read_models import RequestSummary
 
 
 class RequestRepository(AggregateRepository[Request]):
@@ -35,3 +36,29 @@ class RequestRepository(AggregateRepository[Request]):
     @abstractmethod
     def find_by_date_range(self, start_date: datetime, end_date: datetime) -> List[Request]:
         """Find requests within date range."""
+
+    @abstractmethod
+    def find_summaries(self, criteria: Optional[Dict[str, Any]] = None) -> List[RequestSummary]:
+        """Find lightweight request summaries matching criteria (all when None)."""
+
+    @abstractmethod
+    def iter_summaries(
+        self, criteria: Optional[Dict[str, Any]] = None, after_id: Optional[str] = None
+    ) -> Iterator[RequestSummary]:
+        """Iterate request summaries in request ID order, starting after after_id."""
+
+    @abstractmethod
+    def find_deadlines(self) -> Dict[str, datetime]:
+        """Find deadlines of active requests that have a timeout, keyed by request ID."""
+
+    @abstractmethod
+    def find_archivable(self, completed_before: datetime) -> List[str]:
+        """Find IDs of terminal requests completed before the given time."""
+
+    @abstractmethod
+    def archive(self, request_ids: List[str]) -> int:
+        """Move requests from live storage to the archive, returning how many moved."""
+
+    @abstractmethod
+    def find_history(self, criteria: Optional[Dict[str, Any]] = None) -> List[Request]:
+        """Find archived requests matching criteria (all when None)."""
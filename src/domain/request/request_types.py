@@ -132,7 +132,11 @@ class RequestStatus(str, Enum):
             True if transition is valid, False otherwise
         """
         valid_transitions = {
-            RequestStatus.PENDING: [RequestStatus.IN_PROGRESS, RequestStatus.CANCELLED],
+            RequestStatus.PENDING: [
+                RequestStatus.IN_PROGRESS,
+                RequestStatus.CANCELLED,
+                RequestStatus.TIMEOUT,
+            ],
             RequestStatus.IN_PROGRESS: [
                 RequestStatus.COMPLETED,
                 RequestStatus.FAILED,
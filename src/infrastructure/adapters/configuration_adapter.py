@@ -127,6 +127,7 @@ class ConfigurationAdapter(ConfigurationPort):
                 "type": storage_config.get("type", "json"),
                 "path": storage_config.get("path", "data"),
                 "backup_enabled": storage_config.get("backup_enabled", True),
+                "retention": storage_config.get("retention", {}),
             }
         except Exception:
             return {"type": "json", "path": "data", "backup_enabled": True}
@@ -10,6 +10,7 @@ from infrastructure.error.decorators import (
     handle_application_exceptions,
     handle_exceptions,
 )
+from infrastructure.resilience.engine import RetryPolicy, get_retry_engine
 
 T = TypeVar("T")
 
@@ -31,27 +32,20 @@ class ErrorHandlingAdapter(ErrorHandlingPort):
         return handle_exceptions(context="error_logging", layer="application")(func)
 
     def retry_on_failure(self, max_retries: int = 3, delay: float = 1.0) -> Callable:
-        """Retry operations on failure."""
+        """Retry operations on failure, backing off with full jitter from ``delay`` seconds."""
 
         def decorator(func: Callable[..., T]) -> Callable[..., T]:
             """Decorator that applies retry logic to a function."""
+            policy = RetryPolicy(
+                callsite=getattr(func, "__name__", "operation"),
+                max_retries=max_retries,
+                base_delay=delay,
+            )
 
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> Any:
                 """Wrapper function that implements retry logic."""
-                last_exception = None
-                for attempt in range(max_retries + 1):
-                    try:
-                        return func(*args, **kwargs)
-                    except Exception as e:
-                        last_exception = e
-                        if attempt < max_retries:
-                            import time
-
-                            time.sleep(delay)
-                        else:
-                            raise last_exception
-                return None  # Should never reach here
+                return get_retry_engine().run(policy, func, *args, **kwargs)
 
             return wrapper
 
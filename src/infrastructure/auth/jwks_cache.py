@@ -0,0 +1,149 @@
+"""Cached JSON Web Key Set for verifying asymmetrically signed tokens."""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional
+
+import jwt
+
+from infrastructure.logging.logger import get_logger
+
+
+def fetch_jwks(url: str, timeout: float) -> Dict[str, Any]:
+    """
+    Fetch a JWKS document over HTTP.
+
+    Args:
+        url: JWKS endpoint
+        timeout: Request timeout in seconds
+
+    Returns:
+        Parsed JWKS document
+    """
+    import requests
+
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.json()
+
+
+class JWKSCache:
+    """
+    Signing keys from a JWKS endpoint, parsed once and cached.
+
+    Keys are refreshed:
+    - in the foreground once the set is older than ``ttl``;
+    - in the background once it is older than ``refresh_ahead * ttl``, so
+      requests keep using the current keys while a rotation is fetched;
+    - when a token names an unknown ``kid`` (the issuer rotated keys), at most
+      once per ``min_refresh_interval`` so forged key IDs cannot be used to
+      hammer the endpoint.
+
+    If a refresh fails, previously fetched keys keep being served. Concurrent
+    callers share one in-flight fetch, which runs in a worker thread.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl: float = 3600.0,
+        refresh_ahead: float = 0.8,
+        min_refresh_interval: float = 30.0,
+        timeout: float = 5.0,
+        fetcher: Optional[Callable[[str, float], Dict[str, Any]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            jwks_url: JWKS endpoint
+            ttl: Seconds after which keys must be re-fetched before use
+            refresh_ahead: Fraction of ttl after which keys are refreshed in the background
+            min_refresh_interval: Minimum seconds between fetches triggered by unknown kids
+                or failures
+            timeout: HTTP timeout in seconds
+            fetcher: Function fetching the JWKS document (defaults to an HTTP GET)
+            clock: Monotonic time source
+        """
+        self.jwks_url = jwks_url
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self._fetcher = fetcher or fetch_jwks
+        self._clock = clock
+        self._keys: Dict[str, Any] = {}
+        self._fetched_at: Optional[float] = None
+        self._attempted_at: Optional[float] = None
+        self._inflight: Optional[asyncio.Future] = None
+        self.logger = get_logger(__name__)
+
+    async def get_key(self, kid: str) -> Optional[Any]:
+        """
+        Get the verification key for a key ID.
+
+        Args:
+            kid: Key ID from the token header
+
+        Returns:
+            Key usable with ``jwt.decode``, or None if the issuer does not publish it
+        """
+        now = self._clock()
+        if self._fetched_at is None or now - self._fetched_at >= self.ttl:
+            if self._may_attempt(now):
+                await self.refresh()
+        elif now - self._fetched_at >= self.ttl * self.refresh_ahead:
+            self._start_refresh()
+
+        key = self._keys.get(kid)
+        if key is None and self._may_attempt(self._clock()):
+            self.logger.debug("Unknown JWKS key ID %s, refreshing keys", kid)
+            await self.refresh()
+            key = self._keys.get(kid)
+        return key
+
+    async def refresh(self) -> bool:
+        """
+        Fetch the key set now, joining a fetch that is already in flight.
+
+        Returns:
+            True if the keys were refreshed
+        """
+        return await asyncio.shield(self._start_refresh())
+
+    def _may_attempt(self, now: float) -> bool:
+        if self._inflight is not None and not self._inflight.done():
+            return True
+        return self._attempted_at is None or now - self._attempted_at >= self.min_refresh_interval
+
+    def _start_refresh(self) -> asyncio.Future:
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.ensure_future(self._fetch_keys())
+        return self._inflight
+
+    async def _fetch_keys(self) -> bool:
+        self._attempted_at = self._clock()
+        try:
+            jwks = await asyncio.to_thread(self._fetcher, self.jwks_url, self.timeout)
+            keys = self._parse_keys(jwks)
+        except Exception as e:
+            self.logger.warning("Failed to refresh JWKS from %s: %s", self.jwks_url, e)
+            return False
+
+        self._keys = keys
+        self._fetched_at = self._attempted_at
+        self.logger.debug("Loaded %s signing keys from %s", len(keys), self.jwks_url)
+        return True
+
+    def _parse_keys(self, jwks: Dict[str, Any]) -> Dict[str, Any]:
+        keys: Dict[str, Any] = {}
+        for jwk in jwks.get("keys", []):
+            kid = jwk.get("kid")
+            if not kid:
+                continue
+            try:
+                keys[kid] = jwt.PyJWK(jwk).key
+            except jwt.PyJWTError as e:
+                self.logger.warning("Skipping unusable JWKS key %s: %s", kid, e)
+        return keys
@@ -11,6 +11,7 @@ from infrastructure.adapters.ports.auth import (
     AuthResult,
     AuthStatus,
 )
+from infrastructure.auth.token_cache import VerifiedTokenCache
 from infrastructure.logging.logger import get_logger
 
 
@@ -23,6 +24,7 @@ class BearerTokenStrategy(AuthPort):
         algorithm: str = "HS256",
         token_expiry: int = 3600,  # 1 hour
         enabled: bool = True,
+        token_cache_size: int = 1024,
     ) -> None:
         """
         Initialize bearer token strategy.
@@ -32,12 +34,14 @@ class BearerTokenStrategy(AuthPort):
             algorithm: JWT algorithm to use
             token_expiry: Token expiry time in seconds
             enabled: Whether this strategy is enabled
+            token_cache_size: Number of verified tokens to cache (0 disables caching)
         """
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.token_expiry = token_expiry
         self.enabled = enabled
         self.logger = get_logger(__name__)
+        self._token_cache = VerifiedTokenCache(max_size=token_cache_size)
 
     async def authenticate(self, context: AuthContext) -> AuthResult:
         """
@@ -71,6 +75,10 @@ class BearerTokenStrategy(AuthPort):
         Returns:
             Authentication result with user information
         """
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+
         try:
             # Decode and verify JWT token
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
@@ -90,7 +98,7 @@ class BearerTokenStrategy(AuthPort):
 
             self.logger.debug("Token validated for user: %s", user_id)
 
-            return AuthResult(
+            result = AuthResult(
                 status=AuthStatus.SUCCESS,
                 user_id=user_id,
                 user_roles=user_roles,
@@ -104,6 +112,8 @@ class BearerTokenStrategy(AuthPort):
                     "issuer": payload.get("iss"),
                 },
             )
+            self._token_cache.put(token, result)
+            return result
 
         except jwt.ExpiredSignatureError:
             return AuthResult(status=AuthStatus.EXPIRED, error_message="Token has expired")
@@ -173,6 +183,7 @@ class BearerTokenStrategy(AuthPort):
         Returns:
             True if token was revoked
         """
+        self._token_cache.invalidate(token)
         self.logger.info("Token revocation requested (not implemented)")
         return True
 
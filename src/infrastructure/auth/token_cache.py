@@ -0,0 +1,106 @@
+"""Bounded cache of already-verified authentication tokens."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from infrastructure.adapters.ports.auth import AuthResult
+
+
+class VerifiedTokenCache:
+    """
+    LRU cache mapping token hashes to successful authentication results.
+
+    Tokens are keyed by their SHA-256 digest so raw credentials are not held
+    as dictionary keys. An entry never outlives the token's ``exp`` claim
+    (``AuthResult.expires_at``) nor ``max_ttl`` seconds, which bounds how long
+    a revoked key or changed role mapping can go unnoticed.
+
+    Cached results are shared between requests and must be treated as
+    read-only by callers.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        max_ttl: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached tokens (0 disables caching)
+            max_ttl: Maximum seconds an entry is served without re-verification
+            clock: Wall-clock source, comparable with JWT ``exp`` values
+        """
+        self.max_size = max_size
+        self.max_ttl = max_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[bytes, Tuple[AuthResult, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> Optional[AuthResult]:
+        """
+        Get the cached result for a token.
+
+        Args:
+            token: Raw token
+
+        Returns:
+            Cached successful result, or None if absent or expired
+        """
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            result, valid_until = entry
+            if self._clock() >= valid_until:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, token: str, result: AuthResult) -> None:
+        """
+        Cache a verification result.
+
+        Only successful results are cached; failures are always re-evaluated.
+
+        Args:
+            token: Raw token
+            result: Result of full verification
+        """
+        if self.max_size <= 0 or not result.is_authenticated:
+            return
+
+        valid_until = self._clock() + self.max_ttl
+        if result.expires_at is not None:
+            valid_until = min(valid_until, float(result.expires_at))
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (result, valid_until)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> None:
+        """Remove a token from the cache (e.g. on revocation)."""
+        with self._lock:
+            self._entries.pop(self._key(token), None)
+
+    def clear(self) -> None:
+        """Remove all cached tokens."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
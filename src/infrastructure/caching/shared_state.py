@@ -0,0 +1,278 @@
+"""Cross-process key/value store for state shared by REST API workers.
+
+Each uvicorn worker is a separate process, so in-memory caches and circuit
+breaker state are per worker: workers disagree about what they have seen
+and each one repeats the same AWS calls. Components that can benefit from
+sharing opt into this store, which keeps JSON values with optional TTLs in
+a local SQLite database (WAL mode, so readers never block the writer).
+
+The store is only configured in multi-worker serve mode. ``serve`` exports
+``HF_SHARED_STATE_PATH`` before the workers start and each worker opens the
+same database lazily through :func:`get_shared_state`; in every other mode
+it returns None and components keep their in-process behaviour.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from infrastructure.logging.logger import get_logger
+from infrastructure.serialization.json_codec import get_json_codec
+
+SHARED_STATE_ENV_VAR = "HF_SHARED_STATE_PATH"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS shared_state (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+class SharedStateStore:
+    """
+    SQLite-backed key/value store with TTLs and atomic read-modify-write.
+
+    Values are JSON documents grouped by namespace. Connections are opened per
+    thread and reopened after ``fork`` so the store can be created before
+    uvicorn starts its workers.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        busy_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite database file shared by all processes
+            busy_timeout: Seconds to wait for another process's write lock
+            clock: Wall-clock source used for expiry
+        """
+        self.path = path
+        self._busy_timeout = busy_timeout
+        self._clock = clock
+        self._local = threading.local()
+        self._codec = get_json_codec()
+        self._logger = get_logger(__name__)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute(_SCHEMA)
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        """
+        Get a value.
+
+        Args:
+            namespace: Namespace of the key
+            key: Key to read
+            default: Returned when the key is missing or expired
+
+        Returns:
+            Stored value or ``default``
+        """
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value, expires_at FROM shared_state WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            )
+            .fetchone()
+        )
+        if row is None or self._expired(row[1]):
+            return default
+        return self._codec.loads(row[0])
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            namespace: Namespace of the key
+            key: Key to write
+            value: JSON-serializable value
+            ttl: Seconds until the value expires (None keeps it until deleted)
+        """
+        with self._transaction() as conn:
+            self._write(conn, namespace, key, value, ttl)
+
+    def delete(self, namespace: str, key: str) -> None:
+        """Delete a value if present."""
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM shared_state WHERE namespace = ? AND key = ?", (namespace, key)
+            )
+
+    def clear(self, namespace: str) -> None:
+        """Delete every value in a namespace."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM shared_state WHERE namespace = ?", (namespace,))
+
+    def update(
+        self,
+        namespace: str,
+        key: str,
+        update_func: Callable[[Any], Any],
+        default: Any = None,
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Atomically read, modify and write a value.
+
+        The write lock is held for the whole call, so concurrent updates from
+        other processes are serialized rather than lost.
+
+        Args:
+            namespace: Namespace of the key
+            key: Key to update
+            update_func: Receives the current value (or ``default``) and returns the new one
+            default: Current value to use when the key is missing or expired
+            ttl: Seconds until the new value expires
+
+        Returns:
+            The new value
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM shared_state WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+            if row is None or self._expired(row[1]):
+                current = default
+            else:
+                current = self._codec.loads(row[0])
+            value = update_func(current)
+            self._write(conn, namespace, key, value, ttl)
+            return value
+
+    def increment(self, namespace: str, key: str, amount: int = 1) -> int:
+        """Atomically increment an integer counter and return its new value."""
+        return self.update(namespace, key, lambda current: current + amount, default=0)
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired values.
+
+        Returns:
+            Number of values deleted
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM shared_state WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (self._clock(),),
+            )
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _expired(self, expires_at: Optional[float]) -> bool:
+        return expires_at is not None and expires_at <= self._clock()
+
+    def _write(
+        self,
+        conn: sqlite3.Connection,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float],
+    ) -> None:
+        expires_at = self._clock() + ttl if ttl is not None else None
+        conn.execute(
+            "INSERT OR REPLACE INTO shared_state (namespace, key, value, expires_at) "
+            "VALUES (?, ?, ?, ?)",
+            (namespace, key, self._codec.dumps(value), expires_at),
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            # Connections must not cross a fork; open a fresh one per process and thread
+            conn = sqlite3.connect(self.path, timeout=self._busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _transaction(self) -> "_ImmediateTransaction":
+        return _ImmediateTransaction(self._connection())
+
+
+class _ImmediateTransaction:
+    """Context manager taking the database write lock up front."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+_shared_state: Optional[SharedStateStore] = None
+_unavailable_path: Optional[str] = None
+_shared_state_lock = threading.Lock()
+
+
+def configure_shared_state(path: Optional[str]) -> Optional[SharedStateStore]:
+    """
+    Enable (or with None, disable) the shared state store for this process and its children.
+
+    Args:
+        path: SQLite database file, or None to disable sharing
+
+    Returns:
+        The configured store, or None when disabled
+    """
+    global _shared_state
+    with _shared_state_lock:
+        if path is None:
+            os.environ.pop(SHARED_STATE_ENV_VAR, None)
+            _shared_state = None
+            return None
+        os.environ[SHARED_STATE_ENV_VAR] = path
+        _shared_state = SharedStateStore(path)
+        return _shared_state
+
+
+def get_shared_state() -> Optional[SharedStateStore]:
+    """
+    Get the shared state store, if shared state is enabled.
+
+    Returns:
+        Store opened on ``HF_SHARED_STATE_PATH``, or None outside multi-worker serve mode
+    """
+    global _shared_state, _unavailable_path
+    if _shared_state is not None:
+        return _shared_state
+    path = os.environ.get(SHARED_STATE_ENV_VAR)
+    if not path or path == _unavailable_path:
+        return None
+    with _shared_state_lock:
+        if _shared_state is None:
+            try:
+                _shared_state = SharedStateStore(path)
+            except (OSError, sqlite3.Error) as e:
+                get_logger(__name__).warning("Shared state disabled, cannot open %s: %s", path, e)
+                _unavailable_path = path
+                return None
+        return _shared_state
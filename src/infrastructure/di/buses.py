@@ -13,7 +13,7 @@ SOLID principles and CQRS best practices:
 No middleware complexity - handlers own their cross-cutting concerns.
 """
 
-from typing import TypeVar
+from typing import Any, Callable, Type, TypeVar
 
 from application.decorators import (
     get_command_handler_for_type,
@@ -22,12 +22,43 @@ from application.decorators import (
 from application.interfaces.command_query import Command, Query
 from domain.base.ports import LoggingPort
 from infrastructure.di.container import DIContainer
+from infrastructure.di.handler_manifest import (
+    COMMAND_HANDLERS,
+    QUERY_HANDLERS,
+    get_handler_manifest,
+)
 
 TQuery = TypeVar("TQuery", bound=Query)
 TCommand = TypeVar("TCommand", bound=Command)
 TResult = TypeVar("TResult")
 
 
+def _resolve_handler(
+    container: DIContainer, message_type: Type, lookup: Callable[[Type], Type], kind: str
+) -> Any:
+    """
+    Get the handler instance for a command or query type.
+
+    Handlers that are not imported yet are imported from the handler
+    manifest on their first dispatch, and registered as singletons.
+
+    Raises:
+        KeyError: If no handler is registered or in the manifest
+    """
+    try:
+        handler_class = lookup(message_type)
+    except KeyError:
+        manifest = get_handler_manifest()
+        if manifest is None:
+            raise
+        manifest.load_handler(kind, message_type)
+        handler_class = lookup(message_type)
+
+    if not container.is_registered(handler_class):
+        container.register_singleton(handler_class)
+    return container.get(handler_class)
+
+
 class QueryBus:
     """
     Pure CQRS Query Bus - Thin routing layer only.
@@ -63,8 +94,7 @@ class QueryBus:
         """
         try:
             # Pure routing - get handler and delegate
-            handler_class = get_query_handler_for_type(type(query))
-            handler = self.container.get(handler_class)
+            handler = self._get_handler(type(query))
             return await handler.handle(query)
 
         except KeyError:
@@ -78,8 +108,7 @@ class QueryBus:
 
                 # Try again after lazy setup
                 try:
-                    handler_class = get_query_handler_for_type(type(query))
-                    handler = self.container.get(handler_class)
+                    handler = self._get_handler(type(query))
                     return await handler.handle(query)
                 except KeyError:
                     self.logger.error(
@@ -94,6 +123,12 @@ class QueryBus:
             self.logger.error("Query execution failed: %s", str(e))
             raise
 
+    def _get_handler(self, query_type: Type) -> Any:
+        """Get the handler instance for a query type, importing it on first dispatch."""
+        return _resolve_handler(
+            self.container, query_type, get_query_handler_for_type, QUERY_HANDLERS
+        )
+
     def _trigger_lazy_cqrs_setup(self) -> None:
         """Trigger lazy CQRS infrastructure setup."""
         try:
@@ -139,8 +174,7 @@ class CommandBus:
         """
         try:
             # Pure routing - get handler and delegate
-            handler_class = get_command_handler_for_type(type(command))
-            handler = self.container.get(handler_class)
+            handler = self._get_handler(type(command))
             return await handler.handle(command)
 
         except KeyError:
@@ -154,8 +188,7 @@ class CommandBus:
 
                 # Try again after lazy setup
                 try:
-                    handler_class = get_command_handler_for_type(type(command))
-                    handler = self.container.get(handler_class)
+                    handler = self._get_handler(type(command))
                     return await handler.handle(command)
                 except KeyError:
                     self.logger.error(
@@ -170,6 +203,12 @@ class CommandBus:
             self.logger.error("Command execution failed: %s", str(e))
             raise
 
+    def _get_handler(self, command_type: Type) -> Any:
+        """Get the handler instance for a command type, importing it on first dispatch."""
+        return _resolve_handler(
+            self.container, command_type, get_command_handler_for_type, COMMAND_HANDLERS
+        )
+
     def _trigger_lazy_cqrs_setup(self) -> None:
         """Trigger lazy CQRS infrastructure setup."""
         try:
@@ -9,6 +9,11 @@ from typing import Any, Callable, Dict, Optional, Set, Type, TypeVar, get_type_h
 
 from domain.base.dependency_injection import get_injectable_metadata, is_injectable
 from domain.base.di_contracts import DependencyRegistration, DILifecycle, DIScope
+from infrastructure.di.components.resolution_plan import (
+    ParameterPlan,
+    ResolutionPlan,
+    ResolutionPlanStore,
+)
 from infrastructure.di.exceptions import (
     CircularDependencyError,
     DependencyResolutionError,
@@ -31,6 +36,8 @@ class DependencyResolver:
         self._cqrs_registry = cqrs_registry
         self._lock = threading.RLock()
         self._resolution_cache: Dict[Type, Any] = {}
+        self._plans: Dict[Type, ResolutionPlan] = {}
+        self._plan_store: Optional[ResolutionPlanStore] = None
 
     def resolve(
         self,
@@ -183,11 +190,37 @@ class DependencyResolver:
     def _resolve_constructor_parameters(
         self, cls: Type, dependency_chain: Set[Type]
     ) -> Dict[str, Any]:
-        """Resolve constructor parameters for a class."""
+        """Resolve constructor parameters for a class by following its resolution plan."""
+        parameters = {}
+        for name, dependency_type, required in self._get_plan(cls):
+            if required:
+                parameters[name] = self.resolve(dependency_type, cls, dependency_chain)
+            else:
+                # Optional parameter - try to resolve, use default if not available
+                with suppress(DependencyResolutionError, UnregisteredDependencyError):
+                    parameters[name] = self.resolve(dependency_type, cls, dependency_chain)
+        return parameters
+
+    def _get_plan(self, cls: Type) -> ResolutionPlan:
+        """Get the resolution plan of a class, compiling it on first use."""
+        plan = self._plans.get(cls)
+        if plan is not None:
+            return plan
+
+        plan = self._plan_store.load(cls) if self._plan_store else None
+        if plan is None:
+            plan = self._compile_plan(cls)
+            if self._plan_store:
+                self._plan_store.store(cls, plan)
+        self._plans[cls] = plan
+        return plan
+
+    def _compile_plan(self, cls: Type) -> ResolutionPlan:
+        """Compile the constructor of a class into the dependencies to resolve, in order."""
         try:
             # Get constructor signature
             signature = inspect.signature(cls.__init__)
-            parameters = {}
+            plan = []
 
             # Get type hints
             type_hints = get_type_hints(cls.__init__)
@@ -231,16 +264,11 @@ class DependencyResolver:
                             f"Primitive types must have default values or be provided explicitly.",
                         )
 
-                # Resolve dependency
-                if param.default == inspect.Parameter.empty:
-                    # Required parameter
-                    parameters[param_name] = self.resolve(param_type, cls, dependency_chain)
-                else:
-                    # Optional parameter - try to resolve, use default if not available
-                    with suppress(DependencyResolutionError, UnregisteredDependencyError):
-                        parameters[param_name] = self.resolve(param_type, cls, dependency_chain)
+                plan.append(
+                    ParameterPlan(param_name, param_type, param.default == inspect.Parameter.empty)
+                )
 
-            return parameters
+            return tuple(plan)
 
         except Exception as e:
             if isinstance(
@@ -258,6 +286,21 @@ class DependencyResolver:
                     f"Failed to resolve constructor parameters for { cls.__name__}: { str(e)}",
                 )
 
+    def set_plan_store(self, plan_store: Optional[ResolutionPlanStore]) -> None:
+        """
+        Persist compiled resolution plans so later processes skip reflection.
+
+        Args:
+            plan_store: Store to load plans from and save new plans to (None disables)
+        """
+        with self._lock:
+            self._plan_store = plan_store
+
+    def save_plans(self) -> None:
+        """Write newly compiled resolution plans to the plan store."""
+        if self._plan_store:
+            self._plan_store.save()
+
     def _resolve_function_parameters(
         self, func: Callable, dependency_chain: Set[Type]
     ) -> Dict[str, Any]:
@@ -412,4 +455,5 @@ class DependencyResolver:
         """Clear resolution cache."""
         with self._lock:
             self._resolution_cache.clear()
+            self._plans.clear()
             logger.debug("Dependency resolution cache cleared")
@@ -0,0 +1,160 @@
+"""Compiled constructor resolution plans and their persistent store."""
+
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Tuple, Type
+
+logger = logging.getLogger(__name__)
+
+PLAN_CACHE_VERSION = "1.1"
+
+
+class ParameterPlan(NamedTuple):
+    """How to provide one constructor parameter."""
+
+    name: str
+    dependency_type: Any
+    required: bool
+
+
+ResolutionPlan = Tuple[ParameterPlan, ...]
+
+
+class ResolutionPlanStore:
+    """
+    Resolution plans persisted in the work dir cache.
+
+    A plan is reused by a later process only while the source file of the
+    planned class is unchanged, so editing a constructor recompiles it.
+    Plans whose dependency types cannot be referenced by module and name
+    (e.g. ``Optional[...]``) are kept in memory only.
+    """
+
+    def __init__(self, cache_file: str) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            cache_file: Path of the plan cache file
+        """
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+
+    def load(self, cls: Type) -> Optional[ResolutionPlan]:
+        """
+        Get the persisted plan of ``cls`` if it is still valid.
+
+        Args:
+            cls: Class to construct
+
+        Returns:
+            Plan, or None if there is none or the class changed since it was saved
+        """
+        with self._lock:
+            entry = self._get_entries().get(type_key(cls))
+        if not entry or entry.get("source_mtime") != _source_mtime(cls):
+            return None
+        try:
+            return tuple(
+                ParameterPlan(name, import_type(dependency_key), required)
+                for name, dependency_key, required in entry["parameters"]
+            )
+        except (ImportError, AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.debug("Ignoring stale resolution plan of %s: %s", cls.__name__, e)
+            return None
+
+    def store(self, cls: Type, plan: ResolutionPlan) -> None:
+        """
+        Remember the plan of ``cls`` for the next :meth:`save`.
+
+        Args:
+            cls: Planned class
+            plan: Compiled plan
+        """
+        if not all(isinstance(p.dependency_type, type) for p in plan):
+            return
+        mtime = _source_mtime(cls)
+        if mtime is None:
+            return
+        entry = {
+            "source_mtime": mtime,
+            "parameters": [[p.name, type_key(p.dependency_type), p.required] for p in plan],
+        }
+        with self._lock:
+            entries = self._get_entries()
+            if entries.get(type_key(cls)) != entry:
+                entries[type_key(cls)] = entry
+                self._dirty = True
+
+    def save(self) -> None:
+        """Write new plans to the cache file, keeping plans saved by other processes."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = {**self._read(), **self._entries}
+            self._dirty = False
+
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump({"version": PLAN_CACHE_VERSION, "plans": entries}, f)
+            os.replace(tmp_file, self.cache_file)
+            logger.debug("Saved %s resolution plans to %s", len(entries), self.cache_file)
+        except OSError as e:
+            logger.debug("Could not save resolution plans: %s", e)
+
+    def _get_entries(self) -> Dict[str, Dict[str, Any]]:
+        """Get the entries, reading the cache file on first use (caller holds the lock)."""
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file) as f:
+                data = json.load(f)
+            if data.get("version") != PLAN_CACHE_VERSION:
+                return {}
+            return dict(data.get("plans", {}))
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug("Ignoring unreadable resolution plan cache %s: %s", self.cache_file, e)
+            return {}
+
+
+def type_key(cls: Type) -> str:
+    """Get the ``module:qualname`` reference of a class."""
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def import_type(key: str) -> Type:
+    """Import the class referenced by a ``module:qualname`` key."""
+    module_name, qualname = key.split(":", 1)
+    obj: Any = sys.modules.get(module_name) or importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _source_mtime(cls: Type) -> Optional[float]:
+    """Newest modification time of the modules defining ``cls`` and its bases."""
+    source_files = set()
+    for klass in cls.__mro__:
+        source_file = getattr(sys.modules.get(klass.__module__), "__file__", None)
+        if source_file:
+            source_files.add(source_file)
+        elif klass is cls:
+            return None
+    try:
+        # An inherited __init__ is defined by a base's module
+        return max(os.path.getmtime(source_file) for source_file in source_files)
+    except OSError:
+        return None
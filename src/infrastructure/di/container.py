@@ -2,6 +2,7 @@
 Dependency Injection Container Implementation
 """
 
+import atexit
 import threading
 import time
 from contextlib import contextmanager
@@ -95,6 +96,7 @@ class DIContainer(DIContainerPort, CQRSHandlerRegistrationPort, ContainerPort):
         self._lazy_config = LazyLoadingConfig.from_config_manager()
         self._lazy_factories: Dict[Type, Any] = {}
         self._on_demand_registrations: Dict[Type, Any] = {}
+        self._plan_cache_file: Optional[str] = None
 
         logger.info(
             "DI Container initialized (lazy_loading=%s)",
@@ -300,6 +302,25 @@ class DIContainer(DIContainerPort, CQRSHandlerRegistrationPort, ContainerPort):
         """Get the lazy loading configuration."""
         return self._lazy_config
 
+    def enable_resolution_plan_cache(self, cache_file: str) -> None:
+        """
+        Persist compiled resolution plans, so later processes skip constructor reflection.
+
+        New plans are written when the process exits.
+
+        Args:
+            cache_file: Path of the resolution plan cache
+        """
+        from infrastructure.di.components.resolution_plan import ResolutionPlanStore
+
+        with self._lock:
+            if self._plan_cache_file == cache_file:
+                return
+            if self._plan_cache_file is None:
+                atexit.register(self._dependency_resolver.save_plans)
+            self._plan_cache_file = cache_file
+            self._dependency_resolver.set_plan_store(ResolutionPlanStore(cache_file))
+
     def clear(self) -> None:
         """Clear all registrations."""
         with self._lock:
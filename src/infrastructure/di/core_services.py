@@ -30,13 +30,8 @@ def register_core_services(container: DIContainer) -> None:
     # Register provider strategy
     container.register_factory(ProviderPort, lambda c: _create_provider_strategy(c))
 
-    # Register event publisher
-    from infrastructure.events.publisher import ConfigurableEventPublisher
-
-    container.register_factory(
-        EventPublisherPort,
-        lambda c: ConfigurableEventPublisher(mode="logging"),  # Default to logging mode
-    )
+    # Register event publisher (singleton: async mode owns a dispatcher thread)
+    container.register_singleton(EventPublisherPort, lambda c: _create_event_publisher(c))
 
     # Register command and query buses with factory functions
     container.register_factory(
@@ -72,6 +67,40 @@ def _create_scheduler_strategy(container: DIContainer) -> SchedulerPort:
     return factory.create_strategy(scheduler_type, container)
 
 
+def _create_event_publisher(container: DIContainer) -> EventPublisherPort:
+    """Create event publisher from events configuration."""
+    from config.schemas.common_schema import EventsConfig
+    from infrastructure.events.publisher import ConfigurableEventPublisher
+
+    try:
+        events_config = container.get(ConfigurationPort).get_typed(EventsConfig)
+    except Exception:
+        events_config = EventsConfig()
+
+    event_log = None
+    if events_config.enabled and events_config.log_enabled:
+        from infrastructure.events.event_log import EventLogWriter
+
+        event_log = EventLogWriter(
+            events_config.events_dir,
+            max_bytes=events_config.log_max_bytes,
+            max_age_seconds=events_config.log_rotate_seconds,
+            retention_seconds=events_config.event_retention_days * 86400,
+            fsync=events_config.log_fsync,
+        )
+
+    return ConfigurableEventPublisher(
+        mode=events_config.publisher_mode,
+        pipeline_options={
+            "max_queue_size": events_config.queue_size,
+            "batch_size": events_config.batch_size,
+            "max_batch_delay": events_config.batch_delay_ms / 1000,
+            "telemetry_sample_rate": events_config.telemetry_sample_rate,
+        },
+        event_log=event_log,
+    )
+
+
 def _create_storage_strategy(container: DIContainer) -> StoragePort:
     """Create storage strategy using factory."""
     from infrastructure.factories.storage_strategy_factory import StorageStrategyFactory
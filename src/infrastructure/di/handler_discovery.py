@@ -30,6 +30,7 @@ from application.decorators import (
     get_registered_query_handlers,
 )
 from infrastructure.di.container import DIContainer
+from infrastructure.di.handler_manifest import HandlerManifest, set_handler_manifest
 from infrastructure.logging.logger import get_logger
 
 logger = get_logger(__name__)
@@ -59,14 +60,21 @@ class HandlerDiscoveryService:
             perf_config = config_manager.get_typed(PerformanceConfig)
 
             self.cache_enabled = perf_config.caching.handler_discovery.enabled
+            self.manifest_enabled = perf_config.caching.handler_discovery.manifest
             self.cache_file = (
                 self._resolve_cache_path(config_manager) if self.cache_enabled else None
             )
 
+            plan_config = perf_config.caching.resolution_plans
+            if plan_config.enabled:
+                cache_dir = os.path.dirname(self._resolve_cache_path(config_manager))
+                container.enable_resolution_plan_cache(os.path.join(cache_dir, plan_config.file))
+
         except Exception as e:
             logger.warning("Failed to get caching configuration: %s", e)
             # Fallback to default behavior
             self.cache_enabled = True
+            self.manifest_enabled = False
             self.cache_file = self._resolve_cache_path_fallback()
 
     def _resolve_cache_path(self, config_manager) -> str:
@@ -98,6 +106,9 @@ class HandlerDiscoveryService:
 
         # Try to load from cache first
         cached_result = self._try_load_from_cache(base_package)
+        if cached_result and self.manifest_enabled and cached_result.get("manifest"):
+            self._register_handlers_from_manifest(cached_result["manifest"])
+            return
         if cached_result:
             logger.info(
                 "Using cached handler discovery (%s handlers)", cached_result["total_handlers"]
@@ -245,6 +256,9 @@ class HandlerDiscoveryService:
                     "query_handlers": self._serialize_handlers(query_handlers),
                     "command_handlers": self._serialize_handlers(command_handlers),
                 },
+                "manifest": HandlerManifest.from_handlers(
+                    query_handlers, command_handlers
+                ).to_dict(),
             }
 
             # Atomic write to prevent corruption
@@ -261,6 +275,20 @@ class HandlerDiscoveryService:
             logger.debug("Failed to save cache: %s", e)
             # Continue without caching - not critical for functionality
 
+    def _register_handlers_from_manifest(self, manifest_data: Dict[str, Dict[str, str]]) -> None:
+        """
+        Register handlers from the cached manifest without importing them.
+
+        The buses import each handler module when its command or query is
+        first dispatched.
+        """
+        manifest = HandlerManifest(manifest_data)
+        set_handler_manifest(manifest)
+        logger.info(
+            "Handler registration from manifest complete. %s handlers load on first use",
+            len(manifest),
+        )
+
     def _register_handlers_from_cache(self, cached_handlers: Dict[str, Any]) -> None:
         """Register handlers from cached information."""
         try:
@@ -0,0 +1,127 @@
+"""Handler manifest: CQRS handler locations known without importing them.
+
+Handler discovery records, for every command and query type, the module
+and qualified name of its handler. When the manifest is installed the
+buses look a handler up here the first time its message is dispatched and
+import only that handler's module; its ``@command_handler`` or
+``@query_handler`` decorator then registers it as usual. A CLI command
+therefore imports the handlers it dispatches to, not all of them.
+"""
+
+import threading
+from typing import Dict, Optional, Type
+
+from infrastructure.di.components.resolution_plan import import_type, type_key
+from infrastructure.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+QUERY_HANDLERS = "query_handlers"
+COMMAND_HANDLERS = "command_handlers"
+
+
+class HandlerManifest:
+    """Locations of command and query handlers, keyed by message type."""
+
+    def __init__(self, entries: Optional[Dict[str, Dict[str, str]]] = None) -> None:
+        """
+        Initialize the manifest.
+
+        Args:
+            entries: ``{kind: {message "module:qualname": handler "module:qualname"}}``
+        """
+        self.entries = {
+            QUERY_HANDLERS: dict((entries or {}).get(QUERY_HANDLERS, {})),
+            COMMAND_HANDLERS: dict((entries or {}).get(COMMAND_HANDLERS, {})),
+        }
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_handlers(
+        cls, query_handlers: Dict[Type, Type], command_handlers: Dict[Type, Type]
+    ) -> "HandlerManifest":
+        """
+        Build a manifest from the handler registries.
+
+        Args:
+            query_handlers: Query type to handler class
+            command_handlers: Command type to handler class
+
+        Returns:
+            Manifest of the handlers
+        """
+        return cls(
+            {
+                QUERY_HANDLERS: {
+                    type_key(message): type_key(handler)
+                    for message, handler in query_handlers.items()
+                },
+                COMMAND_HANDLERS: {
+                    type_key(message): type_key(handler)
+                    for message, handler in command_handlers.items()
+                },
+            }
+        )
+
+    def to_dict(self) -> Dict[str, Dict[str, str]]:
+        """Serialize the manifest for the discovery cache."""
+        return {kind: dict(handlers) for kind, handlers in self.entries.items()}
+
+    def __len__(self) -> int:
+        """Get the number of handlers in the manifest."""
+        return sum(len(handlers) for handlers in self.entries.values())
+
+    def load_handler(self, kind: str, message_type: Type) -> Type:
+        """
+        Import the handler of a message type.
+
+        Args:
+            kind: QUERY_HANDLERS or COMMAND_HANDLERS
+            message_type: Command or query type being dispatched
+
+        Returns:
+            Handler class
+
+        Raises:
+            KeyError: If the manifest has no importable handler for the type
+        """
+        handler_key = self.entries[kind].get(type_key(message_type))
+        if handler_key is None:
+            raise KeyError(f"No handler in manifest for {message_type.__name__}")
+
+        with self._lock:
+            try:
+                handler_class = import_type(handler_key)
+            except (ImportError, AttributeError, ValueError) as e:
+                logger.warning("Handler %s from manifest not importable: %s", handler_key, e)
+                raise KeyError(f"Handler {handler_key} not importable") from e
+
+        logger.debug("Imported handler %s for %s", handler_key, message_type.__name__)
+        return handler_class
+
+    def load_all(self) -> None:
+        """Import every handler in the manifest, e.g. to enumerate all of them."""
+        with self._lock:
+            for handlers in self.entries.values():
+                for handler_key in handlers.values():
+                    try:
+                        import_type(handler_key)
+                    except (ImportError, AttributeError, ValueError) as e:
+                        logger.warning(
+                            "Handler %s from manifest not importable: %s", handler_key, e
+                        )
+
+
+_manifest: Optional[HandlerManifest] = None
+
+
+def set_handler_manifest(manifest: Optional[HandlerManifest]) -> None:
+    """Install the manifest the buses use for handlers that are not imported yet."""
+    global _manifest
+    _manifest = manifest
+
+
+def get_handler_manifest() -> Optional[HandlerManifest]:
+    """Get the installed handler manifest, if any."""
+    return _manifest
+
@@ -22,6 +22,65 @@ def register_infrastructure_services(container: DIContainer) -> None:
     # Register repository services
     _register_repository_services(container)
 
+    _configure_circuit_breaker_persistence(container)
+
+    _configure_retry_engine(container)
+
+
+def _configure_circuit_breaker_persistence(container: DIContainer) -> None:
+    """Persist circuit breaker state in the work dir when enabled."""
+    import os
+
+    from config.schemas.app_schema import AppConfig
+    from infrastructure.caching.shared_state import SharedStateStore
+    from infrastructure.resilience.strategy.circuit_breaker import configure_state_store
+
+    logger = get_logger(__name__)
+    try:
+        config = container.get(ConfigurationPort)
+        breaker_config = config.get_typed(AppConfig).circuit_breaker
+        if not breaker_config.persist_state:
+            return
+        path = os.path.join(config.get_work_dir(), "cache", breaker_config.state_file)
+    except Exception as e:
+        logger.debug("Circuit breaker state persistence not configured: %s", e)
+        return
+
+    configure_state_store(lambda: SharedStateStore(path))
+    logger.debug("Circuit breaker state persisted in %s", path)
+
+
+def _configure_retry_engine(container: DIContainer) -> None:
+    """Size the process-wide retry budget from configuration and export retry metrics."""
+    from config.schemas.performance_schema import PerformanceConfig
+    from infrastructure.resilience.engine import (
+        RetryBudget,
+        RetryEngine,
+        configure_retry_engine,
+    )
+    from monitoring.metrics import MetricsCollector
+
+    logger = get_logger(__name__)
+    try:
+        performance_config = container.get(ConfigurationPort).get_typed(PerformanceConfig)
+        metrics = container.get_optional(MetricsCollector)
+    except Exception as e:
+        logger.debug("Retry engine not configured: %s", e)
+        return
+    if not isinstance(performance_config, PerformanceConfig):
+        return
+
+    budget_config = performance_config.retry_budget
+
+    budget = None
+    if budget_config.enabled:
+        budget = RetryBudget(
+            ratio=budget_config.ratio,
+            min_per_second=budget_config.min_per_second,
+            capacity=budget_config.capacity,
+        )
+    configure_retry_engine(RetryEngine(budget=budget, metrics=metrics))
+
 
 def _register_template_services(container: DIContainer):
     """Register template configuration services."""
@@ -65,6 +124,56 @@ def _register_template_services(container: DIContainer):
     # Check if AMI resolution is enabled via AWS extensions
     _register_ami_resolver_if_enabled(container)
 
+    _register_instance_type_catalog(container)
+
+
+def _register_instance_type_catalog(container: DIContainer) -> None:
+    """Register the instance type catalog used for template attributes and validation."""
+    from domain.base.ports.instance_type_catalog_port import InstanceTypeCatalogPort
+
+    def create_instance_type_catalog(c: DIContainer) -> InstanceTypeCatalogPort:
+        """Create the catalog for the active AWS region, falling back to the offline snapshot."""
+        import os
+
+        from config.schemas.performance_schema import PerformanceConfig
+        from providers.aws.infrastructure.aws_client import AWSClient
+        from providers.aws.infrastructure.template.instance_type_catalog import (
+            AWSInstanceTypeCatalog,
+        )
+
+        logger = get_logger(__name__)
+        config = c.get(ConfigurationPort)
+        try:
+            cache_config = config.get_typed(PerformanceConfig).caching.instance_types
+        except Exception as e:
+            logger.debug("Using default instance type cache settings: %s", e)
+            from config.schemas.performance_schema import InstanceTypeCacheConfig
+
+            cache_config = InstanceTypeCacheConfig()
+
+        cache_dir = None
+        if cache_config.enabled:
+            try:
+                cache_dir = os.path.join(config.get_work_dir(), "cache")
+            except Exception as e:
+                logger.debug("Instance type catalog will not be persisted: %s", e)
+
+        try:
+            aws_client = c.get(AWSClient)
+        except Exception as e:
+            logger.debug("AWS client unavailable, instance type catalog uses snapshot: %s", e)
+            return AWSInstanceTypeCatalog("offline", cache_dir=None)
+
+        return AWSInstanceTypeCatalog(
+            aws_client.region_name,
+            ec2_client_factory=lambda: aws_client.ec2_client,
+            cache_dir=cache_dir,
+            ttl_seconds=cache_config.ttl_seconds,
+            retry_seconds=cache_config.retry_seconds,
+        )
+
+    container.register_singleton(InstanceTypeCatalogPort, create_instance_type_catalog)
+
 
 def _register_ami_resolver_if_enabled(container: DIContainer) -> None:
     """Register AMI resolver if enabled in AWS provider extensions."""
@@ -0,0 +1,354 @@
+"""Durable, append-only event log in the events directory.
+
+Events are written as newline-delimited JSON to numbered segment files
+(``events-00000001.ndjson``, ...) so external tooling can consume request
+and machine lifecycle events without reading the storage files. Each batch
+is written with a single ``write`` and made durable with a single ``fsync``
+(group commit). All processes append to the newest segment while holding a
+lock file in the events directory, so short-lived CLI processes share one
+segment instead of each leaving a file behind; segments rotate by size and
+age. The first line of each segment is a header record holding the time the
+segment was created, which readers skip.
+
+EventLogReader replays segments in order and can follow the log as it
+grows, resuming from an EventLogPosition.
+"""
+
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from domain.base.events import DomainEvent
+from infrastructure.events.pipeline import TELEMETRY_EVENT_TYPES
+from infrastructure.logging.logger import get_logger
+from infrastructure.serialization.json_codec import get_json_codec
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+SEGMENT_PREFIX = "events-"
+SEGMENT_SUFFIX = ".ndjson"
+LOCK_FILE = ".events.lock"
+SEGMENT_HEADER_TYPE = "EventLogSegmentHeader"
+_SEGMENT_PATTERN = re.compile(r"^events-(\d{8,})\.ndjson$")
+
+
+def _segment_name(sequence: int) -> str:
+    return f"{SEGMENT_PREFIX}{sequence:08d}{SEGMENT_SUFFIX}"
+
+
+def list_segments(directory: Path) -> List[str]:
+    """
+    List event log segment file names in replay order.
+
+    Args:
+        directory: Events directory
+
+    Returns:
+        Segment file names, oldest first
+    """
+    if not directory.is_dir():
+        return []
+    matches = (_SEGMENT_PATTERN.match(name) for name in os.listdir(directory))
+    return [m.group(0) for m in sorted(filter(None, matches), key=lambda m: int(m.group(1)))]
+
+
+class EventLogPosition(NamedTuple):
+    """Position just after a record: segment file name and byte offset."""
+
+    segment: str
+    offset: int
+
+
+class EventLogWriter:
+    """
+    Append-only NDJSON event log with group commit and rotation.
+
+    Writers append to the newest segment under an exclusive lock on the
+    events directory's lock file (where fcntl is available). Age is measured
+    from the creation time in the segment's header, so it survives across the
+    short-lived processes that append to the segment.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_age_seconds: float = 3600.0,
+        retention_seconds: Optional[float] = None,
+        fsync: bool = True,
+        exclude_event_types: Iterable[str] = TELEMETRY_EVENT_TYPES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            directory: Events directory (created if missing)
+            max_bytes: Rotate once a segment would exceed this size
+            max_age_seconds: Rotate once a segment is older than this
+            retention_seconds: Delete segments not modified for this long on rotation
+                (None keeps everything)
+            fsync: Fsync each batch (disable only for tests and benchmarks)
+            exclude_event_types: Event types not written (persistence telemetry by default)
+            clock: Wall-clock source
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.retention_seconds = retention_seconds
+        self.fsync = fsync
+        self.exclude_event_types = frozenset(exclude_event_types)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._lock_fd: Optional[int] = None
+        self._segment: Optional[str] = None
+        self._size = 0
+        self._header_size = 0
+        self._created_at = 0.0
+        self.logger = get_logger(__name__)
+
+    @property
+    def current_segment(self) -> Optional[str]:
+        """Name of the segment being written, if any."""
+        return self._segment
+
+    def write_batch(self, events: Iterable[DomainEvent]) -> int:
+        """
+        Append events and make them durable with one write and one fsync.
+
+        Args:
+            events: Events to append
+
+        Returns:
+            Number of events written
+        """
+        codec = get_json_codec()
+        lines = [
+            codec.dumps_bytes(event.model_dump(mode="json"))
+            for event in events
+            if event.event_type not in self.exclude_event_types
+        ]
+        if not lines:
+            return 0
+        lines.append(b"")
+        data = b"\n".join(lines)
+
+        with self._lock, self._directory_lock():
+            self._open_newest()
+            if self._fd is None or self._should_rotate(len(data)):
+                self._rotate()
+            view = memoryview(data)
+            while view:
+                written = os.write(self._fd, view)
+                view = view[written:]
+            if self.fsync:
+                os.fsync(self._fd)
+            self._size += len(data)
+        return len(lines) - 1
+
+    def close(self) -> None:
+        """Close the current segment."""
+        with self._lock:
+            self._close_segment()
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    @contextmanager
+    def _directory_lock(self) -> Iterator[None]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        if self._lock_fd is None:
+            self._lock_fd = os.open(self.directory / LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _open_newest(self) -> None:
+        """Switch to the newest segment if another writer rotated past ours."""
+        if self._segment is not None:
+            following = _segment_name(_sequence(self._segment) + 1)
+            if not (self.directory / following).exists():
+                # Still the newest; pick up what other writers appended
+                self._size = os.fstat(self._fd).st_size
+                return
+        existing = list_segments(self.directory)
+        self._close_segment()
+        if not existing:
+            return
+
+        name = existing[-1]
+        self._fd = os.open(self.directory / name, os.O_WRONLY | os.O_APPEND)
+        stat = os.fstat(self._fd)
+        self._segment = name
+        self._size = stat.st_size
+        self._read_header(stat)
+
+    def _read_header(self, stat: os.stat_result) -> None:
+        """Take the segment's creation time from its header line."""
+        with open(self.directory / self._segment, "rb") as segment:
+            first = segment.readline()
+        try:
+            header = get_json_codec().loads(first) if first.endswith(b"\n") else {}
+        except ValueError:
+            header = {}
+        if isinstance(header, dict) and header.get("event_type") == SEGMENT_HEADER_TYPE:
+            self._header_size = len(first)
+            self._created_at = float(header["created_at"])
+        else:
+            # Segment written before headers: best available estimate
+            self._header_size = 0
+            self._created_at = getattr(stat, "st_birthtime", None) or self._clock()
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if self._size > self._header_size and self._size + incoming > self.max_bytes:
+            return True
+        return self._clock() - self._created_at >= self.max_age_seconds
+
+    def _rotate(self) -> None:
+        self._close_segment()
+        existing = list_segments(self.directory)
+        sequence = int(_SEGMENT_PATTERN.match(existing[-1]).group(1)) if existing else 0
+
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_APPEND
+        while True:
+            sequence += 1
+            name = _segment_name(sequence)
+            try:
+                self._fd = os.open(self.directory / name, flags, 0o644)
+                break
+            except FileExistsError:
+                # Another process created this segment first (no fcntl lock)
+                continue
+
+        self._segment = name
+        self._created_at = self._clock()
+        header = get_json_codec().dumps_bytes(
+            {"event_type": SEGMENT_HEADER_TYPE, "created_at": self._created_at}
+        )
+        self._header_size = os.write(self._fd, header + b"\n")
+        self._size = self._header_size
+        self.logger.debug("Opened event log segment %s", self.directory / name)
+        if self.retention_seconds is not None:
+            self._apply_retention(exclude=name)
+
+    def _close_segment(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._segment = None
+
+    def _apply_retention(self, exclude: str) -> None:
+        cutoff = self._clock() - self.retention_seconds
+        for name in list_segments(self.directory):
+            path = self.directory / name
+            try:
+                if name != exclude and path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError as e:
+                self.logger.warning("Failed to remove expired event segment %s: %s", path, e)
+
+
+class EventLogReader:
+    """Replay and follow an event log written by EventLogWriter."""
+
+    def __init__(self, directory: str) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            directory: Events directory
+        """
+        self.directory = Path(directory)
+
+    def read(
+        self,
+        position: Optional[EventLogPosition] = None,
+        event_types: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[EventLogPosition, Dict[str, Any]]]:
+        """
+        Replay complete records after a position.
+
+        A partially written trailing line is not returned; reading again from
+        the last yielded position picks it up once it is complete.
+
+        Args:
+            position: Resume after this position (None replays from the start)
+            event_types: Only yield these event types (all when None)
+
+        Yields:
+            Position after each record, and the decoded event
+        """
+        codec = get_json_codec()
+        wanted = frozenset(event_types) if event_types is not None else None
+        segments = list_segments(self.directory)
+        if position is not None:
+            segments = [
+                name for name in segments if _sequence(name) >= _sequence(position.segment)
+            ]
+
+        for name in segments:
+            offset = position.offset if position is not None and name == position.segment else 0
+            try:
+                with open(self.directory / name, "rb") as segment:
+                    segment.seek(offset)
+                    for line in segment:
+                        if not line.endswith(b"\n"):
+                            break
+                        offset += len(line)
+                        record = codec.loads(line)
+                        if record.get("event_type") == SEGMENT_HEADER_TYPE:
+                            continue
+                        if wanted is None or record.get("event_type") in wanted:
+                            yield EventLogPosition(name, offset), record
+            except FileNotFoundError:
+                # Removed by retention while replaying
+                continue
+
+    def follow(
+        self,
+        position: Optional[EventLogPosition] = None,
+        event_types: Optional[Iterable[str]] = None,
+        poll_interval: float = 0.5,
+        stop: Optional[threading.Event] = None,
+    ) -> Iterator[Tuple[EventLogPosition, Dict[str, Any]]]:
+        """
+        Replay records after a position, then keep yielding new ones as they arrive.
+
+        Args:
+            position: Resume after this position (None starts from the beginning)
+            event_types: Only yield these event types (all when None)
+            poll_interval: Seconds between checks for new records
+            stop: Event that ends iteration when set
+
+        Yields:
+            Position after each record, and the decoded event
+        """
+        wanted = frozenset(event_types) if event_types is not None else None
+        while stop is None or not stop.is_set():
+            # Track position over all records so filtered ones are not re-read
+            for record_position, record in self.read(position):
+                position = record_position
+                if wanted is None or record.get("event_type") in wanted:
+                    yield record_position, record
+            if stop is not None:
+                stop.wait(poll_interval)
+            else:
+                time.sleep(poll_interval)
+
+
+def _sequence(name: str) -> int:
+    match = _SEGMENT_PATTERN.match(name)
+    return int(match.group(1)) if match else -1
@@ -0,0 +1,268 @@
+"""Asynchronous, batched in-process event dispatch.
+
+Producers hand events to a bounded queue and return immediately; a daemon
+thread drains the queue and passes events to the dispatch callback in
+batches. Telemetry-class events (repository operation timings and similar)
+can be sampled before they are built and are the first to be dropped when
+the queue is full, while business events apply back-pressure and, as a last
+resort, are dispatched on the caller's thread so they are never lost.
+"""
+
+import queue
+import random
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+from domain.base.events import DomainEvent
+from infrastructure.logging.logger import get_logger
+
+# Events describing how persistence performed rather than what happened to
+# the domain; safe to sample or drop under load.
+TELEMETRY_EVENT_TYPES: FrozenSet[str] = frozenset(
+    {
+        "RepositoryOperationStartedEvent",
+        "RepositoryOperationCompletedEvent",
+        "SlowQueryDetectedEvent",
+        "TransactionStartedEvent",
+        "TransactionCommittedEvent",
+        "StoragePerformanceEvent",
+        "StorageHealthCheckEvent",
+        "ConnectionPoolEvent",
+    }
+)
+
+_STOP = object()
+
+
+class EventPipeline:
+    """
+    Bounded queue with a background dispatcher that delivers events in batches.
+
+    Metrics returned by get_metrics():
+    - submitted: events accepted onto the queue
+    - dispatched: events delivered to the dispatch callback
+    - batches: dispatch callback invocations
+    - sampled_out: telemetry events skipped by sampling
+    - dropped_queue_full: telemetry events dropped because the queue was full
+    - blocked: business events that waited for queue space
+    - dispatched_inline: business events delivered on the caller's thread
+    - dispatch_errors: dispatch callback failures
+    - queue_depth / max_queue_depth: current and peak queue length
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[Sequence[DomainEvent]], None],
+        max_queue_size: int = 10000,
+        batch_size: int = 100,
+        max_batch_delay: float = 0.0,
+        telemetry_sample_rate: float = 1.0,
+        telemetry_event_types: Iterable[str] = TELEMETRY_EVENT_TYPES,
+        block_timeout: float = 0.1,
+        random_source: Callable[[], float] = random.random,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            dispatch: Callback receiving each batch of events
+            max_queue_size: Maximum number of queued events
+            batch_size: Maximum number of events per dispatch call
+            max_batch_delay: Seconds to wait for a batch to fill once its first
+                event arrives (0 dispatches whatever is already queued)
+            telemetry_sample_rate: Fraction of telemetry events to keep (0.0-1.0)
+            telemetry_event_types: Event types treated as telemetry
+            block_timeout: Seconds a business event waits for queue space before
+                being dispatched inline
+            random_source: Source of uniform random numbers for sampling
+        """
+        if not 0.0 <= telemetry_sample_rate <= 1.0:
+            raise ValueError("telemetry_sample_rate must be between 0.0 and 1.0")
+
+        self._dispatch = dispatch
+        self.batch_size = max(1, batch_size)
+        self.max_batch_delay = max_batch_delay
+        self.telemetry_sample_rate = telemetry_sample_rate
+        self.telemetry_event_types = frozenset(telemetry_event_types)
+        self.block_timeout = block_timeout
+        self._random = random_source
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._metrics: Dict[str, int] = dict.fromkeys(
+            (
+                "submitted",
+                "dispatched",
+                "batches",
+                "sampled_out",
+                "dropped_queue_full",
+                "blocked",
+                "dispatched_inline",
+                "dispatch_errors",
+                "max_queue_depth",
+            ),
+            0,
+        )
+        self.logger = get_logger(__name__)
+
+    def is_telemetry(self, event_type: str) -> bool:
+        """Whether an event type may be sampled or dropped."""
+        return event_type in self.telemetry_event_types
+
+    def should_publish(self, event_type: str) -> bool:
+        """
+        Make the sampling decision for an event before it is built.
+
+        Args:
+            event_type: Event class name
+
+        Returns:
+            False if a telemetry event is sampled out
+        """
+        if self.telemetry_sample_rate >= 1.0 or event_type not in self.telemetry_event_types:
+            return True
+        if self.telemetry_sample_rate > 0.0 and self._random() < self.telemetry_sample_rate:
+            return True
+        self._count("sampled_out")
+        return False
+
+    def submit(self, event: DomainEvent) -> bool:
+        """
+        Queue an event for dispatch.
+
+        Args:
+            event: Event to dispatch
+
+        Returns:
+            False if the event was dropped
+        """
+        if self._thread is None:
+            self.start()
+
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            if self.is_telemetry(event.event_type):
+                self._count("dropped_queue_full")
+                return False
+
+            self._count("blocked")
+            try:
+                self._queue.put(event, timeout=self.block_timeout)
+            except queue.Full:
+                # Never lose business events: deliver on the caller's thread
+                self._count("dispatched_inline")
+                self._deliver([event])
+                return True
+
+        self._count("submitted")
+        return True
+
+    def start(self) -> None:
+        """Start the dispatcher thread if it is not running."""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="event-pipeline-dispatcher", daemon=True
+            )
+            self._thread.start()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every queued event has been dispatched.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the queue drained within the timeout
+        """
+        if self._thread is None:
+            return True
+
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Dispatch queued events and stop the dispatcher thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the queue to drain
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self.flush(timeout)
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            self.logger.warning("Event pipeline did not drain before shutdown")
+            return
+        thread.join(timeout)
+        self._thread = None
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Get pipeline and back-pressure counters."""
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        metrics["queue_depth"] = self._queue.qsize()
+        metrics["queue_capacity"] = self._queue.maxsize
+        return metrics
+
+    def _count(self, name: str, value: int = 1) -> None:
+        with self._metrics_lock:
+            self._metrics[name] += value
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            depth = self._queue.qsize() + 1
+            if item is _STOP:
+                self._queue.task_done()
+                return
+
+            batch: List[DomainEvent] = [item]
+            stop = False
+            deadline = time.monotonic() + self.max_batch_delay
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._deliver(batch)
+            with self._metrics_lock:
+                self._metrics["batches"] += 1
+                self._metrics["max_queue_depth"] = max(self._metrics["max_queue_depth"], depth)
+            for _ in range(len(batch) + (1 if stop else 0)):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _deliver(self, batch: Sequence[DomainEvent]) -> None:
+        try:
+            self._dispatch(batch)
+            self._count("dispatched", len(batch))
+        except Exception as e:
+            self._count("dispatch_errors")
+            self.logger.error("Event batch dispatch failed (%s events): %s", len(batch), e)
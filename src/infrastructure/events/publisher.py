@@ -1,8 +1,11 @@
 """Configurable Event Publisher - Simple, mode-based event publishing."""
 
-from typing import Callable, Dict, List
+import atexit
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from domain.base.events import DomainEvent, EventPublisher
+from infrastructure.events.event_log import EventLogWriter
+from infrastructure.events.pipeline import TELEMETRY_EVENT_TYPES, EventPipeline
 from infrastructure.logging.logger import get_logger
 
 
@@ -11,36 +14,108 @@ class ConfigurableEventPublisher(EventPublisher):
     Simple, configurable event publisher supporting all deployment modes.
 
     Modes:
-    - "logging": Just log events for audit trail (Script mode)
+    - "logging": Log events for audit trail (Script mode); handlers registered
+      in this process, e.g. by the timeout sweeper of a running server, are
+      still called synchronously
     - "sync": Call registered handlers synchronously (REST API mode)
-    - "async": Publish to message queues (EDA mode - future)
+    - "async": Queue events and call handlers in batches on a background
+      thread (see EventPipeline), keeping dispatch off the caller's path
+
+    With an event log, every mode also appends events to the durable log in
+    the events directory; batches are written by the background dispatcher
+    with one fsync each.
     """
 
-    def __init__(self, mode: str = "logging") -> None:
-        """Initialize with publishing mode."""
+    def __init__(
+        self,
+        mode: str = "logging",
+        pipeline_options: Optional[Dict[str, Any]] = None,
+        event_log: Optional[EventLogWriter] = None,
+    ) -> None:
+        """
+        Initialize with publishing mode.
+
+        Args:
+            mode: Publishing mode
+            pipeline_options: EventPipeline keyword arguments (async mode or event log)
+            event_log: Durable event log to append published events to
+        """
         self.mode = mode
         self._handlers: Dict[str, List[Callable]] = {}
         self._logger = get_logger(__name__)
+        self._pipeline: Optional[EventPipeline] = None
+        self._event_log = event_log
 
         # Validate mode
         valid_modes = ["logging", "sync", "async"]
         if mode not in valid_modes:
             raise ValueError(f"Invalid mode '{mode}'. Must be one of: {valid_modes}")
 
+        if mode == "async" or event_log is not None:
+            self._pipeline = EventPipeline(self._dispatch_batch, **(pipeline_options or {}))
+            atexit.register(self.shutdown)
+
     def publish(self, event: DomainEvent) -> None:
         """Publish event based on configured mode."""
         try:
             if self.mode == "logging":
                 self._log_event(event)
-            elif self.mode == "sync":
+            if self.mode != "async":
                 self._call_handlers_sync(event)
-            elif self.mode == "async":
+
+            if self._pipeline is not None:
                 self._publish_to_queue(event)
         except Exception as e:
             self._logger.error("Failed to publish event %s: %s", event.event_type, e)
             # Don't re-raise - event publishing failure shouldn't break business
             # operations
 
+    def publish_batch(self, events: List[DomainEvent]) -> None:
+        """Publish multiple events."""
+        for event in events:
+            self.publish(event)
+
+    def should_publish(self, event_type: str) -> bool:
+        """
+        Check whether an event of this type should be built and published.
+
+        Lets producers skip constructing telemetry events that the pipeline
+        would sample out. Without a pipeline, telemetry events are only built
+        when a handler is registered for them, since nothing else reads them.
+
+        Args:
+            event_type: Event class name
+
+        Returns:
+            False if the event would be discarded
+        """
+        if self._pipeline is not None:
+            return self._pipeline.should_publish(event_type)
+        return event_type not in TELEMETRY_EVENT_TYPES or event_type in self._handlers
+
+    def is_enabled(self) -> bool:
+        """Check if event publishing is enabled."""
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait for queued events to be dispatched and logged."""
+        if self._pipeline is None:
+            return True
+        return self._pipeline.flush(timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Dispatch queued events, stop the background dispatcher and close the event log."""
+        if self._pipeline is not None:
+            self._pipeline.stop(timeout)
+        if self._event_log is not None:
+            self._event_log.close()
+
+    def get_pipeline_metrics(self) -> Dict[str, int]:
+        """Get queue and back-pressure metrics (empty without a pipeline)."""
+        if self._pipeline is None:
+            return {}
+        return self._pipeline.get_metrics()
+
     def register_handler(self, event_type: str, handler: Callable[[DomainEvent], None]) -> None:
         """Register event handler for specific event type."""
         if event_type not in self._handlers:
@@ -74,9 +149,20 @@ class ConfigurableEventPublisher(EventPublisher):
                 # Continue with other handlers
 
     def _publish_to_queue(self, event: DomainEvent) -> None:
-        """Publish to message queue (EDA mode - future implementation)."""
-        # Future implementation for message queue publishing
-        self._logger.info("Would publish to queue: %s", event.event_type)
+        """Queue event for background dispatch and logging."""
+        self._pipeline.submit(event)
+
+    def _dispatch_batch(self, events: Sequence[DomainEvent]) -> None:
+        """Log and dispatch a batch of queued events (dispatcher thread)."""
+        if self._event_log is not None:
+            try:
+                self._event_log.write_batch(events)
+            except OSError as e:
+                self._logger.error("Failed to append %s events to event log: %s", len(events), e)
+
+        if self.mode == "async":
+            for event in events:
+                self._call_handlers_sync(event)
 
     def get_registered_handlers(self) -> Dict[str, int]:
         """Get count of registered handlers by event type (for debugging)."""
@@ -84,6 +170,12 @@ class ConfigurableEventPublisher(EventPublisher):
 
 
 # Factory function for DI container
-def create_event_publisher(mode: str = "logging") -> ConfigurableEventPublisher:
+def create_event_publisher(
+    mode: str = "logging",
+    pipeline_options: Optional[Dict[str, Any]] = None,
+    event_log: Optional[EventLogWriter] = None,
+) -> ConfigurableEventPublisher:
     """Create event publisher with specified mode."""
-    return ConfigurableEventPublisher(mode=mode)
+    return ConfigurableEventPublisher(
+        mode=mode, pipeline_options=pipeline_options, event_log=event_log
+    )
@@ -1,8 +1,8 @@
 """Component lifecycle management."""
 
 from abc import ABC, abstractmethod
-from threading import RLock
-from typing import Dict, List, Optional, Type
+from threading import Condition, RLock, Thread
+from typing import Any, Callable, Dict, List, Optional, Type
 
 from infrastructure.logging.logger import get_logger
 
@@ -34,6 +34,69 @@ class Lifecycle(ABC):
         """
 
 
+class PeriodicTask(Lifecycle):
+    """
+    Runs a callable on a daemon thread every interval seconds.
+
+    The first run happens one interval after initialization. A failing run
+    is logged and the task keeps its schedule.
+    """
+
+    def __init__(self, name: str, task: Callable[[], Any], interval: float) -> None:
+        """
+        Initialize the task.
+
+        Args:
+            name: Name of the task and its thread
+            task: Callable to run
+            interval: Seconds between runs
+
+        Raises:
+            ValueError: If interval is not positive
+        """
+        if interval <= 0:
+            raise ValueError("Periodic task interval must be positive")
+        self.name = name
+        self.interval = interval
+        self._task = task
+        self._wakeup = Condition()
+        self._stopping = False
+        self._thread: Optional[Thread] = None
+        self._logger = get_logger(__name__)
+
+    def initialize(self) -> None:
+        """Start the task thread."""
+        with self._wakeup:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        self._logger.info("Started %s every %s seconds", self.name, self.interval)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the task thread, waiting for a run in progress to finish."""
+        with self._wakeup:
+            thread = self._thread
+            self._stopping = True
+            self._wakeup.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                if not self._stopping:
+                    self._wakeup.wait(self.interval)
+                if self._stopping:
+                    return
+            try:
+                self._task()
+            except Exception as e:
+                self._logger.error("Periodic task %s failed: %s", self.name, e)
+
+
 class LifecycleManager:
     """
     Manager for component lifecycles.
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import logging.handlers
+import queue
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from config import LoggingConfig
+from infrastructure.serialization.json_codec import get_json_codec
 
 
 class JsonFormatter(logging.Formatter):
@@ -58,6 +63,9 @@ class JsonFormatter(logging.Formatter):
         if hasattr(record, "correlation_id"):
             message["correlation_id"] = record.correlation_id
 
+        if hasattr(record, "suppressed"):
+            message["suppressed"] = record.suppressed
+
         # Include any extra fields provided in the log call
         if hasattr(record, "extra"):
             message.update(record.extra)
@@ -65,6 +73,202 @@ class JsonFormatter(logging.Formatter):
         return json.dumps(message)
 
 
+class FastJsonFormatter(JsonFormatter):
+    """
+    Format log records as JSON with the same fields as JsonFormatter.
+
+    Relative file paths and locations are computed once per call site, the
+    timestamp's date and time part once per second, and the record is
+    encoded with the process-wide JSON codec.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the instance."""
+        super().__init__(**kwargs)
+        self._call_sites: Dict[Tuple[str, int, str], Tuple[str, str]] = {}
+        self._second: Optional[int] = None
+        self._second_text = ""
+        self._codec = get_json_codec()
+
+    def _call_site(self, record: logging.LogRecord) -> Tuple[str, str]:
+        key = (record.pathname, record.lineno, record.funcName)
+        site = self._call_sites.get(key)
+        if site is None:
+            file_path = record.pathname
+            src_index = file_path.find("/src/")
+            if src_index >= 0:
+                file_path = file_path[src_index + 1 :]
+            site = (file_path, f"{file_path}:{record.lineno} ({record.funcName})")
+            self._call_sites[key] = site
+        return site
+
+    def _timestamp(self, created: float) -> str:
+        second = int(created)
+        microsecond = round((created - second) * 1_000_000)
+        if microsecond >= 1_000_000:
+            return datetime.utcfromtimestamp(created).isoformat()
+        if second != self._second:
+            self._second_text = datetime.utcfromtimestamp(second).isoformat()
+            self._second = second
+        if microsecond:
+            return f"{self._second_text}.{microsecond:06d}"
+        return self._second_text
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as JSON."""
+        file_path, location = self._call_site(record)
+        message = {
+            "timestamp": self._timestamp(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "file": file_path,
+            "location": location,
+        }
+        if self.default_fields:
+            message.update(self.default_fields)
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            message["exception"] = record.exc_text
+
+        extras = record.__dict__
+        for key in ("request_id", "correlation_id", "suppressed"):
+            if key in extras:
+                message[key] = extras[key]
+        if "extra" in extras:
+            message.update(extras["extra"])
+
+        return self._codec.dumps(message)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Limit how many records each logger emits, for log calls in hot loops.
+
+    Every logger gets a token bucket refilled at its rate (records per
+    second) and holding up to ``burst`` records. Rates are looked up by
+    logger name, falling back to the nearest configured parent and then to
+    the default rate; a rate of 0 means unlimited. Records at WARNING and
+    above always pass. The number of records suppressed since the last one
+    that passed is attached to the next passing record as ``suppressed``.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.0,
+        burst: Optional[int] = None,
+        rates: Optional[Mapping[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            rate: Default records per second per logger (0 disables limiting)
+            burst: Records a logger may emit at once (defaults to one second's worth)
+            rates: Per-logger rates overriding the default, keyed by logger name
+            clock: Monotonic time source
+        """
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.rates = dict(rates or {})
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._resolved: Dict[str, float] = {}
+        # logger name -> [tokens, last refill time, suppressed count]
+        self._buckets: Dict[str, List[float]] = {}
+
+    def rate_for(self, name: str) -> float:
+        """Get the records-per-second limit applying to a logger."""
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate = self.rate
+            candidate = name
+            while candidate:
+                if candidate in self.rates:
+                    rate = self.rates[candidate]
+                    break
+                candidate = candidate.rpartition(".")[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide whether a record passes the logger's rate limit."""
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rate_for(record.name)
+        if rate <= 0:
+            return True
+
+        capacity = self.burst if self.burst is not None else max(1.0, rate)
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets.get(record.name)
+            if bucket is None:
+                bucket = self._buckets[record.name] = [capacity, now, 0]
+            else:
+                bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+
+            if bucket[0] < 1:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1
+            if bucket[2]:
+                record.suppressed = int(bucket[2])
+                bucket[2] = 0
+        return True
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Hand log records to a QueueListener without formatting them.
+
+    Only the message arguments are merged on the logging thread, so mutable
+    arguments are captured as they were at the call; formatting and I/O are
+    left to the listener's handlers. When the queue is full, records below
+    WARNING are dropped and counted while warnings and errors wait briefly
+    for space.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[Any]", block_timeout: float = 1.0) -> None:
+        """
+        Initialize the handler.
+
+        Args:
+            log_queue: Queue drained by a QueueListener
+            block_timeout: Seconds a WARNING or higher record waits for queue space
+        """
+        super().__init__(log_queue)
+        self.block_timeout = block_timeout
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message arguments; leave formatting to the listener."""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record, dropping low-severity records when the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno >= logging.WARNING:
+                try:
+                    self.queue.put(record, timeout=self.block_timeout)
+                    return
+                except queue.Full:
+                    pass
+            self.dropped += 1
+
+
 class ContextLogger(logging.Logger):
     """Logger that supports context information."""
 
@@ -103,6 +307,9 @@ class ContextLogger(logging.Logger):
 # Flag to track if logging has been initialized
 _logging_initialized = False
 
+# Background listener writing records in queue mode
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(config: LoggingConfig) -> None:
     """
@@ -111,7 +318,7 @@ def setup_logging(config: LoggingConfig) -> None:
     Args:
         config: Logging configuration
     """
-    global _logging_initialized
+    global _logging_initialized, _queue_listener
 
     # Only initialize logging once
     if _logging_initialized:
@@ -137,7 +344,7 @@ def setup_logging(config: LoggingConfig) -> None:
         root_logger.removeHandler(handler)
 
     # Create formatters
-    json_formatter = JsonFormatter()
+    json_formatter = FastJsonFormatter()
     text_formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s [%(pathname)s:%(lineno)d (%(funcName)s)]"
     )
@@ -156,10 +363,11 @@ def setup_logging(config: LoggingConfig) -> None:
         logger.debug("Could not get console_enabled from ConfigurationManager: %s", str(e))
         console_enabled = config.console_enabled
 
+    handlers: List[logging.Handler] = []
     if console_enabled:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(text_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # Configure file logging if path provided
     if config.file_path:
@@ -174,7 +382,34 @@ def setup_logging(config: LoggingConfig) -> None:
             backupCount=config.backup_count,
         )
         file_handler.setFormatter(json_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    rate_limited = config.rate_limit_per_second > 0 or bool(config.rate_limits)
+
+    def rate_limit_filter() -> RateLimitFilter:
+        return RateLimitFilter(
+            rate=config.rate_limit_per_second,
+            burst=config.rate_limit_burst,
+            rates=config.rate_limits,
+        )
+
+    if config.queue_enabled and handlers:
+        # Format and write on a background thread; callers only enqueue
+        log_queue: "queue.Queue[Any]" = queue.Queue(maxsize=config.queue_size)
+        queue_handler = NonBlockingQueueHandler(log_queue)
+        if rate_limited:
+            queue_handler.addFilter(rate_limit_filter())
+        _queue_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _queue_listener.start()
+        atexit.register(shutdown_logging)
+        root_logger.addHandler(queue_handler)
+    else:
+        for handler in handlers:
+            if rate_limited:
+                handler.addFilter(rate_limit_filter())
+            root_logger.addHandler(handler)
 
     # Set default logging levels for third-party libraries
     get_logger("boto3").setLevel(logging.WARNING)
@@ -188,6 +423,19 @@ def setup_logging(config: LoggingConfig) -> None:
     logging.getLogger(__name__).debug("Logging system initialized")
 
 
+def shutdown_logging() -> None:
+    """Write out queued log records and stop the background listener."""
+    global _queue_listener
+
+    listener = _queue_listener
+    if listener is None:
+        return
+    _queue_listener = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+
+
 def get_logger(name: str) -> ContextLogger:
     """
     Get a logger instance.
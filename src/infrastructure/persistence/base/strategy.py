@@ -1,6 +1,8 @@
 """Storage strategy interfaces and base implementations."""
 
+import heapq
 from abc import ABC, abstractmethod
+from operator import itemgetter
 from types import TracebackType
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 
@@ -358,6 +360,40 @@ class BaseStorageStrategy(StorageStrategy[T], Generic[T]):
         except Exception as e:
             raise PersistenceError(f"Error deleting batch: {str(e)}")
 
+    def find_page(
+        self,
+        criteria: Optional[Dict[str, Any]] = None,
+        after_id: Optional[str] = None,
+        limit: int = 500,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Find one page of entities in entity ID order.
+
+        This default loads all entities and keeps only the page, so peak memory
+        is that of find_all. Strategies that can filter and order at the source
+        override it.
+
+        Args:
+            criteria: Dictionary of field-value pairs to match (all when None)
+            after_id: Only return entities whose ID sorts after this one
+            limit: Maximum number of entities
+
+        Returns:
+            Up to limit entities keyed by ID, in ascending ID order
+        """
+        all_entities = self.find_all()
+        if not isinstance(all_entities, dict):
+            all_entities = {
+                self._get_entity_id_from_dict(entity): entity for entity in all_entities
+            }
+        candidates = (
+            (entity_id, entity_data)
+            for entity_id, entity_data in all_entities.items()
+            if (after_id is None or entity_id > after_id)
+            and (not criteria or self._matches_criteria(entity_data, criteria))
+        )
+        return dict(heapq.nsmallest(limit, candidates, key=itemgetter(0)))
+
     def _get_entity_id_from_dict(self, data: Dict[str, Any]) -> str:
         """
         Get entity ID from dictionary.
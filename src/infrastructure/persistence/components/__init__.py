@@ -1,10 +1,10 @@
 """Storage strategy components package with consistent naming."""
 
+import importlib
+from typing import Any
+
 # Base interfaces
-# DynamoDB-specific components (clearly prefixed)
-from .dynamodb_client_manager import DynamoDBClientManager
-from .dynamodb_converter import DynamoDBConverter
-from .dynamodb_transaction_manager import DynamoDBTransactionManager
+from .archive_store import ArchiveStore, JSONSegmentArchiveStore, StorageArchiveStore
 from .file_manager import FileManager
 
 # Generic components (truly reusable across storage types)
@@ -13,7 +13,6 @@ from .resource_manager import DataConverter, QueryManager
 from .serialization_manager import JSONSerializer, SerializationManager
 
 # SQL-specific components (clearly prefixed)
-from .sql_connection_manager import SQLConnectionManager
 from .sql_query_builder import SQLQueryBuilder
 from .sql_serializer import SQLSerializer
 from .transaction_manager import (
@@ -22,6 +21,26 @@ from .transaction_manager import (
     TransactionManager,
 )
 
+# Backend-specific components that import SQLAlchemy or boto3 are resolved on
+# first access, so a JSON-backed CLI invocation never loads those libraries.
+_LAZY_COMPONENTS = {
+    "SQLConnectionManager": ".sql_connection_manager",
+    "DynamoDBClientManager": ".dynamodb_client_manager",
+    "DynamoDBConverter": ".dynamodb_converter",
+    "DynamoDBTransactionManager": ".dynamodb_transaction_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import backend-specific components on first access."""
+    module_name = _LAZY_COMPONENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__: list[str] = [
     # Base interfaces
     "ResourceManager",
@@ -36,6 +55,9 @@ __all__: list[str] = [
     "MemoryTransactionManager",
     "NoOpTransactionManager",
     "FileManager",
+    "ArchiveStore",
+    "JSONSegmentArchiveStore",
+    "StorageArchiveStore",
     # SQL components
     "SQLConnectionManager",
     "SQLQueryBuilder",
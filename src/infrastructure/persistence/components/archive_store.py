@@ -0,0 +1,169 @@
+"""Archive stores holding records moved out of the live storage."""
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from infrastructure.logging.logger import get_logger
+from infrastructure.persistence.exceptions import PersistenceError
+
+
+class ArchiveStore(ABC):
+    """
+    Append-only store for archived records.
+
+    Live storage keeps only requests and machines that may still change;
+    records past the retention period are moved here and read back only by
+    explicit history queries.
+    """
+
+    @abstractmethod
+    def archive(self, records: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Add records to the archive.
+
+        Args:
+            records: Records keyed by entity ID
+
+        Raises:
+            PersistenceError: If the records cannot be archived
+        """
+
+    @abstractmethod
+    def find_all(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all archived records.
+
+        Returns:
+            Archived records keyed by entity ID
+        """
+
+    def find_by_criteria(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Get archived records whose fields equal the criteria values.
+
+        Args:
+            criteria: Dictionary of field-value pairs to match
+
+        Returns:
+            Matching archived records
+        """
+        return [
+            record
+            for record in self.find_all().values()
+            if all(record.get(field) == value for field, value in criteria.items())
+        ]
+
+
+class JSONSegmentArchiveStore(ArchiveStore):
+    """
+    Archive of gzip-compressed JSON segments, one written per archive run.
+
+    Segments are never rewritten, so archiving costs a write of the archived
+    records only, however large the history grows.
+    """
+
+    def __init__(self, directory: str, entity_type: str) -> None:
+        """
+        Initialize the archive.
+
+        Args:
+            directory: Directory holding the segments
+            entity_type: Type of the archived entities, used as segment name prefix
+        """
+        self.directory = Path(directory)
+        self.entity_type = entity_type
+        self.logger = get_logger(__name__)
+
+    def archive(self, records: Dict[str, Dict[str, Any]]) -> None:
+        """Write the records as a new compressed segment."""
+        if not records:
+            return
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        segment = self.directory / f"{self.entity_type}-{timestamp}-{os.getpid()}.json.gz"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(records, default=str).encode("utf-8"))
+            os.replace(tmp_path, segment)
+        except OSError as e:
+            self.logger.error("Failed to write archive segment %s: %s", segment, e)
+            raise PersistenceError(f"Failed to archive {self.entity_type}: {e}")
+        self.logger.debug("Archived %s %s to %s", len(records), self.entity_type, segment.name)
+
+    def find_all(self) -> Dict[str, Dict[str, Any]]:
+        """Read all segments, oldest first."""
+        records: Dict[str, Dict[str, Any]] = {}
+        for segment in sorted(self.directory.glob(f"{self.entity_type}-*.json.gz")):
+            try:
+                with gzip.open(segment, "rb") as f:
+                    records.update(json.loads(f.read().decode("utf-8")))
+            except (OSError, ValueError) as e:
+                self.logger.warning("Skipping unreadable archive segment %s: %s", segment, e)
+        return records
+
+
+class StorageArchiveStore(ArchiveStore):
+    """
+    Archive kept in a separate storage strategy, e.g. an archive SQL table.
+
+    With a TTL the records carry an expiry attribute, in epoch seconds, that
+    DynamoDB time-to-live uses to drop them from the archive table.
+    """
+
+    def __init__(
+        self,
+        strategy_factory: Callable[[], Any],
+        ttl_attribute: Optional[str] = None,
+        ttl_seconds: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the archive.
+
+        Args:
+            strategy_factory: Creates the archive storage strategy on first use
+            ttl_attribute: Record attribute holding the expiry time
+            ttl_seconds: How long archived records are kept
+        """
+        self._strategy_factory = strategy_factory
+        self._strategy: Optional[Any] = None
+        self._lock = threading.Lock()
+        self.ttl_attribute = ttl_attribute
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def strategy(self) -> Any:
+        """Get the archive storage strategy, creating it on first use."""
+        if self._strategy is None:
+            with self._lock:
+                if self._strategy is None:
+                    self._strategy = self._strategy_factory()
+        return self._strategy
+
+    def archive(self, records: Dict[str, Dict[str, Any]]) -> None:
+        """Save the records in the archive storage."""
+        if not records:
+            return
+        if self.ttl_attribute and self.ttl_seconds:
+            expires_at = int(time.time()) + self.ttl_seconds
+            records = {
+                entity_id: {**record, self.ttl_attribute: expires_at}
+                for entity_id, record in records.items()
+            }
+        self.strategy.save_batch(records)
+
+    def find_all(self) -> Dict[str, Dict[str, Any]]:
+        """Get all records of the archive storage."""
+        return self.strategy.find_all()
+
+    def find_by_criteria(self, criteria: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Let the archive storage filter the records."""
+        return self.strategy.find_by_criteria(criteria)
@@ -197,6 +197,34 @@ class DynamoDBClientManager(ResourceManager):
             self.logger.error("Unexpected error creating table %s: %s", table_name, e)
             return False
 
+    def enable_time_to_live(self, table_name: str, attribute_name: str) -> bool:
+        """
+        Enable TTL on a table so DynamoDB deletes items once attribute_name passes.
+
+        Args:
+            table_name: Name of the table
+            attribute_name: Attribute holding the expiry as epoch seconds
+
+        Returns:
+            True if TTL is enabled on the attribute, False otherwise
+        """
+        try:
+            description = self.dynamodb.describe_time_to_live(TableName=table_name)
+            current = description.get("TimeToLiveDescription", {})
+            if current.get("TimeToLiveStatus") in ("ENABLED", "ENABLING"):
+                return current.get("AttributeName") == attribute_name
+
+            self.dynamodb.update_time_to_live(
+                TableName=table_name,
+                TimeToLiveSpecification={"Enabled": True, "AttributeName": attribute_name},
+            )
+            self.logger.info("Enabled TTL on %s.%s", table_name, attribute_name)
+            return True
+
+        except ClientError as e:
+            self.logger.error("Failed to enable TTL on table %s: %s", table_name, e)
+            return False
+
     def put_item(self, table_name: str, item: Dict[str, Any]) -> bool:
         """
         Put item to DynamoDB table.
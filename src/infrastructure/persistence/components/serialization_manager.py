@@ -1,11 +1,11 @@
 """Serialization components for storage operations."""
 
-import json
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Any, Dict, Optional, Type, TypeVar
 
 from infrastructure.logging.logger import get_logger
+from infrastructure.serialization.json_codec import JSONDecodeError, get_json_codec
 
 E = TypeVar("E", bound=Enum)
 
@@ -28,6 +28,7 @@ class JSONSerializer(SerializationManager):
     def __init__(self) -> None:
         """Initialize the instance."""
         self.logger = get_logger(__name__)
+        self.codec = get_json_codec()
 
     def serialize(self, data: Dict[str, Any]) -> str:
         """
@@ -40,9 +41,8 @@ class JSONSerializer(SerializationManager):
             JSON string representation
         """
         try:
-            # Handle enum serialization
-            serializable_data = self._prepare_for_serialization(data)
-            return json.dumps(serializable_data, indent=2, default=str, ensure_ascii=False)
+            # The codec encodes enums, datetimes and UUIDs natively
+            return self.codec.dumps(data, pretty=True)
         except Exception as e:
             self.logger.error("JSON serialization failed: %s", e)
             raise
@@ -60,39 +60,14 @@ class JSONSerializer(SerializationManager):
         try:
             if not data or not data.strip():
                 return {}
-            return json.loads(data)
-        except json.JSONDecodeError as e:
+            return self.codec.loads(data)
+        except JSONDecodeError as e:
             self.logger.error("JSON deserialization failed: %s", e)
             raise
         except Exception as e:
             self.logger.error("Unexpected deserialization error: %s", e)
             raise
 
-    def _prepare_for_serialization(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare data for JSON serialization by handling special types."""
-        if not isinstance(data, dict):
-            return data
-
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, Enum):
-                result[key] = self.serialize_enum(value)
-            elif isinstance(value, dict):
-                result[key] = self._prepare_for_serialization(value)
-            elif isinstance(value, list):
-                result[key] = [
-                    (
-                        self._prepare_for_serialization(item)
-                        if isinstance(item, dict)
-                        else (self.serialize_enum(item) if isinstance(item, Enum) else item)
-                    )
-                    for item in value
-                ]
-            else:
-                result[key] = value
-
-        return result
-
     @staticmethod
     def serialize_enum(enum_value: Optional[Enum]) -> Optional[str]:
         """Serialize enum to string value."""
@@ -262,15 +262,59 @@ class SQLQueryBuilder(QueryManager):
         Returns:
             Tuple of (query, parameters)
         """
-        if not criteria:
+        where_clauses, parameters = self._build_where_clauses(criteria)
+        if not where_clauses:
             return self.build_select_all(), {}
 
+        # nosec B608
+        query = (
+            f"SELECT * FROM {self.table_name} "  # nosec B608
+            f"WHERE {' AND '.join(where_clauses)}"  # nosec B608
+        )
+
+        self.logger.debug("Built SELECT with criteria query for %s", self.table_name)
+        return query, parameters
+
+    def build_select_page(
+        self,
+        criteria: Optional[Dict[str, Any]],
+        id_column: str,
+        after_id: Optional[str],
+        limit: int,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build keyset-paginated SELECT ordered by the ID column.
+
+        Args:
+            criteria: Search criteria (all rows when None)
+            id_column: Name of the ID column
+            after_id: Only select rows whose ID sorts after this one
+            limit: Maximum number of rows
+
+        Returns:
+            Tuple of (query, parameters)
+        """
+        self._validate_identifier(id_column)
+        where_clauses, parameters = self._build_where_clauses(criteria or {})
+        if after_id is not None:
+            where_clauses.append(f"{id_column} > :page_after_id")
+            parameters["page_after_id"] = after_id
+        parameters["page_limit"] = int(limit)
+
+        where = f"WHERE {' AND '.join(where_clauses)} " if where_clauses else ""
+        # nosec B608
+        query = (
+            f"SELECT * FROM {self.table_name} {where}"  # nosec B608
+            f"ORDER BY {id_column} LIMIT :page_limit"  # nosec B608
+        )
+
+        self.logger.debug("Built paginated SELECT query for %s", self.table_name)
+        return query, parameters
+
+    def _build_where_clauses(self, criteria: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
         # Filter criteria to only include known columns
         filtered_criteria = {k: v for k, v in criteria.items() if k in self.columns}
 
-        if not filtered_criteria:
-            return self.build_select_all(), {}
-
         # Validate all column names
         for column in filtered_criteria.keys():
             self._validate_identifier(column)
@@ -303,14 +347,7 @@ class SQLQueryBuilder(QueryManager):
                 where_clauses.append(f"{column} = :{param_name}")
                 parameters[param_name] = value
 
-        # nosec B608
-        query = (
-            f"SELECT * FROM {self.table_name} "  # nosec B608
-            f"WHERE {' AND '.join(where_clauses)}"  # nosec B608
-        )
-
-        self.logger.debug("Built SELECT with criteria query for %s", self.table_name)
-        return query, parameters
+        return where_clauses, parameters
 
     def build_count(self) -> str:
         """
@@ -1,12 +1,12 @@
 """SQL serialization components for domain to database mapping."""
 
-import json
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from infrastructure.logging.logger import get_logger
 from infrastructure.persistence.components.resource_manager import DataConverter
+from infrastructure.serialization.json_codec import JSONDecodeError, get_json_codec
 
 
 class SQLSerializer(DataConverter):
@@ -26,6 +26,7 @@ class SQLSerializer(DataConverter):
         """
         self.id_column = id_column
         self.logger = get_logger(__name__)
+        self.codec = get_json_codec()
 
     def to_storage_format(self, domain_data: Dict[str, Any]) -> Any:
         """Convert domain data to SQL format (implements DataConverter interface)."""
@@ -168,7 +169,7 @@ class SQLSerializer(DataConverter):
 
         # Handle complex types (lists, dicts) as JSON
         if isinstance(value, (list, dict)):
-            return json.dumps(value, default=str, ensure_ascii=False)
+            return self.codec.dumps(value)
 
         # Handle boolean
         if isinstance(value, bool):
@@ -203,8 +204,8 @@ class SQLSerializer(DataConverter):
             # Try to parse as JSON for complex types
             if value.startswith(("[", "{")):
                 try:
-                    return json.loads(value)
-                except (json.JSONDecodeError, ValueError):
+                    return self.codec.loads(value)
+                except (JSONDecodeError, ValueError):
                     # Not JSON, return as string
                     return value
             return value
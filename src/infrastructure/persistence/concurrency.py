@@ -1,11 +1,11 @@
 """Optimistic concurrency control utilities."""
 
-import time
 from functools import wraps
 from typing import Any, Callable, Dict, List, Optional, TypeVar
 
 from domain.base.exceptions import ConcurrencyError
 from infrastructure.logging.logger import get_logger
+from infrastructure.resilience.engine import RetryPolicy, get_retry_engine
 
 T = TypeVar("T")  # Entity type
 R = TypeVar("R")  # Return type
@@ -20,7 +20,7 @@ class OptimisticConcurrencyControl:
 
         Args:
             max_retries: Maximum number of retries
-            retry_delay: Delay between retries in seconds
+            retry_delay: Backoff cap of the first retry in seconds (doubles per retry)
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
@@ -37,30 +37,28 @@ class OptimisticConcurrencyControl:
             Decorated function
         """
 
+        policy = RetryPolicy(
+            callsite="concurrency_conflict",
+            max_retries=self.max_retries,
+            base_delay=self.retry_delay,
+            retry_on=(ConcurrencyError,),
+            on_retry=lambda attempt, e, delay: self.logger.debug(
+                "Concurrency error detected, retrying (%s/%s) in %.2fs: %s",
+                attempt + 1,
+                self.max_retries,
+                delay,
+                e,
+            ),
+        )
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> R:
             """Wrap function."""
-            retries = 0
-            while True:
-                try:
-                    return func(*args, **kwargs)
-                except ConcurrencyError as e:
-                    retries += 1
-                    if retries > self.max_retries:
-                        self.logger.warning(
-                            "Maximum retries (%s) exceeded for concurrency error: %s",
-                            self.max_retries,
-                            e,
-                        )
-                        raise
-
-                    self.logger.debug(
-                        "Concurrency error detected, retrying (%s/%s): %s",
-                        retries,
-                        self.max_retries,
-                        e,
-                    )
-                    time.sleep(self.retry_delay)
+            try:
+                return get_retry_engine().run(policy, func, *args, **kwargs)
+            except ConcurrencyError as e:
+                self.logger.warning("Giving up on concurrency error: %s", e)
+                raise
 
         return wrapper
 
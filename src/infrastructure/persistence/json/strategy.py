@@ -1,7 +1,13 @@
 """JSON storage strategy implementation using componentized architecture."""
 
-from typing import Any, Dict, List, Optional
-
+import heapq
+import os
+import sqlite3
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional
+
+from infrastructure.caching.shared_state import get_shared_state
 from infrastructure.logging.logger import get_logger
 from infrastructure.persistence.base.strategy import BaseStorageStrategy
 
@@ -14,6 +20,11 @@ from infrastructure.persistence.components import (
 )
 from infrastructure.persistence.exceptions import PersistenceError
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
 
 class JSONStorageStrategy(BaseStorageStrategy):
     """
@@ -21,6 +32,10 @@ class JSONStorageStrategy(BaseStorageStrategy):
 
     Orchestrates components for file operations, locking, serialization,
     and transaction management. Reduced from 935 lines to ~200 lines.
+
+    Writes hold an exclusive lock on a sidecar ``<file>.lock`` file (where
+    fcntl is available) around their read-modify-write, so server workers
+    and CLI processes sharing the file do not lose each other's updates.
     """
 
     def __init__(
@@ -49,6 +64,12 @@ class JSONStorageStrategy(BaseStorageStrategy):
         self._data_cache: Optional[Dict[str, Dict[str, Any]]] = None
         self._cache_valid = False
 
+        # In multi-worker serve mode other processes write the same file; a shared
+        # generation counter per file tells this process when its cache is stale.
+        self._shared_state = get_shared_state()
+        self._cache_generation: Optional[int] = None
+        self._lock_fd: Optional[int] = None
+
         self.logger.debug("Initialized JSON storage strategy for %s at %s", entity_type, file_path)
 
     def save(self, entity_id: str, data: Dict[str, Any]) -> None:
@@ -59,10 +80,10 @@ class JSONStorageStrategy(BaseStorageStrategy):
             entity_id: Unique identifier for the entity
             data: Entity data to save
         """
-        with self.lock_manager.write_lock():
+        with self._write_lock():
             try:
                 # Load current data
-                all_data = self._load_data()
+                all_data = self._load_for_update()
 
                 # Update with new data
                 all_data[entity_id] = data
@@ -129,9 +150,9 @@ class JSONStorageStrategy(BaseStorageStrategy):
         Args:
             entity_id: Entity identifier
         """
-        with self.lock_manager.write_lock():
+        with self._write_lock():
             try:
-                all_data = self._load_data()
+                all_data = self._load_for_update()
 
                 if entity_id not in all_data:
                     self.logger.warning(
@@ -209,6 +230,41 @@ class JSONStorageStrategy(BaseStorageStrategy):
                 self.logger.error("Failed to search %s entities: %s", self.entity_type, e)
                 raise PersistenceError(f"Failed to search entities: {e}")
 
+    def find_page(
+        self,
+        criteria: Optional[Dict[str, Any]] = None,
+        after_id: Optional[str] = None,
+        limit: int = 500,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Find one page of entities in entity ID order.
+
+        Entities are selected from the loaded file without copying or sorting
+        all of them.
+
+        Args:
+            criteria: Search criteria (all entities when None)
+            after_id: Only return entities whose ID sorts after this one
+            limit: Maximum number of entities
+
+        Returns:
+            Up to limit entities keyed by ID, in ascending ID order
+        """
+        with self.lock_manager.read_lock():
+            try:
+                all_data = self._load_data()
+                candidates = (
+                    (entity_id, entity_data)
+                    for entity_id, entity_data in all_data.items()
+                    if (after_id is None or entity_id > after_id)
+                    and (not criteria or self._matches_criteria(entity_data, criteria))
+                )
+                return dict(heapq.nsmallest(limit, candidates, key=itemgetter(0)))
+
+            except Exception as e:
+                self.logger.error("Failed to page %s entities: %s", self.entity_type, e)
+                raise PersistenceError(f"Failed to page entities: {e}")
+
     def save_batch(self, entities: Dict[str, Dict[str, Any]]) -> None:
         """
         Save multiple entities in batch.
@@ -216,9 +272,9 @@ class JSONStorageStrategy(BaseStorageStrategy):
         Args:
             entities: Dictionary of entities to save
         """
-        with self.lock_manager.write_lock():
+        with self._write_lock():
             try:
-                all_data = self._load_data()
+                all_data = self._load_for_update()
                 all_data.update(entities)
                 self._save_data(all_data)
                 self._cache_valid = False
@@ -236,9 +292,9 @@ class JSONStorageStrategy(BaseStorageStrategy):
         Args:
             entity_ids: List of entity IDs to delete
         """
-        with self.lock_manager.write_lock():
+        with self._write_lock():
             try:
-                all_data = self._load_data()
+                all_data = self._load_for_update()
 
                 for entity_id in entity_ids:
                     all_data.pop(entity_id, None)
@@ -270,6 +326,9 @@ class JSONStorageStrategy(BaseStorageStrategy):
         """Clean up resources."""
         self._data_cache = None
         self._cache_valid = False
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
         self.logger.debug("Cleaned up JSON storage strategy for %s", self.entity_type)
 
     def count(self) -> int:
@@ -286,9 +345,40 @@ class JSONStorageStrategy(BaseStorageStrategy):
                 self.logger.error(f"Failed to count {self.entity_type} entities: {e}")
                 return 0
 
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Serialize writers across threads, then across processes."""
+        with self.lock_manager.write_lock():
+            if fcntl is None:
+                yield
+                return
+            if self._lock_fd is None:
+                lock_path = f"{self.file_manager.file_path}.lock"
+                self._lock_fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _load_for_update(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load data for a read-modify-write under the write lock.
+
+        The file is re-read unless a shared generation proves the cache current.
+        """
+        if self._shared_state is None:
+            self._cache_valid = False
+        return self._load_data()
+
     def _load_data(self) -> Dict[str, Dict[str, Any]]:
         """Load data from file with caching."""
-        if self._cache_valid and self._data_cache is not None:
+        generation = self._shared_generation()
+        if (
+            self._cache_valid
+            and self._data_cache is not None
+            and generation == self._cache_generation
+        ):
             return self._data_cache
 
         try:
@@ -305,6 +395,7 @@ class JSONStorageStrategy(BaseStorageStrategy):
             # Cache the data
             self._data_cache = data
             self._cache_valid = True
+            self._cache_generation = generation
 
             return data
 
@@ -331,11 +422,33 @@ class JSONStorageStrategy(BaseStorageStrategy):
             # Update cache
             self._data_cache = data
             self._cache_valid = True
+            self._cache_generation = self._bump_shared_generation()
 
         except Exception as e:
             self.logger.error("Failed to save data: %s", e)
             raise
 
+    def _shared_generation(self) -> Optional[int]:
+        """Get the shared write generation of the file (None when not shared)."""
+        if self._shared_state is None:
+            return None
+        try:
+            return self._shared_state.get("json_storage", str(self.file_manager.file_path), 0)
+        except sqlite3.Error as e:
+            self.logger.debug("Shared storage generation unavailable: %s", e)
+            self._cache_valid = False
+            return None
+
+    def _bump_shared_generation(self) -> Optional[int]:
+        """Tell other processes the file changed; returns the new generation."""
+        if self._shared_state is None:
+            return None
+        try:
+            return self._shared_state.increment("json_storage", str(self.file_manager.file_path))
+        except sqlite3.Error as e:
+            self.logger.debug("Failed to publish shared storage generation: %s", e)
+            return None
+
     def _matches_criteria(self, entity_data: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
         """Check if entity matches search criteria."""
         for key, expected_value in criteria.items():
@@ -6,6 +6,7 @@ from typing import Optional
 
 from infrastructure.logging.logger import get_logger
 from infrastructure.persistence.base.unit_of_work import BaseUnitOfWork
+from infrastructure.persistence.components.archive_store import JSONSegmentArchiveStore
 
 # Import JSON storage strategy
 from infrastructure.persistence.json.strategy import JSONStorageStrategy
@@ -75,9 +76,18 @@ class JSONUnitOfWork(BaseUnitOfWork):
             file_path=template_path, create_dirs=create_dirs, entity_type="templates"
         )
 
+        # Archived requests and machines go to compressed segments beside the data files
+        archive_dir = os.path.join(data_dir, "archive")
+
         # Create repositories using simplified implementations
-        self.machine_repository = MachineRepository(machine_strategy)
-        self.request_repository = RequestRepository(request_strategy)
+        self.machine_repository = MachineRepository(
+            machine_strategy, archive_store=JSONSegmentArchiveStore(archive_dir, "machines")
+        )
+        self.request_repository = RequestRepository(
+            request_strategy,
+            archive_store=JSONSegmentArchiveStore(archive_dir, "requests"),
+            machine_storage=machine_strategy,
+        )
         self.template_repository = TemplateRepository(template_strategy)
 
         self.logger.debug(
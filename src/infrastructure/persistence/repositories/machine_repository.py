@@ -1,20 +1,29 @@
 """Single machine repository implementation using storage strategy composition."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from domain.base.ports.storage_port import StoragePort
-from domain.base.value_objects import InstanceId
+from domain.base.value_objects import InstanceId, InstanceType, Tags
 from domain.machine.aggregate import Machine
+from domain.machine.read_models import MachineSummary
 from domain.machine.repository import MachineRepository as MachineRepositoryInterface
 from domain.machine.value_objects import MachineId, MachineStatus
 from infrastructure.error.decorators import handle_infrastructure_exceptions
 from infrastructure.logging.logger import get_logger
+from infrastructure.persistence.components.archive_store import ArchiveStore
+
+
+# Records read from storage per page when iterating summaries
+SUMMARY_PAGE_SIZE = 500
 
 
 class MachineSerializer:
     """Handles Machine aggregate serialization/deserialization."""
 
+    # Version written by to_dict; only records with this version are rehydrated trusted
+    schema_version = "2.0.0"
+
     def __init__(self) -> None:
         """Initialize the instance."""
         self.logger = get_logger(__name__)
@@ -55,7 +64,7 @@ class MachineSerializer:
                 "created_at": (machine.created_at.isoformat() if machine.created_at else None),
                 "updated_at": (machine.updated_at.isoformat() if machine.updated_at else None),
                 # Schema version for migration support
-                "schema_version": "2.0.0",
+                "schema_version": self.schema_version,
             }
         except Exception as e:
             self.logger.error("Failed to serialize machine %s: %s", machine.instance_id, e)
@@ -125,13 +134,117 @@ class MachineSerializer:
             self.logger.error("Failed to deserialize machine data: %s", e)
             raise
 
+    def rehydrate(self, data: Dict[str, Any]) -> Machine:
+        """
+        Convert a stored record to a Machine, skipping re-validation when trusted.
+
+        Records written by to_dict at the current schema version already passed
+        validation when they were saved, so after cheap structural checks the
+        aggregate is built without validation. Legacy or migrated records, and
+        any record failing the checks, go through the validating from_dict.
+        """
+        if self._is_trusted(data):
+            try:
+                return self._from_trusted_dict(data)
+            except (KeyError, TypeError, ValueError) as e:
+                self.logger.debug(
+                    "Trusted rehydration failed for machine %s, validating: %s",
+                    data.get("instance_id"),
+                    e,
+                )
+        return self.from_dict(data)
+
+    def _is_trusted(self, data: Dict[str, Any]) -> bool:
+        """Structural checks on a record before skipping validation."""
+        return (
+            data.get("schema_version") == self.schema_version
+            and _non_empty_str(data.get("instance_id"))
+            and _non_empty_str(data.get("instance_type"))
+            and isinstance(data.get("template_id"), str)
+            and isinstance(data.get("image_id"), str)
+            and isinstance(data.get("provider_type"), str)
+            and isinstance(data.get("version"), int)
+            and isinstance(data.get("security_group_ids"), list)
+            and isinstance(data.get("tags"), dict)
+            and isinstance(data.get("metadata"), dict)
+            and isinstance(data.get("provider_data"), dict)
+        )
+
+    def _from_trusted_dict(self, data: Dict[str, Any]) -> Machine:
+        from domain.machine.machine_status import MachineStatus
+
+        instance_id = InstanceId.rehydrate(value=data["instance_id"])
+        return Machine.rehydrate(
+            id=instance_id,
+            instance_id=instance_id,
+            template_id=data["template_id"],
+            request_id=data.get("request_id"),
+            provider_type=data["provider_type"],
+            instance_type=InstanceType.rehydrate(value=data["instance_type"]),
+            image_id=data["image_id"],
+            private_ip=data.get("private_ip"),
+            public_ip=data.get("public_ip"),
+            subnet_id=data.get("subnet_id"),
+            security_group_ids=data["security_group_ids"],
+            status=MachineStatus(data["status"]),
+            status_reason=data.get("status_reason"),
+            launch_time=_parse_datetime(data.get("launch_time")),
+            termination_time=_parse_datetime(data.get("termination_time")),
+            tags=Tags.rehydrate(tags=data["tags"]),
+            metadata=data["metadata"],
+            provider_data=data["provider_data"],
+            version=data["version"],
+            created_at=_parse_datetime(data.get("created_at")),
+            updated_at=_parse_datetime(data.get("updated_at")),
+        )
+
+    def to_summary(self, data: Dict[str, Any]) -> MachineSummary:
+        """Project a stored machine record onto a summary without aggregate validation."""
+        return MachineSummary(
+            instance_id=data["instance_id"],
+            template_id=data.get("template_id"),
+            request_id=data.get("request_id"),
+            status=data.get("status", "pending"),
+            status_reason=data.get("status_reason"),
+            instance_type=data.get("instance_type"),
+            image_id=data.get("image_id"),
+            private_ip=data.get("private_ip"),
+            public_ip=data.get("public_ip"),
+            provider_type=data.get("provider_type", "aws"),
+            launch_time=data.get("launch_time"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at"),
+            metadata=data.get("metadata") or {},
+        )
+
+
+def _non_empty_str(value: Any) -> bool:
+    return isinstance(value, str) and bool(value) and value == value.strip()
+
+
+def _parse_datetime(value: Union[datetime, str, None]) -> Optional[datetime]:
+    """Parse a stored timestamp; SQL drivers return datetimes, other storage ISO strings."""
+    if not value:
+        return None
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def _is_terminal_record(data: Dict[str, Any]) -> bool:
+    try:
+        return MachineStatus.from_str(str(data.get("status", ""))).is_terminal
+    except ValueError:
+        return False
+
 
 class MachineRepositoryImpl(MachineRepositoryInterface):
     """Single machine repository implementation using storage strategy composition."""
 
-    def __init__(self, storage_port: StoragePort) -> None:
-        """Initialize repository with storage port."""
+    def __init__(
+        self, storage_port: StoragePort, archive_store: Optional[ArchiveStore] = None
+    ) -> None:
+        """Initialize repository with storage port and optional archive."""
         self.storage_port = storage_port
+        self.archive_store = archive_store
         self.serializer = MachineSerializer()
         self.logger = get_logger(__name__)
 
@@ -162,7 +275,7 @@ class MachineRepositoryImpl(MachineRepositoryInterface):
         try:
             data = self.storage_port.find_by_id(str(machine_id.value))
             if data:
-                return self.serializer.from_dict(data)
+                return self.serializer.rehydrate(data)
             return None
         except Exception as e:
             self.logger.error("Failed to get machine %s: %s", machine_id, e)
@@ -180,7 +293,7 @@ class MachineRepositoryImpl(MachineRepositoryInterface):
             criteria = {"instance_id": str(instance_id.value)}
             data_list = self.storage_port.find_by_criteria(criteria)
             if data_list:
-                return self.serializer.from_dict(data_list[0])
+                return self.serializer.rehydrate(data_list[0])
             return None
         except Exception as e:
             self.logger.error("Failed to find machine by instance_id %s: %s", instance_id, e)
@@ -192,7 +305,7 @@ class MachineRepositoryImpl(MachineRepositoryInterface):
         try:
             criteria = {"template_id": template_id}
             data_list = self.storage_port.find_by_criteria(criteria)
-            return [self.serializer.from_dict(data) for data in data_list]
+            return [self.serializer.rehydrate(data) for data in data_list]
         except Exception as e:
             self.logger.error("Failed to find machines by template_id %s: %s", template_id, e)
             raise
@@ -203,7 +316,7 @@ class MachineRepositoryImpl(MachineRepositoryInterface):
         try:
             criteria = {"status": status.value}
             data_list = self.storage_port.find_by_criteria(criteria)
-            return [self.serializer.from_dict(data) for data in data_list]
+            return [self.serializer.rehydrate(data) for data in data_list]
         except Exception as e:
             self.logger.error("Failed to find machines by status %s: %s", status, e)
             raise
@@ -218,7 +331,7 @@ class MachineRepositoryImpl(MachineRepositoryInterface):
             # Filter to only machine records (must have instance_id field)
             machine_data_list = [data for data in data_list if "instance_id" in data]
 
-            return [self.serializer.from_dict(data) for data in machine_data_list]
+            return [self.serializer.rehydrate(data) for data in machine_data_list]
         except Exception as e:
             self.logger.error("Failed to find machines by request_id %s: %s", request_id, e)
             raise
@@ -250,11 +363,104 @@ class MachineRepositoryImpl(MachineRepositoryInterface):
         """Find all machines."""
         try:
             all_data = self.storage_port.find_all()
-            return [self.serializer.from_dict(data) for data in all_data.values()]
+            return [self.serializer.rehydrate(data) for data in all_data.values()]
         except Exception as e:
             self.logger.error("Failed to find all machines: %s", e)
             raise
 
+    @handle_infrastructure_exceptions(context="machine_repository_find_summaries")
+    def find_summaries(self, criteria: Optional[Dict[str, Any]] = None) -> List[MachineSummary]:
+        """Find machine summaries matching storage-level criteria (all when None)."""
+        try:
+            if criteria:
+                data_list = self.storage_port.find_by_criteria(criteria)
+            else:
+                data_list = self.storage_port.find_all().values()
+
+            # Skip non-machine records that share the same storage file
+            return [self.serializer.to_summary(data) for data in data_list if "instance_id" in data]
+        except Exception as e:
+            self.logger.error("Failed to find machine summaries: %s", e)
+            raise
+
+    def iter_summaries(
+        self, criteria: Optional[Dict[str, Any]] = None, after_id: Optional[str] = None
+    ) -> Iterator[MachineSummary]:
+        """
+        Iterate machine summaries in instance ID order.
+
+        Records are read from storage one page of SUMMARY_PAGE_SIZE at a time,
+        so callers can stream or paginate without loading the whole store.
+
+        Args:
+            criteria: Storage-level criteria (all machines when None)
+            after_id: Only yield machines whose instance ID sorts after this one
+
+        Yields:
+            Machine summaries
+        """
+        while True:
+            page = self.storage_port.find_page(criteria, after_id, SUMMARY_PAGE_SIZE)
+            for entity_id, data in page.items():
+                # Shared single-file storage also holds the other entity type
+                if "instance_id" in data:
+                    yield self.serializer.to_summary(data)
+                after_id = entity_id
+            if len(page) < SUMMARY_PAGE_SIZE:
+                return
+
+    @handle_infrastructure_exceptions(context="machine_repository_archive_by_request_ids")
+    def archive_by_request_ids(self, request_ids: List[str]) -> int:
+        """
+        Move terminated and failed machines of the given requests to the archive.
+
+        Machines in any other state stay in live storage, since they can still
+        be returned.
+
+        Args:
+            request_ids: IDs of the requests whose machines are archived
+
+        Returns:
+            Number of archived machines
+        """
+        if self.archive_store is None:
+            self.logger.warning("No archive store configured, machines are kept in live storage")
+            return 0
+
+        try:
+            records = {}
+            for request_id in request_ids:
+                for data in self.storage_port.find_by_criteria({"request_id": request_id}):
+                    # Only machine records (must have instance_id field)
+                    if "instance_id" in data and _is_terminal_record(data):
+                        records[data["instance_id"]] = data
+            if not records:
+                return 0
+
+            self.archive_store.archive(records)
+            self.storage_port.delete_batch(list(records))
+            self.logger.info("Archived %s machines", len(records))
+            return len(records)
+        except Exception as e:
+            self.logger.error("Failed to archive machines: %s", e)
+            raise
+
+    @handle_infrastructure_exceptions(context="machine_repository_find_history")
+    def find_history(self, criteria: Optional[Dict[str, Any]] = None) -> List[Machine]:
+        """Find archived machines matching criteria (all when None)."""
+        if self.archive_store is None:
+            return []
+
+        try:
+            if criteria:
+                data_list = self.archive_store.find_by_criteria(criteria)
+            else:
+                data_list = list(self.archive_store.find_all().values())
+            return [self.serializer.rehydrate(data) for data in data_list if "instance_id" in data]
+        except Exception as e:
+            self.logger.error("Failed to find machine history: %s", e)
+            raise
+
     @handle_infrastructure_exceptions(context="machine_repository_delete")
     def delete(self, machine_id: MachineId) -> None:
         """Delete machine by ID."""
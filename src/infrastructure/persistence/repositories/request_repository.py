@@ -1,8 +1,8 @@
 """Single request repository implementation using storage strategy composition."""
 
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Type, Union
 from uuid import uuid4
 
 from domain.base.events import (
@@ -14,16 +14,26 @@ from domain.base.events import (
 )
 from domain.base.ports.storage_port import StoragePort
 from domain.base.value_objects import InstanceId  # Add InstanceId import
+from domain.machine.value_objects import MachineStatus
 from domain.request.aggregate import Request
+from domain.request.read_models import RequestSummary
 from domain.request.repository import RequestRepository as RequestRepositoryInterface
 from domain.request.value_objects import RequestId, RequestStatus, RequestType
 from infrastructure.error.decorators import handle_infrastructure_exceptions
 from infrastructure.logging.logger import get_logger
+from infrastructure.persistence.components.archive_store import ArchiveStore
+
+
+# Records read from storage per page when iterating summaries
+SUMMARY_PAGE_SIZE = 500
 
 
 class RequestSerializer:
     """Handles Request aggregate serialization/deserialization."""
 
+    # Version written by to_dict; only records with this version are rehydrated trusted
+    schema_version = "2.0.0"
+
     def __init__(self) -> None:
         """Initialize the instance."""
         self.logger = get_logger(__name__)
@@ -61,6 +71,8 @@ class RequestSerializer:
                 "completed_at": (
                     request.completed_at.isoformat() if request.completed_at else None
                 ),
+                # Indexed by the timeout sweeper
+                "deadline": request.deadline.isoformat() if request.deadline else None,
                 # Versioning
                 "version": request.version,
                 # Legacy fields for backward compatibility
@@ -68,7 +80,7 @@ class RequestSerializer:
                 "tags": request.metadata.get("tags", {}),
                 "error_message": request.status_message,  # Legacy field name
                 # Schema version for migration support
-                "schema_version": "2.0.0",
+                "schema_version": self.schema_version,
             }
         except Exception as e:
             self.logger.error("Failed to serialize request %s: %s", request.request_id, e)
@@ -130,18 +142,145 @@ class RequestSerializer:
             self.logger.error("Failed to deserialize request data: %s", e)
             raise
 
+    def rehydrate(self, data: Dict[str, Any]) -> Request:
+        """
+        Convert a stored record to a Request, skipping re-validation when trusted.
+
+        Records written by to_dict at the current schema version already passed
+        validation when they were saved, so after cheap structural checks the
+        aggregate is built without validation. Legacy or migrated records, and
+        any record failing the checks, go through the validating from_dict.
+        """
+        if self._is_trusted(data):
+            try:
+                return self._from_trusted_dict(data)
+            except (KeyError, TypeError, ValueError) as e:
+                self.logger.debug(
+                    "Trusted rehydration failed for request %s, validating: %s",
+                    data.get("request_id"),
+                    e,
+                )
+        return self.from_dict(data)
+
+    def _is_trusted(self, data: Dict[str, Any]) -> bool:
+        """Structural checks on a record before skipping validation."""
+        request_id = data.get("request_id")
+        machine_ids = data.get("machine_ids")
+        return (
+            data.get("schema_version") == self.schema_version
+            and isinstance(request_id, str)
+            and request_id.startswith(("req-", "ret-"))
+            and isinstance(data.get("template_id"), str)
+            and isinstance(data.get("provider_type"), str)
+            and isinstance(data.get("machine_count"), int)
+            and isinstance(data.get("successful_count"), int)
+            and isinstance(data.get("failed_count"), int)
+            and isinstance(data.get("version"), int)
+            and isinstance(data.get("resource_ids"), list)
+            and isinstance(machine_ids, list)
+            and all(isinstance(machine_id, str) and machine_id for machine_id in machine_ids)
+            and isinstance(data.get("metadata"), dict)
+            and isinstance(data.get("error_details"), dict)
+            and isinstance(data.get("provider_data"), dict)
+        )
+
+    def _from_trusted_dict(self, data: Dict[str, Any]) -> Request:
+        request_id = RequestId.rehydrate(value=data["request_id"])
+        return Request.rehydrate(
+            id=request_id,
+            request_id=request_id,
+            template_id=data["template_id"],
+            requested_count=data["machine_count"],
+            request_type=RequestType(data["request_type"]),
+            status=RequestStatus(data["status"]),
+            status_message=data.get("status_message", data.get("error_message")),
+            provider_name=data.get("provider_name"),
+            provider_api=data.get("provider_api"),
+            provider_type=data["provider_type"],
+            resource_ids=data["resource_ids"],
+            message=data.get("message"),
+            instance_ids=[
+                InstanceId.rehydrate(value=machine_id) for machine_id in data["machine_ids"]
+            ],
+            successful_count=data["successful_count"],
+            failed_count=data["failed_count"],
+            metadata=data["metadata"],
+            error_details=data["error_details"],
+            provider_data=data["provider_data"],
+            created_at=_parse_datetime(data["created_at"]),
+            started_at=_parse_datetime(data.get("started_at")),
+            completed_at=_parse_datetime(data.get("completed_at")),
+            version=data["version"],
+        )
+
+    def to_summary(self, data: Dict[str, Any]) -> RequestSummary:
+        """Project a stored request record onto a summary without aggregate validation."""
+        return RequestSummary(
+            request_id=data["request_id"],
+            template_id=data.get("template_id"),
+            request_type=data["request_type"],
+            status=data["status"],
+            status_message=data.get("status_message", data.get("error_message")),
+            requested_count=data.get("machine_count", data.get("requested_count", 1)),
+            successful_count=data.get("successful_count", 0),
+            failed_count=data.get("failed_count", 0),
+            machine_ids=tuple(data.get("machine_ids", ())),
+            provider_api=data.get("provider_api"),
+            created_at=data["created_at"],
+            completed_at=data.get("completed_at"),
+            metadata=data.get("metadata") or {},
+        )
+
+
+def _parse_datetime(value: Union[datetime, str, None]) -> Optional[datetime]:
+    """Parse a stored timestamp; SQL drivers return datetimes, other storage ISO strings."""
+    if not value:
+        return None
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    """Drop the timezone of aware datetimes; stored timestamps are naive UTC."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
 
 class RequestRepositoryImpl(RequestRepositoryInterface):
     """Single request repository implementation using storage strategy composition."""
 
-    def __init__(self, storage_port: StoragePort, event_publisher=None) -> None:
-        """Initialize repository with storage port and optional event publisher."""
+    def __init__(
+        self,
+        storage_port: StoragePort,
+        event_publisher=None,
+        archive_store: Optional[ArchiveStore] = None,
+        machine_storage: Optional[StoragePort] = None,
+    ) -> None:
+        """Initialize repository with storage port, optional event publisher and archive.
+
+        Args:
+            storage_port: Storage holding request records
+            event_publisher: Optional publisher for repository telemetry events
+            archive_store: Optional store receiving archived requests
+            machine_storage: Storage holding machine records, used to keep requests
+                with live machines out of the archive (defaults to storage_port,
+                as in single_file mode)
+        """
         self.storage_port = storage_port
+        self.archive_store = archive_store
+        self.machine_storage = machine_storage or storage_port
         self.serializer = RequestSerializer()
         self.logger = get_logger(__name__)
         self.event_publisher = event_publisher
         self.slow_query_threshold_ms = 1000.0  # 1 second threshold
 
+    def _should_publish(self, event_class: Type[DomainEvent]) -> bool:
+        """Check whether to build a persistence event (no publisher, or sampled out)."""
+        if self.event_publisher is None:
+            return False
+        should_publish = getattr(self.event_publisher, "should_publish", None)
+        return should_publish is None or should_publish(event_class.__name__)
+
     def _publish_persistence_event(self, event: DomainEvent) -> None:
         """Publish persistence event if publisher is available."""
         if self.event_publisher:
@@ -156,19 +295,21 @@ class RequestRepositoryImpl(RequestRepositoryInterface):
         operation_id = str(uuid4())
         start_time = time.time()
         entity_id = str(request.request_id.value)
+        storage_strategy = self.storage_port.__class__.__name__
 
         # Publish operation started event
-        self._publish_persistence_event(
-            RepositoryOperationStartedEvent(
-                aggregate_id=operation_id,
-                aggregate_type="RepositoryOperation",
-                operation_id=operation_id,
-                entity_type="Request",
-                entity_id=entity_id,
-                storage_strategy=self.storage_port.__class__.__name__,
-                operation_type="save",
+        if self._should_publish(RepositoryOperationStartedEvent):
+            self._publish_persistence_event(
+                RepositoryOperationStartedEvent(
+                    aggregate_id=operation_id,
+                    aggregate_type="RepositoryOperation",
+                    operation_id=operation_id,
+                    entity_type="Request",
+                    entity_id=entity_id,
+                    storage_strategy=storage_strategy,
+                    operation_type="save",
+                )
             )
-        )
 
         try:
             # Save the request
@@ -183,23 +324,26 @@ class RequestRepositoryImpl(RequestRepositoryInterface):
             request.clear_domain_events()
 
             # Publish operation completed event
-            self._publish_persistence_event(
-                RepositoryOperationCompletedEvent(
-                    aggregate_id=operation_id,
-                    aggregate_type="RepositoryOperation",
-                    operation_id=operation_id,
-                    entity_type="Request",
-                    entity_id=entity_id,
-                    storage_strategy=self.storage_port.__class__.__name__,
-                    operation_type="save",
-                    duration_ms=duration_ms,
-                    success=True,
-                    records_affected=1,
+            if self._should_publish(RepositoryOperationCompletedEvent):
+                self._publish_persistence_event(
+                    RepositoryOperationCompletedEvent(
+                        aggregate_id=operation_id,
+                        aggregate_type="RepositoryOperation",
+                        operation_id=operation_id,
+                        entity_type="Request",
+                        entity_id=entity_id,
+                        storage_strategy=storage_strategy,
+                        operation_type="save",
+                        duration_ms=duration_ms,
+                        success=True,
+                        records_affected=1,
+                    )
                 )
-            )
 
             # Check for slow operations
-            if duration_ms > self.slow_query_threshold_ms:
+            if duration_ms > self.slow_query_threshold_ms and self._should_publish(
+                SlowQueryDetectedEvent
+            ):
                 self._publish_persistence_event(
                     SlowQueryDetectedEvent(
                         aggregate_id=operation_id,
@@ -207,7 +351,7 @@ class RequestRepositoryImpl(RequestRepositoryInterface):
                         operation_id=operation_id,
                         entity_type="Request",
                         entity_id=entity_id,
-                        storage_strategy=self.storage_port.__class__.__name__,
+                        storage_strategy=storage_strategy,
                         operation_type="save",
                         duration_ms=duration_ms,
                         threshold_ms=self.slow_query_threshold_ms,
@@ -224,21 +368,22 @@ class RequestRepositoryImpl(RequestRepositoryInterface):
             duration_ms = (time.time() - start_time) * 1000
 
             # Publish operation failed event
-            self._publish_persistence_event(
-                RepositoryOperationFailedEvent(
-                    aggregate_id=operation_id,
-                    aggregate_type="RepositoryOperation",
-                    operation_id=operation_id,
-                    entity_type="Request",
-                    entity_id=entity_id,
-                    storage_strategy=self.storage_port.__class__.__name__,
-                    operation_type="save",
-                    error_message=str(e),
-                    error_code=type(e).__name__,
-                    retry_count=0,
-                    duration_ms=duration_ms,
+            if self._should_publish(RepositoryOperationFailedEvent):
+                self._publish_persistence_event(
+                    RepositoryOperationFailedEvent(
+                        aggregate_id=operation_id,
+                        aggregate_type="RepositoryOperation",
+                        operation_id=operation_id,
+                        entity_type="Request",
+                        entity_id=entity_id,
+                        storage_strategy=storage_strategy,
+                        operation_type="save",
+                        error_message=str(e),
+                        error_code=type(e).__name__,
+                        retry_count=0,
+                        duration_ms=duration_ms,
+                    )
                 )
-            )
 
             self.logger.error("Failed to save request %s: %s", request.request_id, e)
             raise
@@ -249,7 +394,7 @@ class RequestRepositoryImpl(RequestRepositoryInterface):
         try:
             data = self.storage_port.find_by_id(str(request_id.value))
             if data:
-                return self.serializer.from_dict(data)
+                return self.serializer.rehydrate(data)
             return None
         except Exception as e:
             self.logger.error("Failed to get request %s: %s", request_id, e)
@@ -275,7 +420,7 @@ class RequestRepositoryImpl(RequestRepositoryInterface):
         try:
             criteria = {"status": status.value}
             data_list = self.storage_port.find_by_criteria(criteria)
-            return [self.serializer.from_dict(data) for data in data_list]
+            return [self.serializer.rehydrate(data) for data in data_list]
         except Exception as e:
             self.logger.error("Failed to find requests by status %s: %s", status, e)
             raise
@@ -286,7 +431,7 @@ class RequestRepositoryImpl(RequestRepositoryInterface):
         try:
             criteria = {"template_id": template_id}
             data_list = self.storage_port.find_by_criteria(criteria)
-            return [self.serializer.from_dict(data) for data in data_list]
+            return [self.serializer.rehydrate(data) for data in data_list]
         except Exception as e:
             self.logger.error("Failed to find requests by template_id %s: %s", template_id, e)
             raise
@@ -297,7 +442,7 @@ class RequestRepositoryImpl(RequestRepositoryInterface):
         try:
             criteria = {"request_type": request_type.value}
             data_list = self.storage_port.find_by_criteria(criteria)
-            return [self.serializer.from_dict(data) for data in data_list]
+            return [self.serializer.rehydrate(data) for data in data_list]
         except Exception as e:
             self.logger.error("Failed to find requests by type %s: %s", request_type, e)
             raise
@@ -339,11 +484,181 @@ class RequestRepositoryImpl(RequestRepositoryInterface):
         """Find all requests."""
         try:
             all_data = self.storage_port.find_all()
-            return [self.serializer.from_dict(data) for data in all_data.values()]
+            return [self.serializer.rehydrate(data) for data in all_data.values()]
         except Exception as e:
             self.logger.error("Failed to find all requests: %s", e)
             raise
 
+    @handle_infrastructure_exceptions(context="request_repository_find_summaries")
+    def find_summaries(self, criteria: Optional[Dict[str, Any]] = None) -> List[RequestSummary]:
+        """Find request summaries matching storage-level criteria (all when None)."""
+        try:
+            if criteria:
+                data_list = self.storage_port.find_by_criteria(criteria)
+            else:
+                data_list = self.storage_port.find_all().values()
+
+            # Skip non-request records (machines also carry request_id)
+            return [
+                self.serializer.to_summary(data) for data in data_list if "request_type" in data
+            ]
+        except Exception as e:
+            self.logger.error("Failed to find request summaries: %s", e)
+            raise
+
+    def iter_summaries(
+        self, criteria: Optional[Dict[str, Any]] = None, after_id: Optional[str] = None
+    ) -> Iterator[RequestSummary]:
+        """
+        Iterate request summaries in request ID order.
+
+        Records are read from storage one page of SUMMARY_PAGE_SIZE at a time,
+        so callers can stream or paginate without loading the whole store.
+
+        Args:
+            criteria: Storage-level criteria (all requests when None)
+            after_id: Only yield requests whose ID sorts after this one
+
+        Yields:
+            Request summaries
+        """
+        while True:
+            page = self.storage_port.find_page(criteria, after_id, SUMMARY_PAGE_SIZE)
+            for entity_id, data in page.items():
+                # Shared single-file storage also holds the other entity type
+                if "request_type" in data:
+                    yield self.serializer.to_summary(data)
+                after_id = entity_id
+            if len(page) < SUMMARY_PAGE_SIZE:
+                return
+
+    @handle_infrastructure_exceptions(context="request_repository_find_deadlines")
+    def find_deadlines(self) -> Dict[str, datetime]:
+        """
+        Find deadlines of active requests that have a timeout.
+
+        Returns:
+            Naive UTC deadlines keyed by request ID
+        """
+        try:
+            active_statuses = [status.value for status in RequestStatus if status.is_active()]
+            data_list = self.storage_port.find_by_criteria({"status": {"$in": active_statuses}})
+
+            deadlines = {}
+            for data in data_list:
+                if "request_type" not in data:
+                    continue
+                deadline = _parse_datetime(data.get("deadline"))
+                timeout = data.get("timeout")
+                # Records saved before deadlines were stored only carry the timeout
+                if deadline is None and isinstance(timeout, int) and timeout > 0:
+                    deadline = _parse_datetime(data["created_at"]) + timedelta(
+                        seconds=timeout
+                    )
+                if deadline is not None:
+                    deadlines[data["request_id"]] = _as_naive_utc(deadline)
+            return deadlines
+        except Exception as e:
+            self.logger.error("Failed to find request deadlines: %s", e)
+            raise
+
+    @handle_infrastructure_exceptions(context="request_repository_find_archivable")
+    def find_archivable(self, completed_before: datetime) -> List[str]:
+        """
+        Find IDs of terminal requests completed before the given time.
+
+        Requests without a completion time are aged by their creation time.
+        Requests that still own machines in a non-terminal state are skipped:
+        an acquire request completes when it is fulfilled, while its hosts keep
+        running until they are returned.
+
+        Args:
+            completed_before: Naive UTC (or timezone-aware) cutoff time
+
+        Returns:
+            IDs of the requests that may be archived
+        """
+        try:
+            cutoff = _as_naive_utc(completed_before)
+            terminal_statuses = [status.value for status in RequestStatus if status.is_terminal()]
+            data_list = self.storage_port.find_by_criteria({"status": {"$in": terminal_statuses}})
+
+            request_ids = []
+            for data in data_list:
+                # Skip non-request records (machines also carry status)
+                if "request_type" not in data:
+                    continue
+                finished_at = _parse_datetime(data.get("completed_at") or data.get("created_at"))
+                if finished_at is not None and _as_naive_utc(finished_at) < cutoff:
+                    request_ids.append(data["request_id"])
+            if not request_ids:
+                return []
+
+            live_statuses = [status.value for status in MachineStatus if not status.is_terminal]
+            busy_request_ids = {
+                data.get("request_id")
+                for data in self.machine_storage.find_by_criteria(
+                    {"status": {"$in": live_statuses}}
+                )
+                # Only machine records (must have instance_id field)
+                if "instance_id" in data
+            }
+            return [request_id for request_id in request_ids if request_id not in busy_request_ids]
+        except Exception as e:
+            self.logger.error("Failed to find archivable requests: %s", e)
+            raise
+
+    @handle_infrastructure_exceptions(context="request_repository_archive")
+    def archive(self, request_ids: List[str]) -> int:
+        """
+        Move requests from live storage to the archive.
+
+        Records are written to the archive before they are deleted, so a
+        failure in between leaves a request in both places rather than neither.
+
+        Args:
+            request_ids: IDs of the requests to archive
+
+        Returns:
+            Number of archived requests
+        """
+        if self.archive_store is None:
+            self.logger.warning("No archive store configured, requests are kept in live storage")
+            return 0
+
+        try:
+            records = {}
+            for request_id in request_ids:
+                data = self.storage_port.find_by_id(request_id)
+                if data and "request_type" in data:
+                    records[request_id] = data
+            if not records:
+                return 0
+
+            self.archive_store.archive(records)
+            self.storage_port.delete_batch(list(records))
+            self.logger.info("Archived %s requests", len(records))
+            return len(records)
+        except Exception as e:
+            self.logger.error("Failed to archive requests: %s", e)
+            raise
+
+    @handle_infrastructure_exceptions(context="request_repository_find_history")
+    def find_history(self, criteria: Optional[Dict[str, Any]] = None) -> List[Request]:
+        """Find archived requests matching criteria (all when None)."""
+        if self.archive_store is None:
+            return []
+
+        try:
+            if criteria:
+                data_list = self.archive_store.find_by_criteria(criteria)
+            else:
+                data_list = list(self.archive_store.find_all().values())
+            return [self.serializer.rehydrate(data) for data in data_list if "request_type" in data]
+        except Exception as e:
+            self.logger.error("Failed to find request history: %s", e)
+            raise
+
     @handle_infrastructure_exceptions(context="request_repository_delete")
     def delete(self, request_id: RequestId) -> None:
         """Delete request by ID."""
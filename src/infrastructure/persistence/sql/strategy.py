@@ -251,6 +251,47 @@ class SQLStorageStrategy(BaseStorageStrategy):
                 self.logger.error("Failed to search entities: %s", e)
                 raise PersistenceError(f"Failed to search entities: {e}")
 
+    def find_page(
+        self,
+        criteria: Optional[Dict[str, Any]] = None,
+        after_id: Optional[str] = None,
+        limit: int = 500,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Find one page of entities in entity ID order with a keyset query.
+
+        Args:
+            criteria: Search criteria (all entities when None)
+            after_id: Only return entities whose ID sorts after this one
+            limit: Maximum number of entities
+
+        Returns:
+            Up to limit entities keyed by ID, in ascending ID order
+        """
+        with self.lock_manager.read_lock():
+            try:
+                id_column = self._get_id_column()
+                prepared_criteria = self.serializer.prepare_criteria(criteria or {})
+                query, params = self.query_builder.build_select_page(
+                    prepared_criteria, id_column, after_id, limit
+                )
+
+                with self.connection_manager.get_session() as session:
+                    result = session.execute(text(query), params)
+                    rows = result.fetchall()
+
+                entities = {}
+                for row in rows:
+                    row_dict = dict(row._mapping) if hasattr(row, "_mapping") else dict(row)
+                    entity_data = self.serializer.deserialize_from_row(row_dict)
+                    entities[str(row_dict[id_column])] = entity_data
+
+                return entities
+
+            except Exception as e:
+                self.logger.error("Failed to page entities: %s", e)
+                raise PersistenceError(f"Failed to page entities: {e}")
+
     def save_batch(self, entities: Dict[str, Dict[str, Any]]) -> None:
         """
         Save multiple entities in batch.
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from infrastructure.logging.logger import get_logger
 from infrastructure.persistence.base.unit_of_work import BaseUnitOfWork
+from infrastructure.persistence.components.archive_store import StorageArchiveStore
 
 # Import new simplified repositories
 from infrastructure.persistence.repositories.machine_repository import (
@@ -61,9 +62,19 @@ class SQLUnitOfWork(BaseUnitOfWork):
         )
         template_strategy.engine = engine
 
+        # Archived requests and machines go to archive tables with the same columns
+        machine_archive = StorageArchiveStore(
+            lambda: self._create_archive_strategy("machines_archive", self._get_machine_columns())
+        )
+        request_archive = StorageArchiveStore(
+            lambda: self._create_archive_strategy("requests_archive", self._get_request_columns())
+        )
+
         # Create repositories using simplified implementations
-        self.machine_repository = MachineRepository(machine_strategy)
-        self.request_repository = RequestRepository(request_strategy)
+        self.machine_repository = MachineRepository(machine_strategy, archive_store=machine_archive)
+        self.request_repository = RequestRepository(
+            request_strategy, archive_store=request_archive, machine_storage=machine_strategy
+        )
         self.template_repository = TemplateRepository(template_strategy)
 
         self.logger.debug("Initialized SQLUnitOfWork with simplified repositories")
@@ -83,6 +94,18 @@ class SQLUnitOfWork(BaseUnitOfWork):
         """Get template repository."""
         return self.template_repository
 
+    def _create_archive_strategy(
+        self, table_name: str, columns: Dict[str, str]
+    ) -> SQLStorageStrategy:
+        """Create the strategy of an archive table on first use."""
+        archive_strategy = SQLStorageStrategy(
+            config=None,  # Will be set from engine
+            table_name=table_name,
+            columns=columns,
+        )
+        archive_strategy.engine = self.engine
+        return archive_strategy
+
     def _get_machine_columns(self) -> Dict[str, str]:
         """Get machine table column definitions."""
         return {
@@ -119,6 +142,7 @@ class SQLUnitOfWork(BaseUnitOfWork):
             "created_at": "TIMESTAMP",
             "updated_at": "TIMESTAMP",
             "completed_at": "TIMESTAMP",
+            "deadline": "TIMESTAMP",
         }
 
     def _get_template_columns(self) -> Dict[str, str]:
@@ -1,13 +1,25 @@
 """Infrastructure resilience package - Integrated retry mechanisms."""
 
 from .config import RetryConfig
+from .deadline import deadline_scope, get_deadline, remaining_time
+from .engine import (
+    RetryBudget,
+    RetryEngine,
+    RetryPolicy,
+    backoff_delay,
+    configure_retry_engine,
+    get_retry_engine,
+)
 from .exceptions import (
     CircuitBreakerOpenError,
+    DeadlineExceededError,
     InvalidRetryStrategyError,
     MaxRetriesExceededError,
     RetryConfigurationError,
     RetryError,
 )
+from .hedging import HedgedCaller
+from .rate_limiter import RateLimiter, configure_rate_limiter, get_rate_limiter
 from .retry_decorator import get_retry_config_for_service, retry
 from .strategy import (
     CircuitBreakerStrategy,
@@ -20,6 +32,13 @@ __all__: list[str] = [
     # Main retry decorator
     "retry",
     "get_retry_config_for_service",
+    # Retry engine
+    "RetryEngine",
+    "RetryPolicy",
+    "RetryBudget",
+    "backoff_delay",
+    "configure_retry_engine",
+    "get_retry_engine",
     # Configuration
     "RetryConfig",
     # Exceptions
@@ -28,9 +47,19 @@ __all__: list[str] = [
     "InvalidRetryStrategyError",
     "RetryConfigurationError",
     "CircuitBreakerOpenError",
+    "DeadlineExceededError",
     # Strategies
     "RetryStrategy",
     "ExponentialBackoffStrategy",
     "CircuitBreakerStrategy",
     "CircuitState",
+    # Deadlines and hedging
+    "deadline_scope",
+    "get_deadline",
+    "remaining_time",
+    "HedgedCaller",
+    # Rate limiting
+    "RateLimiter",
+    "configure_rate_limiter",
+    "get_rate_limiter",
 ]
@@ -0,0 +1,105 @@
+"""Per-command deadlines propagated to the calls a command makes.
+
+A deadline is set once where a command enters the application (the CLI
+sets it from ``--deadline`` or the HostFactory ``HF_TIMEOUT``) and read by
+the code making remote calls, so a single slow response cannot hold the
+command past the point where its caller gives up on it. Deadlines live in
+a context variable: they follow the command through ``await`` and
+``asyncio.to_thread``, while threads started directly must copy the context
+(``contextvars.copy_context().run``).
+"""
+
+import contextvars
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from infrastructure.resilience.exceptions import DeadlineExceededError
+
+DEADLINE_ENV_VAR = "HF_TIMEOUT"
+
+# Share of a caller's timeout the command may spend; the rest is left for
+# writing the response before the caller kills the script
+DEADLINE_HEADROOM = 0.9
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "deadline", default=None
+)
+
+
+def get_deadline() -> Optional[float]:
+    """Get the current deadline as a ``time.monotonic()`` value, if one is set."""
+    return _deadline.get()
+
+
+def remaining_time() -> Optional[float]:
+    """Get the seconds left before the current deadline (None when there is none)."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def check_deadline(operation: str) -> None:
+    """
+    Fail fast when the current deadline has already passed.
+
+    Args:
+        operation: Name of the operation about to start
+
+    Raises:
+        DeadlineExceededError: If no time is left
+    """
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededError(operation, 0.0)
+
+
+@contextmanager
+def deadline_scope(timeout: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Run a block with a deadline ``timeout`` seconds from now.
+
+    Nested scopes can only shorten the deadline of the enclosing one.
+
+    Args:
+        timeout: Seconds the block may take (None keeps the current deadline)
+
+    Yields:
+        The deadline in effect inside the block
+    """
+    current = _deadline.get()
+    if timeout is None:
+        yield current
+        return
+
+    deadline = time.monotonic() + max(0.0, timeout)
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def command_timeout(explicit: Optional[float] = None) -> Optional[float]:
+    """
+    Get the time budget of the running command.
+
+    Args:
+        explicit: Timeout given on the command line, in seconds
+
+    Returns:
+        Seconds the command may spend, or None when it has no timeout
+    """
+    timeout = explicit
+    if timeout is None:
+        try:
+            timeout = float(os.environ[DEADLINE_ENV_VAR])
+        except (KeyError, ValueError):
+            return None
+    if timeout <= 0:
+        return None
+    return timeout * DEADLINE_HEADROOM
@@ -0,0 +1,306 @@
+"""Retry engine shared by every retry loop in the application.
+
+One engine runs the retry loops of the ``@retry`` decorator, optimistic
+concurrency control and the error handling adapter, in a blocking
+(:meth:`RetryEngine.run`) and an asyncio (:meth:`RetryEngine.run_async`)
+flavour; the async one awaits its backoff so the event loop keeps serving
+other work while a call is throttled.
+
+Backoff uses full jitter: the delay is drawn uniformly between zero and
+the exponential cap, which spreads out retries of callers that failed
+together. Every retry also spends a token from a process-wide
+:class:`RetryBudget` that is refilled by first attempts; once retries
+make up more than the budgeted share of calls, failures are returned to
+the caller instead of being retried, so a throttled or failing dependency
+does not get its load multiplied by retry storms.
+"""
+
+import asyncio
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Tuple, Type
+
+from infrastructure.logging.logger import get_logger
+from infrastructure.resilience.deadline import check_deadline, remaining_time
+from infrastructure.resilience.exceptions import DeadlineExceededError
+
+logger = get_logger(__name__)
+
+_random = secrets.SystemRandom()
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float, jitter: bool = True) -> float:
+    """
+    Get the backoff before retry ``attempt`` (0-based).
+
+    Args:
+        attempt: Number of the failed attempt, starting at 0
+        base_delay: Delay cap of the first retry in seconds
+        max_delay: Largest delay cap in seconds
+        jitter: Draw the delay uniformly below the cap (full jitter)
+
+    Returns:
+        Delay in seconds
+    """
+    cap = min(max_delay, base_delay * (2**attempt))
+    return _random.uniform(0.0, cap) if jitter else cap
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a share of calls.
+
+    Each call deposits ``ratio`` tokens and each retry spends one, so in the
+    long run at most ``ratio`` retries are made per call. A trickle of
+    ``min_per_second`` tokens keeps rarely called operations retryable.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        capacity: float = 50.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the retry budget.
+
+        Args:
+            ratio: Retries allowed per call
+            min_per_second: Retries allowed per second regardless of call volume
+            capacity: Most retry tokens that can be saved up
+            clock: Monotonic time source
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated_at = clock()
+        self._exhausted = 0
+
+    def record_call(self) -> None:
+        """Deposit the share of a retry earned by a call."""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """
+        Spend a token for one retry.
+
+        Returns:
+            True if the retry is within budget
+        """
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated_at)
+            self._updated_at = now
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.min_per_second)
+            if self._tokens < 1.0:
+                self._exhausted += 1
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def get_stats(self) -> dict:
+        """Get the available tokens and the number of retries refused."""
+        with self._lock:
+            return {"tokens": self._tokens, "exhausted": self._exhausted}
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How one call site retries.
+
+    Attributes:
+        callsite: Name used in logs and retry metrics
+        max_retries: Retries after the first attempt
+        base_delay: Backoff cap of the first retry in seconds
+        max_delay: Largest backoff cap in seconds
+        jitter: Use full-jitter backoff
+        retry_on: Exception types that may be retried
+        should_retry: Extra check ``(attempt, error) -> bool`` for retryable errors
+        delay: Custom backoff ``(attempt) -> seconds``, replacing the exponential one
+        on_retry: Called with ``(attempt, error, delay)`` before each backoff
+        use_budget: Whether retries spend tokens from the retry budget
+    """
+
+    callsite: str
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    jitter: bool = True
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,)
+    should_retry: Optional[Callable[[int, BaseException], bool]] = None
+    delay: Optional[Callable[[int], float]] = None
+    on_retry: Optional[Callable[[int, BaseException, float], None]] = None
+    use_budget: bool = True
+
+
+class RetryEngine:
+    """Run calls with retries according to a :class:`RetryPolicy`."""
+
+    def __init__(
+        self,
+        budget: Optional[RetryBudget] = None,
+        metrics: Optional[Any] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """
+        Initialize the retry engine.
+
+        Args:
+            budget: Retry budget shared by all call sites (None disables the budget)
+            metrics: MetricsCollector receiving per-call-site retry counters
+            sleep: Blocking sleep used by :meth:`run`
+            async_sleep: Awaitable sleep used by :meth:`run_async`
+        """
+        self.budget = budget
+        self._metrics = metrics
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._lock = threading.Lock()
+        self._registered_counters: set = set()
+
+    def set_metrics(self, metrics: Optional[Any]) -> None:
+        """Set the MetricsCollector receiving retry counters."""
+        with self._lock:
+            self._metrics = metrics
+            self._registered_counters.clear()
+
+    def run(self, policy: RetryPolicy, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call ``func``, sleeping between retries.
+
+        Args:
+            policy: Retry policy of the call site
+            func: Function to call
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            Exception: The error of the last attempt when it is not retried
+        """
+        self._record_call(policy)
+        attempt = 0
+        while True:
+            check_deadline(policy.callsite)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(policy, attempt, e)
+                if delay is None:
+                    raise
+            self._sleep(delay)
+            attempt += 1
+
+    async def run_async(
+        self, policy: RetryPolicy, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        """
+        Await ``func``, awaiting the backoff between retries instead of blocking.
+
+        Args:
+            policy: Retry policy of the call site
+            func: Coroutine function to await
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            Exception: The error of the last attempt when it is not retried
+        """
+        self._record_call(policy)
+        attempt = 0
+        while True:
+            check_deadline(policy.callsite)
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                delay = self._next_delay(policy, attempt, e)
+                if delay is None:
+                    raise
+            await self._async_sleep(delay)
+            attempt += 1
+
+    def _record_call(self, policy: RetryPolicy) -> None:
+        if policy.use_budget and self.budget is not None:
+            self.budget.record_call()
+
+    def _next_delay(
+        self, policy: RetryPolicy, attempt: int, error: BaseException
+    ) -> Optional[float]:
+        """Get the backoff before retrying ``error``, or None when it is not retried."""
+        if isinstance(error, DeadlineExceededError) or not isinstance(error, policy.retry_on):
+            return None
+        # should_retry sees every failure, also the last one (circuit breakers count them)
+        if policy.should_retry is not None and not policy.should_retry(attempt, error):
+            return None
+        if attempt >= policy.max_retries:
+            return None
+
+        if policy.delay is not None:
+            delay = policy.delay(attempt)
+        else:
+            delay = backoff_delay(attempt, policy.base_delay, policy.max_delay, policy.jitter)
+
+        remaining = remaining_time()
+        if remaining is not None and delay >= remaining:
+            logger.warning(
+                "Not retrying %s: %.2fs left before the deadline. Error: %s",
+                policy.callsite,
+                remaining,
+                error,
+            )
+            return None
+
+        if policy.use_budget and self.budget is not None and not self.budget.try_acquire():
+            logger.warning("Retry budget exhausted, not retrying %s: %s", policy.callsite, error)
+            self._count("retry_budget_exhausted_total")
+            return None
+
+        self._count(f"{policy.callsite}_retries_total")
+        if policy.on_retry is not None:
+            policy.on_retry(attempt, error, delay)
+        return delay
+
+    def _count(self, name: str) -> None:
+        """Increment a retry counter on the MetricsCollector, registering it on first use."""
+        metrics = self._metrics
+        if metrics is None:
+            return
+        with self._lock:
+            if name not in self._registered_counters:
+                metrics.register_counter(name)
+                self._registered_counters.add(name)
+        metrics.increment_counter(name)
+
+
+_engine: Optional[RetryEngine] = None
+_engine_lock = threading.Lock()
+
+
+def configure_retry_engine(engine: Optional[RetryEngine]) -> None:
+    """Set the process-wide retry engine (None restores the default on next use)."""
+    global _engine
+    _engine = engine
+
+
+def get_retry_engine() -> RetryEngine:
+    """Get the process-wide retry engine, created with a default budget on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = RetryEngine(budget=RetryBudget())
+    return _engine
@@ -60,3 +60,19 @@ class CircuitBreakerOpenError(RetryError):
             f"Circuit breaker is OPEN for service '{service_name}' "
             f"after {failure_count} failures. Failing fast to prevent cascading failures."
         )
+
+
+class DeadlineExceededError(RetryError):
+    """Exception raised when an operation cannot complete before its deadline."""
+
+    def __init__(self, operation: str, timeout: float) -> None:
+        """
+        Initialize DeadlineExceededError.
+
+        Args:
+            operation: Name of the operation that ran out of time
+            timeout: Seconds the operation was allowed
+        """
+        self.operation = operation
+        self.timeout = timeout
+        super().__init__(f"Deadline exceeded for '{operation}' after {timeout:.2f}s")
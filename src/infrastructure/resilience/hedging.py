@@ -0,0 +1,208 @@
+"""Deadline-bounded and hedged execution of idempotent calls.
+
+A call made through :class:`HedgedCaller` never keeps its caller waiting
+past the current deadline (see :mod:`infrastructure.resilience.deadline`).
+With hedging enabled, a call still running after the observed p95 latency
+of its operation gets a second, identical call; whichever answers first
+wins. Only a few percent of calls are slow enough to be hedged, so the
+extra load is small while tail latency drops to roughly that of the
+faster of two calls. Hedges are also capped at a share of all calls, so a
+uniformly slow service does not get its load doubled.
+
+Only idempotent calls may be hedged or abandoned at the deadline: the
+losing call keeps running in the background and its result is discarded.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from infrastructure.logging.logger import get_logger
+from infrastructure.resilience.deadline import get_deadline, remaining_time
+from infrastructure.resilience.exceptions import DeadlineExceededError
+
+logger = get_logger(__name__)
+
+
+class HedgedCaller:
+    """Run idempotent calls bounded by the current deadline, hedging slow ones."""
+
+    def __init__(
+        self,
+        hedging: bool = False,
+        percentile: float = 0.95,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_delay: float = 5.0,
+        min_samples: int = 20,
+        window: int = 500,
+        max_hedge_ratio: float = 0.1,
+        metrics: Optional[Any] = None,
+    ) -> None:
+        """
+        Initialize the caller.
+
+        Args:
+            hedging: Whether slow calls get a second, hedged call
+            percentile: Latency percentile after which a call is hedged
+            initial_delay: Hedge delay used until enough latencies are recorded
+            min_delay: Shortest hedge delay
+            max_delay: Longest hedge delay
+            min_samples: Latencies recorded per operation before using the percentile
+            window: Latencies kept per operation
+            max_hedge_ratio: Largest share of calls that may be hedged
+            metrics: MetricsCollector receiving hedge and deadline counters
+        """
+        self.hedging = hedging
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.max_hedge_ratio = max_hedge_ratio
+        self._metrics = metrics
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "deadline_exceeded": 0}
+
+        if metrics is not None:
+            metrics.register_counter("hedged_requests_total")
+            metrics.register_counter("hedged_request_wins_total")
+            metrics.register_counter("deadline_exceeded_total")
+            metrics.register_gauge("hedge_rate")
+
+    def call(self, key: str, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Call ``func``, returning no later than the current deadline.
+
+        Args:
+            key: Operation name used for latency tracking, e.g. ``ec2:DescribeInstances``
+            func: Idempotent function to call
+            *args: Positional arguments for ``func``
+            **kwargs: Keyword arguments for ``func``
+
+        Returns:
+            The result of the first call to succeed
+
+        Raises:
+            DeadlineExceededError: If no call succeeded before the deadline
+            Exception: The error of the original call when every call failed
+        """
+        deadline = get_deadline()
+        if not self.hedging and deadline is None:
+            return func(*args, **kwargs)
+
+        remaining = remaining_time()
+        if remaining is not None and remaining <= 0:
+            raise self._deadline_exceeded(key, 0.0)
+
+        started = time.monotonic()
+        with self._lock:
+            self._stats["calls"] += 1
+        attempts: List[Future] = [self._start(func, args, kwargs)]
+
+        if self.hedging:
+            delay = self.hedge_delay(key)
+            if remaining is None or delay < remaining:
+                done, _ = wait(attempts, timeout=delay)
+                if not done and self._take_hedge():
+                    logger.debug("Hedging %s after %.3fs", key, delay)
+                    attempts.append(self._start(func, args, kwargs))
+
+        pending = set(attempts)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, timeout=remaining_time(), return_when=FIRST_COMPLETED)
+            if not done:
+                raise self._deadline_exceeded(key, time.monotonic() - started)
+            for future in done:
+                if future.exception() is None:
+                    self._record_success(key, future is not attempts[0], started)
+                    return future.result()
+                if future is attempts[0] or error is None:
+                    error = future.exception()
+        raise error  # type: ignore[misc]
+
+    def hedge_delay(self, key: str) -> float:
+        """
+        Get how long a call of ``key`` may run before it is hedged.
+
+        Args:
+            key: Operation name
+
+        Returns:
+            Delay in seconds
+        """
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return self.initial_delay
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile))
+        return min(self.max_delay, max(self.min_delay, ordered[index]))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hedging and deadline statistics.
+
+        Returns:
+            Call, hedge, hedge win and deadline-exceeded counts, and the hedge rate
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        stats["hedge_rate"] = stats["hedged"] / stats["calls"] if stats["calls"] else 0.0
+        return stats
+
+    def _start(self, func: Callable[..., Any], args: Any, kwargs: Any) -> Future:
+        """Run a call on a daemon thread so an abandoned call never blocks exit."""
+        future: Future = Future()
+        context = contextvars.copy_context()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = context.run(func, *args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        threading.Thread(target=run, name="hedged-call", daemon=True).start()
+        return future
+
+    def _take_hedge(self) -> bool:
+        """Count a hedge if the hedge budget allows one."""
+        with self._lock:
+            if self._stats["hedged"] >= self._stats["calls"] * self.max_hedge_ratio:
+                return False
+            self._stats["hedged"] += 1
+            rate = self._stats["hedged"] / self._stats["calls"]
+        if self._metrics is not None:
+            self._metrics.increment_counter("hedged_requests_total")
+            self._metrics.set_gauge("hedge_rate", rate)
+        return True
+
+    def _record_success(self, key: str, hedge_won: bool, started: float) -> None:
+        latency = time.monotonic() - started
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=self.window)
+            samples.append(latency)
+            if hedge_won:
+                self._stats["hedge_wins"] += 1
+        if hedge_won and self._metrics is not None:
+            self._metrics.increment_counter("hedged_request_wins_total")
+
+    def _deadline_exceeded(self, key: str, elapsed: float) -> DeadlineExceededError:
+        with self._lock:
+            self._stats["deadline_exceeded"] += 1
+        if self._metrics is not None:
+            self._metrics.increment_counter("deadline_exceeded_total")
+        logger.warning("Deadline exceeded for %s after %.2fs", key, elapsed)
+        return DeadlineExceededError(key, elapsed)
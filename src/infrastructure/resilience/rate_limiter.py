@@ -0,0 +1,268 @@
+"""Client-side token-bucket rate limiting with throttle-adaptive rates.
+
+Each key (for example ``ec2:DescribeInstances``) has its own token bucket.
+Callers reserve a token before calling the remote API and sleep for as long
+as the reservation requires, so concurrent callers queue fairly instead of
+all retrying at once. When the remote API throttles a call the bucket's
+rate is cut multiplicatively; every successful call then raises it
+additively back towards the configured rate (AIMD).
+
+Buckets are shared by all threads of a process. With a
+:class:`~infrastructure.caching.shared_state.SharedStateStore` they are
+also shared by every process using the same store file, which keeps
+several plugin instances sharing one account's API quota from
+overrunning it together.
+"""
+
+import fnmatch
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from infrastructure.caching.shared_state import SharedStateStore
+from infrastructure.logging.logger import get_logger
+from infrastructure.resilience.deadline import remaining_time
+
+SHARED_STATE_NAMESPACE = "rate_limit"
+
+logger = get_logger(__name__)
+
+
+def reserve_token(state: Dict[str, float], now: float, burst: float) -> float:
+    """
+    Refill a bucket and reserve one token from it.
+
+    Tokens may go negative: a negative balance is the queue of callers
+    already waiting, and the returned wait puts this caller behind them.
+
+    Args:
+        state: Bucket state (``tokens``, ``updated_at``, ``rate``), updated in place
+        now: Current time in seconds
+        burst: Bucket capacity
+
+    Returns:
+        Seconds the caller must wait before making its call
+    """
+    rate = state["rate"]
+    elapsed = max(0.0, now - state["updated_at"])
+    tokens = min(burst, state["tokens"] + elapsed * rate) - 1.0
+    state["tokens"] = tokens
+    state["updated_at"] = now
+    return 0.0 if tokens >= 0 else -tokens / rate
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter keyed by API action.
+
+    Limits are looked up by exact key first, then by the longest matching
+    ``fnmatch`` pattern (``ec2:Describe*``), then fall back to the default.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, Mapping[str, float]]] = None,
+        default_rate: float = 20.0,
+        default_burst: float = 100.0,
+        min_rate: float = 0.5,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.05,
+        max_wait: float = 30.0,
+        store: Optional[SharedStateStore] = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            limits: Per-key or per-pattern ``{"rate": ..., "burst": ...}`` overrides
+            default_rate: Tokens per second for keys without a limit
+            default_burst: Bucket capacity for keys without a limit
+            min_rate: Lowest rate a bucket is cut to after throttling
+            decrease_factor: Rate multiplier applied on each throttle
+            increase_step: Fraction of the configured rate regained per successful call
+            max_wait: Longest a caller waits for a token before proceeding anyway
+            store: Cross-process store for bucket state (None keeps buckets in process)
+            clock: Wall-clock source (shared buckets compare times across processes)
+            sleep: Sleep function
+        """
+        self._limits = dict(limits or {})
+        self._patterns = sorted(
+            (key for key in self._limits if any(c in key for c in "*?[")),
+            key=len,
+            reverse=True,
+        )
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.max_wait = max_wait
+        self._store = store
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Dict[str, float]] = {}
+        self._resolved_limits: Dict[str, Tuple[float, float]] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def limit_for(self, key: str) -> Tuple[float, float]:
+        """
+        Get the configured (rate, burst) of a key.
+
+        Args:
+            key: Rate limit key, e.g. ``ec2:DescribeInstances``
+
+        Returns:
+            Tuple of tokens per second and bucket capacity
+        """
+        resolved = self._resolved_limits.get(key)
+        if resolved is None:
+            limit = self._limits.get(key)
+            if limit is None:
+                limit = next(
+                    (self._limits[p] for p in self._patterns if fnmatch.fnmatchcase(key, p)),
+                    {},
+                )
+            resolved = (
+                float(limit.get("rate", self.default_rate)),
+                float(limit.get("burst", self.default_burst)),
+            )
+            self._resolved_limits[key] = resolved
+        return resolved
+
+    def acquire(self, key: str) -> float:
+        """
+        Take a token for one call, sleeping until it is available.
+
+        Args:
+            key: Rate limit key
+
+        Returns:
+            Seconds spent waiting
+        """
+        _, burst = self.limit_for(key)
+        now = self._clock()
+        wait = self._with_bucket(key, lambda state: reserve_token(state, now, burst))
+        if wait <= 0:
+            return 0.0
+
+        waited = min(wait, self.max_wait)
+        remaining = remaining_time()
+        if remaining is not None:
+            # Leave the deadline to the call itself rather than sleeping through it
+            waited = min(waited, remaining)
+        with self._lock:
+            stats = self._stats_for(key)
+            stats["waits"] += 1
+            stats["wait_seconds"] += waited
+        if wait > self.max_wait:
+            logger.debug("Rate limit wait for %s capped at %.1fs (needed %.1fs)", key, waited, wait)
+        self._sleep(waited)
+        return waited
+
+    def record_throttle(self, key: str) -> None:
+        """
+        Cut the rate of a key after the remote API throttled a call.
+
+        Args:
+            key: Rate limit key
+        """
+
+        def throttle(state: Dict[str, float]) -> float:
+            state["rate"] = max(self.min_rate, state["rate"] * self.decrease_factor)
+            # Drop any saved-up burst so queued callers back off immediately
+            state["tokens"] = min(state["tokens"], 0.0)
+            return state["rate"]
+
+        new_rate = self._with_bucket(key, throttle)
+        with self._lock:
+            self._stats_for(key)["throttles"] += 1
+        logger.info("Throttled on %s, client-side rate reduced to %.2f/s", key, new_rate)
+
+    def record_success(self, key: str) -> None:
+        """
+        Raise the rate of a key back towards its configured rate.
+
+        Args:
+            key: Rate limit key
+        """
+        rate, _ = self.limit_for(key)
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket["rate"] >= rate:
+            # Already at full rate (as far as this process knows): nothing to write
+            return
+
+        def recover(state: Dict[str, float]) -> float:
+            state["rate"] = min(rate, state["rate"] + rate * self.increase_step)
+            return state["rate"]
+
+        self._with_bucket(key, recover)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-key limiter statistics.
+
+        Returns:
+            Mapping of key to current rate, waits, total wait time and throttles
+        """
+        with self._lock:
+            return {
+                key: {
+                    "rate": self._buckets.get(key, {}).get("rate", self.limit_for(key)[0]),
+                    **stats,
+                }
+                for key, stats in self._stats.items()
+            }
+
+    def _stats_for(self, key: str) -> Dict[str, float]:
+        """Get the statistics of a key (caller holds the lock)."""
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = {"waits": 0, "wait_seconds": 0.0, "throttles": 0}
+        return stats
+
+    def _new_bucket(self, key: str) -> Dict[str, float]:
+        rate, burst = self.limit_for(key)
+        return {"tokens": burst, "updated_at": self._clock(), "rate": rate}
+
+    def _with_bucket(self, key: str, operation: Callable[[Dict[str, float]], float]) -> float:
+        """Apply ``operation`` to the bucket of ``key`` atomically and return its result."""
+        with self._lock:
+            if self._store is not None:
+                result = 0.0
+
+                def apply(stored: Optional[Dict[str, float]]) -> Dict[str, float]:
+                    nonlocal result
+                    state = stored if stored is not None else self._new_bucket(key)
+                    result = operation(state)
+                    self._buckets[key] = dict(state)
+                    return state
+
+                try:
+                    self._store.update(SHARED_STATE_NAMESPACE, key, apply)
+                    return result
+                except sqlite3.Error as e:
+                    logger.warning("Shared rate limit state unavailable, using local: %s", e)
+                    self._store = None
+
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = self._new_bucket(key)
+            return operation(bucket)
+
+
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def configure_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Set the process-wide rate limiter (None disables client-side rate limiting)."""
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Get the process-wide rate limiter, if one is configured."""
+    return _rate_limiter
@@ -1,11 +1,13 @@
 """Integrated retry decorator supporting multiple strategies."""
 
-import time
+import asyncio
 from functools import wraps
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Optional, TypeVar
 
 from infrastructure.logging.logger import get_logger
+from infrastructure.resilience.engine import RetryPolicy, get_retry_engine
 from infrastructure.resilience.exceptions import (
+    DeadlineExceededError,
     InvalidRetryStrategyError,
     MaxRetriesExceededError,
 )
@@ -23,6 +25,7 @@ def retry(
     max_delay: float = 60.0,
     jitter: bool = True,
     service: str = "default",
+    callsite: Optional[str] = None,
     # Circuit breaker specific parameters
     failure_threshold: int = 5,
     reset_timeout: int = 60,
@@ -39,6 +42,7 @@ def retry(
         max_delay: Maximum delay in seconds
         jitter: Whether to add jitter to delays
         service: Service name for error classification and circuit breaker identification
+        callsite: Name of the call site in retry metrics (defaults to the function name)
         failure_threshold: Number of failures before opening circuit (circuit breaker only)
         reset_timeout: Seconds to wait before transitioning to half-open (circuit breaker only)
         half_open_timeout: Seconds to wait in half-open before closing (circuit breaker only)
@@ -78,69 +82,118 @@ def retry(
                 f"Unsupported retry strategy: {strategy}. Supported: exponential, circuit_breaker"
             )
 
-        @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> T:
-            """Execute function with retry logic."""
-            attempt = 0
-
-            while True:
-                try:
-                    result = func(*args, **kwargs)
+        operation_name = getattr(func, "__name__", "operation")
+        name = callsite or operation_name
 
-                    # Record success for circuit breaker
-                    if hasattr(retry_strategy, "record_success"):
-                        retry_strategy.record_success()
+        if asyncio.iscoroutinefunction(func):
 
-                    # Log successful retry if this wasn't the first attempt
-                    if attempt > 0:
-                        logger.info(
-                            "Operation succeeded after %s attempts: %s", attempt + 1, func.__name__
-                        )
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                """Await function with retry logic, without blocking the event loop."""
+                call = _StrategyCall(retry_strategy, name, operation_name, max_attempts)
 
+                async def attempt() -> Any:
+                    call.before_attempt()
+                    result = await func(*args, **kwargs)
+                    call.succeeded()
                     return result
 
+                try:
+                    return await get_retry_engine().run_async(call.policy, attempt)
                 except Exception as e:
-                    pass
-
-                    # Check if we should retry
-                    if not retry_strategy.should_retry(attempt, e):
-                        if attempt >= max_attempts:
-                            logger.error(
-                                "Max retry attempts (%s) exceeded for %s: %s",
-                                max_attempts,
-                                func.__name__,
-                                e,
-                            )
-                            raise MaxRetriesExceededError(attempt + 1, e)
-                        else:
-                            logger.error("Non-retryable error in %s: %s", func.__name__, e)
-                            raise
-
-                    # Calculate delay
-                    delay = retry_strategy.get_delay(attempt)
-
-                    # Handle retry event (logging, metrics)
-                    retry_strategy.on_retry(attempt, e)
-
-                    # Log retry attempt
-                    logger.warning(
-                        "Retry attempt %s/%s for %s after %.2fs delay. Error: %s",
-                        attempt + 1,
-                        max_attempts,
-                        func.__name__,
-                        delay,
-                        e,
-                    )
-
-                    # Wait before retry
-                    time.sleep(delay)
-                    attempt += 1
+                    call.raise_final(e)
+                    raise
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            """Execute function with retry logic."""
+            call = _StrategyCall(retry_strategy, name, operation_name, max_attempts)
+
+            def attempt() -> T:
+                call.before_attempt()
+                result = func(*args, **kwargs)
+                call.succeeded()
+                return result
+
+            try:
+                return get_retry_engine().run(call.policy, attempt)
+            except Exception as e:
+                call.raise_final(e)
+                raise
 
         return wrapper
 
     return decorator
 
 
+class _StrategyCall:
+    """One decorated call: adapts a retry strategy to a :class:`RetryPolicy`."""
+
+    def __init__(self, strategy: Any, callsite: str, operation_name: str, max_attempts: int):
+        self.strategy = strategy
+        self.operation_name = operation_name
+        self.max_attempts = max_attempts
+        self.attempt = -1
+        self.failed_attempt = -1
+        self.error: Optional[BaseException] = None
+        self.policy = RetryPolicy(
+            callsite=callsite,
+            max_retries=max_attempts,
+            should_retry=self.should_retry,
+            delay=strategy.get_delay,
+            on_retry=self.on_retry,
+        )
+
+    def before_attempt(self) -> None:
+        self.attempt += 1
+        # Open circuits fail fast without calling the service
+        if hasattr(self.strategy, "before_call"):
+            self.strategy.before_call()
+
+    def succeeded(self) -> None:
+        # Record success for circuit breaker
+        if hasattr(self.strategy, "record_success"):
+            self.strategy.record_success()
+
+        # Log successful retry if this wasn't the first attempt
+        if self.attempt > 0:
+            logger.info(
+                "Operation succeeded after %s attempts: %s", self.attempt + 1, self.operation_name
+            )
+
+    def should_retry(self, attempt: int, error: BaseException) -> bool:
+        self.failed_attempt, self.error = attempt, error
+        return self.strategy.should_retry(attempt, error)
+
+    def on_retry(self, attempt: int, error: BaseException, delay: float) -> None:
+        # Handle retry event (logging, metrics)
+        self.strategy.on_retry(attempt, error)
+        logger.warning(
+            "Retry attempt %s/%s for %s after %.2fs delay. Error: %s",
+            attempt + 1,
+            self.max_attempts,
+            self.operation_name,
+            delay,
+            error,
+        )
+
+    def raise_final(self, error: Exception) -> None:
+        """Raise MaxRetriesExceededError when ``error`` ended the call by exhausting attempts."""
+        if error is not self.error or isinstance(error, DeadlineExceededError):
+            return
+        if self.failed_attempt >= self.max_attempts:
+            logger.error(
+                "Max retry attempts (%s) exceeded for %s: %s",
+                self.max_attempts,
+                self.operation_name,
+                error,
+            )
+            raise MaxRetriesExceededError(self.failed_attempt + 1, error) from error
+        logger.error("Non-retryable error in %s: %s", self.operation_name, error)
+
+
 def get_retry_config_for_service(service: str) -> dict:
     """
     Get default retry configuration for a specific AWS service.
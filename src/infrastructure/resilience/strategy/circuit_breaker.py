@@ -1,16 +1,61 @@
 """Circuit breaker retry strategy."""
 
-import secrets
+import sqlite3
+import threading
 import time
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
+from infrastructure.caching.shared_state import SharedStateStore, get_shared_state
 from infrastructure.logging.logger import get_logger
+from infrastructure.resilience.engine import backoff_delay
 from infrastructure.resilience.exceptions import CircuitBreakerOpenError
 from infrastructure.resilience.strategy.base import RetryStrategy
 
 logger = get_logger(__name__)
 
+SHARED_STATE_NAMESPACE = "circuit_breaker"
+
+# Optional persisted store for circuit state outside serve mode (see configure_state_store)
+_state_store_factory: Optional[Callable[[], SharedStateStore]] = None
+_state_store: Optional[SharedStateStore] = None
+_state_store_lock = threading.Lock()
+
+
+def configure_state_store(factory: Optional[Callable[[], SharedStateStore]]) -> None:
+    """
+    Persist circuit state in a store shared by consecutive processes.
+
+    Each HostFactory script invocation is a new process, so without this
+    every invocation starts with a closed circuit. The factory is called the
+    first time a circuit breaker needs its state, so processes that never use
+    one do not open the store.
+
+    Args:
+        factory: Creates the store, or None to keep circuit state in process
+    """
+    global _state_store_factory, _state_store
+    with _state_store_lock:
+        _state_store_factory = factory
+        _state_store = None
+
+
+def get_state_store() -> Optional[SharedStateStore]:
+    """Get the store circuit state is kept in, or None for in-process state."""
+    global _state_store_factory, _state_store
+    shared = get_shared_state()
+    if shared is not None:
+        return shared
+    if _state_store is None and _state_store_factory is not None:
+        with _state_store_lock:
+            if _state_store is None and _state_store_factory is not None:
+                try:
+                    _state_store = _state_store_factory()
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning("Circuit breaker state will not be persisted: %s", e)
+                    _state_store_factory = None
+    return _state_store
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -28,10 +73,17 @@ class CircuitBreakerStrategy(RetryStrategy):
     - CLOSED: Normal operation, allows all requests
     - OPEN: Fails fast, blocks all requests for a timeout period
     - HALF_OPEN: Allows limited requests to test if service recovered
+
+    Circuit state is process-wide: every instance for the same service shares
+    one state, guarded by a lock. When a state store is configured (shared
+    state in multi-worker serve mode, or the persisted work-dir store) the
+    state is read from and updated in the store, so concurrent workers and
+    consecutive CLI invocations see the same circuit.
     """
 
     # Class-level storage for circuit states (shared across instances)
     _circuit_states: Dict[str, Dict[str, Any]] = {}
+    _lock = threading.RLock()
 
     def __init__(
         self,
@@ -71,14 +123,17 @@ class CircuitBreakerStrategy(RetryStrategy):
         self.half_open_timeout = half_open_timeout
 
         # Initialize circuit state if not exists
-        if service_name not in self._circuit_states:
-            self._circuit_states[service_name] = {
-                "state": CircuitState.CLOSED,
-                "failure_count": 0,
-                "last_failure_time": None,
-                "last_success_time": None,
-                "half_open_start_time": None,
-            }
+        with self._lock:
+            self._circuit_states.setdefault(
+                service_name,
+                {
+                    "state": CircuitState.CLOSED,
+                    "failure_count": 0,
+                    "last_failure_time": None,
+                    "last_success_time": None,
+                    "half_open_start_time": None,
+                },
+            )
 
         logger.debug(
             "Initialized circuit breaker for %s",
@@ -91,6 +146,21 @@ class CircuitBreakerStrategy(RetryStrategy):
             },
         )
 
+    def before_call(self) -> None:
+        """
+        Fail fast before calling the service while the circuit is open.
+
+        Raises:
+            CircuitBreakerOpenError: If the circuit is open
+        """
+        if self._get_current_state(time.time()) == CircuitState.OPEN:
+            circuit_state = self._circuit_states[self.service_name]
+            raise CircuitBreakerOpenError(
+                service_name=self.service_name,
+                failure_count=circuit_state["failure_count"],
+                last_failure_time=circuit_state["last_failure_time"],
+            )
+
     def should_retry(self, attempt: int, exception: Exception) -> bool:
         """
         Determine if operation should be retried based on circuit state.
@@ -103,10 +173,9 @@ class CircuitBreakerStrategy(RetryStrategy):
             True if should retry, False otherwise
         """
         current_time = time.time()
-        circuit_state = self._circuit_states[self.service_name]
 
         # Update failure count and state
-        self._record_failure(current_time)
+        circuit_state = self._record_failure(current_time)
 
         # Check circuit state
         state = self._get_current_state(current_time)
@@ -202,104 +271,162 @@ class CircuitBreakerStrategy(RetryStrategy):
         Record a successful operation to potentially close the circuit.
         """
         current_time = time.time()
-        circuit_state = self._circuit_states[self.service_name]
-
-        circuit_state["last_success_time"] = current_time
-        circuit_state["failure_count"] = 0  # Reset failure count on success
-
-        # If we were in half-open state, close the circuit
-        if circuit_state["state"] == CircuitState.HALF_OPEN:
-            circuit_state["state"] = CircuitState.CLOSED
-            circuit_state["half_open_start_time"] = None
 
-            logger.info(
-                "Circuit breaker CLOSED for %s after successful recovery",
-                self.service_name,
-                extra={
-                    "service_name": self.service_name,
-                    "state": CircuitState.CLOSED.value,
-                },
-            )
-
-    def _record_failure(self, current_time: float) -> None:
-        """Record a failure and update circuit state."""
-        circuit_state = self._circuit_states[self.service_name]
-
-        circuit_state["failure_count"] += 1
-        circuit_state["last_failure_time"] = current_time
-
-        # Check if we should open the circuit
-        if (
-            circuit_state["state"] == CircuitState.CLOSED
-            and circuit_state["failure_count"] >= self.failure_threshold
-        ):
-
-            circuit_state["state"] = CircuitState.OPEN
+        circuit_state = self._refresh_state()
+        if circuit_state["state"] == CircuitState.CLOSED and circuit_state["failure_count"] == 0:
+            # Nothing to reset: avoid a store write on every successful call
+            circuit_state["last_success_time"] = current_time
+            return
 
-            logger.error(
-                "Circuit breaker OPENED for %s after %s failures",
-                self.service_name,
-                circuit_state["failure_count"],
-                extra={
-                    "service_name": self.service_name,
-                    "state": CircuitState.OPEN.value,
-                    "failure_count": circuit_state["failure_count"],
-                    "failure_threshold": self.failure_threshold,
-                },
-            )
-
-    def _get_current_state(self, current_time: float) -> CircuitState:
-        """Get the current circuit state, handling state transitions."""
-        circuit_state = self._circuit_states[self.service_name]
-        current_state = circuit_state["state"]
+        def apply(circuit_state: Dict[str, Any]) -> None:
+            circuit_state["last_success_time"] = current_time
+            circuit_state["failure_count"] = 0  # Reset failure count on success
 
-        if current_state == CircuitState.OPEN:
-            # Check if we should transition to half-open
-            if (
-                circuit_state["last_failure_time"]
-                and current_time - circuit_state["last_failure_time"] >= self.reset_timeout
-            ):
-
-                circuit_state["state"] = CircuitState.HALF_OPEN
-                circuit_state["half_open_start_time"] = current_time
+            # If we were in half-open state, close the circuit
+            if circuit_state["state"] == CircuitState.HALF_OPEN:
+                circuit_state["state"] = CircuitState.CLOSED
+                circuit_state["half_open_start_time"] = None
 
                 logger.info(
-                    "Circuit breaker transitioning to HALF_OPEN for %s",
+                    "Circuit breaker CLOSED for %s after successful recovery",
                     self.service_name,
                     extra={
                         "service_name": self.service_name,
-                        "state": CircuitState.HALF_OPEN.value,
-                        "reset_timeout": self.reset_timeout,
+                        "state": CircuitState.CLOSED.value,
                     },
                 )
 
-                return CircuitState.HALF_OPEN
+        self._update_state(apply)
 
-        elif (
-            current_state == CircuitState.HALF_OPEN
-        ):  # noqa: SIM102 (false positive - if-elif structure)
-            # Check if we should timeout back to open
+    def _record_failure(self, current_time: float) -> Dict[str, Any]:
+        """Record a failure and update circuit state."""
+
+        def apply(circuit_state: Dict[str, Any]) -> None:
+            circuit_state["failure_count"] += 1
+            circuit_state["last_failure_time"] = current_time
+
+            # Check if we should open the circuit
             if (
-                circuit_state["half_open_start_time"]
-                and current_time - circuit_state["half_open_start_time"] >= self.half_open_timeout
+                circuit_state["state"] == CircuitState.CLOSED
+                and circuit_state["failure_count"] >= self.failure_threshold
             ):
 
                 circuit_state["state"] = CircuitState.OPEN
-                circuit_state["half_open_start_time"] = None
 
-                logger.warning(
-                    "Circuit breaker timeout in HALF_OPEN, returning to OPEN for %s",
+                logger.error(
+                    "Circuit breaker OPENED for %s after %s failures",
                     self.service_name,
+                    circuit_state["failure_count"],
                     extra={
                         "service_name": self.service_name,
                         "state": CircuitState.OPEN.value,
-                        "half_open_timeout": self.half_open_timeout,
+                        "failure_count": circuit_state["failure_count"],
+                        "failure_threshold": self.failure_threshold,
                     },
                 )
 
-                return CircuitState.OPEN
+        return self._update_state(apply)
+
+    def _get_current_state(self, current_time: float) -> CircuitState:
+        """Get the current circuit state, handling state transitions."""
+        if self._transition_due(self._refresh_state(), current_time):
+            return self._update_state(
+                lambda circuit_state: self._apply_transition(circuit_state, current_time)
+            )["state"]
+        return self._circuit_states[self.service_name]["state"]
+
+    def _transition_due(self, circuit_state: Dict[str, Any], current_time: float) -> bool:
+        """Check whether a timeout moves the circuit to another state."""
+        current_state = circuit_state["state"]
+        if current_state == CircuitState.OPEN:
+            return bool(
+                circuit_state["last_failure_time"]
+                and current_time - circuit_state["last_failure_time"] >= self.reset_timeout
+            )
+        if current_state == CircuitState.HALF_OPEN:
+            return bool(
+                circuit_state["half_open_start_time"]
+                and current_time - circuit_state["half_open_start_time"] >= self.half_open_timeout
+            )
+        return False
 
-        return current_state
+    def _apply_transition(self, circuit_state: Dict[str, Any], current_time: float) -> None:
+        """Apply a due timeout transition (re-checked against the latest state)."""
+        if not self._transition_due(circuit_state, current_time):
+            return
+
+        if circuit_state["state"] == CircuitState.OPEN:
+            # Reset timeout elapsed: transition to half-open
+            circuit_state["state"] = CircuitState.HALF_OPEN
+            circuit_state["half_open_start_time"] = current_time
+
+            logger.info(
+                "Circuit breaker transitioning to HALF_OPEN for %s",
+                self.service_name,
+                extra={
+                    "service_name": self.service_name,
+                    "state": CircuitState.HALF_OPEN.value,
+                    "reset_timeout": self.reset_timeout,
+                },
+            )
+        else:
+            # Half-open timeout elapsed: return to open
+            circuit_state["state"] = CircuitState.OPEN
+            circuit_state["half_open_start_time"] = None
+
+            logger.warning(
+                "Circuit breaker timeout in HALF_OPEN, returning to OPEN for %s",
+                self.service_name,
+                extra={
+                    "service_name": self.service_name,
+                    "state": CircuitState.OPEN.value,
+                    "half_open_timeout": self.half_open_timeout,
+                },
+            )
+
+    def _refresh_state(self) -> Dict[str, Any]:
+        """Get the circuit state, refreshed from the state store when one is configured."""
+        store = get_state_store()
+        with self._lock:
+            circuit_state = self._circuit_states[self.service_name]
+            if store is not None:
+                try:
+                    stored = store.get(SHARED_STATE_NAMESPACE, self.service_name)
+                except sqlite3.Error as e:
+                    logger.debug(
+                        "Stored circuit state unavailable for %s: %s", self.service_name, e
+                    )
+                    stored = None
+                if stored is not None:
+                    circuit_state.update(stored, state=CircuitState(stored["state"]))
+            return circuit_state
+
+    def _update_state(self, mutate: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """Apply a state change under the lock, atomically in the state store if configured."""
+        store = get_state_store()
+        with self._lock:
+            circuit_state = self._circuit_states[self.service_name]
+            if store is None:
+                mutate(circuit_state)
+                return circuit_state
+
+            applied = False
+
+            def apply(stored: Any) -> Dict[str, Any]:
+                nonlocal applied
+                if stored is not None:
+                    circuit_state.update(stored, state=CircuitState(stored["state"]))
+                mutate(circuit_state)
+                applied = True
+                return {**circuit_state, "state": circuit_state["state"].value}
+
+            try:
+                store.update(SHARED_STATE_NAMESPACE, self.service_name, apply)
+            except sqlite3.Error as e:
+                logger.warning("Circuit state for %s not persisted: %s", self.service_name, e)
+                if not applied:
+                    mutate(circuit_state)
+            return circuit_state
 
     def get_delay(self, attempt: int) -> float:
         """
@@ -337,21 +464,8 @@ class CircuitBreakerStrategy(RetryStrategy):
         Returns:
             Delay in seconds
         """
-
-        # Exponential backoff: base_delay * (2 ^ attempt)
-        delay = self.base_delay * (2**attempt)
-
-        # Cap at max_delay
-        delay = min(delay, self.max_delay)
-
-        # Add jitter if enabled
-        if self.jitter:
-            jitter_range = delay * 0.1  # 10% jitter
-            # Use secrets for cryptographically secure randomness
-            random_float = secrets.SystemRandom().random() * 2 - 1  # Range from -1 to 1
-            delay += jitter_range * random_float
-
-        return max(0.0, delay)
+        # Full jitter: uniform between 0 and min(max_delay, base_delay * 2^attempt)
+        return backoff_delay(attempt, self.base_delay, self.max_delay, self.jitter)
 
     def get_circuit_info(self) -> Dict[str, Any]:
         """
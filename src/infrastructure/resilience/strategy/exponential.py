@@ -1,13 +1,13 @@
 """Exponential backoff retry strategy."""
 
-import secrets
+from infrastructure.resilience.engine import backoff_delay
 
 
 class ExponentialBackoffStrategy:
     """
     Exponential backoff retry strategy.
 
-    This strategy implements exponential backoff with jitter, matching the
+    This strategy implements exponential backoff with full jitter, matching the
     current usage patterns in the codebase (max_retries=3, base_delay=1.0).
     """
 
@@ -64,19 +64,8 @@ class ExponentialBackoffStrategy:
         Returns:
             Delay in seconds before next retry
         """
-        # Calculate exponential delay: base_delay * (2 ^ attempt)
-        delay = self.base_delay * (2**attempt)
-
-        # Cap at maximum delay
-        delay = min(delay, self.max_delay)
-
-        # Add jitter if enabled (randomize between 50% and 100% of calculated delay)
-        if self.jitter:
-            # Use secrets for cryptographically secure randomness
-            random_float = secrets.SystemRandom().random() * 0.5  # Range from 0 to 0.5
-            delay *= 0.5 + random_float
-
-        return delay
+        # Full jitter: uniform between 0 and min(max_delay, base_delay * 2^attempt)
+        return backoff_delay(attempt, self.base_delay, self.max_delay, self.jitter)
 
     def on_retry(self, attempt: int, exception: Exception) -> None:
         """
@@ -1,12 +1,16 @@
 """HostFactory scheduler strategy for field mapping and response formatting."""
 
 import os
-from typing import TYPE_CHECKING, Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 if TYPE_CHECKING:
     pass
 
 from config.manager import ConfigurationManager
+from domain.base.ports.instance_type_catalog_port import (
+    InstanceTypeCatalogPort,
+    InstanceTypeInfo,
+)
 from domain.base.ports.logging_port import LoggingPort
 from domain.machine.aggregate import Machine
 from domain.request.aggregate import Request
@@ -403,6 +407,16 @@ class HostFactorySchedulerStrategy(BaseSchedulerStrategy):
             "instanceType", "t2.micro"
         )
 
+        # Prefer the instance type catalog, which covers every type the region offers
+        info = self._lookup_instance_type(instance_type)
+        if info is not None:
+            arch = "ARM64" if "arm64" in info.architectures else "X86_64"
+            return {
+                "type": ["String", arch],
+                "ncpus": ["Numeric", str(info.vcpus)],
+                "nram": ["Numeric", str(info.memory_mib)],
+            }
+
         # CPU/RAM mapping for common instance types
         cpu_ram_mapping = {
             "t2.micro": {"ncpus": "1", "nram": "1024"},
@@ -429,6 +443,17 @@ class HostFactorySchedulerStrategy(BaseSchedulerStrategy):
             "nram": ["Numeric", specs["nram"]],
         }
 
+    def _lookup_instance_type(self, instance_type: str) -> Optional[InstanceTypeInfo]:
+        """Look up instance type specs in the registered catalog, if any."""
+        try:
+            from infrastructure.di.container import get_container
+
+            catalog = get_container().get_optional(InstanceTypeCatalogPort)
+            return catalog.get(instance_type) if catalog is not None else None
+        except Exception as e:
+            self._logger.debug("Instance type catalog lookup failed for %s: %s", instance_type, e)
+            return None
+
     def get_config_file_path(self) -> str:
         """Get config file path using configuration."""
         # Get raw config and build path manually
@@ -692,6 +717,7 @@ class HostFactorySchedulerStrategy(BaseSchedulerStrategy):
             "partial": "complete_with_error",
             "failed": "complete_with_error",
             "cancelled": "complete_with_error",
+            "timeout": "complete_with_error",
         }
 
         return status_mapping.get(domain_status.lower(), "running")
@@ -704,6 +730,8 @@ class HostFactorySchedulerStrategy(BaseSchedulerStrategy):
             return f"Partially fulfilled: {machine_count} instances created"
         elif status == "failed":
             return "Failed to create instances"
+        elif status == "timeout":
+            return "Request timed out"
         elif status in ["pending", "in_progress", "provisioning"]:
             return ""  # HostFactory examples show empty message for running
         else:
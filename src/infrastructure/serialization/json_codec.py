@@ -0,0 +1,149 @@
+"""Pluggable JSON codec for persistence files, SQL JSON columns and API/CLI output.
+
+The stdlib codec is always available. When ``orjson`` is installed it is
+selected automatically; set ``HF_JSON_CODEC=stdlib`` to force the stdlib
+codec (or ``orjson`` to require it).
+
+Both codecs encode datetimes, dates, enums, UUIDs, sets, pydantic
+models and value objects natively, so callers can pass domain-shaped data
+without first converting everything to strings. Anything else (including
+Decimal) falls back to ``str()``, matching the ``default=str`` behaviour
+previously used throughout the codebase.
+"""
+
+import importlib.util
+import json
+import os
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Optional, Union
+from uuid import UUID
+
+JSON_CODEC_ENV_VAR = "HF_JSON_CODEC"
+
+JSONDecodeError = json.JSONDecodeError
+
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+
+
+def encode_default(obj: Any) -> Any:
+    """
+    Convert objects the underlying encoder does not handle natively.
+
+    Args:
+        obj: Object to convert
+
+    Returns:
+        JSON serializable representation of the object
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    # Value objects expose their primitive through .value
+    if hasattr(obj, "value"):
+        return obj.value
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    return str(obj)
+
+
+class JSONCodec:
+    """JSON codec backed by the standard library ``json`` module."""
+
+    name = "stdlib"
+
+    def dumps(self, obj: Any, pretty: bool = False) -> str:
+        """
+        Serialize an object to a JSON string.
+
+        Args:
+            obj: Object to serialize
+            pretty: Indent output by two spaces
+
+        Returns:
+            JSON string
+        """
+        if pretty:
+            return json.dumps(obj, indent=2, default=encode_default, ensure_ascii=False)
+        return json.dumps(obj, default=encode_default, ensure_ascii=False, separators=(",", ":"))
+
+    def dumps_bytes(self, obj: Any, pretty: bool = False) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON bytes."""
+        return self.dumps(obj, pretty=pretty).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Deserialize a JSON document.
+
+        Args:
+            data: JSON string or UTF-8 bytes
+
+        Returns:
+            Deserialized object
+
+        Raises:
+            JSONDecodeError: If the document is not valid JSON
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by ``orjson``, falling back to stdlib for unsupported input."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Initialize the codec, importing orjson."""
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+        self._fallback = JSONCodec()
+
+    def dumps(self, obj: Any, pretty: bool = False) -> str:
+        """Serialize an object to a JSON string."""
+        return self.dumps_bytes(obj, pretty=pretty).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any, pretty: bool = False) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON bytes."""
+        options = (self._options | self._orjson.OPT_INDENT_2) if pretty else self._options
+        try:
+            return self._orjson.dumps(obj, default=encode_default, option=options)
+        except TypeError:
+            # orjson rejects integers wider than 64 bits and deeply nested input
+            return self._fallback.dumps_bytes(obj, pretty=pretty)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Deserialize a JSON document (orjson.JSONDecodeError subclasses JSONDecodeError)."""
+        return self._orjson.loads(data)
+
+
+_codec: Optional[JSONCodec] = None
+
+
+def _create_codec() -> JSONCodec:
+    preference = os.environ.get(JSON_CODEC_ENV_VAR, "auto").lower()
+    if preference == JSONCodec.name:
+        return JSONCodec()
+    if preference == OrjsonCodec.name or ORJSON_AVAILABLE:
+        return OrjsonCodec()
+    return JSONCodec()
+
+
+def get_json_codec() -> JSONCodec:
+    """Get the process-wide JSON codec, selecting it on first use."""
+    global _codec
+    if _codec is None:
+        _codec = _create_codec()
+    return _codec
+
+
+def set_json_codec(codec: Optional[JSONCodec]) -> None:
+    """Replace the process-wide JSON codec (None re-selects on next use)."""
+    global _codec
+    _codec = codec
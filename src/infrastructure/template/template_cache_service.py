@@ -1,14 +1,20 @@
 """Template cache service with focused responsibilities."""
 
+import sqlite3
 import threading
+import time
 from abc import ABC, abstractmethod
+from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from domain.base.ports import LoggingPort
+from infrastructure.caching.shared_state import SharedStateStore, get_shared_state
 
 from .dtos import TemplateDTO
 
+SHARED_STATE_NAMESPACE = "template_cache"
+
 
 class TemplateCacheService(ABC):
     """
@@ -81,21 +87,36 @@ class TTLTemplateCacheService(TemplateCacheService):
 
     Caches templates with a time-to-live expiration.
     Follows SRP by focusing only on TTL caching logic.
+
+    With a shared state store (multi-worker serve mode) the cached templates
+    live in the store, so one worker's load or invalidation is seen by all
+    workers; the decoded list is kept locally until the shared entry changes.
     """
 
-    def __init__(self, ttl_seconds: int = 300, logger: LoggingPort = None) -> None:
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        logger: LoggingPort = None,
+        shared_state: Optional[SharedStateStore] = None,
+        shared_key: str = "templates",
+    ) -> None:
         """
         Initialize TTL cache service.
 
         Args:
             ttl_seconds: Time-to-live in seconds (default: 5 minutes)
             logger: Logging port for service logging
+            shared_state: Cross-process store to share the cache through
+            shared_key: Key of this cache in the shared store
         """
         self._ttl_seconds = ttl_seconds
         self._logger = logger
         self._cached_templates: Optional[List[TemplateDTO]] = None
         self._cache_time: Optional[datetime] = None
         self._lock = threading.Lock()
+        self._shared_state = shared_state
+        self._shared_key = shared_key
+        self._shared_stamp: Optional[float] = None
 
     def get_or_load(self, loader_func: Callable[[], List[TemplateDTO]]) -> List[TemplateDTO]:
         """
@@ -108,6 +129,13 @@ class TTLTemplateCacheService(TemplateCacheService):
             List of templates from cache or freshly loaded
         """
         with self._lock:
+            if self._shared_state is not None:
+                try:
+                    return self._get_or_load_shared(loader_func)
+                except sqlite3.Error as e:
+                    if self._logger:
+                        self._logger.warning("Shared template cache unavailable: %s", e)
+
             if self._is_cache_valid():
                 if self._logger:
                     self._logger.debug("TTL cache hit: returning cached templates")
@@ -127,14 +155,56 @@ class TTLTemplateCacheService(TemplateCacheService):
         with self._lock:
             self._cached_templates = None
             self._cache_time = None
+            self._shared_stamp = None
+            if self._shared_state is not None:
+                try:
+                    self._shared_state.delete(SHARED_STATE_NAMESPACE, self._shared_key)
+                except sqlite3.Error as e:
+                    if self._logger:
+                        self._logger.warning("Failed to invalidate shared template cache: %s", e)
             if self._logger:
                 self._logger.debug("TTL cache invalidated")
 
     def is_cached(self) -> bool:
         """Check if templates are currently cached and valid."""
         with self._lock:
+            if self._shared_state is not None:
+                try:
+                    entry = self._shared_state.get(SHARED_STATE_NAMESPACE, self._shared_key)
+                    return entry is not None
+                except sqlite3.Error:
+                    pass
             return self._is_cache_valid()
 
+    def _get_or_load_shared(
+        self, loader_func: Callable[[], List[TemplateDTO]]
+    ) -> List[TemplateDTO]:
+        """Serve templates from the shared store, loading and publishing them on a miss."""
+        entry = self._shared_state.get(SHARED_STATE_NAMESPACE, self._shared_key)
+        if entry is not None:
+            if self._cached_templates is None or entry["cached_at"] != self._shared_stamp:
+                self._cached_templates = [_template_from_dict(t) for t in entry["templates"]]
+                self._shared_stamp = entry["cached_at"]
+                self._cache_time = datetime.fromtimestamp(entry["cached_at"])
+            if self._logger:
+                self._logger.debug("Shared TTL cache hit: returning cached templates")
+            return self._cached_templates
+
+        if self._logger:
+            self._logger.debug("Shared TTL cache miss: loading fresh templates")
+        templates = loader_func()
+        cached_at = time.time()
+        self._shared_state.set(
+            SHARED_STATE_NAMESPACE,
+            self._shared_key,
+            {"cached_at": cached_at, "templates": [asdict(t) for t in templates]},
+            ttl=self._ttl_seconds,
+        )
+        self._cached_templates = templates
+        self._shared_stamp = cached_at
+        self._cache_time = datetime.fromtimestamp(cached_at)
+        return templates
+
     def _is_cache_valid(self) -> bool:
         """
         Check if the current cache is valid (not expired).
@@ -184,6 +254,7 @@ class AutoRefreshTemplateCacheService(TTLTemplateCacheService):
         ttl_seconds: int = 300,
         auto_refresh: bool = False,
         logger: LoggingPort = None,
+        shared_state: Optional[SharedStateStore] = None,
     ) -> None:
         """
         Initialize auto-refresh cache service.
@@ -192,8 +263,9 @@ class AutoRefreshTemplateCacheService(TTLTemplateCacheService):
             ttl_seconds: Time-to-live in seconds
             auto_refresh: Enable automatic background refresh
             logger: Logging port for service logging
+            shared_state: Cross-process store to share the cache through
         """
-        super().__init__(ttl_seconds, logger)
+        super().__init__(ttl_seconds, logger, shared_state)
         self._auto_refresh = auto_refresh
         self._refresh_timer: Optional[threading.Timer] = None
         self._loader_func: Optional[Callable[[], List[TemplateDTO]]] = None
@@ -267,6 +339,9 @@ def create_template_cache_service(
     Raises:
         ValueError: If cache_type is not supported
     """
+    if cache_type in ("ttl", "auto_refresh"):
+        kwargs.setdefault("shared_state", get_shared_state())
+
     if cache_type == "noop":
         return NoOpTemplateCacheService(logger)
     elif cache_type == "ttl":
@@ -275,3 +350,12 @@ def create_template_cache_service(
         return AutoRefreshTemplateCacheService(logger=logger, **kwargs)
     else:
         raise ValueError(f"Unsupported cache type: {cache_type}")
+
+
+def _template_from_dict(data: Dict[str, Any]) -> TemplateDTO:
+    """Rebuild a TemplateDTO from its shared-state JSON form."""
+    values = dict(data)
+    for field in ("created_at", "updated_at"):
+        if isinstance(values.get(field), str):
+            values[field] = datetime.fromisoformat(values[field])
+    return TemplateDTO(**values)
@@ -0,0 +1,6 @@
+"""Request deadline tracking and timeout sweeping."""
+
+from .deadline_index import DeadlineIndex
+from .sweeper import RequestTimeoutSweeper
+
+__all__: list[str] = ["DeadlineIndex", "RequestTimeoutSweeper"]
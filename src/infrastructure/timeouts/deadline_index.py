@@ -0,0 +1,84 @@
+"""Min-heap index of request deadlines."""
+
+import heapq
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+class DeadlineIndex:
+    """
+    Request deadlines ordered in a min-heap.
+
+    Scheduling and popping cost O(log n). Rescheduled or cancelled requests
+    leave their old heap entry behind; it is skipped when it reaches the top,
+    and the heap is rebuilt once stale entries outnumber live ones.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._heap: List[Tuple[float, str]] = []
+        self._deadlines: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of scheduled requests."""
+        return len(self._deadlines)
+
+    def __contains__(self, request_id: object) -> bool:
+        """Check whether a request is scheduled."""
+        return request_id in self._deadlines
+
+    def schedule(self, request_id: str, deadline: float) -> None:
+        """
+        Schedule a request, replacing any earlier deadline it had.
+
+        Args:
+            request_id: ID of the request
+            deadline: Epoch seconds after which the request times out
+        """
+        with self._lock:
+            if self._deadlines.get(request_id) == deadline:
+                return
+            self._deadlines[request_id] = deadline
+            heapq.heappush(self._heap, (deadline, request_id))
+            self._compact()
+
+    def cancel(self, request_id: str) -> None:
+        """Remove a request that finished before its deadline."""
+        with self._lock:
+            if self._deadlines.pop(request_id, None) is not None:
+                self._compact()
+
+    def next_deadline(self) -> Optional[float]:
+        """Get the earliest deadline, or None when nothing is scheduled."""
+        with self._lock:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_expired(self, now: float) -> List[str]:
+        """
+        Remove and return the requests whose deadline is at or before now.
+
+        Args:
+            now: Current time in epoch seconds
+
+        Returns:
+            Expired request IDs, earliest deadline first
+        """
+        expired = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                deadline, request_id = heapq.heappop(self._heap)
+                if self._deadlines.get(request_id) == deadline:
+                    del self._deadlines[request_id]
+                    expired.append(request_id)
+        return expired
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._deadlines.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def _compact(self) -> None:
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            self._heap = [(deadline, rid) for rid, deadline in self._deadlines.items()]
+            heapq.heapify(self._heap)
@@ -0,0 +1,205 @@
+"""Background sweeper timing out requests whose deadline has passed."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, List, Optional
+
+from domain.base import UnitOfWorkFactory
+from domain.base.events import DomainEvent
+from domain.machine.machine_status import MachineStatus
+from domain.request.request_types import RequestStatus, RequestType
+from infrastructure.lifecycle import Lifecycle
+from infrastructure.logging.logger import get_logger
+from infrastructure.timeouts.deadline_index import DeadlineIndex
+
+
+def _epoch(value: datetime) -> float:
+    """Convert a naive UTC (or timezone-aware) datetime to epoch seconds."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _is_fulfilled(uow: Any, request: Any) -> bool:
+    """Whether an acquire request already has all its machines running."""
+    if request.request_type != RequestType.ACQUIRE:
+        return False
+    machines = uow.machines.find_by_request_id(str(request.request_id))
+    running = sum(1 for machine in machines if machine.status == MachineStatus.RUNNING)
+    return running >= request.requested_count
+
+
+class RequestTimeoutSweeper(Lifecycle):
+    """
+    Times out requests when their deadline passes.
+
+    Deadlines are kept in a DeadlineIndex, so the sweeper thread sleeps until
+    the earliest one and handles each expiry in O(log n) instead of scanning
+    active requests on every poll. The index is loaded from the deadlines
+    stored with the requests, kept current from request events published in
+    this process, and reloaded every resync_interval seconds to pick up
+    requests created by other processes sharing the store.
+    """
+
+    def __init__(
+        self,
+        uow_factory: UnitOfWorkFactory,
+        event_publisher: Optional[Any] = None,
+        resync_interval: float = 300.0,
+        index: Optional[DeadlineIndex] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the sweeper.
+
+        Args:
+            uow_factory: Factory for units of work reading and saving requests
+            event_publisher: Publisher for the timeout events; request events are
+                also subscribed from it when it supports register_handler
+            resync_interval: Seconds between reloads of the stored deadlines
+            index: Deadline index to use (a new one when None)
+            clock: Source of the current time in epoch seconds
+        """
+        self._uow_factory = uow_factory
+        self._event_publisher = event_publisher
+        self.resync_interval = resync_interval
+        self.index = index if index is not None else DeadlineIndex()
+        self._clock = clock
+        self._wakeup = threading.Condition()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._next_resync = 0.0
+        self.logger = get_logger(__name__)
+
+    def initialize(self) -> None:
+        """Load the stored deadlines and start the sweeper thread."""
+        self.resync()
+        register_handler = getattr(self._event_publisher, "register_handler", None)
+        if register_handler is not None:
+            register_handler("RequestCreatedEvent", self.handle_event)
+            register_handler("RequestStatusChangedEvent", self.handle_event)
+
+        with self._wakeup:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name="request-timeout-sweeper", daemon=True
+            )
+            self._thread.start()
+        self.logger.info("Request timeout sweeper started with %s deadlines", len(self.index))
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the sweeper thread."""
+        with self._wakeup:
+            thread = self._thread
+            self._stopping = True
+            self._wakeup.notify_all()
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    def resync(self) -> int:
+        """
+        Load the deadlines of active requests from the request store.
+
+        Returns:
+            Number of loaded deadlines
+        """
+        with self._uow_factory.create_unit_of_work() as uow:
+            deadlines = uow.requests.find_deadlines()
+        for request_id, deadline in deadlines.items():
+            self.index.schedule(request_id, _epoch(deadline))
+        self._next_resync = self._clock() + self.resync_interval
+        return len(deadlines)
+
+    def track(self, request_id: str, deadline: datetime) -> None:
+        """Schedule a request, waking the sweeper if it is now the earliest deadline."""
+        self.index.schedule(request_id, _epoch(deadline))
+        with self._wakeup:
+            self._wakeup.notify_all()
+
+    def handle_event(self, event: DomainEvent) -> None:
+        """Keep the index current from request created and status changed events."""
+        request_id = getattr(event, "request_id", None)
+        if not request_id:
+            return
+        if event.event_type == "RequestCreatedEvent":
+            timeout = getattr(event, "timeout", None)
+            if timeout:
+                self.track(request_id, event.occurred_at + timedelta(seconds=timeout))
+        elif event.event_type == "RequestStatusChangedEvent":
+            try:
+                finished = not RequestStatus(event.new_status).is_active()
+            except ValueError:
+                return
+            if finished:
+                self.index.cancel(request_id)
+
+    def sweep(self, now: Optional[float] = None) -> List[str]:
+        """
+        Time out every request whose deadline has passed.
+
+        Args:
+            now: Current time in epoch seconds (the clock when None)
+
+        Returns:
+            IDs of the requests that were timed out
+        """
+        now = self._clock() if now is None else now
+        timed_out = []
+        for request_id in self.index.pop_expired(now):
+            try:
+                if self._expire(request_id, now):
+                    timed_out.append(request_id)
+            except Exception as e:
+                self.logger.error("Failed to time out request %s: %s", request_id, e)
+        return timed_out
+
+    def _expire(self, request_id: str, now: float) -> bool:
+        with self._uow_factory.create_unit_of_work() as uow:
+            request = uow.requests.find_by_request_id(request_id)
+            # Finished meanwhile, possibly in another process
+            if request is None or not request.status.is_active():
+                return False
+            deadline = request.deadline
+            if deadline is None:
+                return False
+            if _epoch(deadline) > now:
+                self.index.schedule(request_id, _epoch(deadline))
+                return False
+            # Fleet and ASG requests stay in progress once their machines run
+            if _is_fulfilled(uow, request):
+                return False
+            events = uow.requests.save(request.time_out())
+
+        self.logger.warning("Request %s timed out", request_id)
+        if self._event_publisher is not None:
+            for event in events:
+                self._event_publisher.publish(event)
+        return True
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                if self._stopping:
+                    return
+                now = self._clock()
+                wake_at = self._next_resync
+                next_deadline = self.index.next_deadline()
+                if next_deadline is not None:
+                    wake_at = min(wake_at, next_deadline)
+                if wake_at > now:
+                    self._wakeup.wait(wake_at - now)
+                if self._stopping:
+                    return
+
+            try:
+                if self._clock() >= self._next_resync:
+                    self.resync()
+                self.sweep()
+            except Exception as e:
+                self.logger.error("Request timeout sweep failed: %s", e)
+                with self._wakeup:
+                    self._wakeup.wait(1.0)
@@ -1,5 +1,7 @@
 """Infrastructure utilities - common utilities and factories."""
 
+from typing import Any
+
 # Import common utilities
 # Export abstract interface from canonical location
 from domain.base import UnitOfWorkFactory
@@ -42,7 +44,16 @@ from infrastructure.utilities.factories.api_handler_factory import APIHandlerFac
 
 # Import factories (removed legacy ProviderFactory)
 from infrastructure.utilities.factories.repository_factory import RepositoryFactory
-from infrastructure.utilities.factories.sql_engine_factory import SQLEngineFactory
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import SQLEngineFactory so SQLAlchemy loads only for SQL storage."""
+    if name == "SQLEngineFactory":
+        from infrastructure.utilities.factories.sql_engine_factory import SQLEngineFactory
+
+        return SQLEngineFactory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__: list[str] = [
     # String utilities
@@ -1,9 +1,20 @@
 """Factory utilities for infrastructure components."""
 
+from typing import Any
+
 # Import factories (removed legacy ProviderFactory)
 from infrastructure.utilities.factories.api_handler_factory import APIHandlerFactory
 from infrastructure.utilities.factories.repository_factory import RepositoryFactory
-from infrastructure.utilities.factories.sql_engine_factory import SQLEngineFactory
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import SQLEngineFactory so SQLAlchemy loads only for SQL storage."""
+    if name == "SQLEngineFactory":
+        from infrastructure.utilities.factories.sql_engine_factory import SQLEngineFactory
+
+        return SQLEngineFactory
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__: list[str] = [
     # Factories (legacy ProviderFactory removed)
@@ -1,6 +1,9 @@
 """Core MCP Server implementation for Open Host Factory Plugin."""
 
+import asyncio
+import inspect
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Dict, Optional, Union
@@ -8,6 +11,46 @@ from typing import Any, Callable, Dict, Optional, Union
 from _package import PACKAGE_NAME, __version__
 from infrastructure.logging.logger import get_logger
 
+from .read_cache import ReadCache
+
+# Read-only tools whose results are cached, with the kind of data they return
+READ_ONLY_TOOLS: Dict[str, str] = {
+    "list_templates": "templates",
+    "get_template": "templates",
+    "list_providers": "providers",
+    "get_provider_config": "providers",
+    "list_return_requests": "requests",
+}
+
+# Tools that change state, with the cached kinds they make stale
+MUTATING_TOOLS: Dict[str, tuple] = {
+    "request_machines": ("requests",),
+    "return_machines": ("requests",),
+}
+
+# Tools that provision or release capacity run at most this many at a time
+DEFAULT_TOOL_CONCURRENCY: Dict[str, int] = {
+    "request_machines": 2,
+    "return_machines": 2,
+}
+
+
+def _run_tool(tool_func: Callable, args: Any, app: Any) -> Any:
+    """Run a tool on the calling worker thread, with its own event loop if it is async."""
+    result = tool_func(args, app)
+    if inspect.isawaitable(result):
+        return asyncio.run(_await(result))
+    return result
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
+
+
+def _is_error_result(result: Any) -> bool:
+    """Check whether a tool result reports a failure, which must not be cached."""
+    return isinstance(result, dict) and (result.get("success") is False or "error" in result)
+
 
 class MCPMessageType(Enum):
     """MCP message types according to the specification."""
@@ -37,10 +80,34 @@ class OpenHFPluginMCPServer:
     CLI commands as MCP tools and domain objects as MCP resources.
     """
 
-    def __init__(self, app=None) -> None:
-        """Initialize MCP server with application instance."""
+    def __init__(
+        self,
+        app=None,
+        max_workers: int = 8,
+        tool_concurrency: Optional[Dict[str, int]] = None,
+        cache_ttl: float = 30.0,
+    ) -> None:
+        """
+        Initialize MCP server with application instance.
+
+        Args:
+            app: Application instance (DI container) passed to the tools
+            max_workers: Tool calls executed at the same time
+            tool_concurrency: Per-tool limits on concurrent calls
+            cache_ttl: Seconds read-only tool results are cached (0 disables caching)
+
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
         self.app = app
         self.logger = get_logger(__name__)
+        self.max_workers = max_workers
+        self.tool_concurrency = {**DEFAULT_TOOL_CONCURRENCY, **(tool_concurrency or {})}
+        self.read_cache = ReadCache(ttl=cache_ttl)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tool_slots: Dict[str, asyncio.Semaphore] = {}
         self.tools: Dict[str, Callable] = {}
         self.resources: Dict[str, Callable] = {}
         self.prompts: Dict[str, Dict[str, Any]] = {}
@@ -51,6 +118,42 @@ class OpenHFPluginMCPServer:
         self._register_core_tools()
         self._register_core_resources()
         self._register_core_prompts()
+        self._subscribe_cache_invalidation()
+
+    def _subscribe_cache_invalidation(self) -> None:
+        """
+        Drop cached reads when domain events report changes.
+
+        Only events published in this process, i.e. by the tools, reach the
+        cache; changes made by other processes sharing the store are picked
+        up when the cached entries expire.
+        """
+        if self.app is None or not hasattr(self.app, "get"):
+            return
+        try:
+            from domain.base.ports import EventPublisherPort
+
+            publisher = self.app.get(EventPublisherPort)
+            register_handler = getattr(publisher, "register_handler", None)
+            if register_handler is None:
+                return
+            for event_type in (
+                "TemplateCreatedEvent",
+                "TemplateUpdatedEvent",
+                "TemplateDeletedEvent",
+                "RequestCreatedEvent",
+                "RequestStatusChangedEvent",
+                "MachineStatusChangedEvent",
+            ):
+                register_handler(event_type, self.read_cache.handle_event)
+        except Exception as e:
+            self.logger.debug("Cached MCP reads expire by TTL only: %s", e)
+
+    def shutdown(self) -> None:
+        """Stop the tool executor."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     def _register_core_tools(self) -> None:
         """Register core MCP tools from CLI handlers."""
@@ -262,14 +365,57 @@ class OpenHFPluginMCPServer:
         if tool_name not in self.tools:
             raise ValueError(f"Unknown tool: {tool_name}")
 
+        result = await self._call_tool(tool_name, arguments)
+
+        return {"content": [{"type": "text", "text": json.dumps(result, indent=2, default=str)}]}
+
+    async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Call a tool, serving read-only tools from the cache when possible."""
+        kind = READ_ONLY_TOOLS.get(tool_name)
+        key = ReadCache.key(tool_name, arguments)
+        generation = None
+        if kind is not None:
+            cached = self.read_cache.get(kind, key)
+            if cached is not None:
+                return cached
+            generation = self.read_cache.generation(kind)
+
+        result = await self._execute_tool(tool_name, arguments)
+
+        if kind is not None:
+            if not _is_error_result(result):
+                self.read_cache.put(kind, key, result, generation=generation)
+        elif tool_name in MUTATING_TOOLS:
+            self.read_cache.invalidate(MUTATING_TOOLS[tool_name])
+        return result
+
+    async def _execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """
+        Run a tool on the executor, within the tool's concurrency limit.
+
+        Each call runs to completion on its own worker thread and event loop, so
+        a tool blocked on a slow provider call does not hold up other tools or
+        the message loop.
+        """
         # Convert arguments to args-like object
         args = type("Args", (), arguments)()
-
-        # Call the tool function
         tool_func = self.tools[tool_name]
-        result = await tool_func(args, self.app)
 
-        return {"content": [{"type": "text", "text": json.dumps(result, indent=2, default=str)}]}
+        slots = self._tool_slots.get(tool_name)
+        if slots is None:
+            limit = self.tool_concurrency.get(tool_name, self.max_workers)
+            slots = self._tool_slots.setdefault(tool_name, asyncio.Semaphore(limit))
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="mcp-tool"
+            )
+
+        async with slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, _run_tool, tool_func, args, self.app
+            )
 
     async def _handle_resources_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle resources/list request."""
@@ -388,15 +534,11 @@ class OpenHFPluginMCPServer:
     async def _get_templates_resource(self, uri: str) -> Dict[str, Any]:
         """Get templates resource data."""
         # Use the list_templates tool to get data
-        args = type("Args", (), {})()
-        result = await self.tools["list_templates"](args, self.app)
-        return result
+        return await self._call_tool("list_templates", {})
 
     async def _get_requests_resource(self, uri: str) -> Dict[str, Any]:
         """Get requests resource data."""
-        args = type("Args", (), {})()
-        result = await self.tools["list_return_requests"](args, self.app)
-        return result
+        return await self._call_tool("list_return_requests", {})
 
     async def _get_machines_resource(self, uri: str) -> Dict[str, Any]:
         """Get machines resource data."""
@@ -405,9 +547,7 @@ class OpenHFPluginMCPServer:
 
     async def _get_providers_resource(self, uri: str) -> Dict[str, Any]:
         """Get providers resource data."""
-        args = type("Args", (), {})()
-        result = await self.tools["list_providers"](args, self.app)
-        return result
+        return await self._call_tool("list_providers", {})
 
     def _generate_provision_prompt(self, arguments: Dict[str, Any]) -> str:
         """Generate infrastructure provisioning prompt."""
@@ -2,7 +2,7 @@
 
 import asyncio
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Set
 
 from infrastructure.di.container import get_container
 from infrastructure.error.decorators import handle_interface_exceptions
@@ -28,29 +28,77 @@ async def handle_mcp_serve(args) -> Dict[str, Any]:
     port = getattr(args, "port", 3000)
     host = getattr(args, "host", "localhost")
     stdio_mode = getattr(args, "stdio", False)
+    max_workers = getattr(args, "max_workers", 8)
 
     # Get application instance from DI container
     container = get_container()
 
     # Create MCP server instance
-    mcp_server = OpenHFPluginMCPServer(app=container)
+    mcp_server = OpenHFPluginMCPServer(app=container, max_workers=max_workers)
 
-    if stdio_mode:
-        # Run in stdio mode for direct MCP client communication
-        logger.info("Starting MCP server in stdio mode")
-        await _run_stdio_server(mcp_server)
-        return {"message": "MCP server started in stdio mode"}
-    else:
-        # Run as TCP server (for development/testing)
-        logger.info("Starting MCP server on %s:%s", host, port)
-        await _run_tcp_server(mcp_server, host, port)
-        return {"message": f"MCP server started on {host}:{port}"}
+    try:
+        if stdio_mode:
+            # Run in stdio mode for direct MCP client communication
+            logger.info("Starting MCP server in stdio mode")
+            await _run_stdio_server(mcp_server)
+            return {"message": "MCP server started in stdio mode"}
+        else:
+            # Run as TCP server (for development/testing)
+            logger.info("Starting MCP server on %s:%s", host, port)
+            await _run_tcp_server(mcp_server, host, port)
+            return {"message": f"MCP server started on {host}:{port}"}
+    finally:
+        mcp_server.shutdown()
+
+
+class _MessageDispatcher:
+    """
+    Processes MCP messages concurrently and writes each response when ready.
+
+    Responses carry the request id, so they may be written out of order. At
+    most max_in_flight messages are processed at once; reading stops until
+    one finishes, which keeps a flood of calls from queueing without bound.
+    """
+
+    def __init__(self, mcp_server: OpenHFPluginMCPServer, send, max_in_flight: int) -> None:
+        self._mcp_server = mcp_server
+        self._send = send
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._tasks: Set[asyncio.Task] = set()
+        self._logger = get_logger(__name__)
+
+    async def submit(self, message: str) -> None:
+        """Start processing a message, waiting while too many are in flight."""
+        await self._slots.acquire()
+        task = asyncio.create_task(self._process(message))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def drain(self) -> None:
+        """Wait for the messages still in flight."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _process(self, message: str) -> None:
+        try:
+            response = await self._mcp_server.handle_message(message)
+            await self._send(response)
+        except Exception as e:
+            self._logger.error("Error processing MCP message: %s", e)
+        finally:
+            self._slots.release()
 
 
 async def _run_stdio_server(mcp_server: OpenHFPluginMCPServer):
     """Run MCP server in stdio mode."""
     logger = get_logger(__name__)
 
+    async def send(response: str) -> None:
+        # Write response to stdout
+        print(response, flush=True)  # noqa: MCP protocol output
+
+    dispatcher = _MessageDispatcher(mcp_server, send, max_in_flight=2 * mcp_server.max_workers)
+
     try:
         # Read from stdin, write to stdout
         while True:
@@ -65,11 +113,8 @@ async def _run_stdio_server(mcp_server: OpenHFPluginMCPServer):
                 if not line:
                     continue
 
-                # Process MCP message
-                response = await mcp_server.handle_message(line)
-
-                # Write response to stdout
-                print(response, flush=True)  # noqa: MCP protocol output
+                # Process MCP message without waiting for earlier ones
+                await dispatcher.submit(line)
 
             except KeyboardInterrupt:
                 logger.info("MCP server interrupted by user")
@@ -83,6 +128,8 @@ async def _run_stdio_server(mcp_server: OpenHFPluginMCPServer):
                 }
                 print(error_response, flush=True)  # noqa: MCP protocol output
 
+        await dispatcher.drain()
+
     except Exception as e:
         logger.error("Fatal error in stdio server: %s", e)
         raise
@@ -96,6 +143,18 @@ async def _run_tcp_server(mcp_server: OpenHFPluginMCPServer, host: str, port: in
         """Handle individual client connection."""
         client_addr = writer.get_extra_info("peername")
         logger.info("Client connected: %s", client_addr)
+        write_lock = asyncio.Lock()
+
+        async def send(response: str) -> None:
+            # Send response to client, one whole line at a time
+            async with write_lock:
+                writer.write((response + "\n").encode())
+                await writer.drain()
+            logger.debug("Sent response: %s", response)
+
+        dispatcher = _MessageDispatcher(
+            mcp_server, send, max_in_flight=2 * mcp_server.max_workers
+        )
 
         try:
             while True:
@@ -110,14 +169,10 @@ async def _run_tcp_server(mcp_server: OpenHFPluginMCPServer, host: str, port: in
 
                 logger.debug("Received message: %s", message)
 
-                # Process MCP message
-                response = await mcp_server.handle_message(message)
-
-                # Send response to client
-                writer.write((response + "\n").encode())
-                await writer.drain()
+                # Process MCP message without waiting for earlier ones
+                await dispatcher.submit(message)
 
-                logger.debug("Sent response: %s", response)
+            await dispatcher.drain()
 
         except Exception as e:
             logger.error("Error handling client %s: %s", client_addr, e)
@@ -0,0 +1,125 @@
+"""Short-lived cache of read-only MCP tool results."""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# Domain event type prefixes and the cached kinds they make stale
+EVENT_PREFIX_KINDS: Dict[str, Tuple[str, ...]] = {
+    "Template": ("templates",),
+    "Request": ("requests",),
+    "Machine": ("requests",),
+    "Provider": ("providers",),
+}
+
+
+class ReadCache:
+    """
+    LRU cache of read-only tool results, grouped by kind.
+
+    Entries expire after ttl seconds and a whole kind (templates, requests,
+    providers) is dropped when a write or domain event changes it, so fan-out
+    clients reading the same list share one query instead of each waiting on
+    the provider.
+
+    Cached results are shared between calls and must be treated as read-only.
+    Every invalidation bumps the kind's generation; a result read under an
+    older generation is not cached, so a read racing a write cannot bring
+    back the stale data the write dropped.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        max_size: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a result is served before it is read again (0 disables caching)
+            max_size: Maximum number of cached results
+            clock: Monotonic time source
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Any, float]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(name: str, arguments: Dict[str, Any]) -> str:
+        """Build the cache key of a tool call."""
+        return f"{name}:{json.dumps(arguments, sort_keys=True, default=str)}"
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """
+        Get a cached result.
+
+        Args:
+            kind: Kind of data the result holds
+            key: Key of the call that produced it
+
+        Returns:
+            Cached result, or None if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get((kind, key))
+            if entry is None:
+                return None
+            result, valid_until = entry
+            if self._clock() >= valid_until:
+                del self._entries[(kind, key)]
+                return None
+            self._entries.move_to_end((kind, key))
+            return result
+
+    def generation(self, kind: str) -> int:
+        """Get the generation of a kind; take it before reading the data to cache."""
+        with self._lock:
+            return self._generations.get(kind, 0)
+
+    def put(self, kind: str, key: str, result: Any, generation: Optional[int] = None) -> None:
+        """
+        Cache a result for ttl seconds.
+
+        Args:
+            kind: Kind of data the result holds
+            key: Key of the call that produced it
+            result: Result to cache
+            generation: Generation of the kind when the read started; the
+                result is dropped if the kind was invalidated since
+        """
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generations.get(kind, 0):
+                return
+            self._entries[(kind, key)] = (result, self._clock() + self.ttl)
+            self._entries.move_to_end((kind, key))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, kinds: Iterable[str]) -> None:
+        """Drop every cached result of the given kinds."""
+        kinds = set(kinds)
+        with self._lock:
+            for kind in kinds:
+                self._generations[kind] = self._generations.get(kind, 0) + 1
+            for entry_key in [k for k in self._entries if k[0] in kinds]:
+                del self._entries[entry_key]
+
+    def handle_event(self, event: Any) -> None:
+        """Drop the kinds a domain event changes."""
+        event_type = getattr(event, "event_type", "") or type(event).__name__
+        for prefix, kinds in EVENT_PREFIX_KINDS.items():
+            if event_type.startswith(prefix):
+                self.invalidate(kinds)
+
+    def __len__(self) -> int:
+        """Get the number of cached results, expired ones included."""
+        return len(self._entries)
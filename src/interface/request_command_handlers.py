@@ -57,7 +57,9 @@ async def handle_get_request_status(args: "argparse.Namespace") -> Dict[str, Any
         if not request_id:
             continue
 
-        query = GetRequestQuery(request_id=request_id)
+        query = GetRequestQuery(
+            request_id=request_id, include_health=bool(getattr(args, "health", False))
+        )
         request_dto = await query_bus.execute(query)
         request_dtos.append(request_dto)
 
@@ -114,7 +116,10 @@ async def handle_request_machines(args: "argparse.Namespace") -> Dict[str, Any]:
     metadata["dry_run"] = is_dry_run_active()
 
     command = CreateRequestCommand(
-        template_id=template_id, requested_count=int(machine_count), metadata=metadata
+        template_id=template_id,
+        requested_count=int(machine_count),
+        timeout=getattr(args, "request_timeout", None),
+        metadata=metadata,
     )
 
     # Execute command and get request ID - let exceptions bubble up
@@ -161,6 +166,37 @@ async def handle_request_machines(args: "argparse.Namespace") -> Dict[str, Any]:
             }
 
 
+def _page_options(args: "argparse.Namespace") -> Dict[str, Any]:
+    """Pagination options shared by list commands."""
+    return {
+        "limit": getattr(args, "limit", None),
+        "cursor": getattr(args, "cursor", None),
+        "stream": True,
+    }
+
+
+def _streaming_requested(args: "argparse.Namespace") -> bool:
+    """Whether the CLI should write list results incrementally."""
+    return bool(getattr(args, "stream", False)) or getattr(args, "format", None) == "ndjson"
+
+
+def _list_result(key: str, page: Any, message: str, stream: bool) -> Dict[str, Any]:
+    """
+    Build a list command result from a lazy page.
+
+    When streaming, the page itself is returned and the CLI output layer
+    writes it incrementally, adding count and next_cursor once consumed.
+    """
+    if stream:
+        return {key: page, "message": message}
+
+    items = list(page)
+    result: Dict[str, Any] = {key: items, "count": len(items), "message": message}
+    if page.next_cursor:
+        result["next_cursor"] = page.next_cursor
+    return result
+
+
 @handle_interface_exceptions(context="get_return_requests", interface_type="cli")
 async def handle_get_return_requests(args: "argparse.Namespace") -> Dict[str, Any]:
     """
@@ -178,14 +214,40 @@ async def handle_get_return_requests(args: "argparse.Namespace") -> Dict[str, An
 
     from application.dto.queries import ListReturnRequestsQuery
 
-    query = ListReturnRequestsQuery()
-    requests = await query_bus.execute(query)
+    query = ListReturnRequestsQuery(status=getattr(args, "status", None), **_page_options(args))
+    page = await query_bus.execute(query)
 
-    return {
-        "requests": requests,
-        "count": len(requests),
-        "message": "Return requests retrieved successfully",
-    }
+    return _list_result(
+        "requests", page, "Return requests retrieved successfully", _streaming_requested(args)
+    )
+
+
+@handle_interface_exceptions(context="list_machines", interface_type="cli")
+async def handle_list_machines(args: "argparse.Namespace") -> Dict[str, Any]:
+    """
+    Handle list machines operations.
+
+    Args:
+        args: Argument namespace with resource/action structure
+
+    Returns:
+        Machines list
+    """
+    container = get_container()
+    query_bus = container.get(QueryBus)
+
+    from application.dto.queries import ListMachinesQuery
+
+    query = ListMachinesQuery(
+        status=getattr(args, "status", None),
+        template_id=getattr(args, "template_id", None),
+        **_page_options(args),
+    )
+    page = await query_bus.execute(query)
+
+    return _list_result(
+        "machines", page, "Machines retrieved successfully", _streaming_requested(args)
+    )
 
 
 @handle_interface_exceptions(context="request_return_machines", interface_type="cli")
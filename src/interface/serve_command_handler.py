@@ -1,5 +1,6 @@
 """CLI command handler for REST API server."""
 
+import os
 import signal
 from typing import Any, Dict
 
@@ -58,19 +59,56 @@ async def handle_serve_api(args) -> Dict[str, Any]:
             server_config.log_level,
         )
 
-        # Create and configure the FastAPI app
-        app = create_fastapi_app(server_config)
+        effective_workers = server_config.workers if not reload else 1
+        if effective_workers > 1 and server_config.shared_state.enabled:
+            _configure_shared_state(config_manager, server_config)
+
+        background_tasks = [
+            task
+            for task in (
+                _start_timeout_sweeper(container, config_manager),
+                _start_request_archiver(container, config_manager),
+            )
+            if task is not None
+        ]
 
         # Start the server
         import uvicorn
 
+        if effective_workers > 1:
+            # uvicorn only forks workers for an import string; each worker
+            # bootstraps its own application through api.server:create_app
+            from api.server import CONFIG_PATH_ENV
+
+            config_path = getattr(args, "config", None)
+            if config_path:
+                os.environ[CONFIG_PATH_ENV] = os.path.abspath(config_path)
+            try:
+                uvicorn.run(
+                    "api.server:create_app",
+                    factory=True,
+                    host=server_config.host,
+                    port=server_config.port,
+                    workers=effective_workers,
+                    log_level=server_config.log_level,
+                    access_log=True,
+                )
+            finally:
+                _shutdown_background_tasks(background_tasks)
+            return {
+                "message": "Server stopped",
+                "host": server_config.host,
+                "port": server_config.port,
+                "workers": effective_workers,
+            }
+
+        # Create and configure the FastAPI app
+        app = create_fastapi_app(server_config)
+
         config = uvicorn.Config(
             app=app,
             host=server_config.host,
             port=server_config.port,
-            workers=(
-                server_config.workers if not reload else 1
-            ),  # Reload mode requires single worker
             reload=reload,
             log_level=server_config.log_level,
             access_log=True,
@@ -88,7 +126,10 @@ async def handle_serve_api(args) -> Dict[str, Any]:
         signal.signal(signal.SIGTERM, signal_handler)
 
         # Start the server (this blocks until shutdown)
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            _shutdown_background_tasks(background_tasks)
 
         return {
             "message": "Server started successfully",
@@ -100,3 +141,109 @@ async def handle_serve_api(args) -> Dict[str, Any]:
     except Exception as e:
         logger.error("Failed to start server: %s", e)
         return {"error": str(e), "message": "Failed to start server"}
+
+
+def _configure_shared_state(config_manager, server_config) -> None:
+    """Share caches and circuit breaker state between worker processes."""
+    from infrastructure.caching.shared_state import configure_shared_state
+
+    logger = get_logger(__name__)
+    path = server_config.shared_state.path or os.path.join(
+        config_manager.get_work_dir(), "shared_state.db"
+    )
+    try:
+        store = configure_shared_state(path)
+        purged = store.purge_expired()
+    except Exception as e:
+        configure_shared_state(None)
+        logger.warning("Shared state unavailable, workers keep per-process caches: %s", e)
+        return
+    logger.info("Workers share state through %s (%s expired entries purged)", path, purged)
+
+
+def _start_timeout_sweeper(container, config_manager):
+    """Start timing out requests past their deadline while the server runs."""
+    from config.schemas.common_schema import RequestConfig
+    from domain.base import UnitOfWorkFactory
+    from domain.base.ports import EventPublisherPort
+    from infrastructure.timeouts import RequestTimeoutSweeper
+
+    logger = get_logger(__name__)
+    request_config = config_manager.get_typed(RequestConfig)
+    if not request_config.timeout_sweeper_enabled:
+        return None
+
+    event_publisher = container.get(EventPublisherPort)
+    sweeper = RequestTimeoutSweeper(
+        container.get(UnitOfWorkFactory),
+        event_publisher=event_publisher,
+        resync_interval=request_config.timeout_resync_interval,
+    )
+    try:
+        _register_timeout_release(container, event_publisher)
+        sweeper.initialize()
+    except Exception as e:
+        logger.warning("Request timeout sweeper unavailable: %s", e)
+        return None
+    return sweeper
+
+
+def _register_timeout_release(container, event_publisher) -> None:
+    """Return the machines of requests the sweeper times out."""
+    import asyncio
+
+    from application.events.handlers.request_handlers import RequestTimeoutHandler
+    from domain.base import UnitOfWorkFactory
+    from infrastructure.di.buses import CommandBus
+
+    logger = get_logger(__name__)
+    handler = RequestTimeoutHandler(
+        logger,
+        event_publisher=event_publisher,
+        command_bus=container.get(CommandBus),
+        uow_factory=container.get(UnitOfWorkFactory),
+    )
+
+    def release(event) -> None:
+        # Timeout events are published from the sweeper thread, which has no loop
+        try:
+            asyncio.run(handler.handle(event))
+        except Exception as e:
+            logger.error("Failed to release timed out request: %s", e)
+
+    event_publisher.register_handler("RequestTimeoutEvent", release)
+
+
+def _start_request_archiver(container, config_manager):
+    """Start archiving terminal requests periodically while the server runs."""
+    import asyncio
+
+    from application.dto.commands import ArchiveCompletedRequestsCommand
+    from config.schemas.storage_schema import StorageConfig
+    from infrastructure.di.buses import CommandBus
+    from infrastructure.lifecycle import PeriodicTask
+
+    logger = get_logger(__name__)
+    interval = config_manager.get_typed(StorageConfig).retention.archive_interval
+    if not interval:
+        return None
+
+    command_bus = container.get(CommandBus)
+
+    def archive() -> None:
+        # The archive age defaults to storage.retention.archive_after_hours
+        asyncio.run(command_bus.execute(ArchiveCompletedRequestsCommand()))
+
+    archiver = PeriodicTask("request-archiver", archive, interval)
+    try:
+        archiver.initialize()
+    except Exception as e:
+        logger.warning("Request archiver unavailable: %s", e)
+        return None
+    return archiver
+
+
+def _shutdown_background_tasks(tasks) -> None:
+    """Stop the background tasks started for the server."""
+    for task in tasks:
+        task.shutdown()
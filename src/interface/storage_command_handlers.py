@@ -141,3 +141,58 @@ async def handle_storage_metrics(args) -> Dict[str, Any]:
     metrics = await query_bus.execute(query)
 
     return {"metrics": metrics, "message": "Storage metrics retrieved successfully"}
+
+
+@handle_interface_exceptions(context="storage_archive", interface_type="cli")
+async def handle_storage_archive(args) -> Dict[str, Any]:
+    """
+    Handle archive of completed requests.
+
+    Args:
+        args: Argument namespace with resource/action structure
+
+    Returns:
+        Archive results
+    """
+    container = get_container()
+    command_bus = container.get(CommandBus)
+
+    from application.dto.commands import ArchiveCompletedRequestsCommand
+
+    command = ArchiveCompletedRequestsCommand(
+        older_than_hours=getattr(args, "older_than_hours", None),
+        dry_run=getattr(args, "dry_run", False),
+    )
+    result = await command_bus.execute(command)
+
+    return {"archive": result, "message": "Completed requests archived successfully"}
+
+
+@handle_interface_exceptions(context="storage_history", interface_type="cli")
+async def handle_storage_history(args) -> Dict[str, Any]:
+    """
+    Handle request history operations.
+
+    Args:
+        args: Argument namespace with resource/action structure
+
+    Returns:
+        Archived requests
+    """
+    container = get_container()
+    query_bus = container.get(QueryBus)
+
+    from application.dto.queries import ListRequestHistoryQuery
+
+    query = ListRequestHistoryQuery(
+        request_id=getattr(args, "request_id", None),
+        status=getattr(args, "status", None),
+        limit=getattr(args, "limit", None),
+    )
+    requests = await query_bus.execute(query)
+
+    return {
+        "requests": [request.to_dict() for request in requests],
+        "count": len(requests),
+        "message": "Request history retrieved successfully",
+    }
@@ -1,12 +1,13 @@
 """Application metrics collection and monitoring."""
 
-import json
+import math
+import re
 import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from infrastructure.logging.logger import get_logger
 
@@ -69,27 +70,122 @@ class Timer:
         return duration
 
 
+# Latency histogram buckets: 2^(1/8) apart (~4.5% relative error) from 0.1 ms to ~3 hours
+HISTOGRAM_MIN_VALUE = 1e-4
+HISTOGRAM_GROWTH = 2 ** (1 / 8)
+HISTOGRAM_BUCKETS = 256
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram with bounded memory.
+
+    Samples are counted in log-spaced buckets, so recording is O(1) and
+    memory does not grow with the number of samples. Percentiles are
+    computed from the bucket counts when requested and are accurate to the
+    bucket width (about 4.5%).
+    """
+
+    def __init__(self, name: str, labels: Optional[Dict[str, str]] = None) -> None:
+        """Initialize an empty histogram."""
+        self.name = name
+        self.labels = labels or {}
+        self.buckets = [0] * (HISTOGRAM_BUCKETS + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Count one sample."""
+        value = max(0.0, value)
+        self.buckets[self._bucket_index(value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def percentile(self, quantile: float) -> float:
+        """
+        Get the value below which ``quantile`` of the samples fall.
+
+        Args:
+            quantile: Fraction between 0 and 1
+
+        Returns:
+            Estimated value, 0.0 when nothing was recorded
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(quantile * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min(max(self._bucket_value(index), self.min), self.max)
+        return self.max
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self.buckets = [0] * (HISTOGRAM_BUCKETS + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def to_dict(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> Dict[str, Any]:
+        """Convert histogram to a summary dictionary."""
+        summary = {
+            "name": self.name,
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "labels": self.labels,
+        }
+        for quantile in quantiles:
+            summary[f"p{quantile * 100:g}"] = self.percentile(quantile)
+        return summary
+
+    @staticmethod
+    def _bucket_index(value: float) -> int:
+        if value <= HISTOGRAM_MIN_VALUE:
+            return 0
+        index = math.ceil(math.log(value / HISTOGRAM_MIN_VALUE, HISTOGRAM_GROWTH))
+        return min(index, HISTOGRAM_BUCKETS)
+
+    @staticmethod
+    def _bucket_value(index: int) -> float:
+        """Get the geometric middle of a bucket."""
+        if index == 0:
+            return HISTOGRAM_MIN_VALUE
+        return HISTOGRAM_MIN_VALUE * HISTOGRAM_GROWTH ** (index - 0.5)
+
+
 class MetricsCollector:
     """Collects and manages application metrics."""
 
-    def __init__(self, config: Dict[str, Any]) -> None:
-        """Initialize metrics collector."""
-        self.config = config
+    def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Initialize metrics collector.
+
+        Args:
+            config: Metrics settings (METRICS_DIR); defaults apply when None
+        """
+        self.config = config or {}
         self.metrics: Dict[str, Metric] = {}
-        self.timers: Dict[str, List[float]] = {}
-        self._lock = threading.Lock()
+        self.histograms: Dict[str, Histogram] = {}
+        self._lock = threading.RLock()
 
-        # Create metrics directory
-        self.metrics_dir = Path(config.get("METRICS_DIR", "./metrics"))
-        self.metrics_dir.mkdir(parents=True, exist_ok=True)
+        # Directory of metrics files left by earlier versions, see cleanup_old_metrics
+        self.metrics_dir = Path(self.config.get("METRICS_DIR", "./metrics"))
 
         # Initialize default metrics
         self._initialize_metrics()
 
-        # Start background metrics writer if enabled
-        if config.get("METRICS_ENABLED", True):
-            self._start_metrics_writer()
-
     def _initialize_metrics(self) -> None:
         """Initialize default metrics."""
         # Request metrics
@@ -146,15 +242,23 @@ class MetricsCollector:
         return Timer(name, labels)
 
     def record_time(self, name: str, duration: float) -> None:
-        """Record a timing duration."""
+        """Record a timing duration in the histogram of ``name``."""
         with self._lock:
-            if name not in self.timers:
-                self.timers[name] = []
-            self.timers[name].append(duration)
-
-            # Calculate and update average response time
-            avg_time = sum(self.timers[name]) / len(self.timers[name])
-            self.set_gauge(f"{name}_seconds", avg_time)
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(name)
+            histogram.record(duration)
+
+            # Keep the average response time gauge up to date
+            self.set_gauge(f"{name}_seconds", histogram.sum / histogram.count)
+
+    def get_percentiles(
+        self, name: str, quantiles: Sequence[float] = DEFAULT_QUANTILES
+    ) -> Optional[Dict[str, Any]]:
+        """Get count, mean and percentiles of the durations recorded for ``name``."""
+        with self._lock:
+            histogram = self.histograms.get(name)
+            return histogram.to_dict(quantiles) if histogram else None
 
     def record_success(
         self,
@@ -197,35 +301,40 @@ class MetricsCollector:
         with self._lock:
             return {name: metric.to_dict() for name, metric in self.metrics.items()}
 
-    def _start_metrics_writer(self) -> None:
-        """Start background metrics writer thread."""
-
-        def write_metrics() -> None:
-            """Write metrics to file periodically in background thread."""
-            while True:
-                try:
-                    metrics = self.get_metrics()
-
-                    # Write to JSON file
-                    metrics_file = self.metrics_dir / "metrics.json"
-                    with metrics_file.open("w") as f:
-                        json.dump(metrics, f, indent=2)
-
-                    # Write to Prometheus format
-                    prom_file = self.metrics_dir / "metrics.prom"
-                    with prom_file.open("w") as f:
-                        for name, metric in metrics.items():
-                            labels = ",".join(f'{k}="{v}"' for k, v in metric["labels"].items())
-                            f.write(f'{name}{{{labels}}} {metric["value"]}\n')
+    def get_histograms(self) -> Dict[str, Dict[str, Any]]:
+        """Get count, mean and percentiles of every recorded duration."""
+        with self._lock:
+            return {name: histogram.to_dict() for name, histogram in self.histograms.items()}
 
-                    time.sleep(self.config.get("METRICS_INTERVAL", 60))
+    def export_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
 
-                except Exception as e:
-                    logger.error("Error writing metrics: %s", e)
-                    time.sleep(5)  # Shorter sleep on error
+        Counters and gauges are exported as such; duration histograms are
+        exported as summaries with p50/p95/p99 quantiles, sum and count.
 
-        thread = threading.Thread(target=write_metrics, daemon=True)
-        thread.start()
+        Returns:
+            Exposition text
+        """
+        lines: List[str] = []
+        with self._lock:
+            for metric in self.metrics.values():
+                name = _prometheus_name(metric.name)
+                kind = "counter" if isinstance(metric, Counter) else "gauge"
+                lines.append(f"# TYPE {name} {kind}")
+                lines.append(f"{name}{_prometheus_labels(metric.labels)} {metric.value}")
+
+            for histogram in self.histograms.values():
+                name = _prometheus_name(histogram.name)
+                lines.append(f"# TYPE {name} summary")
+                for quantile in DEFAULT_QUANTILES:
+                    labels = _prometheus_labels({**histogram.labels, "quantile": f"{quantile:g}"})
+                    lines.append(f"{name}{labels} {histogram.percentile(quantile)}")
+                labels = _prometheus_labels(histogram.labels)
+                lines.append(f"{name}_sum{labels} {histogram.sum}")
+                lines.append(f"{name}_count{labels} {histogram.count}")
+
+        return "\n".join(lines) + "\n" if lines else ""
 
     def check_thresholds(self) -> List[Dict[str, Any]]:
         """Check metrics against configured thresholds."""
@@ -256,17 +365,17 @@ class MetricsCollector:
                     metric.value = 0.0
                 elif isinstance(metric, Gauge):
                     metric.value = 0.0
-            self.timers.clear()
+            self.histograms.clear()
 
     def cleanup_old_metrics(self, max_age: timedelta = DEFAULT_MAX_AGE) -> None:
         """Clean up old metrics data."""
         cutoff = datetime.utcnow() - max_age
 
         with self._lock:
-            # Clean up timers
-            for name in list(self.timers.keys()):
-                if not self.timers[name]:
-                    del self.timers[name]
+            # Clean up histograms without samples
+            for name in list(self.histograms.keys()):
+                if not self.histograms[name].count:
+                    del self.histograms[name]
 
             # Clean up old metric files
             for file in self.metrics_dir.glob("*.json"):
@@ -275,3 +384,20 @@ class MetricsCollector:
                         file.unlink()
                     except Exception as e:
                         logger.warning("Failed to delete old metrics file %s: %s", file, e)
+
+
+def _prometheus_name(name: str) -> str:
+    """Make ``name`` a valid Prometheus metric name."""
+    name = re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _prometheus_labels(labels: Dict[str, str]) -> str:
+    """Render a Prometheus label set, escaping values."""
+    if not labels:
+        return ""
+    rendered = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        rendered.append(f'{_prometheus_name(key)}="{value}"')
+    return "{" + ",".join(rendered) + "}"
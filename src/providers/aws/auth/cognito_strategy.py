@@ -1,6 +1,6 @@
 """AWS Cognito authentication strategy."""
 
-from typing import List, Optional
+from typing import Any, List, Optional
 
 import boto3
 import jwt
@@ -14,6 +14,8 @@ from infrastructure.adapters.ports.auth import (
     AuthResult,
     AuthStatus,
 )
+from infrastructure.auth.jwks_cache import JWKSCache
+from infrastructure.auth.token_cache import VerifiedTokenCache
 
 
 @injectable
@@ -28,6 +30,8 @@ class CognitoAuthStrategy(AuthPort):
         region: str = "us-east-1",
         jwks_url: Optional[str] = None,
         enabled: bool = True,
+        jwks_cache_ttl: float = 3600.0,
+        token_cache_size: int = 1024,
     ) -> None:
         """
         Initialize Cognito authentication strategy.
@@ -38,6 +42,8 @@ class CognitoAuthStrategy(AuthPort):
             region: AWS region
             jwks_url: JWKS URL for token verification (auto-generated if not provided)
             enabled: Whether this strategy is enabled
+            jwks_cache_ttl: Seconds signing keys are cached before being re-fetched
+            token_cache_size: Number of verified tokens to cache (0 disables caching)
         """
         self.user_pool_id = user_pool_id
         self.client_id = client_id
@@ -54,6 +60,9 @@ class CognitoAuthStrategy(AuthPort):
                 f"{user_pool_id}/.well-known/jwks.json"
             )
 
+        self._jwks_cache = JWKSCache(self.jwks_url, ttl=jwks_cache_ttl)
+        self._token_cache = VerifiedTokenCache(max_size=token_cache_size)
+
         # Initialize Cognito client
         try:
             self.cognito_client = boto3.client("cognito-idp", region_name=region)
@@ -99,6 +108,10 @@ class CognitoAuthStrategy(AuthPort):
         Returns:
             Authentication result with user information from Cognito
         """
+        cached = self._token_cache.get(token)
+        if cached is not None:
+            return cached
+
         try:
             # Decode token without verification first to get header
             unverified_header = jwt.get_unverified_header(token)
@@ -107,7 +120,7 @@ class CognitoAuthStrategy(AuthPort):
             if not kid:
                 return AuthResult(status=AuthStatus.INVALID, error_message="Token missing key ID")
 
-            # Get public key from JWKS (simplified - in production, cache this)
+            # Get public key from the cached JWKS
             public_key = await self._get_public_key(kid)
             if not public_key:
                 return AuthResult(
@@ -136,7 +149,7 @@ class CognitoAuthStrategy(AuthPort):
             # Generate permissions based on roles
             permissions = self._generate_permissions(roles)
 
-            return AuthResult(
+            result = AuthResult(
                 status=AuthStatus.SUCCESS,
                 user_id=user_id,
                 user_roles=roles,
@@ -152,6 +165,8 @@ class CognitoAuthStrategy(AuthPort):
                     "client_id": payload.get("aud"),
                 },
             )
+            self._token_cache.put(token, result)
+            return result
 
         except jwt.ExpiredSignatureError:
             return AuthResult(status=AuthStatus.EXPIRED, error_message="Token has expired")
@@ -207,6 +222,7 @@ class CognitoAuthStrategy(AuthPort):
         Returns:
             True if token was revoked successfully
         """
+        self._token_cache.invalidate(token)
         try:
             # Cognito doesn't have a direct revoke endpoint for access tokens
             # You would typically revoke the refresh token or sign out the user
@@ -238,10 +254,13 @@ class CognitoAuthStrategy(AuthPort):
         """
         return self.enabled
 
-    async def _get_public_key(self, kid: str) -> Optional[str]:
+    async def _get_public_key(self, kid: str) -> Optional[Any]:
         """
         Get public key from Cognito JWKS endpoint.
 
+        Keys are served from a cache that is refreshed on expiry, ahead of
+        expiry in the background, and when the token names an unknown key.
+
         Args:
             kid: Key ID from token header
 
@@ -249,22 +268,7 @@ class CognitoAuthStrategy(AuthPort):
             Public key for token verification
         """
         try:
-            # In production, you would cache JWKS and implement appropriate key rotation
-            # This is a simplified implementation
-            import requests
-
-            # Add timeout to prevent hanging connections (security best practice)
-            response = requests.get(self.jwks_url, timeout=30)
-            jwks = response.json()
-
-            for key in jwks.get("keys", []):
-                if key.get("kid") == kid:
-                    # Convert JWK to PEM format (simplified)
-                    # In production, use a appropriate JWK library
-                    return key  # Return the key dict for now
-
-            return None
-
+            return await self._jwks_cache.get_key(kid)
         except Exception as e:
             self._logger.error("Failed to get public key: %s", e)
             return None
@@ -119,6 +119,13 @@ class AWSProviderConfig(BaseProviderConfig):
         0, description="Number of retries for status requests"
     )
     describe_request_interval: int = Field(0, description="Delay between retries in milliseconds")
+    delete_retained_resources: bool = Field(
+        False,
+        description=(
+            "Delete volumes and network interfaces with DeleteOnTermination=false "
+            "when machines are returned"
+        ),
+    )
 
     @model_validator(mode="after")
     def check_auth_method(self) -> "AWSProviderConfig":
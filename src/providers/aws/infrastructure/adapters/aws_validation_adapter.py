@@ -333,6 +333,17 @@ class AWSValidationAdapter(BaseProviderValidationAdapter):
         Returns:
             True if instance type appears to be valid AWS format
         """
+        from providers.aws.infrastructure.template.instance_type_catalog import (
+            get_instance_type_catalog,
+        )
+
+        catalog = get_instance_type_catalog()
+        if catalog is not None:
+            if catalog.get(instance_type) is not None:
+                return True
+            if catalog.is_authoritative():
+                return False
+
         # Basic AWS instance type validation (family.size)
         if "." not in instance_type:
             return False
@@ -5,13 +5,22 @@ This module provides an adapter for AWS-specific machine operations.
 It extracts AWS-specific logic from the domain layer.
 """
 
-from typing import Any, Dict
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
 
 from domain.base.dependency_injection import injectable
 from domain.base.ports import LoggingPort
 from domain.base.value_objects import InstanceType
 from domain.machine.aggregate import Machine
-from domain.machine.value_objects import MachineStatus, PriceType
+from domain.machine.value_objects import HealthCheckResult, MachineStatus, PriceType
+from infrastructure.resilience.engine import backoff_delay
 from providers.aws.domain.template.value_objects import ProviderApi
 from providers.aws.exceptions.aws_exceptions import (
     AWSError,
@@ -22,6 +31,56 @@ from providers.aws.exceptions.aws_exceptions import (
 )
 from providers.aws.infrastructure.aws_client import AWSClient
 
+# DescribeInstanceStatus accepts at most 100 instance IDs per call
+INSTANCE_STATUS_BATCH_SIZE = 100
+
+_INSTANCE_ID_PATTERN = re.compile(r"\bi-[0-9a-f]+\b")
+
+# EC2 describe filters accept at most 200 values
+CLEANUP_FILTER_BATCH_SIZE = 200
+
+_IN_USE_CODES = frozenset(
+    {"VolumeInUse", "InvalidNetworkInterface.InUse", "IncorrectState", "DependencyViolation"}
+)
+_ALREADY_DELETED_CODES = frozenset(
+    {"InvalidVolume.NotFound", "InvalidNetworkInterfaceID.NotFound"}
+)
+
+
+def _client_error_code(error: Optional[BaseException]) -> str:
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code", "")
+    return ""
+
+
+@dataclass
+class ResourceCleanupPlan:
+    """Volumes and network interfaces left behind by the machines of a return request."""
+
+    volume_ids: List[str] = field(default_factory=list)
+    network_interface_ids: List[str] = field(default_factory=list)
+    volume_attachments: List[Tuple[str, str]] = field(default_factory=list)
+    network_interface_attachments: List[str] = field(default_factory=list)
+
+    def is_empty(self) -> bool:
+        """Check whether there is nothing to delete."""
+        return not (self.volume_ids or self.network_interface_ids)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the resources to delete; attachments only matter before termination."""
+        return {
+            "volume_ids": list(self.volume_ids),
+            "network_interface_ids": list(self.network_interface_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResourceCleanupPlan":
+        """Create a plan from :meth:`to_dict` output."""
+        return cls(
+            volume_ids=list(data.get("volume_ids", [])),
+            network_interface_ids=list(data.get("network_interface_ids", [])),
+        )
+
 
 @injectable
 class AWSMachineAdapter:
@@ -241,186 +300,251 @@ class AWSMachineAdapter:
             self._logger.error("Unexpected error during health check: %s", str(e))
             raise AWSError(f"Unexpected error during health check: {str(e)}")
 
-    def cleanup_machine_resources(self, machine: Machine) -> Dict[str, Any]:
+    def check_health_bulk(self, machine_ids: Iterable[str]) -> Dict[str, HealthCheckResult]:
         """
-        Clean up AWS resources associated with machine.
+        Check the health of any number of instances with batched status calls.
+
+        Instance IDs are sent to DescribeInstanceStatus 100 at a time with
+        IncludeAllInstances, so stopped and pending instances are reported
+        too and a request with 1,000 machines needs 10 calls.
 
         Args:
-            machine: Machine domain entity
+            machine_ids: Instance IDs to check
 
         Returns:
-            Dictionary with cleanup results
+            Health check result per instance ID. Instances that no longer
+            exist have no entry.
 
         Raises:
-            ResourceCleanupError: If there's an issue cleaning up resources
-            EC2InstanceNotFoundError: If the instance cannot be found
+            AWSError: If a status call fails
         """
-        self._logger.debug("Cleaning up resources for machine: %s", machine.machine_id)
-
-        cleanup_results = {
-            "volumes": {"success": [], "failed": []},
-            "network_interfaces": {"success": [], "failed": []},
-        }
-
-        try:
-            # Check if instance exists using circuit breaker
-            def check_instance_exists():
-                """Check if EC2 instance exists in AWS."""
-                return self._aws_client.ec2_client.describe_instances(
-                    InstanceIds=[str(machine.machine_id)]
+        instance_ids = list(dict.fromkeys(str(machine_id) for machine_id in machine_ids))
+        self._logger.debug("Performing bulk health check for %s machines", len(instance_ids))
+
+        timestamp = datetime.utcnow()
+        results: Dict[str, HealthCheckResult] = {}
+        for start in range(0, len(instance_ids), INSTANCE_STATUS_BATCH_SIZE):
+            batch = instance_ids[start : start + INSTANCE_STATUS_BATCH_SIZE]
+            for instance_status in self._describe_instance_status(batch):
+                results[instance_status["InstanceId"]] = self._to_health_check_result(
+                    instance_status, timestamp
                 )
 
-            try:
-                self._aws_client.execute_with_circuit_breaker(
-                    "ec2", "describe_instances", check_instance_exists
-                )
-            except NetworkError as e:
-                self._logger.error("Network error checking instance existence: %s", str(e))
-                raise AWSError(f"Network error checking instance existence: {str(e)}")
-            except RateLimitError as e:
-                self._logger.warning("Rate limit exceeded checking instance existence: %s", str(e))
-                raise AWSError(f"Rate limit exceeded checking instance existence: {str(e)}")
-            except AWSError as e:
-                error_code = getattr(e, "error_code", "")
-                if error_code == "InvalidInstanceID.NotFound":
-                    self._logger.error("Instance not found during cleanup: %s", machine.machine_id)
-                    raise EC2InstanceNotFoundError(str(machine.machine_id))
-                else:
-                    self._logger.error("AWS error during cleanup: %s", str(e))
-                    raise AWSError(f"AWS error during cleanup: {str(e)}", error_code=error_code)
+        self._logger.debug(
+            "Bulk health check completed: %s of %s machines reported",
+            len(results),
+            len(instance_ids),
+        )
+        return results
 
-            # Detach and delete EBS volumes using circuit breaker
+    def _describe_instance_status(self, instance_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get the status of one batch of instances, skipping IDs that do not exist."""
+        statuses: List[Dict[str, Any]] = []
+        kwargs: Dict[str, Any] = {"InstanceIds": instance_ids, "IncludeAllInstances": True}
+        while True:
             try:
-
-                def get_volumes():
-                    """Get EBS volumes attached to the EC2 instance."""
-                    return self._aws_client.ec2_client.describe_volumes(
-                        Filters=[
-                            {
-                                "Name": "attachment.instance-id",
-                                "Value": [str(machine.machine_id)],
-                            }
-                        ]
+                response = self._aws_client.ec2_client.describe_instance_status(**kwargs)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "")
+                message = e.response.get("Error", {}).get("Message", str(e))
+                if error_code != "InvalidInstanceID.NotFound":
+                    self._logger.error("AWS error during bulk health check: %s", message)
+                    raise AWSError(
+                        f"AWS error during bulk health check: {message}", error_code=error_code
                     )
+                # One unknown ID fails the whole call: retry without the IDs it names
+                missing = set(_INSTANCE_ID_PATTERN.findall(message))
+                remaining = [i for i in kwargs["InstanceIds"] if i not in missing]
+                if not missing or len(remaining) == len(kwargs["InstanceIds"]):
+                    raise EC2InstanceNotFoundError(", ".join(kwargs["InstanceIds"]))
+                self._logger.warning("Instances not found during health check: %s", missing)
+                if not remaining:
+                    return statuses
+                kwargs = {"InstanceIds": remaining, "IncludeAllInstances": True}
+                continue
+
+            statuses.extend(response.get("InstanceStatuses", []))
+            next_token = response.get("NextToken")
+            if not next_token:
+                return statuses
+            kwargs["NextToken"] = next_token
+
+    @staticmethod
+    def _to_health_check_result(
+        instance_status: Dict[str, Any], timestamp: datetime
+    ) -> HealthCheckResult:
+        """Map the system and instance status checks of an instance onto its health."""
+        system = instance_status.get("SystemStatus", {})
+        instance = instance_status.get("InstanceStatus", {})
+        return HealthCheckResult(
+            system_status=system.get("Status") == "ok",
+            instance_status=instance.get("Status") == "ok",
+            timestamp=timestamp,
+            system_details={
+                "status": system.get("Status"),
+                "details": system.get("Details", []),
+            },
+            instance_details={
+                "status": instance.get("Status"),
+                "details": instance.get("Details", []),
+            },
+        )
 
-                volumes = self._aws_client.execute_with_circuit_breaker(
-                    "ec2", "describe_volumes", get_volumes
-                )
+    def plan_resource_cleanup(
+        self, machine_ids: Iterable[str], include_retained: bool = False
+    ) -> ResourceCleanupPlan:
+        """
+        Collect the volumes and network interfaces to delete after machines terminate.
 
-                for volume in volumes["Volumes"]:
-                    volume_id = volume["VolumeId"]
-                    try:
-                        if volume["State"] == "in-use":
-                            self._logger.debug(
-                                "Detaching volume %s from %s", volume_id, machine.machine_id
-                            )
-
-                            def detach_volume(volume_id=volume_id):
-                                """Detach EBS volume from instance."""
-                                return self._aws_client.ec2_client.detach_volume(VolumeId=volume_id)
-
-                            self._aws_client.execute_with_circuit_breaker(
-                                "ec2", "detach_volume", detach_volume
-                            )
-
-                            self._logger.debug("Deleting volume %s", volume_id)
-
-                            def delete_volume(vol_id=volume_id):
-                                """Delete EBS volume."""
-                                return self._aws_client.ec2_client.delete_volume(VolumeId=vol_id)
-
-                            self._aws_client.execute_with_circuit_breaker(
-                                "ec2", "delete_volume", delete_volume
-                            )
-
-                            cleanup_results["volumes"]["success"].append(volume_id)
-                    except AWSError as e:
-                        self._logger.error("Failed to cleanup volume %s: %s", volume_id, str(e))
-                        cleanup_results["volumes"]["failed"].append(
-                            {"id": volume_id, "error": str(e)}
-                        )
-            except AWSError as e:
-                self._logger.error(
-                    "Error processing volumes for %s: %s", machine.machine_id, str(e)
-                )
-                # Continue with other resources even if volumes fail
+        Resources are found with filtered, paginated describes covering up to
+        200 machines each, so planning a return request costs a constant
+        number of calls per 200 machines. Resources AWS deletes on
+        termination are left out; the rest were set to outlive their instance
+        (DeleteOnTermination=false), e.g. interfaces a launch template attaches
+        by NetworkInterfaceId, so they are only collected when asked for. Plan
+        before terminating: the attachment filters no longer match once the
+        instances are gone.
 
-            # Delete network interfaces using circuit breaker
-            try:
+        Args:
+            machine_ids: Instance IDs of the machines being returned
+            include_retained: Collect the volumes and network interfaces that
+                outlive their instance (an empty plan otherwise)
 
-                def get_network_interfaces():
-                    """Get network interfaces attached to the EC2 instance."""
-                    return self._aws_client.ec2_client.describe_network_interfaces(
-                        Filters=[
-                            {
-                                "Name": "attachment.instance-id",
-                                "Value": [str(machine.machine_id)],
-                            }
-                        ]
-                    )
+        Returns:
+            Cleanup plan
 
-                nics = self._aws_client.execute_with_circuit_breaker(
-                    "ec2", "describe_network_interfaces", get_network_interfaces
+        Raises:
+            AWSError: If a describe call fails
+        """
+        instance_ids = list(dict.fromkeys(str(machine_id) for machine_id in machine_ids))
+        plan = ResourceCleanupPlan()
+        if not include_retained:
+            return plan
+
+        for start in range(0, len(instance_ids), CLEANUP_FILTER_BATCH_SIZE):
+            filters = [
+                {
+                    "Name": "attachment.instance-id",
+                    "Values": instance_ids[start : start + CLEANUP_FILTER_BATCH_SIZE],
+                }
+            ]
+            for volume in self._describe_all("describe_volumes", "Volumes", filters):
+                attachments = volume.get("Attachments", [])
+                if any(attachment.get("DeleteOnTermination") for attachment in attachments):
+                    continue
+                plan.volume_ids.append(volume["VolumeId"])
+                plan.volume_attachments.extend(
+                    (volume["VolumeId"], attachment["InstanceId"])
+                    for attachment in attachments
+                    if attachment.get("InstanceId")
                 )
 
-                for nic in nics["NetworkInterfaces"]:
-                    nic_id = nic["NetworkInterfaceId"]
-                    try:
-                        if nic["Status"] == "in-use":
-                            attachment_id = nic["Attachment"]["AttachmentId"]
-                            self._logger.debug(
-                                "Detaching network interface %s from %s", nic_id, machine.machine_id
-                            )
-
-                            def detach_network_interface(attachment_id=attachment_id):
-                                """Detach network interface from instance."""
-                                return self._aws_client.ec2_client.detach_network_interface(
-                                    AttachmentId=attachment_id
-                                )
-
-                            self._aws_client.execute_with_circuit_breaker(
-                                "ec2",
-                                "detach_network_interface",
-                                detach_network_interface,
-                            )
-
-                            self._logger.debug("Deleting network interface %s", nic_id)
-
-                            def delete_network_interface(network_id=nic_id):
-                                """Delete network interface."""
-                                return self._aws_client.ec2_client.delete_network_interface(
-                                    NetworkInterfaceId=network_id
-                                )
-
-                            self._aws_client.execute_with_circuit_breaker(
-                                "ec2",
-                                "delete_network_interface",
-                                delete_network_interface,
-                            )
-
-                            cleanup_results["network_interfaces"]["success"].append(nic_id)
-                    except AWSError as e:
-                        self._logger.error(
-                            "Failed to cleanup network interface %s: %s", nic_id, str(e)
-                        )
-                        cleanup_results["network_interfaces"]["failed"].append(
-                            {"id": nic_id, "error": str(e)}
-                        )
-            except AWSError as e:
-                self._logger.error(
-                    "Error processing network interfaces for %s: %s", machine.machine_id, str(e)
-                )
-                # Continue with other resources even if network interfaces fail
+            for nic in self._describe_all(
+                "describe_network_interfaces", "NetworkInterfaces", filters
+            ):
+                attachment = nic.get("Attachment") or {}
+                if attachment.get("DeleteOnTermination"):
+                    continue
+                plan.network_interface_ids.append(nic["NetworkInterfaceId"])
+                if attachment.get("AttachmentId"):
+                    plan.network_interface_attachments.append(attachment["AttachmentId"])
 
-            self._logger.debug("Resource cleanup completed for %s", machine.machine_id)
-            return cleanup_results
+        self._logger.debug(
+            "Planned cleanup of %s volumes and %s network interfaces for %s machines",
+            len(plan.volume_ids),
+            len(plan.network_interface_ids),
+            len(instance_ids),
+        )
+        return plan
 
-        except EC2InstanceNotFoundError:
-            # Re-raise specific exceptions
-            raise
-        except AWSError:
-            # Re-raise specific exceptions
-            raise
+    def execute_resource_cleanup(
+        self,
+        plan: ResourceCleanupPlan,
+        detach: bool = False,
+        max_workers: int = 10,
+        max_rounds: int = 6,
+        retry_delay: float = 2.0,
+    ) -> Dict[str, Any]:
+        """
+        Delete the resources of a cleanup plan with bounded concurrency.
+
+        Resources still attached to a terminating instance cannot be deleted
+        yet. Only those stragglers are retried, with backoff between rounds,
+        and no further describe calls are made. Those still in use after the
+        last round are returned as the remaining plan for a later attempt.
+
+        Args:
+            plan: Plan from :meth:`plan_resource_cleanup`
+            detach: Detach the resources first, for machines that keep running
+            max_workers: Most delete calls in flight at once
+            max_rounds: Delete attempts per resource
+            retry_delay: Backoff cap in seconds before the first retry round
+
+        Returns:
+            Dictionary with the results per resource type and the remaining plan
+        """
+        ec2_client = self._aws_client.ec2_client
+        if detach:
+            self._run_batch(
+                [
+                    partial(ec2_client.detach_volume, VolumeId=volume_id, InstanceId=instance_id)
+                    for volume_id, instance_id in plan.volume_attachments
+                ]
+                + [
+                    partial(ec2_client.detach_network_interface, AttachmentId=attachment_id)
+                    for attachment_id in plan.network_interface_attachments
+                ],
+                max_workers,
+            )
+
+        results = {
+            "volumes": self._delete_with_retries(
+                plan.volume_ids,
+                lambda volume_id: ec2_client.delete_volume(VolumeId=volume_id),
+                max_workers,
+                max_rounds,
+                retry_delay,
+            ),
+            "network_interfaces": self._delete_with_retries(
+                plan.network_interface_ids,
+                lambda nic_id: ec2_client.delete_network_interface(NetworkInterfaceId=nic_id),
+                max_workers,
+                max_rounds,
+                retry_delay,
+            ),
+        }
+        remaining = ResourceCleanupPlan(
+            volume_ids=results["volumes"]["in_use"],
+            network_interface_ids=results["network_interfaces"]["in_use"],
+        )
+        self._logger.info(
+            "Resource cleanup deleted %s volumes and %s network interfaces "
+            "(%s failed, %s still in use)",
+            len(results["volumes"]["success"]),
+            len(results["network_interfaces"]["success"]),
+            len(results["volumes"]["failed"]) + len(results["network_interfaces"]["failed"]),
+            len(remaining.volume_ids) + len(remaining.network_interface_ids),
+        )
+        return {**results, "remaining": remaining.to_dict()}
+
+    def cleanup_machine_resources(self, machine: Machine) -> Dict[str, Any]:
+        """
+        Clean up AWS resources associated with machine.
+
+        Args:
+            machine: Machine domain entity
+
+        Returns:
+            Dictionary with cleanup results
+
+        Raises:
+            ResourceCleanupError: If there's an issue cleaning up resources
+        """
+        self._logger.debug("Cleaning up resources for machine: %s", machine.machine_id)
+
+        try:
+            plan = self.plan_resource_cleanup([str(machine.machine_id)], include_retained=True)
+            return self.execute_resource_cleanup(plan, detach=True)
         except Exception as e:
             self._logger.error("Unexpected error during resource cleanup: %s", str(e))
             raise ResourceCleanupError(
@@ -429,6 +553,76 @@ class AWSMachineAdapter:
                 "EC2Instance",
             )
 
+    def _describe_all(
+        self, operation_name: str, result_key: str, filters: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Get all pages of a filtered describe call."""
+        paginator = self._aws_client.ec2_client.get_paginator(operation_name)
+        items: List[Dict[str, Any]] = []
+        try:
+            for page in paginator.paginate(Filters=filters):
+                items.extend(page.get(result_key, []))
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "")
+            self._logger.error("Failed to %s during cleanup planning: %s", operation_name, e)
+            raise AWSError(f"Failed to {operation_name}: {e}", error_code=error_code)
+        return items
+
+    def _delete_with_retries(
+        self,
+        resource_ids: List[str],
+        delete: Callable[[str], Any],
+        max_workers: int,
+        max_rounds: int,
+        retry_delay: float,
+    ) -> Dict[str, List[Any]]:
+        """Delete resources concurrently, retrying those that are still in use."""
+        results: Dict[str, List[Any]] = {"success": [], "failed": [], "in_use": []}
+        pending = list(resource_ids)
+        for attempt in range(max_rounds):
+            if not pending:
+                break
+            if attempt:
+                time.sleep(backoff_delay(attempt - 1, retry_delay, 30.0))
+
+            errors = self._run_batch(
+                [partial(delete, resource_id) for resource_id in pending], max_workers
+            )
+            stragglers = []
+            for resource_id, error in zip(pending, errors):
+                error_code = _client_error_code(error)
+                if error is None or error_code in _ALREADY_DELETED_CODES:
+                    results["success"].append(resource_id)
+                elif error_code in _IN_USE_CODES and attempt + 1 < max_rounds:
+                    stragglers.append(resource_id)
+                elif error_code in _IN_USE_CODES:
+                    results["in_use"].append(resource_id)
+                else:
+                    self._logger.error("Failed to cleanup %s: %s", resource_id, error)
+                    results["failed"].append({"id": resource_id, "error": str(error)})
+            if stragglers:
+                self._logger.debug("Retrying cleanup of %s resources still in use", len(stragglers))
+            pending = stragglers
+        return results
+
+    @staticmethod
+    def _run_batch(
+        calls: List[Callable[[], Any]], max_workers: int
+    ) -> List[Optional[BaseException]]:
+        """Run calls on a bounded thread pool and return the error of each, if any."""
+
+        def run(call: Callable[[], Any]) -> Optional[BaseException]:
+            try:
+                call()
+                return None
+            except Exception as e:
+                return e
+
+        if not calls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            return list(executor.map(run, calls))
+
     def get_machine_details(self, machine: Machine) -> Dict[str, Any]:
         """
         Get detailed AWS information for a machine.
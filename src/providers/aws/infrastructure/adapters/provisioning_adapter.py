@@ -16,12 +16,14 @@ from infrastructure.adapters.ports.resource_provisioning_port import (
     ResourceProvisioningPort,
 )
 from infrastructure.template.configuration_manager import TemplateConfigurationManager
+from providers.aws.configuration.config import AWSProviderConfig
 from providers.aws.exceptions.aws_exceptions import (
     AWSEntityNotFoundError,
     AWSValidationError,
     InfrastructureError,
     QuotaExceededError,
 )
+from providers.aws.infrastructure.adapters.machine_adapter import AWSMachineAdapter
 from providers.aws.infrastructure.aws_client import AWSClient
 from providers.aws.infrastructure.aws_handler_factory import AWSHandlerFactory
 from providers.aws.infrastructure.handlers.base_handler import AWSHandler
@@ -186,7 +188,7 @@ class AWSProvisioningAdapter(ResourceProvisioningPort):
         """
         self._logger.info("Checking status of resources for request %s", request.request_id)
 
-        if not request.resource_id:
+        if not request.resource_ids:
             self._logger.error("No resource ID found in request %s", request.request_id)
             raise AWSEntityNotFoundError(f"No resource ID found in request {request.request_id}")
 
@@ -239,7 +241,7 @@ class AWSProvisioningAdapter(ResourceProvisioningPort):
         """
         self._logger.info("Releasing resources for request %s", request.request_id)
 
-        if not request.resource_id:
+        if not request.resource_ids:
             self._logger.error("No resource ID found in request %s", request.request_id)
             raise AWSEntityNotFoundError(f"No resource ID found in request {request.request_id}")
 
@@ -266,8 +268,16 @@ class AWSProvisioningAdapter(ResourceProvisioningPort):
         handler = self._get_handler_for_template(template)
 
         try:
+            # Leftover resources are found by their attachment, so plan before releasing
+            machine_adapter = AWSMachineAdapter(self._aws_client, self._logger)
+            cleanup_plan = machine_adapter.plan_resource_cleanup(
+                [str(instance_id.value) for instance_id in request.instance_ids],
+                include_retained=self._delete_retained_resources(),
+            )
+
             # Release hosts using the handler
             handler.release_hosts(request)
+            machine_adapter.execute_resource_cleanup(cleanup_plan)
             self._logger.info("Successfully released resources for request %s", request.request_id)
         except AWSEntityNotFoundError as e:
             self._logger.error("Resource not found during release: %s", str(e))
@@ -276,6 +286,18 @@ class AWSProvisioningAdapter(ResourceProvisioningPort):
             self._logger.error("Error during resource release: %s", str(e))
             raise InfrastructureError(f"Failed to release resources: {str(e)}")
 
+    def _delete_retained_resources(self) -> bool:
+        """Check whether resources kept past termination are deleted on release."""
+        try:
+            from domain.base.ports import ConfigurationPort
+            from infrastructure.di.container import get_container
+
+            config_manager = get_container().get(ConfigurationPort)
+            return config_manager.get_typed(AWSProviderConfig).delete_retained_resources
+        except Exception as e:
+            self._logger.debug("Could not read AWS cleanup configuration: %s", str(e))
+            return False
+
     def get_resource_health(self, resource_id: str) -> Dict[str, Any]:
         """
         Get health information for a specific AWS resource.
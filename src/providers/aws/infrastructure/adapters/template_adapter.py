@@ -17,6 +17,9 @@ from infrastructure.template.configuration_manager import TemplateConfigurationM
 from infrastructure.template.dtos import TemplateDTO
 from providers.aws.exceptions.aws_exceptions import AWSValidationError
 from providers.aws.infrastructure.aws_client import AWSClient
+from providers.aws.infrastructure.template.instance_type_catalog import (
+    get_instance_type_catalog,
+)
 
 
 class AWSTemplateAdapter(TemplateAdapterPort):
@@ -470,8 +473,14 @@ class AWSTemplateAdapter(TemplateAdapterPort):
         return bool(re.match(r"^ami-[0-9a-f]{8,17}$", ami_id))
 
     def _is_valid_instance_type(self, instance_type: str) -> bool:
-        """Validate instance type format."""
-        # Basic validation - could be extended with actual AWS instance type list
+        """Validate instance type against the catalog, falling back to its format."""
+        catalog = get_instance_type_catalog()
+        if catalog is not None:
+            if catalog.get(instance_type) is not None:
+                return True
+            if catalog.is_authoritative():
+                return False
+
         return bool(re.match(r"^[a-z0-9]+\.[a-z0-9]+$", instance_type))
 
     def _is_valid_subnet_format(self, subnet_id: str) -> bool:
@@ -9,11 +9,20 @@ from botocore.exceptions import ClientError
 
 from domain.base.dependency_injection import injectable
 from domain.base.ports import ConfigurationPort, LoggingPort
+from infrastructure.resilience.rate_limiter import RateLimiter
 from providers.aws.exceptions.aws_exceptions import (
     AuthorizationError,
     AWSConfigurationError,
     NetworkError,
 )
+from providers.aws.infrastructure.hedged_reads import (
+    attach_read_deadlines,
+    get_aws_hedged_caller,
+)
+from providers.aws.infrastructure.rate_limiting import (
+    attach_rate_limiter,
+    get_aws_rate_limiter,
+)
 
 if TYPE_CHECKING:
     pass
@@ -56,6 +65,10 @@ class AWSClient:
 
         # Load performance configuration
         self.perf_config = self._load_performance_config(self._config_manager)
+        typed_perf_config = self._get_typed_performance_config(self._config_manager)
+        self._rate_limiter = self._init_rate_limiter(typed_perf_config.rate_limiting)
+        self._read_operations = typed_perf_config.hedging.read_operations
+        self._read_caller = get_aws_hedged_caller(typed_perf_config.hedging)
 
         # Initialize resource cache
         self._resource_cache: dict[str, Any] = {}
@@ -273,13 +286,44 @@ class AWSClient:
             "cache_ttl": 300,
         }
 
+    def _create_client(self, service_name: str) -> Any:
+        """Create a service client with client-side rate limiting and deadline-bounded reads."""
+        client = self.session.client(service_name, config=self.boto_config)
+        if self._rate_limiter is not None:
+            attach_rate_limiter(client, self._rate_limiter)
+        attach_read_deadlines(client, self._read_caller, self._read_operations)
+        return client
+
+    def _get_typed_performance_config(self, config_manager) -> Any:
+        """Get the typed performance configuration, falling back to its defaults."""
+        from config import PerformanceConfig
+
+        try:
+            perf_config = config_manager.get_typed(PerformanceConfig)
+            if isinstance(perf_config, PerformanceConfig):
+                return perf_config
+        except Exception as e:
+            self._logger.debug("Using default performance configuration: %s", e)
+        return PerformanceConfig()
+
+    def _init_rate_limiter(self, rate_config) -> Optional[RateLimiter]:
+        """Get the process-wide AWS API rate limiter configured for this client."""
+        work_dir = None
+        if rate_config.shared:
+            try:
+                work_dir = self._config_manager.get_work_dir()
+            except Exception as e:
+                self._logger.debug("Work dir unavailable for shared rate limits: %s", e)
+
+        return get_aws_rate_limiter(rate_config, work_dir)
+
     # Property getters for lazy initialization of AWS service clients
     @property
     def ec2_client(self):
         """Lazy initialization of EC2 client."""
         if self._ec2_client is None:
             self._logger.debug("Initializing EC2 client on first use")
-            self._ec2_client = self.session.client("ec2", config=self.boto_config)
+            self._ec2_client = self._create_client("ec2")
         return self._ec2_client
 
     @property
@@ -287,7 +331,7 @@ class AWSClient:
         """Lazy initialization of STS client."""
         if self._sts_client is None:
             self._logger.debug("Initializing STS client on first use")
-            self._sts_client = self.session.client("sts", config=self.boto_config)
+            self._sts_client = self._create_client("sts")
         return self._sts_client
 
     @property
@@ -295,7 +339,7 @@ class AWSClient:
         """Lazy initialization of Auto Scaling client."""
         if self._autoscaling_client is None:
             self._logger.debug("Initializing Auto Scaling client on first use")
-            self._autoscaling_client = self.session.client("autoscaling", config=self.boto_config)
+            self._autoscaling_client = self._create_client("autoscaling")
         return self._autoscaling_client
 
     @property
@@ -303,7 +347,7 @@ class AWSClient:
         """Lazy initialization of SSM client."""
         if self._ssm_client is None:
             self._logger.debug("Initializing SSM client on first use")
-            self._ssm_client = self.session.client("ssm", config=self.boto_config)
+            self._ssm_client = self._create_client("ssm")
         return self._ssm_client
 
     @property
@@ -311,7 +355,7 @@ class AWSClient:
         """Lazy initialization of IAM client."""
         if not hasattr(self, "_iam_client") or self._iam_client is None:
             self._logger.debug("Initializing IAM client on first use")
-            self._iam_client = self.session.client("iam", config=self.boto_config)
+            self._iam_client = self._create_client("iam")
         return self._iam_client
 
     @property
@@ -319,5 +363,5 @@ class AWSClient:
         """Lazy initialization of ELBv2 client."""
         if not hasattr(self, "_elbv2_client") or self._elbv2_client is None:
             self._logger.debug("Initializing ELBv2 client on first use")
-            self._elbv2_client = self.session.client("elbv2", config=self.boto_config)
+            self._elbv2_client = self._create_client("elbv2")
         return self._elbv2_client
@@ -11,24 +11,31 @@ Architecture:
 - Thread-safe and compatible with existing AWS client patterns
 """
 
+import importlib.util
 import logging
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Generator
 
 from infrastructure.mocking.dry_run_context import is_dry_run_active
 
-# Import moto for AWS mocking
-try:
-    from moto import mock_aws
-
-    MOTO_AVAILABLE = True
-except ImportError:
-    MOTO_AVAILABLE = False
-    mock_aws = None
+# Moto is only probed here; importing it pulls in werkzeug/responses and costs
+# ~200ms, so the actual import is deferred until a dry-run context is entered.
+MOTO_AVAILABLE = importlib.util.find_spec("moto") is not None
+mock_aws = None
 
 logger = logging.getLogger(__name__)
 
 
+def _get_mock_aws() -> Any:
+    """Resolve moto's mock_aws factory, importing moto on first use."""
+    global mock_aws
+    if mock_aws is None:
+        from moto import mock_aws as moto_mock_aws
+
+        mock_aws = moto_mock_aws
+    return mock_aws
+
+
 @contextmanager
 def aws_dry_run_context() -> Generator[None, None, None]:
     """
@@ -65,7 +72,7 @@ def aws_dry_run_context() -> Generator[None, None, None]:
 
     if is_dry_run_active():
         logger.debug("DRY-RUN: AWS dry-run mode: Using moto for boto3 mocking")
-        with mock_aws():
+        with _get_mock_aws()():
             yield
     else:
         logger.debug("AWS production mode: Using real boto3 calls")
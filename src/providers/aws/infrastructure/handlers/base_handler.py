@@ -187,7 +187,7 @@ class AWSHandler(ABC):
         )
 
         # Create retry decorator with appropriate strategy
-        @retry(**strategy_config)
+        @retry(callsite=f"{service_name}_{operation_name}", **strategy_config)
         def wrapped_operation():
             """Wrapped operation with retry logic applied."""
             return func(*args, **kwargs)
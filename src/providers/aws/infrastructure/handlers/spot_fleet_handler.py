@@ -27,8 +27,9 @@ Note:
 """
 
 import json
+import os
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from domain.base.dependency_injection import injectable
 from domain.base.ports import LoggingPort
@@ -39,18 +40,39 @@ from infrastructure.utilities.common.resource_naming import get_resource_prefix
 from providers.aws.domain.template.aggregate import AWSTemplate
 from providers.aws.domain.template.value_objects import AWSFleetType
 from providers.aws.exceptions.aws_exceptions import (
+    AuthorizationError,
     AWSInfrastructureError,
     AWSValidationError,
     IAMError,
 )
 from providers.aws.infrastructure.handlers.base_context_mixin import BaseContextMixin
 from providers.aws.infrastructure.handlers.base_handler import AWSHandler
+from providers.aws.infrastructure.iam_validation_cache import IAMValidationCache
 from providers.aws.infrastructure.launch_template.manager import (
     AWSLaunchTemplateManager,
 )
 from providers.aws.utilities.aws_operations import AWSOperations
 
 
+# Permissions simulated for the caller when validating a custom fleet role
+SPOT_FLEET_ACTIONS = (
+    "ec2:RequestSpotFleet",
+    "ec2:ModifySpotFleetRequest",
+    "ec2:CancelSpotFleetRequests",
+    "ec2:DescribeSpotFleetRequests",
+    "ec2:DescribeSpotFleetInstances",
+    "iam:PassRole",
+)
+
+
+def _is_permission_failure(error: Exception) -> bool:
+    """Check whether a fleet launch failed on IAM permissions or the fleet role."""
+    if isinstance(error, (AuthorizationError, IAMError)):
+        return True
+    message = str(error)
+    return any(marker in message for marker in ("IamFleetRole", "iam:PassRole", "AccessDenied"))
+
+
 @injectable
 class SpotFleetHandler(AWSHandler, BaseContextMixin):
     """Handler for Spot Fleet operations."""
@@ -75,6 +97,7 @@ class SpotFleetHandler(AWSHandler, BaseContextMixin):
         """
         # Use base class initialization - eliminates duplication
         super().__init__(aws_client, logger, aws_ops, launch_template_manager, request_adapter)
+        self._iam_validation_cache: Optional[IAMValidationCache] = None
 
         # Get AWS native spec service from container
         from infrastructure.di.container import get_container
@@ -170,11 +193,17 @@ class SpotFleetHandler(AWSHandler, BaseContextMixin):
         )
 
         # Request spot fleet with circuit breaker for critical operation
-        response = self._retry_with_backoff(
-            self.aws_client.ec2_client.request_spot_fleet,
-            operation_type="critical",
-            SpotFleetRequestConfig=fleet_config,
-        )
+        try:
+            response = self._retry_with_backoff(
+                self.aws_client.ec2_client.request_spot_fleet,
+                operation_type="critical",
+                SpotFleetRequestConfig=fleet_config,
+            )
+        except Exception as e:
+            if aws_template.fleet_role and _is_permission_failure(e):
+                # The cached validation no longer holds; check IAM again next time
+                self._invalidate_fleet_role_validation(aws_template.fleet_role)
+            raise
 
         fleet_id = response["SpotFleetRequestId"]
         self._logger.info("Successfully created Spot Fleet request: %s", fleet_id)
@@ -213,14 +242,9 @@ class SpotFleetHandler(AWSHandler, BaseContextMixin):
                         f"Invalid Spot Fleet service-linked role format: {aws_template.fleet_role}"
                     )
             else:
-                # For custom roles, validate with IAM
+                # For custom roles, validate with IAM unless a recent validation passed
                 try:
-                    role_name = aws_template.fleet_role.split("/")[-1]
-                    # Create IAM client directly from session
-                    iam_client = self.aws_client.session.client(
-                        "iam", config=self.aws_client.boto_config
-                    )
-                    self._retry_with_backoff(iam_client.get_role, RoleName=role_name)
+                    self._validate_custom_fleet_role(aws_template.fleet_role)
                 except Exception as e:
                     errors.append(f"Invalid custom fleet role: {str(e)}")
 
@@ -300,6 +324,25 @@ class SpotFleetHandler(AWSHandler, BaseContextMixin):
             return True
         return False
 
+    def _validate_custom_fleet_role(self, fleet_role: str) -> None:
+        """
+        Check that a custom fleet role exists, skipping IAM when a recent check passed.
+
+        Args:
+            fleet_role: Fleet role ARN or name
+        """
+        cache = self._get_iam_validation_cache()
+        key = self._iam_validation_key("role", fleet_role)
+        if cache.is_valid(key):
+            self._logger.debug("Fleet role %s validated recently, skipping IAM", fleet_role)
+            return
+
+        role_name = fleet_role.split("/")[-1]
+        self._retry_with_backoff(
+            self.aws_client.iam_client.get_role, operation_type="read_only", RoleName=role_name
+        )
+        cache.record(key)
+
     def _check_iam_permissions(self, role_arn: str) -> None:
         """
         Check if current credentials have necessary IAM permissions.
@@ -310,22 +353,18 @@ class SpotFleetHandler(AWSHandler, BaseContextMixin):
         Raises:
             IAMError: If permissions are insufficient
         """
+        cache = self._get_iam_validation_cache()
+        key = self._iam_validation_key("permissions", role_arn, SPOT_FLEET_ACTIONS)
+        if cache.is_valid(key):
+            return
+
         try:
             # Get current identity
             identity = self.aws_client.sts_client.get_caller_identity()
 
-            # Check permissions - create IAM client directly from session
-            iam_client = self.aws_client.session.client("iam", config=self.aws_client.boto_config)
-            response = iam_client.simulate_principal_policy(
+            response = self.aws_client.iam_client.simulate_principal_policy(
                 PolicySourceArn=identity["Arn"],
-                ActionNames=[
-                    "ec2:RequestSpotFleet",
-                    "ec2:ModifySpotFleetRequest",
-                    "ec2:CancelSpotFleetRequests",
-                    "ec2:DescribeSpotFleetRequests",
-                    "ec2:DescribeSpotFleetInstances",
-                    "iam:PassRole",
-                ],
+                ActionNames=list(SPOT_FLEET_ACTIONS),
                 ResourceArns=[role_arn],
             )
 
@@ -337,6 +376,48 @@ class SpotFleetHandler(AWSHandler, BaseContextMixin):
         except Exception as e:
             raise IAMError(f"Failed to validate IAM permissions: {str(e)}")
 
+        cache.record(key)
+
+    def _invalidate_fleet_role_validation(self, fleet_role: str) -> None:
+        """Forget the validations of a fleet role so the next request checks IAM again."""
+        cache = self._get_iam_validation_cache()
+        cache.invalidate(self._iam_validation_key("role", fleet_role))
+        cache.invalidate(self._iam_validation_key("permissions", fleet_role, SPOT_FLEET_ACTIONS))
+
+    def _iam_validation_key(self, kind: str, role: str, actions: Tuple[str, ...] = ()) -> str:
+        """Key a validation by credentials profile, region, role and permission set."""
+        profile = getattr(self.aws_client, "profile_name", None) or "default"
+        region = getattr(self.aws_client, "region_name", None) or ""
+        return f"{kind}|{profile}|{region}|{role}|{','.join(actions)}"
+
+    def _get_iam_validation_cache(self) -> IAMValidationCache:
+        """Get the IAM validation cache, creating it from configuration on first use."""
+        if self._iam_validation_cache is not None:
+            return self._iam_validation_cache
+
+        from config.schemas.performance_schema import (
+            IAMValidationCacheConfig,
+            PerformanceConfig,
+        )
+
+        cache_config = IAMValidationCacheConfig()
+        cache_file = None
+        if self.config_port is not None:
+            try:
+                configured = self.config_port.get_typed(PerformanceConfig).caching.iam_validation
+                if isinstance(configured, IAMValidationCacheConfig):
+                    cache_config = configured
+                if cache_config.enabled:
+                    cache_file = os.path.join(
+                        self.config_port.get_work_dir(), "cache", cache_config.file
+                    )
+            except Exception as e:
+                self._logger.debug("IAM validations will not be persisted: %s", e)
+
+        ttl_seconds = cache_config.ttl_seconds if cache_config.enabled else 0
+        self._iam_validation_cache = IAMValidationCache(cache_file, ttl_seconds=ttl_seconds)
+        return self._iam_validation_cache
+
     def _prepare_template_context(self, template: AWSTemplate, request: Request) -> Dict[str, Any]:
         """Prepare context with all computed values for template rendering."""
 
@@ -0,0 +1,107 @@
+"""Deadline-bounded and hedged AWS read calls.
+
+Read-only operations of an :class:`AWSClient` client (``Describe*`` and
+similar, as configured) are routed through a
+:class:`~infrastructure.resilience.hedging.HedgedCaller`: they return no
+later than the running command's deadline and, with hedging enabled, a
+read slower than its p95 latency gets a second call. The client's own
+methods are replaced, so direct calls, ``AWSHandler._retry_with_backoff``,
+``AWSOperations`` and paginators (which call the client method per page)
+are all covered. Writes are never routed through the caller: abandoning
+or duplicating them is not safe.
+"""
+
+import fnmatch
+import threading
+import types
+from typing import Any, Iterable, Optional
+
+from botocore import xform_name
+
+from infrastructure.logging.logger import get_logger
+from infrastructure.resilience.hedging import HedgedCaller
+
+_caller: Optional[HedgedCaller] = None
+_create_lock = threading.Lock()
+
+logger = get_logger(__name__)
+
+
+def get_aws_hedged_caller(config: Any) -> HedgedCaller:
+    """
+    Get the process-wide caller for AWS reads, creating it from configuration once.
+
+    Args:
+        config: HedgingConfig
+
+    Returns:
+        Hedged caller shared by every AWS client of the process
+    """
+    global _caller
+    if _caller is not None:
+        return _caller
+
+    with _create_lock:
+        if _caller is None:
+            _caller = HedgedCaller(
+                hedging=config.enabled,
+                percentile=config.percentile,
+                initial_delay=config.initial_delay,
+                min_delay=config.min_delay,
+                max_delay=config.max_delay,
+                min_samples=config.min_samples,
+                window=config.window,
+                max_hedge_ratio=config.max_hedge_ratio,
+                metrics=_get_metrics_collector(),
+            )
+        return _caller
+
+
+def attach_read_deadlines(client: Any, caller: HedgedCaller, read_operations: Iterable[str]) -> Any:
+    """
+    Route a botocore client's read operations through a hedged caller.
+
+    Args:
+        client: boto3 client
+        caller: Caller bounding and hedging the reads
+        read_operations: ``service:Action`` names or ``fnmatch`` patterns of idempotent reads
+
+    Returns:
+        The same client
+    """
+    service_model = client.meta.service_model
+    service_name = service_model.service_name
+    patterns = [p for p in read_operations if p.split(":", 1)[0] in (service_name, "*")]
+    if not patterns:
+        return client
+
+    for operation_name in service_model.operation_names:
+        key = f"{service_name}:{operation_name}"
+        if any(fnmatch.fnmatchcase(key, pattern) for pattern in patterns):
+            method_name = xform_name(operation_name)
+            read = _read_method(key, method_name, getattr(client, method_name), caller)
+            setattr(client, method_name, types.MethodType(read, client))
+    return client
+
+
+def _read_method(key: str, method_name: str, method: Any, caller: HedgedCaller) -> Any:
+    """Build a client method that sends ``method`` calls through ``caller``."""
+
+    def read(self: Any, *args: Any, **kwargs: Any) -> Any:
+        return caller.call(key, method, *args, **kwargs)
+
+    read.__name__ = method_name
+    read.__doc__ = method.__doc__
+    return read
+
+
+def _get_metrics_collector() -> Optional[Any]:
+    """Get the application's MetricsCollector, if the container provides one."""
+    try:
+        from infrastructure.di.container import get_container
+        from monitoring.metrics import MetricsCollector
+
+        return get_container().get_optional(MetricsCollector)
+    except Exception as e:
+        logger.debug("Hedging metrics will not be exported: %s", e)
+        return None
@@ -0,0 +1,122 @@
+"""Persisted record of IAM prerequisites that passed validation."""
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from infrastructure.logging.logger import get_logger
+
+CACHE_VERSION = "1.0"
+
+
+class IAMValidationCache:
+    """
+    IAM validations (role exists, permissions allowed) remembered for a TTL.
+
+    Entries are kept in memory and, with a cache file, in the work directory
+    so consecutive CLI invocations skip the IAM round trips too. Only passed
+    validations are recorded: a failed one is retried on the next request.
+    """
+
+    def __init__(
+        self,
+        cache_file: Optional[str] = None,
+        ttl_seconds: int = 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_file: Path of the persisted cache (None keeps entries in memory)
+            ttl_seconds: Seconds a validation stays trusted
+            clock: Wall-clock source
+        """
+        self._cache_file = cache_file
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, float]] = None
+        self._logger = get_logger(__name__)
+
+    def is_valid(self, key: str) -> bool:
+        """
+        Check whether a validation passed within the TTL.
+
+        Args:
+            key: Validation key, e.g. role ARN and permission set
+
+        Returns:
+            True if the validation can be skipped
+        """
+        with self._lock:
+            validated_at = self._load().get(key)
+        return validated_at is not None and self._clock() - validated_at <= self.ttl_seconds
+
+    def record(self, key: str) -> None:
+        """
+        Record a validation that passed.
+
+        Args:
+            key: Validation key
+        """
+        with self._lock:
+            self._load()[key] = self._clock()
+            self._write(key, self._entries[key])
+
+    def invalidate(self, key: str) -> None:
+        """
+        Forget a validation so the next request performs it again.
+
+        Args:
+            key: Validation key
+        """
+        with self._lock:
+            if self._load().pop(key, None) is not None:
+                self._write(key, None)
+
+    def _load(self) -> Dict[str, float]:
+        """Get the entries, reading the cache file on first use (caller holds the lock)."""
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self) -> Dict[str, float]:
+        if not self._cache_file or not os.path.exists(self._cache_file):
+            return {}
+        try:
+            with open(self._cache_file) as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return {}
+            now = self._clock()
+            return {
+                key: float(validated_at)
+                for key, validated_at in data.get("entries", {}).items()
+                if now - float(validated_at) <= self.ttl_seconds
+            }
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            self._logger.debug(
+                "Ignoring unreadable IAM validation cache %s: %s", self._cache_file, e
+            )
+            return {}
+
+    def _write(self, key: str, validated_at: Optional[float]) -> None:
+        """Merge one entry into the cache file, keeping entries written by other processes."""
+        if not self._cache_file:
+            return
+        entries = self._read()
+        if validated_at is None:
+            entries.pop(key, None)
+        else:
+            entries[key] = validated_at
+        tmp_file = f"{self._cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._cache_file) or ".", exist_ok=True)
+            with open(tmp_file, "w") as f:
+                json.dump({"version": CACHE_VERSION, "entries": entries}, f)
+            os.replace(tmp_file, self._cache_file)
+        except OSError as e:
+            self._logger.debug("Could not persist IAM validation cache: %s", e)
@@ -0,0 +1,115 @@
+"""Client-side rate limiting of AWS API calls.
+
+A token is taken for every HTTP attempt made through an :class:`AWSClient`
+client, keyed by ``service:Action`` (``ec2:DescribeInstances``). Hooking
+the botocore client rather than individual call sites covers every path:
+calls made through ``AWSHandler._retry_with_backoff`` and ``AWSOperations``,
+each of their retries, botocore's own retries and every paginator page.
+Throttling responses cut the action's rate and successful calls restore it.
+"""
+
+import os
+import threading
+from typing import Any, Optional
+
+from infrastructure.caching.shared_state import SharedStateStore, get_shared_state
+from infrastructure.logging.logger import get_logger
+from infrastructure.resilience.rate_limiter import (
+    RateLimiter,
+    configure_rate_limiter,
+    get_rate_limiter,
+)
+
+THROTTLE_ERROR_CODES = frozenset(
+    {
+        "RequestLimitExceeded",
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "SlowDown",
+    }
+)
+
+_create_lock = threading.Lock()
+
+logger = get_logger(__name__)
+
+
+def get_aws_rate_limiter(config: Any, work_dir: Optional[str] = None) -> Optional[RateLimiter]:
+    """
+    Get the process-wide rate limiter, creating it from configuration once.
+
+    Args:
+        config: RateLimitingConfig
+        work_dir: Work directory for the shared token bucket file
+
+    Returns:
+        Rate limiter, or None when rate limiting is disabled
+    """
+    limiter = get_rate_limiter()
+    if limiter is not None or not config.enabled:
+        return limiter
+
+    with _create_lock:
+        limiter = get_rate_limiter()
+        if limiter is not None:
+            return limiter
+
+        store = get_shared_state()
+        if store is None and config.shared and work_dir:
+            try:
+                store = SharedStateStore(os.path.join(work_dir, "cache", config.state_file))
+            except Exception as e:
+                logger.warning("Rate limits will not be shared between processes: %s", e)
+
+        limiter = RateLimiter(
+            limits=config.limits,
+            default_rate=config.default_rate,
+            default_burst=config.default_burst,
+            min_rate=config.min_rate,
+            decrease_factor=config.decrease_factor,
+            increase_step=config.increase_step,
+            max_wait=config.max_wait,
+            store=store,
+        )
+        configure_rate_limiter(limiter)
+        return limiter
+
+
+def attach_rate_limiter(client: Any, limiter: RateLimiter) -> Any:
+    """
+    Rate limit every HTTP attempt made through a botocore client.
+
+    Args:
+        client: boto3 client
+        limiter: Rate limiter to take tokens from
+
+    Returns:
+        The same client
+    """
+    service_model = client.meta.service_model
+    service_name = service_model.service_name
+    event_service = service_model.service_id.hyphenize()
+
+    def before_send(event_name: str, **kwargs: Any) -> None:
+        # before-send.<service>.<Operation> fires once per HTTP attempt
+        limiter.acquire(f"{service_name}:{event_name.rsplit('.', 1)[-1]}")
+
+    def after_attempt(response: Any, operation: Any, **kwargs: Any) -> None:
+        if response is None:
+            return  # Connection error, nothing was throttled
+        http_response, parsed = response
+        key = f"{service_name}:{operation.name}"
+        if parsed.get("Error", {}).get("Code") in THROTTLE_ERROR_CODES:
+            limiter.record_throttle(key)
+        elif http_response.status_code < 400:
+            limiter.record_success(key)
+
+    # Registered first so the token is taken before any handler answers the request
+    client.meta.events.register_first(f"before-send.{event_service}", before_send)
+    # needs-retry fires after every HTTP attempt, including botocore's own retries
+    client.meta.events.register_first(f"needs-retry.{event_service}", after_attempt)
+    return client
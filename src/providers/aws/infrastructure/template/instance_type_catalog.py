@@ -0,0 +1,204 @@
+"""EC2 instance type catalog backed by DescribeInstanceTypes with a persisted cache."""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from domain.base.ports.instance_type_catalog_port import (
+    InstanceTypeCatalogPort,
+    InstanceTypeInfo,
+)
+from infrastructure.logging.logger import get_logger
+
+SNAPSHOT_FILE = os.path.join(os.path.dirname(__file__), "instance_types_snapshot.json")
+
+CACHE_VERSION = "1.0"
+
+
+class AWSInstanceTypeCatalog(InstanceTypeCatalogPort):
+    """
+    Instance type specifications for one region, loaded once and served from memory.
+
+    Loading order on first lookup:
+    1. The region's cache file in the work directory, if younger than ``ttl_seconds``.
+    2. DescribeInstanceTypes, paged through once; the result is written to the cache file.
+    3. The bundled offline snapshot, when AWS is not reachable. The snapshot is
+       written to the cache file with ``retry_seconds`` as its lifetime so other
+       processes do not retry AWS on every invocation.
+    """
+
+    def __init__(
+        self,
+        region: str,
+        ec2_client_factory: Optional[Callable[[], Any]] = None,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: int = 7 * 24 * 3600,
+        retry_seconds: int = 3600,
+        snapshot_file: str = SNAPSHOT_FILE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize the catalog.
+
+        Args:
+            region: AWS region the catalog describes
+            ec2_client_factory: Returns an EC2 client (None uses the snapshot only)
+            cache_dir: Directory for the persisted catalog (None disables persistence)
+            ttl_seconds: Lifetime of a catalog fetched from AWS
+            retry_seconds: Lifetime of a snapshot fallback before AWS is tried again
+            snapshot_file: Bundled offline snapshot
+            clock: Wall-clock source
+        """
+        self.region = region
+        self._ec2_client_factory = ec2_client_factory
+        self._cache_file = (
+            os.path.join(cache_dir, f"instance_types_{region}.json") if cache_dir else None
+        )
+        self.ttl_seconds = ttl_seconds
+        self.retry_seconds = retry_seconds
+        self._snapshot_file = snapshot_file
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._types: Optional[Dict[str, InstanceTypeInfo]] = None
+        self._source = "unloaded"
+        self._logger = get_logger(__name__)
+
+    @property
+    def source(self) -> str:
+        """Where the loaded catalog came from: "aws", "snapshot" or "unloaded"."""
+        return self._source
+
+    def get(self, instance_type: str) -> Optional[InstanceTypeInfo]:
+        """Get the specification of an instance type."""
+        types = self._types
+        if types is None:
+            types = self._load()
+        return types.get(instance_type)
+
+    def is_authoritative(self) -> bool:
+        """Check whether the catalog was loaded from the EC2 API."""
+        if self._types is None:
+            self._load()
+        return self._source == "aws"
+
+    def refresh(self) -> None:
+        """Drop the in-memory catalog so the next lookup reloads it."""
+        with self._lock:
+            self._types = None
+            self._source = "unloaded"
+
+    def _load(self) -> Dict[str, InstanceTypeInfo]:
+        with self._lock:
+            if self._types is not None:
+                return self._types
+
+            cached = self._read_cache()
+            if cached is not None:
+                self._types, self._source = cached
+                return self._types
+
+            records = self._fetch_from_aws()
+            source = "aws"
+            if records is None:
+                records = self._read_json(self._snapshot_file).get("instance_types", {})
+                source = "snapshot"
+            self._write_cache(records, source)
+
+            self._types = _parse_records(records)
+            self._source = source
+            self._logger.debug(
+                "Loaded %s instance types for %s from %s", len(self._types), self.region, source
+            )
+            return self._types
+
+    def _read_cache(self) -> Optional[Tuple[Dict[str, InstanceTypeInfo], str]]:
+        if not self._cache_file or not os.path.exists(self._cache_file):
+            return None
+        try:
+            data = self._read_json(self._cache_file)
+            if data.get("version") != CACHE_VERSION:
+                return None
+            source = data.get("source", "snapshot")
+            lifetime = self.ttl_seconds if source == "aws" else self.retry_seconds
+            if self._clock() - data.get("fetched_at", 0) > lifetime:
+                return None
+            return _parse_records(data["instance_types"]), source
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self._logger.debug(
+                "Ignoring unreadable instance type cache %s: %s", self._cache_file, e
+            )
+            return None
+
+    def _write_cache(self, records: Dict[str, Dict[str, Any]], source: str) -> None:
+        if not self._cache_file:
+            return
+        data = {
+            "version": CACHE_VERSION,
+            "region": self.region,
+            "source": source,
+            "fetched_at": self._clock(),
+            "instance_types": records,
+        }
+        try:
+            os.makedirs(os.path.dirname(self._cache_file), exist_ok=True)
+            temp_file = f"{self._cache_file}.{os.getpid()}.tmp"
+            with open(temp_file, "w") as f:
+                json.dump(data, f)
+            os.replace(temp_file, self._cache_file)
+        except OSError as e:
+            self._logger.debug("Failed to persist instance type cache: %s", e)
+
+    def _fetch_from_aws(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        if self._ec2_client_factory is None:
+            return None
+        try:
+            paginator = self._ec2_client_factory().get_paginator("describe_instance_types")
+            records: Dict[str, Dict[str, Any]] = {}
+            for page in paginator.paginate(PaginationConfig={"PageSize": 100}):
+                for item in page.get("InstanceTypes", []):
+                    records[item["InstanceType"]] = {
+                        "vcpus": item["VCpuInfo"]["DefaultVCpus"],
+                        "memory_mib": item["MemoryInfo"]["SizeInMiB"],
+                        "architectures": item.get("ProcessorInfo", {}).get(
+                            "SupportedArchitectures", ["x86_64"]
+                        ),
+                        "spot": "spot" in item.get("SupportedUsageClasses", ["spot"]),
+                    }
+            return records
+        except Exception as e:
+            self._logger.warning(
+                "Could not describe instance types in %s, using offline snapshot: %s",
+                self.region,
+                e,
+            )
+            return None
+
+    @staticmethod
+    def _read_json(path: str) -> Dict[str, Any]:
+        with open(path) as f:
+            return json.load(f)
+
+
+def _parse_records(records: Dict[str, Dict[str, Any]]) -> Dict[str, InstanceTypeInfo]:
+    return {
+        name: InstanceTypeInfo(
+            instance_type=name,
+            vcpus=int(record["vcpus"]),
+            memory_mib=int(record["memory_mib"]),
+            architectures=tuple(record.get("architectures") or ("x86_64",)),
+            spot_supported=bool(record.get("spot", True)),
+        )
+        for name, record in records.items()
+    }
+
+
+def get_instance_type_catalog() -> Optional[InstanceTypeCatalogPort]:
+    """Get the registered instance type catalog, if any."""
+    try:
+        from infrastructure.di.container import get_container
+
+        return get_container().get_optional(InstanceTypeCatalogPort)
+    except Exception:
+        return None
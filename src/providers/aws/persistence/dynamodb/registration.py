@@ -103,6 +103,7 @@ def create_dynamodb_unit_of_work(config: Any) -> Any:
             machine_table=f"{dynamodb_config.table_prefix}-machines",
             request_table=f"{dynamodb_config.table_prefix}-requests",
             template_table=f"{dynamodb_config.table_prefix}-templates",
+            archive_ttl_days=storage_config.retention.archive_ttl_days,
         )
     else:
         # For testing or other scenarios - assume it's a dict with AWS config
@@ -1,6 +1,7 @@
 """DynamoDB storage strategy implementation using componentized architecture."""
 
-from typing import Any, Dict, List, Optional
+import json
+from typing import Any, Dict, List, Optional, Tuple
 
 from botocore.exceptions import ClientError
 
@@ -57,6 +58,9 @@ class DynamoDBStorageStrategy(BaseStorageStrategy):
         self.transaction_manager = DynamoDBTransactionManager(self.client_manager)
         self.lock_manager = LockManager("simple")  # Simple lock for DynamoDB
 
+        # Sorted scan result of the listing being paged (criteria key, items, next index)
+        self._page_snapshot: Optional[Tuple[str, List[Tuple[str, Dict[str, Any]]], int]] = None
+
         # Initialize table
         self._initialize_table()
 
@@ -87,6 +91,20 @@ class DynamoDBStorageStrategy(BaseStorageStrategy):
             self._self._logger.error("Failed to initialize table %s: %s", self.table_name, e)
             raise
 
+    def enable_time_to_live(self, attribute_name: str) -> None:
+        """
+        Let DynamoDB delete items of this table once attribute_name has passed.
+
+        Args:
+            attribute_name: Attribute holding the expiry as epoch seconds
+        """
+        if not self.client_manager.enable_time_to_live(self.table_name, attribute_name):
+            self._logger.warning(
+                "TTL is not enabled on %s.%s; expired items are kept",
+                self.table_name,
+                attribute_name,
+            )
+
     def save(self, entity_id: str, data: Dict[str, Any]) -> None:
         """
         Save entity data to DynamoDB table.
@@ -264,6 +282,70 @@ class DynamoDBStorageStrategy(BaseStorageStrategy):
                 self._self._logger.error("Failed to search entities: %s", e)
                 return []
 
+    def find_page(
+        self,
+        criteria: Optional[Dict[str, Any]] = None,
+        after_id: Optional[str] = None,
+        limit: int = 500,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Find one page of entities in entity ID order.
+
+        Scans return items in hash order, so ordering needs every matching
+        item. The first page of a listing scans the table once and keeps the
+        sorted result; the following pages, each continuing after the last ID
+        of the previous one, are served from it instead of scanning again.
+
+        Args:
+            criteria: Dictionary of field-value pairs to match (all when None)
+            after_id: Only return entities whose ID sorts after this one
+            limit: Maximum number of entities
+
+        Returns:
+            Up to limit entities keyed by ID, in ascending ID order
+        """
+        criteria_key = json.dumps(criteria or {}, sort_keys=True, default=str)
+        with self.lock_manager.read_lock():
+            snapshot = self._page_snapshot
+            if (
+                snapshot is None
+                or snapshot[0] != criteria_key
+                or after_id is None
+                or snapshot[2] == 0
+                or snapshot[1][snapshot[2] - 1][0] != after_id
+            ):
+                snapshot = (criteria_key, self._scan_sorted(criteria, after_id), 0)
+
+            _, items, start = snapshot
+            page = items[start : start + limit]
+            self._page_snapshot = (criteria_key, items, start + len(page))
+            return dict(page)
+
+    def _scan_sorted(
+        self, criteria: Optional[Dict[str, Any]], after_id: Optional[str]
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Scan the entities matching criteria after after_id, sorted by ID."""
+        try:
+            filter_expression, expression_attribute_values = (None, None)
+            if criteria:
+                filter_expression, expression_attribute_values = (
+                    self.converter.build_filter_expression(criteria)
+                )
+            items = self.client_manager.scan_table(
+                self.table_name, filter_expression, expression_attribute_values
+            )
+        except ClientError as e:
+            self.client_manager.handle_client_error(e, "Find page")
+            return []
+
+        entities = []
+        for item in items:
+            entity_id = self.converter.extract_entity_id(item)
+            if entity_id and (after_id is None or entity_id > after_id):
+                entities.append((entity_id, self.converter.from_dynamodb_item(item)))
+        entities.sort(key=lambda entity: entity[0])
+        return entities
+
     def save_batch(self, entities: Dict[str, Dict[str, Any]]) -> None:
         """
         Save multiple entities in batch.
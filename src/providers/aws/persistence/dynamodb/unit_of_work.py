@@ -4,6 +4,7 @@ from typing import Optional
 
 from domain.base.dependency_injection import injectable
 from infrastructure.persistence.base.unit_of_work import BaseUnitOfWork
+from infrastructure.persistence.components.archive_store import StorageArchiveStore
 
 # Import new simplified repositories
 from infrastructure.persistence.repositories.machine_repository import (
@@ -19,6 +20,9 @@ from infrastructure.persistence.repositories.template_repository import (
 # Import DynamoDB storage strategy
 from providers.aws.persistence.dynamodb.strategy import DynamoDBStorageStrategy
 
+# Attribute of archived items that the archive tables' TTL setting is pointed at
+ARCHIVE_TTL_ATTRIBUTE = "expires_at"
+
 
 @injectable
 class DynamoDBUnitOfWork(BaseUnitOfWork):
@@ -33,6 +37,7 @@ class DynamoDBUnitOfWork(BaseUnitOfWork):
         machine_table: str = "machines",
         request_table: str = "requests",
         template_table: str = "templates",
+        archive_ttl_days: Optional[int] = None,
     ) -> None:
         """
         Initialize DynamoDB unit of work with simplified repositories.
@@ -44,6 +49,8 @@ class DynamoDBUnitOfWork(BaseUnitOfWork):
             machine_table: DynamoDB table name for machines
             request_table: DynamoDB table name for requests
             template_table: DynamoDB table name for templates
+            archive_ttl_days: Days archived records are kept before DynamoDB TTL
+                deletes them (kept forever when None)
         """
         super().__init__()
 
@@ -74,9 +81,25 @@ class DynamoDBUnitOfWork(BaseUnitOfWork):
             profile=profile,
         )
 
+        # Archived requests and machines go to archive tables whose TTL attribute
+        # lets DynamoDB expire them
+        ttl_seconds = archive_ttl_days * 86400 if archive_ttl_days else None
+        machine_archive = StorageArchiveStore(
+            lambda: self._create_archive_strategy(f"{machine_table}-archive", ttl_seconds),
+            ttl_attribute=ARCHIVE_TTL_ATTRIBUTE,
+            ttl_seconds=ttl_seconds,
+        )
+        request_archive = StorageArchiveStore(
+            lambda: self._create_archive_strategy(f"{request_table}-archive", ttl_seconds),
+            ttl_attribute=ARCHIVE_TTL_ATTRIBUTE,
+            ttl_seconds=ttl_seconds,
+        )
+
         # Create repositories using simplified implementations
-        self.machine_repository = MachineRepository(machine_strategy)
-        self.request_repository = RequestRepository(request_strategy)
+        self.machine_repository = MachineRepository(machine_strategy, archive_store=machine_archive)
+        self.request_repository = RequestRepository(
+            request_strategy, archive_store=request_archive, machine_storage=machine_strategy
+        )
         self.template_repository = TemplateRepository(template_strategy)
 
         self._self._logger.debug(
@@ -98,6 +121,20 @@ class DynamoDBUnitOfWork(BaseUnitOfWork):
         """Get template repository."""
         return self.template_repository
 
+    def _create_archive_strategy(
+        self, table_name: str, ttl_seconds: Optional[int]
+    ) -> DynamoDBStorageStrategy:
+        """Create the strategy of an archive table on first use, enabling its TTL."""
+        strategy = DynamoDBStorageStrategy(
+            aws_client=self.aws_client,
+            region=self.region,
+            table_name=table_name,
+            profile=self.profile,
+        )
+        if ttl_seconds:
+            strategy.enable_time_to_live(ARCHIVE_TTL_ATTRIBUTE)
+        return strategy
+
     def _begin_transaction(self) -> None:
         """Begin DynamoDB transaction."""
         try:
@@ -1,9 +1,8 @@
 """AWS-specific retry strategy implementation."""
 
-import secrets
-
 from domain.base.dependency_injection import injectable
 from domain.base.ports import LoggingPort
+from infrastructure.resilience.engine import backoff_delay
 from infrastructure.resilience.strategy.base import RetryStrategy
 from providers.aws.resilience.aws_retry_config import DEFAULT_AWS_RETRY_CONFIG
 from providers.aws.resilience.aws_retry_errors import (
@@ -107,20 +106,8 @@ class AWSRetryStrategy(RetryStrategy):
         Returns:
             Delay in seconds before next retry
         """
-        # Exponential backoff: base_delay * (2 ^ attempt)
-        delay = self.base_delay * (2**attempt)
-
-        # Cap at max_delay
-        delay = min(delay, self.max_delay)
-
-        # Add jitter if enabled
-        if self.jitter:
-            jitter_range = delay * 0.1  # 10% jitter
-            # Use secrets for cryptographically secure randomness
-            random_float = secrets.SystemRandom().random() * 2 - 1  # Range from -1 to 1
-            delay += jitter_range * random_float
-
-        return max(0.0, delay)
+        # Full jitter: uniform between 0 and min(max_delay, base_delay * 2^attempt)
+        return backoff_delay(attempt, self.base_delay, self.max_delay, self.jitter)
 
     def on_retry(self, attempt: int, exception: Exception) -> None:
         """
@@ -13,6 +13,10 @@ from domain.base.ports import LoggingPort
 
 # Import AWS-specific components
 from providers.aws.configuration.config import AWSProviderConfig
+from providers.aws.infrastructure.adapters.machine_adapter import (
+    AWSMachineAdapter,
+    ResourceCleanupPlan,
+)
 from providers.aws.infrastructure.aws_client import AWSClient
 from providers.aws.infrastructure.handlers.ec2_fleet_handler import EC2FleetHandler
 from providers.aws.infrastructure.handlers.run_instances_handler import (
@@ -72,6 +76,7 @@ class AWSProviderStrategy(ProviderStrategy):
         self._aws_client: Optional[AWSClient] = None
         self._resource_manager: Optional[AWSResourceManager] = None
         self._launch_template_manager: Optional[AWSLaunchTemplateManager] = None
+        self._machine_adapter: Optional[AWSMachineAdapter] = None
         self._handlers: Dict[str, Any] = {}
 
     @property
@@ -122,6 +127,15 @@ class AWSProviderStrategy(ProviderStrategy):
             )
         return self._launch_template_manager
 
+    @property
+    def machine_adapter(self) -> Optional[AWSMachineAdapter]:
+        """Get the AWS machine adapter with lazy initialization."""
+        if self._machine_adapter is None and self.aws_client:
+            self._machine_adapter = AWSMachineAdapter(
+                aws_client=self.aws_client, logger=self._logger
+            )
+        return self._machine_adapter
+
     @property
     def handlers(self) -> Dict[str, Any]:
         """Get the AWS handlers with lazy initialization."""
@@ -258,6 +272,8 @@ class AWSProviderStrategy(ProviderStrategy):
             return self._handle_create_instances(operation)
         elif operation.operation_type == ProviderOperationType.TERMINATE_INSTANCES:
             return self._handle_terminate_instances(operation)
+        elif operation.operation_type == ProviderOperationType.CLEANUP_RESOURCES:
+            return self._handle_cleanup_resources(operation)
         elif operation.operation_type == ProviderOperationType.GET_INSTANCE_STATUS:
             return self._handle_get_instance_status(operation)
         elif operation.operation_type == ProviderOperationType.DESCRIBE_RESOURCE_INSTANCES:
@@ -394,12 +410,26 @@ class AWSProviderStrategy(ProviderStrategy):
                 )
 
             try:
+                # Leftover resources are found by their attachment, so plan before terminating
+                cleanup_plan = None
+                if operation.parameters.get("cleanup_resources"):
+                    cleanup_plan = self.machine_adapter.plan_resource_cleanup(
+                        instance_ids,
+                        include_retained=self._aws_config.delete_retained_resources,
+                    )
+
                 response = aws_client.ec2_client.terminate_instances(InstanceIds=instance_ids)
                 terminating_count = len(response.get("TerminatingInstances", []))
                 success = terminating_count == len(instance_ids)
 
+                data: Dict[str, Any] = {"success": success, "terminated_count": terminating_count}
+                # The resources are still attached while the instances shut down,
+                # so they are deleted later through CLEANUP_RESOURCES
+                if cleanup_plan is not None and not cleanup_plan.is_empty():
+                    data["cleanup_plan"] = cleanup_plan.to_dict()
+
                 return ProviderResult.success_result(
-                    {"success": success, "terminated_count": terminating_count},
+                    data,
                     {"operation": "terminate_instances", "instance_ids": instance_ids},
                 )
 
@@ -414,6 +444,18 @@ class AWSProviderStrategy(ProviderStrategy):
                 f"Failed to terminate instances: {str(e)}", "TERMINATE_INSTANCES_ERROR"
             )
 
+    def _handle_cleanup_resources(self, operation: ProviderOperation) -> ProviderResult:
+        """Handle one attempt at deleting the resources left by terminated instances."""
+        try:
+            plan = ResourceCleanupPlan.from_dict(operation.parameters.get("cleanup_plan") or {})
+            results = self.machine_adapter.execute_resource_cleanup(plan, max_rounds=1)
+            return ProviderResult.success_result(results, {"operation": "cleanup_resources"})
+        except Exception as e:
+            self._logger.error("Failed to clean up resources: %s", e)
+            return ProviderResult.error_result(
+                f"Failed to clean up resources: {str(e)}", "CLEANUP_RESOURCES_ERROR"
+            )
+
     def _handle_get_instance_status(self, operation: ProviderOperation) -> ProviderResult:
         """Handle instance status query operation."""
         try:
@@ -441,6 +483,9 @@ class AWSProviderStrategy(ProviderStrategy):
                         machine = self._convert_aws_instance_to_machine(aws_instance)
                         machines.append(machine)
 
+                if operation.parameters.get("include_health") and machines:
+                    self._add_machine_health(machines)
+
                 return ProviderResult.success_result(
                     {"machines": machines, "queried_count": len(instance_ids)},
                     {"operation": "get_instance_status", "instance_ids": instance_ids},
@@ -457,6 +502,21 @@ class AWSProviderStrategy(ProviderStrategy):
                 f"Failed to get instance status: {str(e)}", "GET_INSTANCE_STATUS_ERROR"
             )
 
+    def _add_machine_health(self, machines: List[Dict[str, Any]]) -> None:
+        """Add the status check health of each machine, using batched status calls."""
+        try:
+            health = self.machine_adapter.check_health_bulk(
+                machine["instance_id"] for machine in machines
+            )
+        except Exception as e:
+            self._logger.warning("Failed to check instance health: %s", e)
+            return
+
+        for machine in machines:
+            result = health.get(machine["instance_id"])
+            if result is not None:
+                machine["health"] = result.to_dict()
+
     def _handle_validate_template(self, operation: ProviderOperation) -> ProviderResult:
         """Handle template validation operation."""
         try:
@@ -612,6 +672,7 @@ class AWSProviderStrategy(ProviderStrategy):
             supported_operations=[
                 ProviderOperationType.CREATE_INSTANCES,
                 ProviderOperationType.TERMINATE_INSTANCES,
+                ProviderOperationType.CLEANUP_RESOURCES,
                 ProviderOperationType.GET_INSTANCE_STATUS,
                 ProviderOperationType.DESCRIBE_RESOURCE_INSTANCES,
                 ProviderOperationType.VALIDATE_TEMPLATE,
@@ -866,6 +927,7 @@ class AWSProviderStrategy(ProviderStrategy):
             self._aws_client = None
             self._resource_manager = None
             self._launch_template_manager = None
+            self._machine_adapter = None
             self._handlers = {}
             self._initialized = False
 
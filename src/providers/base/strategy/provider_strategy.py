@@ -20,6 +20,7 @@ class ProviderOperationType(str, Enum):
 
     CREATE_INSTANCES = "create_instances"
     TERMINATE_INSTANCES = "terminate_instances"
+    CLEANUP_RESOURCES = "cleanup_resources"
     GET_INSTANCE_STATUS = "get_instance_status"
     DESCRIBE_RESOURCE_INSTANCES = "describe_resource_instances"
     VALIDATE_TEMPLATE = "validate_template"
@@ -208,11 +209,16 @@ class ProviderStrategy(ABC):
         """
         import asyncio
         import concurrent.futures
+        import contextvars
 
-        # Run sync version in thread pool to avoid blocking event loop
+        # Run sync version in thread pool to avoid blocking event loop; the copied
+        # context carries the command's deadline into the worker thread
         loop = asyncio.get_event_loop()
+        context = contextvars.copy_context()
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            return await loop.run_in_executor(executor, self.execute_operation, operation)
+            return await loop.run_in_executor(
+                executor, context.run, self.execute_operation, operation
+            )
 
     @abstractmethod
     def get_capabilities(self) -> ProviderCapabilities:
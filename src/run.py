@@ -11,6 +11,12 @@ project_root = os.path.dirname(current_dir)  # Go up one level from src/ to proj
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# Start import profiling before the CLI pulls in anything else
+from cli.startup_profile import start_startup_profiler, startup_profiling_requested
+
+if startup_profiling_requested():
+    start_startup_profiler()
+
 # Import CLI modules
 try:
     # Try wheel/installed package import first
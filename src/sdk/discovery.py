@@ -14,6 +14,7 @@ from application.decorators import (
     get_registered_command_handlers,
     get_registered_query_handlers,
 )
+from infrastructure.di.handler_manifest import get_handler_manifest
 
 from .exceptions import HandlerDiscoveryError, MethodExecutionError
 
@@ -57,6 +58,11 @@ class SDKMethodDiscovery:
         methods = {}
 
         try:
+            # Handlers registered from the manifest are imported on first use
+            manifest = get_handler_manifest()
+            if manifest is not None:
+                manifest.load_all()
+
             # Discover query handlers
             query_handlers = get_registered_query_handlers()
             for query_type, handler_class in query_handlers.items():
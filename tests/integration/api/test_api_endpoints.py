@@ -1,11 +1,12 @@
 """Integration tests for API endpoints."""
 
-from unittest.mock import patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
 from api.server import create_fastapi_app
+from application.dto.pagination import PageStream
 from config.schemas.server_schema import AuthConfig, ServerConfig
 
 
@@ -92,11 +93,17 @@ class TestAPIEndpoints:
         # The important thing is it doesn't return 500 (server error)
         assert response.status_code != 500
 
-    @patch("src.api.routers.machines.router")
-    def test_machines_endpoint_routing(self, mock_router, client):
+    @patch("api.routers.machines.get_container")
+    def test_machines_endpoint_routing(self, mock_get_container, client):
         """Test that machines endpoints are properly routed."""
+        query_bus = Mock()
+        query_bus.execute = AsyncMock(return_value=PageStream([], key=lambda m: m["machine_id"]))
+        mock_get_container.return_value.get.return_value = query_bus
+
         response = client.get("/api/v1/machines")
+
         assert response.status_code != 500
+        assert response.json()["data"] == {"machines": [], "count": 0, "next_cursor": None}
 
     @patch("src.api.routers.requests.router")
     def test_requests_endpoint_routing(self, mock_router, client):
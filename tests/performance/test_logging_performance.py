@@ -0,0 +1,93 @@
+"""Request-latency cost of INFO logging: synchronous file handler vs. queue mode.
+
+A simulated request handler logs a fixed number of INFO lines. With the
+synchronous setup every line is formatted and written on the request thread;
+in queue mode the request thread only enqueues and a listener thread formats
+with FastJsonFormatter and writes.
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+import statistics
+import time
+
+import pytest
+
+from infrastructure.logging.logger import (
+    FastJsonFormatter,
+    JsonFormatter,
+    NonBlockingQueueHandler,
+)
+
+REQUESTS = int(os.environ.get("OHFP_LOGGING_BENCH_REQUESTS", "2000"))
+LINES_PER_REQUEST = 10
+
+
+def _simulated_request(logger, index):
+    for line in range(LINES_PER_REQUEST):
+        logger.info("Request %s step %s: found %s machines", f"req-{index}", line, index % 7)
+
+
+def _request_latencies(logger):
+    latencies = []
+    for index in range(REQUESTS):
+        start = time.perf_counter()
+        _simulated_request(logger, index)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _percentile(values, fraction):
+    return sorted(values)[int(len(values) * fraction) - 1]
+
+
+def _file_handler(path, formatter):
+    handler = logging.handlers.RotatingFileHandler(
+        str(path), maxBytes=512 * 1024 * 1024, backupCount=1
+    )
+    handler.setFormatter(formatter)
+    return handler
+
+
+@pytest.mark.performance
+def test_queue_mode_reduces_request_logging_latency(tmp_path):
+    """Queue mode with the fast formatter takes logging off the request path."""
+    logger = logging.getLogger("benchmark.request_logging")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    sync_handler = _file_handler(tmp_path / "sync.log", JsonFormatter())
+    logger.addHandler(sync_handler)
+    try:
+        sync_latencies = _request_latencies(logger)
+    finally:
+        logger.removeHandler(sync_handler)
+        sync_handler.close()
+
+    log_queue = queue.Queue(maxsize=REQUESTS * LINES_PER_REQUEST)
+    queued_handler = _file_handler(tmp_path / "queued.log", FastJsonFormatter())
+    listener = logging.handlers.QueueListener(log_queue, queued_handler)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    listener.start()
+    logger.addHandler(queue_handler)
+    try:
+        queued_latencies = _request_latencies(logger)
+    finally:
+        logger.removeHandler(queue_handler)
+        listener.stop()
+        queued_handler.close()
+
+    with open(tmp_path / "queued.log") as f:
+        assert sum(1 for _ in f) == REQUESTS * LINES_PER_REQUEST
+
+    sync_median = statistics.median(sync_latencies)
+    queued_median = statistics.median(queued_latencies)
+    print(
+        f"{LINES_PER_REQUEST} INFO lines/request - sync: "
+        f"p50 {sync_median * 1e6:.0f}us p99 {_percentile(sync_latencies, 0.99) * 1e6:.0f}us, "
+        f"queued: p50 {queued_median * 1e6:.0f}us "
+        f"p99 {_percentile(queued_latencies, 0.99) * 1e6:.0f}us"
+    )
+    assert queued_median < sync_median
@@ -0,0 +1,79 @@
+"""Memory and CPU comparison of read-model projections against full aggregates.
+
+Bulk listings (getReturnRequests, machine listings) only need a handful of
+fields per record. These tests check that projecting stored records onto
+slots-based summaries stays well below the cost of rebuilding aggregates.
+"""
+
+import os
+import time
+import tracemalloc
+from unittest.mock import Mock
+
+import pytest
+
+from infrastructure.persistence.repositories.machine_repository import (
+    MachineRepositoryImpl,
+)
+
+RECORD_COUNT = int(os.environ.get("OHFP_READ_MODEL_RECORDS", "10000"))
+
+
+def _machine_records(count):
+    return {
+        f"i-{index:017x}": {
+            "instance_id": f"i-{index:017x}",
+            "template_id": "tmpl-bench",
+            "request_id": f"req-{index // 10}",
+            "provider_type": "aws",
+            "instance_type": "t3.micro",
+            "image_id": "ami-12345678",
+            "private_ip": f"10.0.{index // 256 % 256}.{index % 256}",
+            "public_ip": None,
+            "subnet_id": "subnet-12345678",
+            "security_group_ids": ["sg-12345678"],
+            "status": "running",
+            "status_reason": None,
+            "launch_time": "2025-01-01T10:00:00",
+            "termination_time": None,
+            "tags": {"env": "bench"},
+            "metadata": {},
+            "provider_data": {},
+            "version": 1,
+            "created_at": "2025-01-01T09:59:00",
+            "updated_at": "2025-01-01T10:01:00",
+            "schema_version": "2.0.0",
+        }
+        for index in range(count)
+    }
+
+
+def _measure(load):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+@pytest.mark.performance
+def test_machine_summaries_cheaper_than_aggregates():
+    """Listing via summaries uses a fraction of the memory and time of find_all."""
+    storage_port = Mock()
+    storage_port.find_all.return_value = _machine_records(RECORD_COUNT)
+    repository = MachineRepositoryImpl(storage_port)
+
+    aggregates, aggregate_seconds, aggregate_peak = _measure(repository.find_all)
+    del aggregates
+    summaries, summary_seconds, summary_peak = _measure(repository.find_summaries)
+
+    assert len(summaries) == RECORD_COUNT
+    print(
+        f"{RECORD_COUNT} machines - aggregates: {aggregate_seconds * 1000:.0f}ms "
+        f"{aggregate_peak / 1e6:.1f}MB, summaries: {summary_seconds * 1000:.0f}ms "
+        f"{summary_peak / 1e6:.1f}MB"
+    )
+    assert summary_peak * 3 < aggregate_peak
+    assert summary_seconds * 3 < aggregate_seconds
@@ -0,0 +1,74 @@
+"""Loading machines from storage: trusted rehydration vs. full validation.
+
+Records written by the repository at the current schema version are
+rebuilt with model_construct after structural checks; this compares that
+against re-running pydantic validation on every record.
+"""
+
+import gc
+import os
+import time
+
+import pytest
+
+from infrastructure.persistence.repositories.machine_repository import MachineSerializer
+
+RECORD_COUNT = int(os.environ.get("OHFP_REHYDRATION_RECORDS", "100000"))
+
+
+def _machine_record(index):
+    return {
+        "instance_id": f"i-{index:017x}",
+        "template_id": "tmpl-bench",
+        "request_id": f"req-{index // 10}",
+        "provider_type": "aws",
+        "instance_type": "t3.micro",
+        "image_id": "ami-12345678",
+        "private_ip": f"10.0.{index // 256 % 256}.{index % 256}",
+        "public_ip": None,
+        "subnet_id": "subnet-12345678",
+        "security_group_ids": ["sg-12345678"],
+        "status": "running",
+        "status_reason": None,
+        "launch_time": "2025-01-01T10:00:00",
+        "termination_time": None,
+        "tags": {"env": "bench"},
+        "metadata": {},
+        "provider_data": {},
+        "version": 1,
+        "created_at": "2025-01-01T09:59:00",
+        "updated_at": "2025-01-01T10:01:00",
+        "schema_version": MachineSerializer.schema_version,
+    }
+
+
+def _time(load, records):
+    # Keep cyclic GC pauses (which depend on the size of the whole test
+    # session's heap) out of the comparison
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        machines = [load(record) for record in records]
+        return machines, time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+@pytest.mark.performance
+def test_trusted_rehydration_faster_than_validation():
+    """Rehydrating trusted machine records is cheaper than validating them."""
+    serializer = MachineSerializer()
+    records = [_machine_record(index) for index in range(RECORD_COUNT)]
+
+    validated, validated_seconds = _time(serializer.from_dict, records)
+    del validated
+    trusted, trusted_seconds = _time(serializer.rehydrate, records)
+
+    assert len(trusted) == RECORD_COUNT
+    assert trusted[-1].model_dump() == serializer.from_dict(records[-1]).model_dump()
+    print(
+        f"{RECORD_COUNT} machines - validated: {validated_seconds:.2f}s, "
+        f"trusted: {trusted_seconds:.2f}s ({validated_seconds / trusted_seconds:.1f}x)"
+    )
+    assert trusted_seconds < validated_seconds
@@ -0,0 +1,32 @@
+"""Unit tests for the Prometheus metrics endpoint."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.server import create_fastapi_app
+from config.schemas.server_schema import AuthConfig, ServerConfig
+from infrastructure.di.container import DIContainer
+from infrastructure.di.core_services import register_core_services
+from monitoring.metrics import MetricsCollector
+
+
+@pytest.mark.unit
+@pytest.mark.api
+class TestMetricsEndpoint:
+    """GET /metrics serves the collector registered in the DI container."""
+
+    def test_metrics_exposes_registered_collector(self):
+        container = DIContainer()
+        register_core_services(container)
+        container.get(MetricsCollector).increment_counter("requests_total", 3)
+
+        with patch("infrastructure.di.container.get_container", return_value=container):
+            app = create_fastapi_app(ServerConfig(enabled=True, auth=AuthConfig(enabled=False)))
+            response = TestClient(app).get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE requests_total counter" in response.text
+        assert 'requests_total{type="all"} 3' in response.text
@@ -0,0 +1,49 @@
+"""Unit tests for opt-in instance health on request status queries."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from application.dto.queries import GetRequestQuery
+from application.queries.handlers import GetRequestHandler
+
+
+@pytest.fixture
+def provider_context():
+    return Mock(execute_with_strategy=AsyncMock(return_value=Mock(success=False)))
+
+
+@pytest.fixture
+def handler(provider_context):
+    uow = Mock()
+    uow.requests.get_by_id.return_value = Mock(
+        template_id="tmpl", provider_type="aws", provider_instance=None
+    )
+    uow_factory = Mock()
+    uow_factory.create_unit_of_work.return_value = MagicMock(__enter__=Mock(return_value=uow))
+    container = Mock(get=Mock(return_value=provider_context))
+    return GetRequestHandler(uow_factory, Mock(), Mock(), container)
+
+
+def machine():
+    return Mock(
+        request_id="req-00000000-0000-0000-0000-000000000001", instance_id=Mock(value="i-0a")
+    )
+
+
+@pytest.mark.unit
+class TestRequestStatusHealth:
+    """Status polls only pay for DescribeInstanceStatus when asked to."""
+
+    def test_queries_skip_health_by_default(self):
+        assert GetRequestQuery(request_id="req-1").include_health is False
+
+    @pytest.mark.parametrize("include_health", [False, True])
+    def test_health_flag_reaches_provider(self, handler, provider_context, include_health):
+        asyncio.run(
+            handler._update_machine_status_from_aws([machine()], include_health=include_health)
+        )
+
+        operation = provider_context.execute_with_strategy.call_args.args[1]
+        assert operation.parameters["include_health"] is include_health
@@ -0,0 +1,126 @@
+"""Unit tests for cursor pagination over repository read models."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from application.dto.pagination import PageStream, decode_cursor, encode_cursor
+from application.dto.queries import ListActiveRequestsQuery
+from application.queries.handlers import ListActiveRequestsHandler
+from domain.base.exceptions import ValidationError
+from infrastructure.error.exception_handler import get_exception_handler
+from infrastructure.persistence.json.strategy import JSONStorageStrategy
+from infrastructure.persistence.repositories import machine_repository
+from infrastructure.persistence.repositories.machine_repository import (
+    MachineRepositoryImpl,
+)
+
+
+def machine_record(instance_id: str) -> dict:
+    """Minimal stored machine record."""
+    return {
+        "instance_id": instance_id,
+        "template_id": "tmpl-1",
+        "request_id": "req-1",
+        "status": "running",
+        "created_at": "2025-01-01T10:00:00",
+    }
+
+
+@pytest.mark.unit
+class TestPageStream:
+    """Tests for lazy pages and cursors."""
+
+    def test_cursor_round_trip(self):
+        """Cursors are opaque but decode back to the key."""
+        cursor = encode_cursor("i-0123456789abcdef0")
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor) == "i-0123456789abcdef0"
+        assert decode_cursor(None) is None
+
+    def test_invalid_cursor_raises_value_error(self):
+        """Malformed cursors are rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor("%%%")
+
+    def test_invalid_cursor_is_a_bad_request(self):
+        """List queries reject malformed cursors as validation errors (HTTP 400)."""
+        handler = ListActiveRequestsHandler(Mock(), Mock(), Mock())
+        query = ListActiveRequestsQuery(cursor="%%%", stream=True)
+
+        with pytest.raises(ValidationError) as excinfo:
+            asyncio.run(handler.execute_query(query))
+
+        assert get_exception_handler().handle_error_for_http(excinfo.value).http_status == 400
+
+    def test_next_cursor_only_when_more_items_exist(self):
+        """A full page peeks ahead before emitting a cursor."""
+        page = PageStream(iter(["a", "b", "c"]), key=str, limit=2)
+        assert list(page) == ["a", "b"]
+        assert page.count == 2
+        assert decode_cursor(page.next_cursor) == "b"
+
+        exact = PageStream(iter(["a", "b"]), key=str, limit=2)
+        assert list(exact) == ["a", "b"]
+        assert exact.next_cursor is None
+
+    def test_source_closed_when_page_completes(self):
+        """The source generator is closed without being fully consumed."""
+        closed = []
+
+        def source():
+            try:
+                yield from range(100)
+            finally:
+                closed.append(True)
+
+        page = PageStream(source(), key=str, limit=3)
+
+        assert list(page) == [0, 1, 2]
+        assert closed == [True]
+
+
+@pytest.fixture
+def machine_storage(tmp_path):
+    """JSON machine storage holding machines i-1 to i-5 out of order."""
+    storage = JSONStorageStrategy(file_path=str(tmp_path / "machines.json"))
+    storage.save_batch(
+        {
+            record["instance_id"]: record
+            for record in map(machine_record, ["i-3", "i-5", "i-1", "i-4", "i-2"])
+        }
+    )
+    return storage
+
+
+@pytest.mark.unit
+class TestIterSummaries:
+    """Tests for ordered repository iteration."""
+
+    def test_yields_in_id_order_after_cursor_key(self, machine_storage):
+        """Summaries are sorted by ID and resume strictly after after_id."""
+        repository = MachineRepositoryImpl(machine_storage)
+
+        all_ids = [summary.instance_id for summary in repository.iter_summaries()]
+        resumed = [s.instance_id for s in repository.iter_summaries(after_id="i-1")]
+
+        assert all_ids == ["i-1", "i-2", "i-3", "i-4", "i-5"]
+        assert resumed == ["i-2", "i-3", "i-4", "i-5"]
+
+    def test_storage_is_read_one_bounded_page_at_a_time(self, machine_storage, monkeypatch):
+        """Each storage read returns at most a page, continuing after the last ID."""
+        monkeypatch.setattr(machine_repository, "SUMMARY_PAGE_SIZE", 2)
+        port = Mock(wraps=machine_storage)
+        repository = MachineRepositoryImpl(port)
+
+        ids = [summary.instance_id for summary in repository.iter_summaries()]
+
+        assert ids == ["i-1", "i-2", "i-3", "i-4", "i-5"]
+        assert [c.args for c in port.find_page.call_args_list] == [
+            (None, None, 2),
+            (None, "i-2", 2),
+            (None, "i-4", 2),
+        ]
+        port.find_all.assert_not_called()
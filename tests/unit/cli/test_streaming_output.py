@@ -0,0 +1,51 @@
+"""Unit tests for incremental JSON/NDJSON list output."""
+
+import io
+import json
+
+import pytest
+
+from application.dto.pagination import PageStream, decode_cursor
+from cli.formatters import is_streaming_output, write_streaming_output
+
+ITEMS = [{"machine_id": "i-1"}, {"machine_id": "i-2"}, {"machine_id": "i-3"}]
+
+
+def page(limit=None):
+    """Page over ITEMS keyed by machine ID."""
+    return PageStream(iter(ITEMS), key=lambda item: item["machine_id"], limit=limit)
+
+
+@pytest.mark.unit
+class TestStreamingOutput:
+    """Tests for write_streaming_output."""
+
+    def test_ndjson_writes_one_item_per_line_and_cursor(self):
+        """NDJSON output ends with the next page cursor."""
+        result = {"machines": page(limit=2), "message": "ok"}
+        output = io.StringIO()
+
+        assert is_streaming_output(result)
+        write_streaming_output(result, "ndjson", output)
+
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert lines[:2] == ITEMS[:2]
+        assert decode_cursor(lines[2]["next_cursor"]) == "i-2"
+
+    def test_json_output_is_a_valid_envelope(self):
+        """Streamed JSON matches the buffered envelope plus count."""
+        result = {"machines": page(), "message": "ok"}
+        output = io.StringIO()
+
+        write_streaming_output(result, "json", output)
+
+        assert json.loads(output.getvalue()) == {"machines": ITEMS, "message": "ok", "count": 3}
+
+    def test_empty_json_list(self):
+        """An empty page still produces valid JSON."""
+        result = {"machines": PageStream(iter([]), key=str), "message": "ok"}
+        output = io.StringIO()
+
+        write_streaming_output(result, "json", output)
+
+        assert json.loads(output.getvalue())["machines"] == []
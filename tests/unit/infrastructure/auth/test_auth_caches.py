@@ -0,0 +1,218 @@
+"""Unit tests for JWKS and verified-token caching in the auth strategies."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from infrastructure.adapters.ports.auth import AuthResult, AuthStatus
+from infrastructure.auth.jwks_cache import JWKSCache
+from infrastructure.auth.strategy.bearer_token_strategy import BearerTokenStrategy
+from infrastructure.auth.token_cache import VerifiedTokenCache
+
+REGION = "us-east-1"
+USER_POOL_ID = "us-east-1_test"
+CLIENT_ID = "test-client"
+
+
+def signing_key(kid):
+    """RSA private key and its public JWK."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return private_key, jwk
+
+
+class JWKSStub:
+    """Local HTTP server publishing a mutable JWKS document."""
+
+    def __init__(self):
+        self.keys = []
+        self.requests = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.requests += 1
+                body = json.dumps({"keys": stub.keys}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/.well-known/jwks.json"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def jwks_stub():
+    stub = JWKSStub()
+    yield stub
+    stub.stop()
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestVerifiedTokenCache:
+    """Tests for the verified-token LRU."""
+
+    def test_entries_expire_at_token_exp(self):
+        """A cached result is dropped once the token's exp passes."""
+        clock = FakeClock()
+        cache = VerifiedTokenCache(max_ttl=300, clock=clock)
+        result = AuthResult(status=AuthStatus.SUCCESS, user_id="u", expires_at=1010)
+
+        cache.put("token", result)
+        assert cache.get("token") is result
+
+        clock.now = 1010
+        assert cache.get("token") is None
+        assert len(cache) == 0
+
+    def test_failures_not_cached_and_size_bounded(self):
+        """Only successes are cached and the least recently used entry is evicted."""
+        cache = VerifiedTokenCache(max_size=2)
+        success = AuthResult(status=AuthStatus.SUCCESS, user_id="u")
+
+        cache.put("bad", AuthResult(status=AuthStatus.INVALID))
+        for token in ("a", "b"):
+            cache.put(token, success)
+        cache.get("a")
+        cache.put("c", success)
+
+        assert cache.get("bad") is None
+        assert cache.get("b") is None
+        assert cache.get("a") is success and cache.get("c") is success
+
+
+@pytest.mark.unit
+class TestJWKSCache:
+    """Tests for JWKS caching against a local HTTP stub."""
+
+    @pytest.mark.asyncio
+    async def test_keys_fetched_once_within_ttl(self, jwks_stub):
+        """Repeated lookups are served from the parsed key set."""
+        _, jwk = signing_key("k1")
+        jwks_stub.keys = [jwk]
+        cache = JWKSCache(jwks_stub.url)
+
+        first = await cache.get_key("k1")
+        second = await cache.get_key("k1")
+
+        assert first is second
+        assert jwks_stub.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_triggers_rate_limited_refresh(self, jwks_stub):
+        """A rotated-in key is fetched on kid miss, but misses cannot hammer the endpoint."""
+        clock = FakeClock()
+        _, old = signing_key("old")
+        _, new = signing_key("new")
+        jwks_stub.keys = [old]
+        cache = JWKSCache(jwks_stub.url, min_refresh_interval=30, clock=clock)
+        await cache.get_key("old")
+
+        jwks_stub.keys = [old, new]
+        assert await cache.get_key("new") is None  # Within min_refresh_interval
+        clock.now += 30
+        assert await cache.get_key("new") is not None
+        assert await cache.get_key("forged") is None
+
+        assert jwks_stub.requests == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_keys_served_when_refresh_fails(self):
+        """Expired keys remain usable if the endpoint is unavailable."""
+        clock = FakeClock()
+        _, jwk = signing_key("k1")
+        documents = [{"keys": [jwk]}]
+
+        def fetcher(url, timeout):
+            if not documents:
+                raise ConnectionError("endpoint down")
+            return documents.pop()
+
+        cache = JWKSCache("stub", ttl=60, fetcher=fetcher, clock=clock)
+        key = await cache.get_key("k1")
+
+        clock.now += 120
+        assert await cache.get_key("k1") is key
+
+
+@pytest.mark.unit
+class TestStrategyTokenCaching:
+    """Tests for verified-token caching in the strategies."""
+
+    @pytest.mark.asyncio
+    async def test_cognito_steady_state_skips_jwks_and_verification(self, jwks_stub, monkeypatch):
+        """A repeated Cognito token is served from cache without HTTP or signature checks."""
+        from providers.aws.auth.cognito_strategy import CognitoAuthStrategy
+
+        private_key, jwk = signing_key("k1")
+        jwks_stub.keys = [jwk]
+        strategy = CognitoAuthStrategy(
+            logger=None,
+            user_pool_id=USER_POOL_ID,
+            client_id=CLIENT_ID,
+            region=REGION,
+            jwks_url=jwks_stub.url,
+        )
+        token = jwt.encode(
+            {
+                "sub": "user-1",
+                "aud": CLIENT_ID,
+                "iss": f"https://cognito-idp.{REGION}.amazonaws.com/{USER_POOL_ID}",
+                "exp": int(time.time()) + 600,
+                "cognito:groups": ["operators"],
+            },
+            private_key,
+            algorithm="RS256",
+            headers={"kid": "k1"},
+        )
+
+        first = await strategy.validate_token(token)
+        assert first.status == AuthStatus.SUCCESS
+        assert "operator" in first.user_roles
+
+        decode_calls = []
+        monkeypatch.setattr(jwt, "decode", lambda *a, **k: decode_calls.append(a))
+        second = await strategy.validate_token(token)
+
+        assert second is first
+        assert decode_calls == []
+        assert jwks_stub.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_bearer_revocation_invalidates_cache(self):
+        """Revoking a bearer token forces re-verification."""
+        strategy = BearerTokenStrategy(secret_key="test-secret-key-with-at-least-32-bytes")
+        token = strategy._create_access_token("user-1", ["admin"], [])
+
+        first = await strategy.validate_token(token)
+        assert await strategy.validate_token(token) is first
+
+        await strategy.revoke_token(token)
+        assert await strategy.validate_token(token) is not first
@@ -0,0 +1,160 @@
+"""Unit tests for the cross-worker shared state store and its consumers."""
+
+import multiprocessing
+import time
+
+import pytest
+
+from infrastructure.caching.shared_state import SharedStateStore
+from infrastructure.persistence.json.strategy import JSONStorageStrategy
+from infrastructure.resilience.strategy.circuit_breaker import (
+    CircuitBreakerStrategy,
+    CircuitState,
+)
+from infrastructure.template.dtos import TemplateDTO
+from infrastructure.template.template_cache_service import TTLTemplateCacheService
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _increment_many(path, count):
+    store = SharedStateStore(path)
+    for _ in range(count):
+        store.increment("counters", "hits")
+
+
+def _save_many(path, worker, count):
+    storage = JSONStorageStrategy(path, entity_type="machines")
+    for index in range(count):
+        storage.save(f"m-{worker}-{index}", {"status": "pending"})
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SharedStateStore(str(tmp_path / "shared_state.db"))
+
+
+@pytest.fixture
+def shared(store, monkeypatch):
+    """Route consumers that look the store up at construction time to ``store``."""
+    for module in (
+        "infrastructure.persistence.json.strategy",
+        "infrastructure.resilience.strategy.circuit_breaker",
+    ):
+        monkeypatch.setattr(f"{module}.get_shared_state", lambda: store)
+    return store
+
+
+@pytest.mark.unit
+class TestSharedStateStore:
+    """Key/value semantics of the SQLite store."""
+
+    def test_set_get_delete_and_namespaces(self, store):
+        store.set("a", "key", {"value": [1, 2]})
+        store.set("b", "key", "other")
+
+        assert store.get("a", "key") == {"value": [1, 2]}
+        assert store.get("b", "key") == "other"
+        assert store.get("a", "missing", "default") == "default"
+
+        store.delete("a", "key")
+        store.clear("b")
+        assert store.get("a", "key") is None
+        assert store.get("b", "key") is None
+
+    def test_values_expire(self, tmp_path):
+        clock = FakeClock()
+        store = SharedStateStore(str(tmp_path / "ttl.db"), clock=clock)
+        store.set("ns", "short", 1, ttl=10)
+        store.set("ns", "forever", 2)
+
+        clock.now += 11
+        assert store.get("ns", "short") is None
+        assert store.get("ns", "forever") == 2
+        assert store.update("ns", "short", lambda v: (v or 0) + 1) == 1
+        assert store.purge_expired() == 0
+
+    def test_updates_from_processes_are_not_lost(self, store):
+        """Read-modify-write holds the write lock, so concurrent increments all land."""
+        context = multiprocessing.get_context("spawn")
+        workers = [
+            context.Process(target=_increment_many, args=(store.path, 50)) for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+
+        assert store.get("counters", "hits") == 200
+
+
+@pytest.mark.unit
+class TestSharedStateConsumers:
+    """Caches and the circuit breaker agree across workers when they share the store."""
+
+    def test_template_cache_is_shared(self, store):
+        template = TemplateDTO(
+            template_id="tmpl-1", name="tmpl-1", provider_api="EC2Fleet", configuration={}
+        )
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return [template]
+
+        worker_a = TTLTemplateCacheService(ttl_seconds=60, shared_state=store)
+        worker_b = TTLTemplateCacheService(ttl_seconds=60, shared_state=store)
+
+        assert worker_a.get_or_load(loader) == [template]
+        assert worker_b.get_or_load(loader) == [template]
+        assert len(loads) == 1
+
+        worker_b.invalidate()
+        assert not worker_a.is_cached()
+        worker_a.get_or_load(loader)
+        assert len(loads) == 2
+
+    def test_json_storage_sees_writes_from_other_workers(self, shared, tmp_path):
+        path = str(tmp_path / "machines.json")
+        worker_a = JSONStorageStrategy(path, entity_type="machines")
+        worker_b = JSONStorageStrategy(path, entity_type="machines")
+
+        worker_a.save("m-1", {"status": "pending"})
+        assert worker_b.find_by_id("m-1") == {"status": "pending"}
+
+        worker_a.save("m-1", {"status": "running"})
+        assert worker_b.find_by_id("m-1") == {"status": "running"}
+
+    def test_json_saves_from_processes_are_not_lost(self, tmp_path):
+        """Read-modify-write holds the file lock, so concurrent saves all land."""
+        path = str(tmp_path / "machines.json")
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_save_many, args=(path, n, 25)) for n in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+
+        assert len(JSONStorageStrategy(path, entity_type="machines").find_all()) == 100
+
+    def test_circuit_breaker_state_is_shared(self, shared, monkeypatch):
+        breaker_a = CircuitBreakerStrategy("shared-ec2", failure_threshold=2)
+        # A second worker process has its own class-level state
+        monkeypatch.setattr(CircuitBreakerStrategy, "_circuit_states", {})
+        breaker_b = CircuitBreakerStrategy("shared-ec2", failure_threshold=2)
+
+        breaker_a._record_failure(time.time())
+        breaker_b._record_failure(time.time())
+
+        info = breaker_a.get_circuit_info()
+        assert info["failure_count"] == 2
+        assert info["state"] == CircuitState.OPEN.value
+
+        breaker_b.record_success()
+        assert breaker_a.get_circuit_info()["failure_count"] == 0
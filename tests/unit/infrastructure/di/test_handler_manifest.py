@@ -0,0 +1,105 @@
+"""Unit tests for handler registration from the handler manifest."""
+
+import asyncio
+import sys
+import textwrap
+from unittest.mock import Mock
+
+import pytest
+
+from application import decorators
+from infrastructure.di.buses import QueryBus
+from infrastructure.di.container import DIContainer
+from infrastructure.di.handler_manifest import (
+    COMMAND_HANDLERS,
+    QUERY_HANDLERS,
+    HandlerManifest,
+    set_handler_manifest,
+)
+
+QUERY_MODULE = """
+from application.interfaces.command_query import Query
+
+
+class PingQuery(Query):
+    pass
+"""
+
+HANDLER_MODULE = """
+from application.decorators import query_handler
+from application.interfaces.command_query import QueryHandler
+from manifest_queries import PingQuery
+
+
+@query_handler(PingQuery)
+class PingHandler(QueryHandler):
+    async def handle(self, query):
+        return "pong"
+"""
+
+OTHER_HANDLER_MODULE = """
+raise AssertionError("imported a handler that was not dispatched")
+"""
+
+
+@pytest.fixture
+def handler_modules(tmp_path, monkeypatch):
+    """Write a query module and two handler modules that are not imported yet."""
+    (tmp_path / "manifest_queries.py").write_text(textwrap.dedent(QUERY_MODULE))
+    (tmp_path / "manifest_ping_handler.py").write_text(textwrap.dedent(HANDLER_MODULE))
+    (tmp_path / "manifest_other_handler.py").write_text(textwrap.dedent(OTHER_HANDLER_MODULE))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(decorators, "_query_handler_registry", {})
+    yield
+    set_handler_manifest(None)
+    for name in ("manifest_queries", "manifest_ping_handler", "manifest_other_handler"):
+        sys.modules.pop(name, None)
+
+
+@pytest.mark.unit
+class TestHandlerManifest:
+    """Handlers are imported when their message is first dispatched."""
+
+    def test_dispatch_imports_only_the_handler_it_needs(self, handler_modules):
+        from manifest_queries import PingQuery
+
+        set_handler_manifest(
+            HandlerManifest(
+                {
+                    QUERY_HANDLERS: {
+                        "manifest_queries:PingQuery": "manifest_ping_handler:PingHandler",
+                        "manifest_queries:OtherQuery": "manifest_other_handler:OtherHandler",
+                    },
+                    COMMAND_HANDLERS: {},
+                }
+            )
+        )
+        container = DIContainer()
+        bus = QueryBus(container, Mock())
+
+        assert "manifest_ping_handler" not in sys.modules
+        assert asyncio.run(bus.execute(PingQuery())) == "pong"
+        assert "manifest_other_handler" not in sys.modules
+
+        handler_class = sys.modules["manifest_ping_handler"].PingHandler
+        assert container.is_registered(handler_class)
+
+    def test_manifest_round_trips_handler_registries(self, handler_modules):
+        from manifest_ping_handler import PingHandler
+        from manifest_queries import PingQuery
+
+        manifest = HandlerManifest.from_handlers({PingQuery: PingHandler}, {})
+
+        assert HandlerManifest(manifest.to_dict()).to_dict() == {
+            QUERY_HANDLERS: {"manifest_queries:PingQuery": "manifest_ping_handler:PingHandler"},
+            COMMAND_HANDLERS: {},
+        }
+        assert len(manifest) == 1
+
+    def test_missing_handler_raises_key_error(self, handler_modules):
+        from manifest_queries import PingQuery
+
+        manifest = HandlerManifest({COMMAND_HANDLERS: {}})
+
+        with pytest.raises(KeyError):
+            manifest.load_handler(QUERY_HANDLERS, PingQuery)
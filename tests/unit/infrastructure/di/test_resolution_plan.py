@@ -0,0 +1,108 @@
+"""Unit tests for compiled and persisted DI resolution plans."""
+
+import importlib
+import os
+import sys
+from typing import Optional
+from unittest.mock import patch
+
+import pytest
+
+from infrastructure.di.components import dependency_resolver, resolution_plan
+from infrastructure.di.components.cqrs_registry import CQRSHandlerRegistry
+from infrastructure.di.components.dependency_resolver import DependencyResolver
+from infrastructure.di.components.resolution_plan import ParameterPlan, ResolutionPlanStore
+from infrastructure.di.components.service_registry import ServiceRegistry
+
+
+class Repository:
+    def __init__(self) -> None:
+        self.name = "repository"
+
+
+class Clock:
+    pass
+
+
+class Handler:
+    def __init__(self, repository: Repository, clock: Clock = None, retries: int = 3):
+        self.repository = repository
+        self.clock = clock
+        self.retries = retries
+
+
+def make_resolver(plan_store=None):
+    resolver = DependencyResolver(ServiceRegistry(), CQRSHandlerRegistry())
+    resolver.set_plan_store(plan_store)
+    return resolver
+
+
+@pytest.mark.unit
+class TestResolutionPlans:
+    """Constructors are reflected on once, then resolved from their plan."""
+
+    def test_constructor_is_reflected_on_once(self):
+        resolver = make_resolver()
+
+        with patch.object(
+            dependency_resolver, "get_type_hints", wraps=dependency_resolver.get_type_hints
+        ) as type_hints:
+            first = resolver.resolve(Handler)
+            second = resolver.resolve(Handler)
+
+        assert first is not second
+        assert first.repository.name == "repository" and first.retries == 3
+        # One compile each for Handler, Repository and Clock
+        assert type_hints.call_count == 3
+
+    def test_plans_are_persisted_for_the_next_process(self, tmp_path):
+        cache_file = str(tmp_path / "cache" / "resolution_plans.json")
+        resolver = make_resolver(ResolutionPlanStore(cache_file))
+        resolver.resolve(Handler)
+        resolver.save_plans()
+
+        with patch.object(dependency_resolver, "get_type_hints") as type_hints:
+            handler = make_resolver(ResolutionPlanStore(cache_file)).resolve(Handler)
+
+        type_hints.assert_not_called()
+        assert isinstance(handler.repository, Repository)
+
+    def test_plan_of_changed_source_is_recompiled(self, tmp_path):
+        cache_file = str(tmp_path / "resolution_plans.json")
+        store = ResolutionPlanStore(cache_file)
+        store.store(Repository, ())
+        store.save()
+        mtime = os.path.getmtime(__file__)
+
+        with patch.object(resolution_plan, "_source_mtime", return_value=mtime + 10):
+            assert ResolutionPlanStore(cache_file).load(Repository) is None
+        assert ResolutionPlanStore(cache_file).load(Repository) == ()
+
+    def test_plan_is_recompiled_when_a_base_class_changes(self, tmp_path, monkeypatch):
+        base_file = tmp_path / "plan_base_module.py"
+        base_file.write_text(
+            "class Base:\n    def __init__(self, repository):\n        pass\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        base_module = importlib.import_module("plan_base_module")
+        monkeypatch.setitem(sys.modules, "plan_base_module", base_module)
+        subclass = type("Subclass", (base_module.Base,), {"__module__": __name__})
+
+        cache_file = str(tmp_path / "resolution_plans.json")
+        store = ResolutionPlanStore(cache_file)
+        store.store(subclass, (ParameterPlan("repository", Repository, True),))
+        store.save()
+        assert ResolutionPlanStore(cache_file).load(subclass) is not None
+
+        mtime = max(os.path.getmtime(base_file), os.path.getmtime(__file__)) + 10
+        os.utime(base_file, (mtime, mtime))
+
+        assert ResolutionPlanStore(cache_file).load(subclass) is None
+
+    def test_plans_with_generic_types_stay_in_memory(self, tmp_path):
+        store = ResolutionPlanStore(str(tmp_path / "resolution_plans.json"))
+
+        store.store(Handler, (ParameterPlan("clock", Optional[Clock], False),))
+        store.save()
+
+        assert not os.path.exists(store.cache_file)
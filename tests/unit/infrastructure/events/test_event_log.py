@@ -0,0 +1,180 @@
+"""Unit tests for the durable NDJSON event log."""
+
+import os
+
+import pytest
+
+from domain.base.events import DomainEvent, RepositoryOperationStartedEvent
+from infrastructure.events.event_log import (
+    EventLogPosition,
+    EventLogReader,
+    EventLogWriter,
+    list_segments,
+)
+from infrastructure.events.publisher import ConfigurableEventPublisher
+
+
+def business_event(index=0):
+    return DomainEvent(aggregate_id=f"req-{index}", aggregate_type="Request")
+
+
+def telemetry_event():
+    return RepositoryOperationStartedEvent(
+        aggregate_id="op",
+        aggregate_type="RepositoryOperation",
+        operation_id="op",
+        entity_type="Request",
+        entity_id="req-1",
+        storage_strategy="JSONStorageStrategy",
+        operation_type="save",
+    )
+
+
+@pytest.mark.unit
+class TestEventLog:
+    """Tests for EventLogWriter and EventLogReader."""
+
+    def test_round_trip_excludes_telemetry(self, tmp_path):
+        """Written batches replay in order; telemetry events are not logged."""
+        writer = EventLogWriter(str(tmp_path), fsync=False)
+        assert writer.write_batch([business_event(0), telemetry_event(), business_event(1)]) == 2
+        writer.write_batch([business_event(2)])
+        writer.close()
+
+        records = [record for _, record in EventLogReader(str(tmp_path)).read()]
+
+        assert [r["aggregate_id"] for r in records] == ["req-0", "req-1", "req-2"]
+        assert all(r["event_type"] == "DomainEvent" for r in records)
+
+    def test_writers_share_the_newest_segment(self, tmp_path):
+        """Each writer (one per CLI process) appends to the newest segment."""
+        first = EventLogWriter(str(tmp_path), fsync=False)
+        first.write_batch([business_event(0)])
+        first.close()
+        second = EventLogWriter(str(tmp_path), fsync=False)
+        second.write_batch([business_event(1)])
+        first.write_batch([business_event(2)])
+        second.close()
+        first.close()
+
+        assert list_segments(tmp_path) == ["events-00000001.ndjson"]
+        records = [record for _, record in EventLogReader(str(tmp_path)).read()]
+        assert [r["aggregate_id"] for r in records] == ["req-0", "req-1", "req-2"]
+
+    def test_rotates_by_size_and_follows_rotation_by_other_writers(self, tmp_path):
+        """Segments rotate at max_bytes and other writers continue in the new segment."""
+        writer = EventLogWriter(str(tmp_path), max_bytes=1, fsync=False)
+        other = EventLogWriter(str(tmp_path), fsync=False)
+        writer.write_batch([business_event(0)])
+        other.write_batch([business_event(1)])
+        writer.write_batch([business_event(2)])
+        other.write_batch([business_event(3)])
+        writer.close()
+        other.close()
+
+        assert list_segments(tmp_path) == [
+            "events-00000001.ndjson",
+            "events-00000002.ndjson",
+        ]
+        records = [record for _, record in EventLogReader(str(tmp_path)).read()]
+        assert [r["aggregate_id"] for r in records] == ["req-0", "req-1", "req-2", "req-3"]
+
+    def test_rotates_by_age_and_applies_retention(self, tmp_path):
+        """Old segments rotate out and are deleted once past retention."""
+        now = [1_000_000.0]
+        writer = EventLogWriter(
+            str(tmp_path),
+            max_age_seconds=60,
+            retention_seconds=120,
+            fsync=False,
+            clock=lambda: now[0],
+        )
+        writer.write_batch([business_event(0)])
+        first = writer.current_segment
+        os.utime(tmp_path / first, (now[0], now[0]))
+
+        now[0] += 600
+        writer.write_batch([business_event(1)])
+        writer.close()
+
+        assert first not in list_segments(tmp_path)
+        assert len(list_segments(tmp_path)) == 1
+
+    def test_age_is_kept_across_writers(self, tmp_path):
+        """A new writer (CLI process) ages the segment from its creation, not its own start."""
+        now = [1_000_000.0]
+        first = EventLogWriter(
+            str(tmp_path), max_age_seconds=60, fsync=False, clock=lambda: now[0]
+        )
+        first.write_batch([business_event(0)])
+        first.close()
+
+        now[0] += 30
+        second = EventLogWriter(
+            str(tmp_path), max_age_seconds=60, fsync=False, clock=lambda: now[0]
+        )
+        second.write_batch([business_event(1)])
+        second.close()
+        now[0] += 30
+        third = EventLogWriter(
+            str(tmp_path), max_age_seconds=60, fsync=False, clock=lambda: now[0]
+        )
+        third.write_batch([business_event(2)])
+        third.close()
+
+        assert list_segments(tmp_path) == ["events-00000001.ndjson", "events-00000002.ndjson"]
+        records = [record for _, record in EventLogReader(str(tmp_path)).read()]
+        assert [r["aggregate_id"] for r in records] == ["req-0", "req-1", "req-2"]
+
+    def test_partial_line_skipped_until_complete(self, tmp_path):
+        """A torn trailing record is not returned; resuming picks it up once complete."""
+        writer = EventLogWriter(str(tmp_path), fsync=False)
+        writer.write_batch([business_event(0)])
+        segment = tmp_path / writer.current_segment
+        writer.close()
+        with open(segment, "ab") as f:
+            f.write(b'{"event_type": "DomainEvent", "aggregate_id": "req-1"')
+
+        reader = EventLogReader(str(tmp_path))
+        results = list(reader.read())
+        assert [r["aggregate_id"] for _, r in results] == ["req-0"]
+        position = results[-1][0]
+        assert position == EventLogPosition(segment.name, position.offset)
+
+        with open(segment, "ab") as f:
+            f.write(b"}\n")
+        resumed = [r["aggregate_id"] for _, r in reader.read(position)]
+        assert resumed == ["req-1"]
+
+    def test_read_filters_by_event_type(self, tmp_path):
+        """Consumers can select the event types they care about."""
+        writer = EventLogWriter(str(tmp_path), exclude_event_types=(), fsync=False)
+        writer.write_batch([business_event(0), telemetry_event()])
+        writer.close()
+
+        records = list(
+            EventLogReader(str(tmp_path)).read(event_types={"RepositoryOperationStartedEvent"})
+        )
+
+        assert [r["event_type"] for _, r in records] == ["RepositoryOperationStartedEvent"]
+
+
+@pytest.mark.unit
+class TestPublisherEventLog:
+    """Tests for publishing into the event log."""
+
+    def test_published_events_written_by_pipeline(self, tmp_path):
+        """Events published in sync mode are still handled inline and also logged."""
+        handled = []
+        writer = EventLogWriter(str(tmp_path), fsync=False)
+        publisher = ConfigurableEventPublisher(mode="sync", event_log=writer)
+        publisher.register_handler("DomainEvent", handled.append)
+
+        for index in range(5):
+            publisher.publish(business_event(index))
+        publisher.publish(telemetry_event())
+        publisher.shutdown()
+
+        records = [r for _, r in EventLogReader(str(tmp_path)).read()]
+        assert len(records) == 5
+        assert len(handled) == 5
@@ -0,0 +1,152 @@
+"""Unit tests for the asynchronous batched event pipeline."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from domain.base.events import DomainEvent, RepositoryOperationStartedEvent
+from infrastructure.events.pipeline import EventPipeline
+from infrastructure.events.publisher import ConfigurableEventPublisher
+from infrastructure.persistence.repositories.request_repository import (
+    RequestRepositoryImpl,
+)
+
+
+def business_event(index=0):
+    return DomainEvent(aggregate_id=f"req-{index}", aggregate_type="Request")
+
+
+def telemetry_event():
+    return RepositoryOperationStartedEvent(
+        aggregate_id="op",
+        aggregate_type="RepositoryOperation",
+        operation_id="op",
+        entity_type="Request",
+        entity_id="req-1",
+        storage_strategy="JSONStorageStrategy",
+        operation_type="save",
+    )
+
+
+@pytest.mark.unit
+class TestEventPipeline:
+    """Tests for EventPipeline."""
+
+    def test_events_dispatched_in_batches_off_thread(self):
+        """Queued events reach the dispatch callback in batches on the dispatcher thread."""
+        batches = []
+        threads = set()
+
+        def dispatch(batch):
+            threads.add(threading.current_thread().name)
+            batches.append(list(batch))
+
+        pipeline = EventPipeline(dispatch, batch_size=10)
+        for index in range(25):
+            assert pipeline.submit(business_event(index))
+
+        assert pipeline.flush(timeout=5)
+        pipeline.stop()
+
+        assert sum(len(batch) for batch in batches) == 25
+        assert all(len(batch) <= 10 for batch in batches)
+        assert threads == {"event-pipeline-dispatcher"}
+        metrics = pipeline.get_metrics()
+        assert metrics["submitted"] == metrics["dispatched"] == 25
+        assert metrics["batches"] == len(batches)
+
+    def test_sampling_applies_to_telemetry_only(self):
+        """Telemetry is sampled before construction; business events always pass."""
+        pipeline = EventPipeline(Mock(), telemetry_sample_rate=0.0)
+
+        assert not pipeline.should_publish("RepositoryOperationStartedEvent")
+        assert pipeline.should_publish("RequestCreatedEvent")
+        assert pipeline.get_metrics()["sampled_out"] == 1
+
+    def test_full_queue_drops_telemetry_and_inlines_business_events(self):
+        """Back-pressure drops telemetry and never loses business events."""
+        release = threading.Event()
+        started = threading.Event()
+        inline = []
+
+        def dispatch(batch):
+            if threading.current_thread().name == "event-pipeline-dispatcher":
+                started.set()
+                release.wait(5)
+            else:
+                inline.extend(batch)
+
+        pipeline = EventPipeline(dispatch, max_queue_size=1, batch_size=1, block_timeout=0.01)
+        pipeline.submit(business_event(0))
+        started.wait(5)
+        pipeline.submit(business_event(1))  # Fills the queue
+
+        assert not pipeline.submit(telemetry_event())
+        assert pipeline.submit(business_event(2))
+        release.set()
+        pipeline.stop()
+
+        metrics = pipeline.get_metrics()
+        assert metrics["dropped_queue_full"] == 1
+        assert metrics["blocked"] == 1
+        assert metrics["dispatched_inline"] == 1
+        assert [event.aggregate_id for event in inline] == ["req-2"]
+
+
+@pytest.mark.unit
+class TestAsyncPublisher:
+    """Tests for async mode of ConfigurableEventPublisher."""
+
+    def test_handlers_called_by_background_dispatcher(self):
+        """Handlers registered on the publisher run after flush, not inline."""
+        publisher = ConfigurableEventPublisher(mode="async")
+        received = []
+        publisher.register_handler("DomainEvent", received.append)
+
+        publisher.publish(business_event())
+        assert publisher.flush(timeout=5)
+        publisher.shutdown()
+
+        assert len(received) == 1
+        assert publisher.get_pipeline_metrics()["dispatched"] == 1
+
+    def test_repository_skips_sampled_out_telemetry(self):
+        """Saving a request builds no telemetry events when they are sampled out."""
+        publisher = Mock()
+        publisher.should_publish.return_value = False
+        repository = RequestRepositoryImpl(Mock(), event_publisher=publisher)
+        request = Mock()
+        request.request_id.value = "req-1"
+        repository.serializer = Mock()
+        request.get_domain_events.return_value = []
+
+        repository.save(request)
+
+        publisher.publish.assert_not_called()
+        assert publisher.should_publish.call_count == 2
+
+
+@pytest.mark.unit
+class TestLoggingPublisher:
+    """Tests for the default logging mode of ConfigurableEventPublisher."""
+
+    def test_registered_handlers_called_inline(self):
+        """In-process subscribers still receive events when publishing only logs."""
+        publisher = ConfigurableEventPublisher()
+        received = []
+        publisher.register_handler("DomainEvent", received.append)
+
+        publisher.publish(business_event())
+
+        assert len(received) == 1
+
+    def test_telemetry_is_skipped_without_handlers(self):
+        """Persistence telemetry is not built when nothing subscribes to it."""
+        publisher = ConfigurableEventPublisher()
+
+        assert publisher.should_publish("DomainEvent")
+        assert not publisher.should_publish("RepositoryOperationStartedEvent")
+
+        publisher.register_handler("RepositoryOperationStartedEvent", Mock())
+        assert publisher.should_publish("RepositoryOperationStartedEvent")
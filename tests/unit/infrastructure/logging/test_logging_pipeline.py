@@ -0,0 +1,124 @@
+"""Unit tests for queued logging, the fast JSON formatter and rate limiting."""
+
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+
+import pytest
+
+from infrastructure.logging.logger import (
+    FastJsonFormatter,
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    RateLimitFilter,
+)
+
+
+def make_record(msg="processed %s", args=("req-1",), level=logging.INFO, name="app.handlers"):
+    record = logging.LogRecord(
+        name, level, "/opt/app/src/application/handlers.py", 42, msg, args, None, "handle"
+    )
+    record.created = 1_700_000_000.25
+    record.request_id = "req-1"
+    return record
+
+
+@pytest.mark.unit
+class TestFastJsonFormatter:
+    """Tests for FastJsonFormatter."""
+
+    def test_matches_json_formatter_fields(self):
+        """The fast formatter emits the same document as JsonFormatter."""
+        record = make_record()
+        record.extra = {"machine_count": 3}
+
+        slow = json.loads(JsonFormatter(service="hostfactory").format(record))
+        fast = json.loads(FastJsonFormatter(service="hostfactory").format(record))
+
+        assert fast == slow
+        assert fast["file"] == "src/application/handlers.py"
+        assert fast["timestamp"] == "2023-11-14T22:13:20.250000"
+
+    def test_includes_exception_and_whole_second_timestamp(self):
+        """Exceptions are formatted and whole-second timestamps match isoformat."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "app", logging.ERROR, __file__, 1, "failed", None, sys.exc_info(), "f"
+            )
+        record.created = 1_700_000_000.0
+
+        document = json.loads(FastJsonFormatter().format(record))
+
+        assert "ValueError: boom" in document["exception"]
+        assert document["timestamp"] == "2023-11-14T22:13:20"
+
+
+@pytest.mark.unit
+class TestRateLimitFilter:
+    """Tests for RateLimitFilter."""
+
+    def test_limits_per_logger_and_reports_suppressed(self):
+        """Each logger has its own bucket; the next passing record carries the drop count."""
+        now = [0.0]
+        limiter = RateLimitFilter(rate=2, clock=lambda: now[0])
+
+        passed = [limiter.filter(make_record()) for _ in range(5)]
+        assert passed == [True, True, False, False, False]
+        assert limiter.filter(make_record(name="app.other"))
+        assert limiter.filter(make_record(level=logging.WARNING))
+
+        now[0] += 1.0
+        record = make_record()
+        assert limiter.filter(record)
+        assert record.suppressed == 3
+
+    def test_per_logger_overrides_use_nearest_parent(self):
+        """Overrides apply to child loggers; 0 means unlimited."""
+        limiter = RateLimitFilter(rate=1, rates={"app": 0, "app.hot": 1})
+
+        assert limiter.rate_for("app.handlers.query") == 0
+        assert limiter.rate_for("app.hot.loop") == 1
+        assert limiter.rate_for("boto3") == 1
+        assert all(limiter.filter(make_record(name="app.handlers")) for _ in range(10))
+
+
+@pytest.mark.unit
+class TestNonBlockingQueueHandler:
+    """Tests for NonBlockingQueueHandler."""
+
+    def test_listener_formats_off_caller_thread(self):
+        """Records are merged on enqueue and formatted by the listener's handlers."""
+        log_queue = queue.Queue()
+        captured = []
+
+        class Capture(logging.Handler):
+            def emit(self, record):
+                captured.append(self.format(record))
+
+        target = Capture()
+        target.setFormatter(FastJsonFormatter())
+        listener = logging.handlers.QueueListener(log_queue, target)
+        handler = NonBlockingQueueHandler(log_queue)
+        listener.start()
+        try:
+            handler.handle(make_record(args=({"n": 1},)))
+        finally:
+            listener.stop()
+
+        assert json.loads(captured[0])["message"] == "processed {'n': 1}"
+
+    def test_full_queue_drops_info_but_keeps_errors(self):
+        """Low-severity records are dropped when full; errors wait for space."""
+        log_queue = queue.Queue(maxsize=1)
+        handler = NonBlockingQueueHandler(log_queue, block_timeout=0.01)
+
+        handler.handle(make_record())
+        handler.handle(make_record())
+        handler.handle(make_record(level=logging.ERROR))
+
+        assert handler.dropped == 2
+        assert log_queue.qsize() == 1
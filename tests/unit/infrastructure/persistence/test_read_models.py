@@ -0,0 +1,145 @@
+"""Unit tests for machine/request read models and the repository projection path."""
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from application.machine.dto import MachineDTO
+from application.request.dto import RequestDTO
+from domain.machine.read_models import MachineSummary
+from domain.request.read_models import RequestSummary
+from infrastructure.persistence.repositories.machine_repository import (
+    MachineRepositoryImpl,
+)
+from infrastructure.persistence.repositories.request_repository import (
+    RequestRepositoryImpl,
+)
+
+MACHINE_RECORD = {
+    "instance_id": "i-0123456789abcdef0",
+    "template_id": "tmpl-1",
+    "request_id": "req-1",
+    "provider_type": "aws",
+    "instance_type": "t3.micro",
+    "image_id": "ami-12345678",
+    "private_ip": "10.0.0.5",
+    "public_ip": None,
+    "status": "running",
+    "status_reason": None,
+    "launch_time": "2025-01-01T10:00:00",
+    "tags": {"env": "test"},
+    "metadata": {"owner": "batch"},
+    "created_at": "2025-01-01T09:59:00",
+    "updated_at": "2025-01-01T10:01:00",
+    "schema_version": "2.0.0",
+}
+
+REQUEST_RECORD = {
+    "request_id": "ret-1",
+    "template_id": "tmpl-1",
+    "machine_count": 2,
+    "request_type": "return",
+    "status": "in_progress",
+    "status_message": "Returning machines",
+    "provider_api": "RunInstances",
+    "machine_ids": ["i-0123456789abcdef0", "i-0123456789abcdef1"],
+    "successful_count": 1,
+    "failed_count": 0,
+    "metadata": {},
+    "created_at": "2025-01-01T10:00:00",
+    "completed_at": None,
+    "schema_version": "2.0.0",
+}
+
+
+@pytest.fixture
+def storage_port():
+    """Storage port holding one machine and one request record in a shared file."""
+    port = Mock()
+    port.find_all.return_value = {
+        MACHINE_RECORD["instance_id"]: MACHINE_RECORD,
+        REQUEST_RECORD["request_id"]: REQUEST_RECORD,
+    }
+    port.find_by_criteria.return_value = [MACHINE_RECORD, REQUEST_RECORD]
+    return port
+
+
+@pytest.mark.unit
+class TestReadModels:
+    """Tests for slots-based read models."""
+
+    def test_machine_summaries_skip_aggregate_construction(self, storage_port):
+        """find_summaries projects machine records and ignores request records."""
+        repository = MachineRepositoryImpl(storage_port)
+
+        summaries = repository.find_summaries()
+
+        assert len(summaries) == 1
+        summary = summaries[0]
+        assert isinstance(summary, MachineSummary)
+        assert summary.instance_id == "i-0123456789abcdef0"
+        assert summary.status == "running"
+        assert summary.launch_time == "2025-01-01T10:00:00"
+        assert not hasattr(summary, "__dict__")
+
+    def test_request_summaries_use_criteria(self, storage_port):
+        """Criteria are passed through to the storage port unchanged."""
+        repository = RequestRepositoryImpl(storage_port)
+        criteria = {"request_type": "return"}
+
+        summaries = repository.find_summaries(criteria)
+
+        storage_port.find_by_criteria.assert_called_once_with(criteria)
+        assert [summary.request_id for summary in summaries] == ["ret-1"]
+        assert summaries[0].requested_count == 2
+        assert summaries[0].machine_ids == ("i-0123456789abcdef0", "i-0123456789abcdef1")
+
+    def test_summaries_are_immutable(self):
+        """Summaries are frozen and reject unknown attributes."""
+        summary = RequestRepositoryImpl(Mock()).serializer.to_summary(REQUEST_RECORD)
+
+        with pytest.raises(AttributeError):
+            summary.status = "completed"
+        assert summary.to_dict()["machine_ids"] == REQUEST_RECORD["machine_ids"]
+
+    def test_dtos_from_summaries(self):
+        """DTOs built from summaries match the fields listings expose."""
+        machine = MachineRepositoryImpl(Mock()).serializer.to_summary(MACHINE_RECORD)
+        request = RequestRepositoryImpl(Mock()).serializer.to_summary(REQUEST_RECORD)
+
+        machine_dto = MachineDTO.from_summary(machine)
+        request_dto = RequestDTO.from_summary(request)
+
+        assert machine_dto.machine_id == "i-0123456789abcdef0"
+        assert machine_dto.name == "10.0.0.5"
+        assert machine_dto.result == "succeed"
+        assert machine_dto.launch_time == int(datetime(2025, 1, 1, 10).timestamp())
+        assert request_dto.request_type == "return"
+        assert request_dto.created_at == datetime(2025, 1, 1, 10)
+        assert request_dto.message == "Returning machines"
+
+    def test_dtos_from_summaries_with_sql_datetimes(self):
+        """SQL drivers return datetime objects rather than ISO strings."""
+        machine_record = {**MACHINE_RECORD, "launch_time": datetime(2025, 1, 1, 10)}
+        request_record = {**REQUEST_RECORD, "created_at": datetime(2025, 1, 1, 10)}
+        machine = MachineRepositoryImpl(Mock()).serializer.to_summary(machine_record)
+        request = RequestRepositoryImpl(Mock()).serializer.to_summary(request_record)
+
+        machine_dto = MachineDTO.from_summary(machine)
+        request_dto = RequestDTO.from_summary(request)
+
+        assert machine_dto.launch_time == int(datetime(2025, 1, 1, 10).timestamp())
+        assert request_dto.created_at == datetime(2025, 1, 1, 10)
+
+    def test_projection_matches_full_deserialization(self):
+        """Summary fields agree with the aggregate built from the same record."""
+        repository = MachineRepositoryImpl(Mock())
+
+        machine = repository.serializer.from_dict(MACHINE_RECORD)
+        summary = repository.serializer.to_summary(MACHINE_RECORD)
+
+        assert summary.instance_id == str(machine.instance_id.value)
+        assert summary.status == machine.status.value
+        assert summary.instance_type == str(machine.instance_type.value)
+        assert summary.template_id == machine.template_id
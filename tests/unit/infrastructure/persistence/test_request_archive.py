@@ -0,0 +1,148 @@
+"""Unit tests for archiving terminal requests and their machines."""
+
+from datetime import datetime
+
+import pytest
+
+from infrastructure.persistence.components.archive_store import JSONSegmentArchiveStore
+from infrastructure.persistence.json.strategy import JSONStorageStrategy
+from infrastructure.persistence.repositories.machine_repository import (
+    MachineRepositoryImpl,
+)
+from infrastructure.persistence.repositories.request_repository import (
+    RequestRepositoryImpl,
+)
+
+OLD = "req-00000000-0000-4000-8000-000000000001"
+RECENT = "req-00000000-0000-4000-8000-000000000002"
+RUNNING = "req-00000000-0000-4000-8000-000000000003"
+FULFILLED = "req-00000000-0000-4000-8000-000000000004"
+
+
+def request_record(request_id, status, completed_at=None):
+    return {
+        "request_id": request_id,
+        "template_id": "tmpl-1",
+        "machine_count": 1,
+        "request_type": "acquire",
+        "status": status,
+        "provider_api": "RunInstances",
+        "machine_ids": [],
+        "metadata": {},
+        "created_at": "2025-01-01T08:00:00",
+        "completed_at": completed_at,
+        "schema_version": "2.0.0",
+    }
+
+
+def machine_record(instance_id, request_id, status="terminated"):
+    return {
+        "instance_id": instance_id,
+        "template_id": "tmpl-1",
+        "request_id": request_id,
+        "provider_type": "aws",
+        "instance_type": "t3.micro",
+        "image_id": "ami-12345678",
+        "status": status,
+        "tags": {},
+        "metadata": {},
+        "created_at": "2025-01-01T08:00:00",
+        "schema_version": "2.0.0",
+    }
+
+
+@pytest.fixture
+def repositories(tmp_path):
+    """Request and machine repositories sharing one JSON file, as in single_file mode."""
+    data_file = str(tmp_path / "request_database.json")
+    archive_dir = str(tmp_path / "archive")
+    machines = MachineRepositoryImpl(
+        JSONStorageStrategy(file_path=data_file, entity_type="machines"),
+        archive_store=JSONSegmentArchiveStore(archive_dir, "machines"),
+    )
+    requests = RequestRepositoryImpl(
+        JSONStorageStrategy(file_path=data_file, entity_type="requests"),
+        archive_store=JSONSegmentArchiveStore(archive_dir, "requests"),
+        machine_storage=machines.storage_port,
+    )
+    requests.storage_port.save_batch(
+        {
+            OLD: request_record(OLD, "completed", "2025-01-01T09:00:00"),
+            RECENT: request_record(RECENT, "completed", "2025-01-03T09:00:00"),
+            RUNNING: request_record(RUNNING, "in_progress"),
+        }
+    )
+    machines.storage_port.save_batch(
+        {
+            "i-0123456789abcdef0": machine_record("i-0123456789abcdef0", OLD),
+            "i-0123456789abcdef1": machine_record("i-0123456789abcdef1", RECENT),
+        }
+    )
+    return requests, machines
+
+
+def add_fulfilled_request(requests, machines):
+    """An acquire request completed long ago whose hosts are still in use."""
+    requests.storage_port.save(
+        FULFILLED, request_record(FULFILLED, "completed", "2025-01-01T09:00:00")
+    )
+    machines.storage_port.save_batch(
+        {
+            "i-0123456789abcdef2": machine_record("i-0123456789abcdef2", FULFILLED, "running"),
+            "i-0123456789abcdef3": machine_record("i-0123456789abcdef3", FULFILLED),
+        }
+    )
+
+
+@pytest.mark.unit
+class TestRequestArchive:
+    """Terminal requests past the retention period leave the live storage."""
+
+    def test_only_terminal_requests_before_cutoff_are_archivable(self, repositories):
+        requests, _ = repositories
+
+        assert requests.find_archivable(datetime(2025, 1, 2)) == [OLD]
+
+    def test_requests_with_running_machines_are_not_archivable(self, repositories):
+        requests, machines = repositories
+        add_fulfilled_request(requests, machines)
+
+        assert requests.find_archivable(datetime(2025, 1, 2)) == [OLD]
+
+    def test_running_machines_stay_in_live_storage(self, repositories):
+        requests, machines = repositories
+        add_fulfilled_request(requests, machines)
+
+        assert machines.archive_by_request_ids([FULFILLED]) == 1
+
+        live = [str(m.instance_id) for m in machines.find_by_request_id(FULFILLED)]
+        assert live == ["i-0123456789abcdef2"]
+
+    def test_archived_records_move_out_of_live_storage(self, repositories):
+        requests, machines = repositories
+
+        assert machines.archive_by_request_ids([OLD]) == 1
+        assert requests.archive([OLD]) == 1
+
+        assert sorted(s.request_id for s in requests.find_summaries()) == [RECENT, RUNNING]
+        assert [str(m.instance_id) for m in machines.find_by_request_id(OLD)] == []
+        assert [str(r.request_id) for r in requests.find_history()] == [OLD]
+        assert [str(m.instance_id) for m in machines.find_history()] == ["i-0123456789abcdef0"]
+
+    def test_history_reads_every_segment(self, repositories):
+        requests, _ = repositories
+
+        requests.archive([OLD])
+        requests.archive([RECENT])
+
+        history = requests.find_history({"request_id": RECENT})
+        assert [str(r.request_id) for r in history] == [RECENT]
+        assert len(requests.find_history()) == 2
+
+    def test_without_archive_store_nothing_is_archived(self, repositories):
+        requests, _ = repositories
+        live = RequestRepositoryImpl(requests.storage_port)
+
+        assert live.archive([OLD]) == 0
+        assert live.find_history() == []
+        assert requests.storage_port.exists(OLD)
@@ -0,0 +1,164 @@
+"""Unit tests for trusted rehydration of aggregates written by the repositories."""
+
+import contextlib
+import uuid
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from domain.base.value_objects import InstanceId, InstanceType, Tags
+from domain.machine.aggregate import Machine
+from domain.machine.machine_status import MachineStatus
+from domain.request.aggregate import Request
+from domain.request.value_objects import RequestId, RequestStatus, RequestType
+from infrastructure.persistence.repositories.machine_repository import (
+    MachineRepositoryImpl,
+    MachineSerializer,
+)
+from infrastructure.persistence.repositories.request_repository import RequestSerializer
+
+
+def make_machine():
+    return Machine(
+        instance_id=InstanceId(value="i-0123456789abcdef0"),
+        template_id="tmpl-1",
+        request_id="req-1",
+        provider_type="aws",
+        instance_type=InstanceType(value="t3.micro"),
+        image_id="ami-12345678",
+        status=MachineStatus.RUNNING,
+        tags=Tags(tags={"env": "test"}),
+        metadata={"owner": "batch"},
+    )
+
+
+def make_request():
+    return Request(
+        request_id=RequestId(value=f"req-{uuid.uuid4()}"),
+        request_type=RequestType.ACQUIRE,
+        provider_type="aws",
+        template_id="tmpl-1",
+        requested_count=2,
+        status=RequestStatus.IN_PROGRESS,
+        instance_ids=[InstanceId(value="i-0123456789abcdef0")],
+        successful_count=1,
+    )
+
+
+@pytest.mark.unit
+class TestTrustedRehydration:
+    """Trusted and validating paths must produce identical aggregates."""
+
+    def test_machine_trusted_path_matches_validation(self):
+        """A current-version machine record skips validation but yields the same aggregate."""
+        serializer = MachineSerializer()
+        data = serializer.to_dict(make_machine())
+
+        with patch.object(Machine, "model_validate") as model_validate:
+            trusted = serializer.rehydrate(data)
+        model_validate.assert_not_called()
+
+        strict = serializer.from_dict(data)
+        assert trusted.model_dump() == strict.model_dump()
+        assert trusted == strict
+        assert trusted.get_domain_events() == []
+        assert isinstance(trusted.instance_id, InstanceId)
+        assert trusted.status is MachineStatus.RUNNING
+
+    def test_request_trusted_path_matches_validation(self):
+        """A current-version request record round-trips without validation."""
+        serializer = RequestSerializer()
+        data = serializer.to_dict(make_request())
+
+        with patch.object(Request, "model_validate") as model_validate:
+            trusted = serializer.rehydrate(data)
+        model_validate.assert_not_called()
+
+        strict = serializer.from_dict(data)
+        assert trusted.model_dump() == strict.model_dump()
+        assert trusted.model_fields_set == strict.model_fields_set
+        assert trusted.instance_ids == [InstanceId(value="i-0123456789abcdef0")]
+
+    def test_request_with_sql_datetimes_is_rehydrated(self):
+        """Timestamps already returned as datetimes (SQL storage) are taken as they are."""
+        serializer = RequestSerializer()
+        request = make_request()
+        data = {
+            **serializer.to_dict(request),
+            "created_at": request.created_at,
+            "completed_at": datetime(2025, 1, 1, 12),
+        }
+
+        rehydrated = serializer.rehydrate(data)
+
+        assert rehydrated.created_at == request.created_at
+        assert rehydrated.completed_at == datetime(2025, 1, 1, 12)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            {"schema_version": "1.0.0"},
+            {"schema_version": None},
+            {"tags": None},
+            {"instance_id": " i-0123456789abcdef0 "},
+            {"status": "not-a-status"},
+        ],
+    )
+    def test_legacy_or_malformed_machine_records_are_validated(self, change):
+        """Other schema versions and records failing structural checks use from_dict."""
+        serializer = MachineSerializer()
+        data = {**serializer.to_dict(make_machine()), **change}
+        if data["schema_version"] is None:
+            del data["schema_version"]
+
+        with patch.object(serializer, "from_dict", wraps=serializer.from_dict) as from_dict:
+            # Invalid records may still be rejected by validation
+            with contextlib.suppress(ValueError):
+                serializer.rehydrate(data)
+        from_dict.assert_called_once_with(data)
+
+    def test_legacy_request_record_is_validated(self):
+        """Records without machine_count (legacy field names) use from_dict."""
+        serializer = RequestSerializer()
+        data = serializer.to_dict(make_request())
+        data["requested_count"] = data.pop("machine_count")
+
+        with patch.object(serializer, "from_dict", wraps=serializer.from_dict) as from_dict:
+            request = serializer.rehydrate(data)
+
+        from_dict.assert_called_once_with(data)
+        assert request.requested_count == 2
+
+    def test_repository_reads_use_trusted_path(self):
+        """Repository reads go through rehydrate."""
+        storage_port = Mock()
+        storage_port.find_all.return_value = {
+            "i-0123456789abcdef0": MachineSerializer().to_dict(make_machine())
+        }
+        repository = MachineRepositoryImpl(storage_port)
+
+        with patch.object(Machine, "model_validate") as model_validate:
+            machines = repository.find_all()
+
+        model_validate.assert_not_called()
+        assert [str(m.instance_id) for m in machines] == ["i-0123456789abcdef0"]
+
+    def test_rehydrate_fills_defaults_and_requires_required_fields(self):
+        """Omitted fields get fresh defaults; a missing required field is an error."""
+        fields = {
+            "instance_id": InstanceId.rehydrate(value="i-1"),
+            "template_id": "tmpl-1",
+            "provider_type": "aws",
+            "instance_type": InstanceType.rehydrate(value="t3.micro"),
+            "image_id": "ami-1",
+        }
+        first = Machine.rehydrate(**fields)
+        second = Machine.rehydrate(**fields)
+
+        first.security_group_ids.append("sg-1")
+        assert second.security_group_ids == []
+        assert first.status is MachineStatus.PENDING
+        assert first.model_fields_set == set(fields)
+        with pytest.raises(TypeError):
+            Machine.rehydrate(template_id="tmpl-1")
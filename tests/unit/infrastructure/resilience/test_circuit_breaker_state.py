@@ -0,0 +1,96 @@
+"""Unit tests for process-wide and persisted circuit breaker state."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from infrastructure.caching.shared_state import SharedStateStore
+from infrastructure.resilience.exceptions import CircuitBreakerOpenError
+from infrastructure.resilience.retry_decorator import retry
+from infrastructure.resilience.strategy import circuit_breaker
+from infrastructure.resilience.strategy.circuit_breaker import (
+    CircuitBreakerStrategy,
+    CircuitState,
+    configure_state_store,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_circuits(monkeypatch):
+    monkeypatch.setattr(CircuitBreakerStrategy, "_circuit_states", {})
+    monkeypatch.setattr(circuit_breaker, "get_shared_state", lambda: None)
+    yield
+    configure_state_store(None)
+
+
+def new_process():
+    """Forget in-process circuit state, as a fresh CLI invocation would."""
+    CircuitBreakerStrategy._circuit_states.clear()
+
+
+@pytest.mark.unit
+class TestCircuitBreakerState:
+    """Circuit state is consistent across threads and, when persisted, across processes."""
+
+    def test_concurrent_failures_are_all_counted(self):
+        breaker = CircuitBreakerStrategy("threads", failure_threshold=10_000)
+
+        def fail_many():
+            for _ in range(500):
+                breaker._record_failure(time.time())
+
+        threads = [threading.Thread(target=fail_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert breaker.get_circuit_info()["failure_count"] == 4000
+
+    def test_open_circuit_survives_new_process(self, tmp_path):
+        path = str(tmp_path / "circuit_breaker.db")
+        configure_state_store(lambda: SharedStateStore(path))
+        breaker = CircuitBreakerStrategy("ec2", failure_threshold=2)
+        breaker._record_failure(time.time())
+        breaker._record_failure(time.time())
+
+        new_process()
+        configure_state_store(lambda: SharedStateStore(path))
+        fresh = CircuitBreakerStrategy("ec2", failure_threshold=2)
+
+        start = time.perf_counter()
+        for _ in range(100):
+            with pytest.raises(CircuitBreakerOpenError):
+                fresh.before_call()
+        per_call = (time.perf_counter() - start) / 100
+
+        assert fresh.get_circuit_info()["state"] == CircuitState.OPEN.value
+        assert per_call < 0.001
+
+    def test_state_stays_in_process_without_store(self):
+        breaker = CircuitBreakerStrategy("local", failure_threshold=1)
+        breaker._record_failure(time.time())
+
+        new_process()
+        fresh = CircuitBreakerStrategy("local", failure_threshold=1)
+        fresh.before_call()  # closed again
+
+    def test_retry_fails_fast_without_calling_service(self):
+        operation = Mock(side_effect=RuntimeError("throttled"))
+        guarded = retry(
+            strategy="circuit_breaker",
+            service="fail-fast",
+            failure_threshold=1,
+            max_attempts=3,
+            base_delay=0.0,
+        )(operation)
+
+        with pytest.raises(CircuitBreakerOpenError):
+            guarded()
+        calls = operation.call_count
+
+        with pytest.raises(CircuitBreakerOpenError):
+            guarded()
+        assert operation.call_count == calls
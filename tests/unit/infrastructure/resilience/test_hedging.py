@@ -0,0 +1,131 @@
+"""Unit tests for command deadlines and hedged calls."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from infrastructure.resilience.deadline import (
+    DEADLINE_ENV_VAR,
+    command_timeout,
+    deadline_scope,
+    remaining_time,
+)
+from infrastructure.resilience.exceptions import DeadlineExceededError
+from infrastructure.resilience.hedging import HedgedCaller
+from infrastructure.resilience.retry_decorator import retry
+
+
+def slow_then_fast(slow_seconds):
+    """A function whose first call is slow and later calls are instant."""
+    calls = []
+    lock = threading.Lock()
+
+    def func():
+        with lock:
+            calls.append(1)
+            first = len(calls) == 1
+        if first:
+            time.sleep(slow_seconds)
+            return "slow"
+        return "fast"
+
+    func.calls = calls
+    return func
+
+
+@pytest.mark.unit
+class TestDeadline:
+    """Deadlines are scoped, nest to the shorter one and come from the command."""
+
+    def test_nested_scopes_keep_the_shorter_deadline(self):
+        assert remaining_time() is None
+        with deadline_scope(10):
+            with deadline_scope(60):
+                assert remaining_time() <= 10
+            with deadline_scope(1):
+                assert remaining_time() <= 1
+        assert remaining_time() is None
+
+    def test_command_timeout_leaves_headroom(self, monkeypatch):
+        monkeypatch.delenv(DEADLINE_ENV_VAR, raising=False)
+        assert command_timeout() is None
+        assert command_timeout(100) == pytest.approx(90)
+
+        monkeypatch.setenv(DEADLINE_ENV_VAR, "30")
+        assert command_timeout() == pytest.approx(27)
+        monkeypatch.setenv(DEADLINE_ENV_VAR, "not-a-number")
+        assert command_timeout() is None
+
+
+@pytest.mark.unit
+class TestHedgedCaller:
+    """Calls return by the deadline and slow calls are hedged."""
+
+    def test_without_deadline_or_hedging_calls_directly(self):
+        caller = HedgedCaller()
+        thread_ids = []
+
+        caller.call("ec2:DescribeInstances", lambda: thread_ids.append(threading.get_ident()))
+
+        assert thread_ids == [threading.get_ident()]
+        assert caller.get_stats()["calls"] == 0
+
+    def test_slow_call_is_abandoned_at_the_deadline(self):
+        metrics = Mock()
+        caller = HedgedCaller(metrics=metrics)
+
+        start = time.monotonic()
+        with deadline_scope(0.2), pytest.raises(DeadlineExceededError):
+            caller.call("ec2:DescribeFleets", time.sleep, 2)
+
+        assert time.monotonic() - start < 1.0
+        assert caller.get_stats()["deadline_exceeded"] == 1
+        metrics.increment_counter.assert_called_with("deadline_exceeded_total")
+
+    def test_slow_call_is_hedged_and_hedge_wins(self):
+        caller = HedgedCaller(hedging=True, initial_delay=0.05, max_hedge_ratio=1.0)
+        func = slow_then_fast(2)
+
+        start = time.monotonic()
+        assert caller.call("ec2:DescribeInstances", func) == "fast"
+
+        assert time.monotonic() - start < 1.0
+        stats = caller.get_stats()
+        assert (stats["hedged"], stats["hedge_wins"], stats["hedge_rate"]) == (1, 1, 1.0)
+
+    def test_hedges_are_capped_by_budget(self):
+        caller = HedgedCaller(hedging=True, initial_delay=0.01, max_hedge_ratio=0.1)
+
+        for _ in range(10):
+            caller.call("ec2:DescribeInstances", time.sleep, 0.03)
+
+        assert caller.get_stats()["hedged"] == 1
+
+    def test_hedge_delay_follows_observed_percentile(self):
+        caller = HedgedCaller(hedging=True, min_samples=5, min_delay=0.0)
+        for latency in [0.01, 0.02, 0.03, 0.04, 0.5]:
+            caller._record_success("ec2:DescribeInstances", False, time.monotonic() - latency)
+
+        assert caller.hedge_delay("ec2:DescribeInstances") == pytest.approx(0.5, abs=0.05)
+        assert caller.hedge_delay("ec2:DescribeFleets") == caller.initial_delay
+
+    def test_errors_are_raised_without_hedging(self):
+        caller = HedgedCaller(hedging=True, initial_delay=0.5, max_hedge_ratio=1.0)
+        func = Mock(side_effect=ValueError("InvalidParameterValue"))
+
+        with pytest.raises(ValueError):
+            caller.call("ec2:DescribeInstances", func)
+        assert func.call_count == 1
+
+    def test_retry_stops_when_backoff_would_pass_the_deadline(self):
+        operation = Mock(side_effect=RuntimeError("timeout"))
+        guarded = retry(max_attempts=5, base_delay=1.0, jitter=False)(operation)
+
+        start = time.monotonic()
+        with deadline_scope(0.5), pytest.raises(RuntimeError):
+            guarded()
+
+        assert operation.call_count == 1
+        assert time.monotonic() - start < 0.5
@@ -0,0 +1,122 @@
+"""Unit tests for the client-side token-bucket rate limiter."""
+
+import threading
+
+import pytest
+
+from infrastructure.caching.shared_state import SharedStateStore
+from infrastructure.resilience.rate_limiter import RateLimiter
+
+
+class FakeTime:
+    """Clock and sleep that advance together without real waiting."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(fake, **kwargs):
+    return RateLimiter(clock=fake.clock, sleep=fake.sleep, **kwargs)
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    """Token buckets per action, adapting to throttles."""
+
+    def test_burst_then_paced_at_rate(self):
+        fake = FakeTime()
+        limiter = make_limiter(fake, default_rate=10.0, default_burst=3.0)
+
+        waits = [limiter.acquire("ec2:DescribeInstances") for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3:] == pytest.approx([0.1, 0.1])
+
+    def test_limits_resolve_exact_then_longest_pattern(self):
+        limiter = RateLimiter(
+            limits={
+                "ec2:*": {"rate": 5, "burst": 200},
+                "ec2:Describe*": {"rate": 20, "burst": 100},
+                "ec2:RunInstances": {"rate": 2, "burst": 1000},
+            },
+            default_rate=1,
+            default_burst=1,
+        )
+
+        assert limiter.limit_for("ec2:RunInstances") == (2.0, 1000.0)
+        assert limiter.limit_for("ec2:DescribeFleets") == (20.0, 100.0)
+        assert limiter.limit_for("ec2:CreateFleet") == (5.0, 200.0)
+        assert limiter.limit_for("autoscaling:CreateAutoScalingGroup") == (1.0, 1.0)
+
+    def test_throttle_cuts_rate_and_success_restores_it(self):
+        fake = FakeTime()
+        limiter = make_limiter(
+            fake, default_rate=10.0, default_burst=5.0, increase_step=0.25, min_rate=1.0
+        )
+        key = "ec2:CreateFleet"
+        limiter.acquire(key)
+
+        limiter.record_throttle(key)
+        limiter.record_throttle(key)
+        assert limiter.get_stats()[key]["rate"] == pytest.approx(2.5)
+        # The saved-up burst is dropped, so the next call waits at the reduced rate
+        assert limiter.acquire(key) == pytest.approx(0.4)
+
+        for _ in range(10):
+            limiter.record_success(key)
+        assert limiter.get_stats()[key]["rate"] == pytest.approx(10.0)
+        assert limiter.get_stats()[key]["throttles"] == 2
+
+    def test_waits_are_capped(self):
+        fake = FakeTime()
+        limiter = make_limiter(fake, default_rate=0.01, default_burst=1.0, max_wait=2.0)
+
+        limiter.acquire("ec2:RunInstances")
+        assert limiter.acquire("ec2:RunInstances") == 2.0
+
+    def test_threads_share_buckets(self):
+        limiter = RateLimiter(default_rate=1000.0, default_burst=50.0, sleep=lambda s: None)
+        waits = []
+
+        def call_many():
+            for _ in range(25):
+                waits.append(limiter.acquire("ec2:DescribeInstances"))
+
+        threads = [threading.Thread(target=call_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # 100 reservations against a 50-token bucket: about half of them had to wait
+        assert 40 <= sum(1 for w in waits if w > 0) <= 50
+
+    def test_processes_share_buckets_through_store(self, tmp_path):
+        fake = FakeTime()
+        path = str(tmp_path / "rate_limits.db")
+        first = make_limiter(
+            fake, default_rate=1.0, default_burst=2.0, store=SharedStateStore(path)
+        )
+        second = make_limiter(
+            fake, default_rate=1.0, default_burst=2.0, store=SharedStateStore(path)
+        )
+
+        assert first.acquire("ec2:CreateFleet") == 0.0
+        assert second.acquire("ec2:CreateFleet") == 0.0
+        # The bucket is empty for both processes
+        assert first.acquire("ec2:CreateFleet") == pytest.approx(1.0)
+
+        # A throttle seen by one process slows the other one down as well
+        second.record_throttle("ec2:CreateFleet")
+        assert first.acquire("ec2:CreateFleet") == pytest.approx(3.0)
+        first.record_success("ec2:CreateFleet")
+        assert second.get_stats()["ec2:CreateFleet"]["rate"] == pytest.approx(0.5)
+        assert first.get_stats()["ec2:CreateFleet"]["rate"] == pytest.approx(0.55)
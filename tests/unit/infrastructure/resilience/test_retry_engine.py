@@ -0,0 +1,174 @@
+"""Unit tests for the shared retry engine."""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from domain.base.exceptions import ConcurrencyError
+from infrastructure.persistence.concurrency import OptimisticConcurrencyControl
+from infrastructure.resilience.engine import (
+    RetryBudget,
+    RetryEngine,
+    RetryPolicy,
+    backoff_delay,
+    configure_retry_engine,
+)
+from infrastructure.resilience.exceptions import MaxRetriesExceededError
+from infrastructure.resilience.retry_decorator import retry
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def sleeps():
+    """Install an engine that records sleeps instead of waiting."""
+    recorded = []
+    configure_retry_engine(RetryEngine(sleep=recorded.append))
+    yield recorded
+    configure_retry_engine(None)
+
+
+@pytest.mark.unit
+class TestBackoff:
+    """Full-jitter backoff stays below the exponential cap."""
+
+    def test_full_jitter_is_bounded_by_the_cap(self):
+        for attempt in range(8):
+            cap = min(10.0, 0.5 * 2**attempt)
+            delays = [backoff_delay(attempt, 0.5, 10.0) for _ in range(200)]
+            assert all(0.0 <= delay <= cap for delay in delays)
+            assert min(delays) < cap / 2
+
+    def test_without_jitter_the_cap_is_used(self):
+        assert [backoff_delay(a, 1.0, 5.0, jitter=False) for a in range(4)] == [1, 2, 4, 5]
+
+
+@pytest.mark.unit
+class TestRetryBudget:
+    """Retries are limited to a share of calls once saved-up tokens are spent."""
+
+    def test_exhausted_budget_stops_retries(self):
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.5, min_per_second=0.0, capacity=2.0, clock=clock)
+        metrics = Mock()
+        engine = RetryEngine(budget=budget, metrics=metrics, sleep=lambda s: None)
+        policy = RetryPolicy(callsite="describe", max_retries=10, base_delay=0.0)
+        func = Mock(side_effect=RuntimeError("throttled"))
+
+        with pytest.raises(RuntimeError):
+            engine.run(policy, func)
+
+        # Two saved-up tokens plus the half token earned by the call
+        assert func.call_count == 3
+        assert budget.get_stats()["exhausted"] == 1
+        metrics.increment_counter.assert_any_call("describe_retries_total")
+        metrics.increment_counter.assert_called_with("retry_budget_exhausted_total")
+
+    def test_budget_refills_over_time(self):
+        clock = FakeClock()
+        budget = RetryBudget(ratio=0.0, min_per_second=1.0, capacity=1.0, clock=clock)
+
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+        clock.now += 1.0
+        assert budget.try_acquire()
+
+
+@pytest.mark.unit
+class TestRetryEngine:
+    """Both engine flavours share one retry decision."""
+
+    def test_only_listed_errors_are_retried(self):
+        engine = RetryEngine(sleep=lambda s: None)
+        policy = RetryPolicy(callsite="save", retry_on=(ConcurrencyError,))
+        func = Mock(side_effect=ValueError("bad input"))
+
+        with pytest.raises(ValueError):
+            engine.run(policy, func)
+        assert func.call_count == 1
+
+    def test_async_backoff_does_not_block_the_loop(self):
+        engine = RetryEngine()
+        policy = RetryPolicy(callsite="fetch", max_retries=1, base_delay=0.2, jitter=False)
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("timeout")
+            return "ok"
+
+        async def ticker(ticks):
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            ticks = []
+            retried = asyncio.ensure_future(engine.run_async(policy, flaky))
+            await ticker(ticks)
+            return await retried, time.monotonic(), ticks
+
+        result, finished, ticks = asyncio.run(main())
+
+        # The loop kept ticking while the retry was backing off
+        assert result == "ok"
+        assert len(ticks) == 5 and ticks[-1] < finished - 0.1
+        assert len(calls) == 2
+        assert ticks[-1] - ticks[0] < 0.2
+
+
+@pytest.mark.unit
+class TestRetryCallSites:
+    """The decorator and optimistic concurrency control run on the engine."""
+
+    def test_decorator_raises_max_retries_exceeded(self, sleeps):
+        operation = Mock(side_effect=RuntimeError("boom"), __name__="describe")
+
+        with pytest.raises(MaxRetriesExceededError):
+            retry(max_attempts=2, base_delay=1.0, max_delay=4.0)(operation)()
+
+        assert operation.call_count == 3
+        assert len(sleeps) == 2
+        assert sleeps[0] <= 1.0 and sleeps[1] <= 2.0
+
+    def test_decorator_retries_coroutines(self):
+        delays = []
+
+        async def record_sleep(delay):
+            delays.append(delay)
+
+        configure_retry_engine(RetryEngine(async_sleep=record_sleep))
+        attempts = []
+
+        @retry(max_attempts=3, base_delay=1.0)
+        async def fetch():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise RuntimeError("timeout")
+            return "ok"
+
+        try:
+            assert asyncio.run(fetch()) == "ok"
+        finally:
+            configure_retry_engine(None)
+        assert len(attempts) == 3
+        assert len(delays) == 2
+
+    def test_concurrency_conflicts_are_retried(self, sleeps):
+        occ = OptimisticConcurrencyControl(max_retries=2, retry_delay=0.1)
+        save = Mock(side_effect=ConcurrencyError("Request req-1 was modified concurrently"))
+
+        with pytest.raises(ConcurrencyError):
+            occ.retry_on_concurrency_error(save)()
+
+        assert save.call_count == 3
+        assert all(0.0 <= delay <= 0.2 for delay in sleeps)
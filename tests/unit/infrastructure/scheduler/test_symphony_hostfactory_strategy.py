@@ -37,6 +37,12 @@ class TestSymphonyHostFactorySchedulerStrategy:
             self.mock_logger = Mock()
             self.strategy = HostFactorySchedulerStrategy(self.mock_config_manager, self.mock_logger)
 
+    def test_timed_out_requests_complete_with_error(self):
+        """Test that timed out requests are reported as finished with an error."""
+        assert self.strategy._map_domain_status_to_hostfactory("timeout") == (
+            "complete_with_error"
+        )
+
     def test_get_templates_file_path(self):
         """Test templates file path generation."""
         path = self.strategy.get_templates_file_path()
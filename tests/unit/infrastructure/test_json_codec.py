@@ -0,0 +1,96 @@
+"""Unit tests for the pluggable JSON codec."""
+
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+import pytest
+
+from domain.base.value_objects import InstanceId
+from infrastructure.persistence.components.serialization_manager import JSONSerializer
+from infrastructure.persistence.components.sql_serializer import SQLSerializer
+from infrastructure.serialization import json_codec
+from infrastructure.serialization.json_codec import (
+    JSONCodec,
+    JSONDecodeError,
+    get_json_codec,
+    set_json_codec,
+)
+
+CODECS = [JSONCodec]
+if json_codec.ORJSON_AVAILABLE:
+    CODECS.append(json_codec.OrjsonCodec)
+
+
+class Color(Enum):
+    RED = "red"
+
+
+SAMPLE = {
+    "created_at": datetime(2025, 1, 1, 10, 0, 0, 123456),
+    "color": Color.RED,
+    "id": UUID("12345678-1234-5678-1234-567812345678"),
+    "instance_id": InstanceId(value="i-0123456789abcdef0"),
+    "tags": {"name": "é"},
+}
+
+EXPECTED = {
+    "created_at": "2025-01-01T10:00:00.123456",
+    "color": "red",
+    "id": "12345678-1234-5678-1234-567812345678",
+    "instance_id": "i-0123456789abcdef0",
+    "tags": {"name": "é"},
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_codec():
+    """Re-select the process-wide codec after each test."""
+    yield
+    set_json_codec(None)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("codec_class", CODECS)
+class TestJSONCodec:
+    """Tests shared by every codec implementation."""
+
+    def test_native_types_round_trip(self, codec_class):
+        """Datetimes, enums, UUIDs and value objects encode without pre-conversion."""
+        codec = codec_class()
+
+        assert codec.loads(codec.dumps(SAMPLE)) == EXPECTED
+        assert codec.loads(codec.dumps_bytes(SAMPLE, pretty=True)) == EXPECTED
+
+    def test_pretty_output_is_indented(self, codec_class):
+        """Pretty output uses two-space indentation and keeps non-ASCII text."""
+        output = codec_class().dumps({"a": {"b": "é"}}, pretty=True)
+
+        assert output == '{\n  "a": {\n    "b": "é"\n  }\n}'
+
+    def test_invalid_document_raises_decode_error(self, codec_class):
+        """Both codecs raise the stdlib JSONDecodeError type."""
+        with pytest.raises(JSONDecodeError):
+            codec_class().loads("{not json")
+
+
+@pytest.mark.unit
+class TestCodecSelection:
+    """Tests for process-wide codec selection."""
+
+    def test_stdlib_forced_by_environment(self, monkeypatch):
+        """HF_JSON_CODEC=stdlib selects the stdlib codec even when orjson is installed."""
+        monkeypatch.setenv(json_codec.JSON_CODEC_ENV_VAR, "stdlib")
+        set_json_codec(None)
+
+        assert get_json_codec().name == "stdlib"
+
+    def test_storage_serializers_use_configured_codec(self):
+        """JSON storage and SQL JSON columns go through the configured codec."""
+        set_json_codec(JSONCodec())
+
+        storage_content = JSONSerializer().serialize({"machine": {"status": Color.RED}})
+        column_value = SQLSerializer()._serialize_value({"created_at": SAMPLE["created_at"]})
+
+        assert JSONSerializer().deserialize(storage_content) == {"machine": {"status": "red"}}
+        assert column_value == '{"created_at":"2025-01-01T10:00:00.123456"}'
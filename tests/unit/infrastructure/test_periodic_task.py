@@ -0,0 +1,46 @@
+"""Unit tests for periodic background tasks."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from infrastructure.lifecycle import PeriodicTask
+
+
+@pytest.mark.unit
+class TestPeriodicTask:
+    """Periodic tasks run on their interval until shut down."""
+
+    def test_runs_repeatedly_and_survives_failures(self):
+        runs = []
+        done = threading.Event()
+
+        def task():
+            runs.append(len(runs))
+            if len(runs) == 3:
+                done.set()
+            if len(runs) == 1:
+                raise RuntimeError("storage unavailable")
+
+        periodic = PeriodicTask("test-task", task, interval=0.01)
+        periodic.initialize()
+        try:
+            assert done.wait(2.0)
+        finally:
+            periodic.shutdown()
+
+        assert len(runs) >= 3
+
+    def test_shutdown_stops_before_the_first_interval(self):
+        task = Mock()
+        periodic = PeriodicTask("test-task", task, interval=60)
+
+        periodic.initialize()
+        periodic.shutdown()
+
+        task.assert_not_called()
+
+    def test_rejects_non_positive_interval(self):
+        with pytest.raises(ValueError):
+            PeriodicTask("test-task", Mock(), interval=0)
@@ -0,0 +1,204 @@
+"""Unit tests for the request deadline index and timeout sweeper."""
+
+import asyncio
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.events.handlers.request_handlers import RequestTimeoutHandler
+from domain.base.value_objects import InstanceId
+from domain.machine.machine_status import MachineStatus
+from domain.request.aggregate import Request
+from domain.request.request_types import RequestStatus
+from domain.request.value_objects import RequestType
+from infrastructure.persistence.json.strategy import JSONStorageStrategy
+from infrastructure.persistence.repositories.request_repository import (
+    RequestRepositoryImpl,
+)
+from infrastructure.timeouts import DeadlineIndex, RequestTimeoutSweeper
+
+CREATED_AT = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def epoch(value):
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+def new_request(timeout):
+    request = Request.create_new_request(
+        request_type=RequestType.ACQUIRE,
+        template_id="tmpl-1",
+        machine_count=1,
+        provider_type="aws",
+        metadata={"timeout": timeout} if timeout else {},
+    )
+    request.created_at = CREATED_AT
+    request.clear_domain_events()
+    return request
+
+
+@pytest.fixture
+def repository(tmp_path):
+    return RequestRepositoryImpl(JSONStorageStrategy(file_path=str(tmp_path / "requests.json")))
+
+
+@pytest.fixture
+def machines_by_request():
+    return {}
+
+
+@pytest.fixture
+def sweeper(repository, machines_by_request):
+    machines = Mock(find_by_request_id=lambda request_id: machines_by_request.get(request_id, []))
+
+    @contextmanager
+    def create_unit_of_work():
+        yield SimpleNamespace(requests=repository, machines=machines)
+
+    uow_factory = Mock(create_unit_of_work=create_unit_of_work)
+    return RequestTimeoutSweeper(uow_factory, event_publisher=Mock())
+
+
+@pytest.mark.unit
+class TestDeadlineIndex:
+    """Deadlines come out earliest first, skipping cancelled and moved ones."""
+
+    def test_pop_expired_in_deadline_order(self):
+        index = DeadlineIndex()
+        index.schedule("req-c", 30.0)
+        index.schedule("req-a", 10.0)
+        index.schedule("req-b", 20.0)
+
+        assert index.next_deadline() == 10.0
+        assert index.pop_expired(25.0) == ["req-a", "req-b"]
+        assert len(index) == 1 and "req-c" in index
+
+    def test_cancelled_and_rescheduled_entries_are_skipped(self):
+        index = DeadlineIndex()
+        index.schedule("req-a", 10.0)
+        index.schedule("req-b", 20.0)
+        index.cancel("req-a")
+        index.schedule("req-b", 40.0)
+
+        assert index.next_deadline() == 40.0
+        assert index.pop_expired(30.0) == []
+        assert index.pop_expired(40.0) == ["req-b"]
+
+
+@pytest.mark.unit
+class TestRequestTimeoutSweeper:
+    """Requests past their deadline are timed out without scanning the store."""
+
+    def test_only_expired_requests_time_out(self, repository, sweeper):
+        short, long, untimed = new_request(60), new_request(3600), new_request(None)
+        for request in (short, long, untimed):
+            repository.save(request)
+
+        assert sweeper.resync() == 2
+
+        timed_out = sweeper.sweep(now=epoch(CREATED_AT + timedelta(minutes=5)))
+
+        assert timed_out == [str(short.request_id)]
+        assert repository.find_by_request_id(str(short.request_id)).status == (
+            RequestStatus.TIMEOUT
+        )
+        assert repository.find_by_request_id(str(long.request_id)).status == (
+            RequestStatus.PENDING
+        )
+        published = [c.args[0].event_type for c in sweeper._event_publisher.publish.call_args_list]
+        assert published == ["RequestStatusChangedEvent", "RequestTimeoutEvent"]
+        assert len(sweeper.index) == 1
+
+    def test_requests_finished_elsewhere_are_left_alone(self, repository, sweeper):
+        request = new_request(60)
+        repository.save(request)
+        sweeper.resync()
+        repository.save(request.update_status(RequestStatus.COMPLETED))
+
+        assert sweeper.sweep(now=epoch(CREATED_AT + timedelta(hours=1))) == []
+        assert repository.find_by_request_id(str(request.request_id)).status == (
+            RequestStatus.COMPLETED
+        )
+
+    def test_fulfilled_requests_do_not_time_out(self, repository, sweeper, machines_by_request):
+        request = new_request(60)
+        repository.save(request)
+        sweeper.resync()
+        machines_by_request[str(request.request_id)] = [machine("i-0a", MachineStatus.RUNNING)]
+
+        assert sweeper.sweep(now=epoch(CREATED_AT + timedelta(hours=1))) == []
+        assert repository.find_by_request_id(str(request.request_id)).status == (
+            RequestStatus.PENDING
+        )
+
+    def test_events_keep_the_index_current(self, sweeper):
+        created = SimpleNamespace(
+            event_type="RequestCreatedEvent",
+            request_id="req-1",
+            timeout=60,
+            occurred_at=CREATED_AT,
+        )
+        sweeper.handle_event(created)
+        assert sweeper.index.next_deadline() == epoch(CREATED_AT + timedelta(seconds=60))
+
+        finished = SimpleNamespace(
+            event_type="RequestStatusChangedEvent", request_id="req-1", new_status="completed"
+        )
+        sweeper.handle_event(finished)
+        assert len(sweeper.index) == 0
+
+
+def machine(instance_id, status):
+    return SimpleNamespace(instance_id=InstanceId(value=instance_id), status=status)
+
+
+@pytest.mark.unit
+class TestRequestTimeoutRelease:
+    """Machines still held by a timed out acquire request are returned."""
+
+    @pytest.fixture
+    def command_bus(self):
+        return Mock(execute=AsyncMock())
+
+    def timeout_handler(self, command_bus, request, machines):
+        @contextmanager
+        def create_unit_of_work():
+            yield SimpleNamespace(
+                requests=Mock(find_by_request_id=Mock(return_value=request)),
+                machines=Mock(find_by_request_id=Mock(return_value=machines)),
+            )
+
+        uow_factory = Mock(create_unit_of_work=create_unit_of_work)
+        return RequestTimeoutHandler(Mock(), command_bus=command_bus, uow_factory=uow_factory)
+
+    def timeout_event(self, request):
+        events = request.time_out().get_domain_events()
+        return next(e for e in events if e.event_type == "RequestTimeoutEvent")
+
+    def test_unterminated_machines_are_returned(self, command_bus):
+        request = new_request(60)
+        request.instance_ids = [InstanceId(value="i-0a"), InstanceId(value="i-0c")]
+        machines = [
+            machine("i-0a", MachineStatus.RUNNING),
+            machine("i-0b", MachineStatus.TERMINATED),
+        ]
+        handler = self.timeout_handler(command_bus, request, machines)
+
+        asyncio.run(handler.handle(self.timeout_event(request)))
+
+        command = command_bus.execute.call_args.args[0]
+        assert command.machine_ids == ["i-0a", "i-0c"]
+        assert command.metadata == {"timed_out_request_id": str(request.request_id)}
+
+    def test_nothing_is_returned_without_live_machines(self, command_bus):
+        request = new_request(60)
+        handler = self.timeout_handler(
+            command_bus, request, [machine("i-0a", MachineStatus.TERMINATED)]
+        )
+
+        asyncio.run(handler.handle(self.timeout_event(request)))
+
+        command_bus.execute.assert_not_called()
@@ -0,0 +1,198 @@
+"""Unit tests for concurrent MCP tool calls and the read cache."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from domain.base.events import RequestStatusChangedEvent
+from domain.base.ports import EventPublisherPort
+from infrastructure.events.publisher import ConfigurableEventPublisher
+from interface.mcp.server.core import OpenHFPluginMCPServer
+from interface.mcp.server.read_cache import ReadCache
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+@pytest.mark.unit
+class TestMCPToolConcurrency:
+    """Tool calls run side by side on the executor, within per-tool limits."""
+
+    def test_slow_tools_do_not_serialise(self):
+        server = OpenHFPluginMCPServer(max_workers=4)
+
+        async def slow_tool(args, app):
+            await asyncio.sleep(0.2)
+            return {"ok": True}
+
+        server.tools["slow_tool"] = slow_tool
+
+        async def call_many():
+            return await asyncio.gather(
+                *(server._execute_tool("slow_tool", {}) for _ in range(4))
+            )
+
+        started = time.monotonic()
+        results = run(call_many())
+        elapsed = time.monotonic() - started
+        server.shutdown()
+
+        assert results == [{"ok": True}] * 4
+        assert elapsed < 0.6
+
+    def test_per_tool_limit_caps_concurrent_calls(self):
+        server = OpenHFPluginMCPServer(max_workers=8, tool_concurrency={"request_machines": 2})
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def request_machines(args, app):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return {"request_id": args.template_id}
+
+        server.tools["request_machines"] = request_machines
+
+        async def call_many():
+            return await asyncio.gather(
+                *(
+                    server._execute_tool("request_machines", {"template_id": f"t{i}"})
+                    for i in range(6)
+                )
+            )
+
+        results = run(call_many())
+        server.shutdown()
+
+        assert [r["request_id"] for r in results] == [f"t{i}" for i in range(6)]
+        assert active["peak"] == 2
+
+
+@pytest.mark.unit
+class TestMCPReadCache:
+    """Read-only tools are served from the cache until a write makes them stale."""
+
+    def test_reads_are_cached_and_writes_invalidate(self):
+        server = OpenHFPluginMCPServer()
+        calls = {"list_return_requests": 0}
+
+        async def list_return_requests(args, app):
+            calls["list_return_requests"] += 1
+            return {"requests": calls["list_return_requests"]}
+
+        async def return_machines(args, app):
+            return {"status": "accepted"}
+
+        server.tools["list_return_requests"] = list_return_requests
+        server.tools["return_machines"] = return_machines
+
+        async def scenario():
+            first = await server._call_tool("list_return_requests", {})
+            second = await server._call_tool("list_return_requests", {})
+            await server._call_tool("return_machines", {"machine_ids": ["i-1"]})
+            third = await server._call_tool("list_return_requests", {})
+            return first, second, third
+
+        first, second, third = run(scenario())
+        server.shutdown()
+
+        assert first == second == {"requests": 1}
+        assert third == {"requests": 2}
+
+    def test_entries_expire_and_events_invalidate_their_kind(self):
+        now = {"t": 0.0}
+        cache = ReadCache(ttl=10.0, clock=lambda: now["t"])
+        templates_key = ReadCache.key("list_templates", {})
+        providers_key = ReadCache.key("list_providers", {})
+        cache.put("templates", templates_key, ["tmpl-1"])
+        cache.put("providers", providers_key, ["aws"])
+
+        cache.handle_event(type("TemplateUpdatedEvent", (), {"event_type": None})())
+
+        assert cache.get("templates", templates_key) is None
+        assert cache.get("providers", providers_key) == ["aws"]
+
+        now["t"] = 10.0
+        assert cache.get("providers", providers_key) is None
+
+    def test_events_from_the_default_publisher_invalidate(self):
+        publisher = ConfigurableEventPublisher()
+        app = type("App", (), {"get": lambda self, port: {EventPublisherPort: publisher}[port]})()
+        server = OpenHFPluginMCPServer(app=app)
+        key = ReadCache.key("list_return_requests", {})
+        server.read_cache.put("requests", key, {"requests": []})
+
+        publisher.publish(
+            RequestStatusChangedEvent(
+                aggregate_id="req-1",
+                aggregate_type="Request",
+                request_id="req-1",
+                request_type="acquire",
+                old_status="in_progress",
+                new_status="completed",
+            )
+        )
+        server.shutdown()
+
+        assert server.read_cache.get("requests", key) is None
+
+    def test_read_racing_a_write_is_not_cached(self):
+        server = OpenHFPluginMCPServer()
+        read_started = threading.Event()
+        write_done = threading.Event()
+        calls = {"list_return_requests": 0}
+
+        def list_return_requests(args, app):
+            calls["list_return_requests"] += 1
+            stale = calls["list_return_requests"]
+            read_started.set()
+            write_done.wait(1.0)
+            return {"requests": stale}
+
+        def return_machines(args, app):
+            return {"status": "accepted"}
+
+        server.tools["list_return_requests"] = list_return_requests
+        server.tools["return_machines"] = return_machines
+
+        async def scenario():
+            read = asyncio.create_task(server._call_tool("list_return_requests", {}))
+            await asyncio.get_running_loop().run_in_executor(None, read_started.wait, 1.0)
+            await server._call_tool("return_machines", {"machine_ids": ["i-1"]})
+            write_done.set()
+            stale = await read
+            fresh = await server._call_tool("list_return_requests", {})
+            return stale, fresh
+
+        stale, fresh = run(scenario())
+        server.shutdown()
+
+        assert stale == {"requests": 1}
+        assert fresh == {"requests": 2}
+
+    def test_error_results_are_not_cached(self):
+        server = OpenHFPluginMCPServer()
+        results = iter([{"success": False, "error": "throttled"}, {"templates": ["t1"]}])
+        server.tools["list_templates"] = lambda args, app: next(results)
+
+        async def scenario():
+            return (
+                await server._call_tool("list_templates", {}),
+                await server._call_tool("list_templates", {}),
+            )
+
+        failed, succeeded = run(scenario())
+        server.shutdown()
+
+        assert failed == {"success": False, "error": "throttled"}
+        assert succeeded == {"templates": ["t1"]}
+
+    def test_max_workers_must_be_positive(self):
+        with pytest.raises(ValueError):
+            OpenHFPluginMCPServer(max_workers=0)
@@ -0,0 +1 @@
+"""Tests for monitoring components."""
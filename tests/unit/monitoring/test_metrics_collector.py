@@ -0,0 +1,99 @@
+"""Unit tests for metrics collection and Prometheus exposition."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from config.schemas.server_schema import ServerConfig
+from monitoring.metrics import Histogram, MetricsCollector
+
+
+@pytest.fixture
+def collector(tmp_path):
+    return MetricsCollector({"METRICS_DIR": str(tmp_path / "metrics")})
+
+
+@pytest.mark.unit
+class TestHistogram:
+    """Durations are counted in fixed buckets and summarized on demand."""
+
+    def test_percentiles_are_within_bucket_precision(self):
+        histogram = Histogram("describe_duration")
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(0.5) == pytest.approx(0.5, rel=0.05)
+        assert histogram.percentile(0.95) == pytest.approx(0.95, rel=0.05)
+        assert histogram.percentile(0.99) == pytest.approx(0.99, rel=0.05)
+        assert histogram.percentile(1.0) == pytest.approx(1.0)
+
+    def test_memory_does_not_grow_with_samples(self):
+        histogram = Histogram("describe_duration")
+        buckets = len(histogram.buckets)
+
+        for i in range(10000):
+            histogram.record(i * 0.37)
+
+        assert len(histogram.buckets) == buckets
+        assert histogram.percentile(1.0) == pytest.approx(9999 * 0.37)
+
+
+@pytest.mark.unit
+class TestMetricsCollector:
+    """Counters, gauges and durations are exported without a writer thread."""
+
+    def test_no_background_writer_or_files(self, tmp_path):
+        threads = threading.active_count()
+
+        MetricsCollector({"METRICS_DIR": str(tmp_path / "metrics")})
+
+        assert threading.active_count() == threads
+        assert not (tmp_path / "metrics").exists()
+
+    def test_record_time_keeps_percentiles(self, collector):
+        for duration in (0.1, 0.2, 0.3, 0.4, 2.0):
+            collector.record_time("request_machines_duration", duration)
+
+        summary = collector.get_percentiles("request_machines_duration")
+        assert summary["count"] == 5
+        assert summary["p50"] == pytest.approx(0.3, rel=0.05)
+        assert summary["p99"] == pytest.approx(2.0, rel=0.05)
+        assert collector.get_metrics()["request_machines_duration_seconds"]["value"] == (
+            pytest.approx(0.6)
+        )
+
+    def test_unregistered_counter_is_created(self, collector):
+        collector.increment_counter("ec2_describe_instances_retries_total")
+
+        assert collector.get_metrics()["ec2_describe_instances_retries_total"]["value"] == 1.0
+
+    def test_prometheus_exposition(self, collector):
+        collector.increment_counter("requests_total", 3)
+        collector.record_time("get-status duration", 0.25)
+
+        text = collector.export_prometheus()
+
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{type="all"} 3.0' in text
+        assert "# TYPE get_status_duration summary" in text
+        assert 'get_status_duration{quantile="0.95"}' in text
+        assert "get_status_duration_count 1" in text
+
+
+@pytest.mark.unit
+def test_metrics_endpoint_serves_exposition(collector):
+    from api.server import create_fastapi_app
+
+    collector.increment_counter("requests_total")
+    app = create_fastapi_app(ServerConfig(enabled=True))
+
+    container = Mock(get_optional=Mock(return_value=collector))
+    with patch("infrastructure.di.container.get_container", return_value=container):
+        response = TestClient(app).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'requests_total{type="all"} 1.0' in response.text
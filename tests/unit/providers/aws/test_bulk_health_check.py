@@ -0,0 +1,97 @@
+"""Unit tests for batched instance health checks."""
+
+from unittest.mock import Mock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from providers.aws.exceptions.aws_exceptions import AWSError
+from providers.aws.infrastructure.adapters.machine_adapter import AWSMachineAdapter
+
+
+def instance_status(instance_id, system="ok", instance="ok"):
+    return {
+        "InstanceId": instance_id,
+        "InstanceState": {"Name": "running"},
+        "SystemStatus": {"Status": system, "Details": []},
+        "InstanceStatus": {"Status": instance, "Details": []},
+    }
+
+
+def describe_all(InstanceIds, IncludeAllInstances, NextToken=None):
+    return {"InstanceStatuses": [instance_status(i) for i in InstanceIds]}
+
+
+def not_found(instance_ids):
+    return ClientError(
+        {
+            "Error": {
+                "Code": "InvalidInstanceID.NotFound",
+                "Message": f"The instance IDs '{', '.join(instance_ids)}' do not exist",
+            }
+        },
+        "DescribeInstanceStatus",
+    )
+
+
+@pytest.fixture
+def ec2_client():
+    return Mock(describe_instance_status=Mock(side_effect=describe_all))
+
+
+@pytest.fixture
+def adapter(ec2_client):
+    return AWSMachineAdapter(Mock(ec2_client=ec2_client), Mock())
+
+
+@pytest.mark.unit
+class TestBulkHealthCheck:
+    """Health of many instances is read with one status call per 100 IDs."""
+
+    def test_thousand_instances_take_ten_calls(self, adapter, ec2_client):
+        instance_ids = [f"i-{n:017x}" for n in range(1000)]
+
+        results = adapter.check_health_bulk(instance_ids)
+
+        assert ec2_client.describe_instance_status.call_count == 10
+        for call in ec2_client.describe_instance_status.call_args_list:
+            assert len(call.kwargs["InstanceIds"]) == 100
+            assert call.kwargs["IncludeAllInstances"] is True
+        assert set(results) == set(instance_ids)
+        assert all(result.is_healthy for result in results.values())
+
+    def test_status_checks_map_to_health(self, adapter, ec2_client):
+        ec2_client.describe_instance_status.side_effect = [
+            {"InstanceStatuses": [instance_status("i-0a", system="impaired")], "NextToken": "t"},
+            {"InstanceStatuses": [instance_status("i-0b", instance="initializing")]},
+        ]
+
+        results = adapter.check_health_bulk(["i-0a", "i-0b"])
+
+        assert ec2_client.describe_instance_status.call_args.kwargs["NextToken"] == "t"
+        assert not results["i-0a"].system_status and results["i-0a"].instance_status
+        assert results["i-0b"].system_status and not results["i-0b"].instance_status
+        assert results["i-0b"].instance_details["status"] == "initializing"
+
+    def test_missing_instances_are_skipped(self, adapter, ec2_client):
+        ec2_client.describe_instance_status.side_effect = [
+            not_found(["i-0b"]),
+            describe_all(["i-0a", "i-0c"], True),
+        ]
+
+        results = adapter.check_health_bulk(["i-0a", "i-0b", "i-0c"])
+
+        assert set(results) == {"i-0a", "i-0c"}
+        assert ec2_client.describe_instance_status.call_args.kwargs["InstanceIds"] == [
+            "i-0a",
+            "i-0c",
+        ]
+
+    def test_other_errors_raise(self, adapter, ec2_client):
+        ec2_client.describe_instance_status.side_effect = ClientError(
+            {"Error": {"Code": "UnauthorizedOperation", "Message": "denied"}},
+            "DescribeInstanceStatus",
+        )
+
+        with pytest.raises(AWSError):
+            adapter.check_health_bulk(["i-0a"])
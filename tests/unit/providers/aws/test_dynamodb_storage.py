@@ -0,0 +1,104 @@
+"""Unit tests for DynamoDB storage."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from infrastructure.persistence.components import (
+    DynamoDBClientManager,
+    DynamoDBConverter,
+    LockManager,
+)
+from providers.aws.persistence.dynamodb.strategy import DynamoDBStorageStrategy
+from providers.aws.persistence.dynamodb.unit_of_work import DynamoDBUnitOfWork
+
+
+class PagedDynamoDBStorage(DynamoDBStorageStrategy):
+    def count(self):
+        return len(self.find_all())
+
+
+@pytest.fixture
+def strategy():
+    items = [{"id": f"req-{i:04d}", "status": "complete"} for i in range(1200)]
+    # Scans return items in hash order
+    items.reverse()
+
+    strategy = object.__new__(PagedDynamoDBStorage)
+    strategy._logger = Mock()
+    strategy.table_name = "requests"
+    strategy.client_manager = Mock()
+    strategy.client_manager.scan_table.return_value = items
+    strategy.converter = DynamoDBConverter(partition_key="id")
+    strategy.lock_manager = LockManager("simple")
+    strategy._page_snapshot = None
+    return strategy
+
+
+def list_all(strategy, criteria=None):
+    ids = []
+    after_id = None
+    while True:
+        page = strategy.find_page(criteria, after_id=after_id, limit=500)
+        if not page:
+            return ids
+        ids.extend(page)
+        after_id = list(page)[-1]
+
+
+@pytest.mark.unit
+class TestDynamoDBFindPage:
+    def test_listing_every_page_scans_once(self, strategy):
+        ids = list_all(strategy)
+
+        assert ids == sorted(ids)
+        assert len(ids) == 1200
+        assert strategy.client_manager.scan_table.call_count == 1
+
+    def test_each_listing_scans_fresh(self, strategy):
+        list_all(strategy)
+        list_all(strategy, {"status": "complete"})
+
+        assert strategy.client_manager.scan_table.call_count == 2
+
+    def test_unrelated_cursor_scans_after_it(self, strategy):
+        strategy.find_page(after_id=None, limit=500)
+
+        page = strategy.find_page(after_id="req-1000", limit=500)
+
+        assert list(page)[0] == "req-1001"
+        assert len(page) == 199
+        assert strategy.client_manager.scan_table.call_count == 2
+
+
+@pytest.mark.unit
+class TestArchiveTableTTL:
+    def test_ttl_is_enabled_on_the_attribute(self):
+        manager = DynamoDBClientManager(aws_client=Mock())
+        manager.dynamodb.describe_time_to_live.return_value = {
+            "TimeToLiveDescription": {"TimeToLiveStatus": "DISABLED"}
+        }
+
+        assert manager.enable_time_to_live("requests-archive", "expires_at")
+        manager.dynamodb.update_time_to_live.assert_called_once_with(
+            TableName="requests-archive",
+            TimeToLiveSpecification={"Enabled": True, "AttributeName": "expires_at"},
+        )
+
+    def test_enabled_ttl_is_left_alone(self):
+        manager = DynamoDBClientManager(aws_client=Mock())
+        manager.dynamodb.describe_time_to_live.return_value = {
+            "TimeToLiveDescription": {"TimeToLiveStatus": "ENABLED", "AttributeName": "expires_at"}
+        }
+
+        assert manager.enable_time_to_live("requests-archive", "expires_at")
+        manager.dynamodb.update_time_to_live.assert_not_called()
+
+    @patch("providers.aws.persistence.dynamodb.unit_of_work.DynamoDBStorageStrategy")
+    def test_archive_tables_get_ttl_when_records_expire(self, strategy_class):
+        DynamoDBUnitOfWork._create_archive_strategy(Mock(), "requests-archive", 86400)
+        strategy_class.return_value.enable_time_to_live.assert_called_once_with("expires_at")
+
+        strategy_class.reset_mock()
+        DynamoDBUnitOfWork._create_archive_strategy(Mock(), "requests-archive", None)
+        strategy_class.return_value.enable_time_to_live.assert_not_called()
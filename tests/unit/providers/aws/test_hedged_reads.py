@@ -0,0 +1,54 @@
+"""Unit tests for read deadline hooks on AWS clients."""
+
+from unittest.mock import Mock
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+
+from providers.aws.infrastructure.hedged_reads import attach_read_deadlines
+
+EMPTY = b"<DescribeInstancesResponse><reservationSet/></DescribeInstancesResponse>"
+
+
+class FakeRaw:
+    def __init__(self, body):
+        self.body = body
+
+    def stream(self, **kwargs):
+        yield self.body
+
+
+@pytest.fixture
+def ec2_client():
+    client = boto3.client(
+        "ec2",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+    )
+
+    def send(request, **kwargs):
+        # Answer every HTTP attempt without touching the network
+        return AWSResponse(request.url, 200, {}, FakeRaw(EMPTY))
+
+    client.meta.events.register("before-send.ec2", send)
+    return client
+
+
+@pytest.mark.unit
+class TestAttachReadDeadlines:
+    """Configured reads, and only reads, go through the hedged caller."""
+
+    def test_reads_and_their_pages_are_routed_through_the_caller(self, ec2_client):
+        caller = Mock()
+        caller.call.side_effect = lambda key, method, *args, **kwargs: method(*args, **kwargs)
+        attach_read_deadlines(ec2_client, caller, ["ec2:Describe*", "autoscaling:Describe*"])
+
+        ec2_client.describe_instances()
+        list(ec2_client.get_paginator("describe_instances").paginate())
+
+        keys = [c.args[0] for c in caller.call.call_args_list]
+        assert keys == ["ec2:DescribeInstances", "ec2:DescribeInstances"]
+        assert ec2_client.describe_instances.__name__ == "describe_instances"
+        assert "run_instances" not in vars(ec2_client)
@@ -0,0 +1,100 @@
+"""Unit tests for cached Spot Fleet IAM prerequisite validation."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from providers.aws.exceptions.aws_exceptions import AuthorizationError
+from providers.aws.infrastructure.handlers.spot_fleet_handler import SpotFleetHandler
+from providers.aws.infrastructure.iam_validation_cache import IAMValidationCache
+
+ROLE_ARN = "arn:aws:iam::123456789012:role/custom-fleet-role"
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def handler(tmp_path):
+    container = Mock(get=Mock(side_effect=RuntimeError("not registered")))
+    with patch("infrastructure.di.container.get_container", return_value=container):
+        handler = SpotFleetHandler(Mock(), Mock(), Mock(), Mock(), Mock())
+    handler._retry_with_backoff = lambda func, *args, operation_type="standard", **kwargs: func(
+        *args, **kwargs
+    )
+    handler._iam_validation_cache = IAMValidationCache(str(tmp_path / "iam_validation.json"))
+    return handler
+
+
+@pytest.mark.unit
+class TestIAMValidationCache:
+    """Passed validations are trusted for the TTL, also by other processes."""
+
+    def test_entries_expire_and_persist(self, tmp_path):
+        clock = FakeClock()
+        path = str(tmp_path / "cache" / "iam_validation.json")
+        cache = IAMValidationCache(path, ttl_seconds=60, clock=clock)
+
+        cache.record("role|default|us-east-1|fleet-role|")
+        assert cache.is_valid("role|default|us-east-1|fleet-role|")
+        assert IAMValidationCache(path, ttl_seconds=60, clock=clock).is_valid(
+            "role|default|us-east-1|fleet-role|"
+        )
+
+        clock.now += 61
+        assert not cache.is_valid("role|default|us-east-1|fleet-role|")
+
+    def test_invalidate_reaches_the_file(self, tmp_path):
+        path = str(tmp_path / "iam_validation.json")
+        cache = IAMValidationCache(path)
+        cache.record("a")
+        cache.record("b")
+
+        cache.invalidate("a")
+
+        fresh = IAMValidationCache(path)
+        assert not fresh.is_valid("a")
+        assert fresh.is_valid("b")
+
+
+@pytest.mark.unit
+class TestSpotFleetRoleValidation:
+    """Fleet creations reuse a passed role validation and the shared IAM client."""
+
+    def test_role_is_checked_once_per_ttl(self, handler):
+        handler._validate_custom_fleet_role(ROLE_ARN)
+        handler._validate_custom_fleet_role(ROLE_ARN)
+
+        handler.aws_client.iam_client.get_role.assert_called_once_with(
+            RoleName="custom-fleet-role"
+        )
+        handler.aws_client.session.client.assert_not_called()
+
+    def test_failed_role_check_is_not_cached(self, handler):
+        handler.aws_client.iam_client.get_role.side_effect = RuntimeError("NoSuchEntity")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                handler._validate_custom_fleet_role(ROLE_ARN)
+        assert handler.aws_client.iam_client.get_role.call_count == 2
+
+    def test_permission_failure_on_launch_forces_revalidation(self, handler):
+        template = Mock(fleet_role=ROLE_ARN, fleet_type="request")
+        handler._validate_spot_prerequisites = Mock(
+            side_effect=lambda t: handler._validate_custom_fleet_role(t.fleet_role)
+        )
+        handler._create_spot_fleet_config = Mock(return_value={})
+        handler.aws_client.ec2_client.request_spot_fleet.side_effect = AuthorizationError(
+            "not authorized to perform iam:PassRole"
+        )
+
+        for _ in range(2):
+            with pytest.raises(AuthorizationError):
+                handler._create_spot_fleet_internal(Mock(), template)
+
+        assert handler.aws_client.iam_client.get_role.call_count == 2
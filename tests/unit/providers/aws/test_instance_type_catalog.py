@@ -0,0 +1,160 @@
+"""Unit tests for the EC2 instance type catalog."""
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from domain.base.ports.instance_type_catalog_port import InstanceTypeCatalogPort
+from infrastructure.scheduler.hostfactory.strategy import HostFactorySchedulerStrategy
+from providers.aws.infrastructure.template.instance_type_catalog import AWSInstanceTypeCatalog
+
+
+def make_ec2_client(pages):
+    client = MagicMock()
+    client.get_paginator.return_value.paginate.return_value = pages
+    return client
+
+
+DESCRIBE_PAGES = [
+    {
+        "InstanceTypes": [
+            {
+                "InstanceType": "m7g.medium",
+                "VCpuInfo": {"DefaultVCpus": 1},
+                "MemoryInfo": {"SizeInMiB": 4096},
+                "ProcessorInfo": {"SupportedArchitectures": ["arm64"]},
+                "SupportedUsageClasses": ["on-demand", "spot"],
+            }
+        ]
+    },
+    {
+        "InstanceTypes": [
+            {
+                "InstanceType": "u-6tb1.metal",
+                "VCpuInfo": {"DefaultVCpus": 448},
+                "MemoryInfo": {"SizeInMiB": 6291456},
+                "ProcessorInfo": {"SupportedArchitectures": ["x86_64"]},
+                "SupportedUsageClasses": ["on-demand"],
+            }
+        ]
+    },
+]
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestAWSInstanceTypeCatalog:
+    """Catalog loading order: cache file, DescribeInstanceTypes, offline snapshot."""
+
+    def test_snapshot_lookup_without_client(self):
+        """Without an EC2 client the bundled snapshot is used and is not authoritative."""
+        catalog = AWSInstanceTypeCatalog("us-east-1")
+
+        info = catalog.get("m5.large")
+        assert (info.vcpus, info.memory_mib) == (2, 8192)
+        assert catalog.get("m6g.large").architectures == ("arm64",)
+        assert catalog.get("not-a.type") is None
+        assert not catalog.is_authoritative()
+        assert catalog.source == "snapshot"
+
+    def test_fetch_is_persisted_and_reused(self, tmp_path):
+        """A fetched catalog is written once and reused by later processes."""
+        client = make_ec2_client(DESCRIBE_PAGES)
+        catalog = AWSInstanceTypeCatalog(
+            "eu-west-1", ec2_client_factory=lambda: client, cache_dir=str(tmp_path)
+        )
+
+        assert catalog.get("u-6tb1.metal").spot_supported is False
+        assert catalog.is_authoritative()
+        assert catalog.get("m5.large") is None
+        client.get_paginator.assert_called_once_with("describe_instance_types")
+        assert os.path.exists(tmp_path / "instance_types_eu-west-1.json")
+
+        other_client = make_ec2_client([])
+        reloaded = AWSInstanceTypeCatalog(
+            "eu-west-1", ec2_client_factory=lambda: other_client, cache_dir=str(tmp_path)
+        )
+        assert reloaded.get("m7g.medium").vcpus == 1
+        assert reloaded.source == "aws"
+        other_client.get_paginator.assert_not_called()
+
+    def test_expired_cache_is_refetched(self, tmp_path):
+        """A cache older than the TTL triggers a new DescribeInstanceTypes call."""
+        clock = FakeClock()
+        AWSInstanceTypeCatalog(
+            "us-west-2",
+            ec2_client_factory=lambda: make_ec2_client(DESCRIBE_PAGES),
+            cache_dir=str(tmp_path),
+            ttl_seconds=60,
+            clock=clock,
+        ).get("m7g.medium")
+
+        clock.now += 61
+        client = make_ec2_client(DESCRIBE_PAGES[:1])
+        catalog = AWSInstanceTypeCatalog(
+            "us-west-2",
+            ec2_client_factory=lambda: client,
+            cache_dir=str(tmp_path),
+            ttl_seconds=60,
+            clock=clock,
+        )
+
+        assert catalog.get("u-6tb1.metal") is None
+        client.get_paginator.assert_called_once()
+
+    def test_failed_fetch_caches_snapshot_for_retry_period(self, tmp_path):
+        """When AWS fails the snapshot is persisted with the shorter retry lifetime."""
+        clock = FakeClock()
+        failing = MagicMock()
+        failing.get_paginator.side_effect = RuntimeError("no credentials")
+
+        def make_catalog(client):
+            return AWSInstanceTypeCatalog(
+                "ap-south-1",
+                ec2_client_factory=lambda: client,
+                cache_dir=str(tmp_path),
+                retry_seconds=300,
+                clock=clock,
+            )
+
+        assert make_catalog(failing).get("c5.large").vcpus == 2
+        with open(tmp_path / "instance_types_ap-south-1.json") as f:
+            assert json.load(f)["source"] == "snapshot"
+
+        client = make_ec2_client(DESCRIBE_PAGES)
+        make_catalog(client).get("c5.large")
+        client.get_paginator.assert_not_called()
+
+        clock.now += 301
+        assert make_catalog(client).is_authoritative()
+        client.get_paginator.assert_called_once()
+
+
+@pytest.mark.unit
+def test_hostfactory_attributes_use_catalog():
+    """HostFactory attributes come from the catalog, including ARM architecture."""
+    catalog = AWSInstanceTypeCatalog("us-east-1", ec2_client_factory=None)
+    container = MagicMock()
+    container.get_optional.side_effect = (
+        lambda cls: catalog if cls is InstanceTypeCatalogPort else None
+    )
+    with patch("infrastructure.di.container.get_container", return_value=container):
+        strategy = HostFactorySchedulerStrategy(MagicMock(), MagicMock())
+        attributes = strategy._create_hf_attributes({"instance_type": "m6g.2xlarge"})
+        fallback = strategy._create_hf_attributes({"instance_type": "z9.unknown"})
+
+    assert attributes == {
+        "type": ["String", "ARM64"],
+        "ncpus": ["Numeric", "8"],
+        "nram": ["Numeric", "32768"],
+    }
+    assert fallback["ncpus"] == ["Numeric", "1"]
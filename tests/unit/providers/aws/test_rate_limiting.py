@@ -0,0 +1,78 @@
+"""Unit tests for rate limiting hooks on AWS clients."""
+
+from unittest.mock import Mock
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+
+from providers.aws.infrastructure.rate_limiting import attach_rate_limiter
+
+
+THROTTLED = (
+    b"<Response><Errors><Error><Code>RequestLimitExceeded</Code>"
+    b"<Message>Request limit exceeded.</Message></Error></Errors></Response>"
+)
+EMPTY = b"<DescribeInstancesResponse><reservationSet/></DescribeInstancesResponse>"
+
+
+class FakeRaw:
+    def __init__(self, body):
+        self.body = body
+
+    def stream(self, **kwargs):
+        yield self.body
+
+
+@pytest.fixture
+def ec2_client():
+    return boto3.client(
+        "ec2",
+        region_name="us-east-1",
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing",
+        config=Config(retries={"max_attempts": 2, "mode": "standard"}),
+    )
+
+
+def respond_with(client, *responses):
+    """Answer HTTP attempts in order without touching the network."""
+    pending = list(responses)
+
+    def send(request, **kwargs):
+        status, body = pending.pop(0)
+        return AWSResponse(request.url, status, {}, FakeRaw(body))
+
+    client.meta.events.register("before-send.ec2", send)
+
+
+@pytest.mark.unit
+class TestAttachRateLimiter:
+    """Every HTTP attempt through a hooked client takes a token and reports its outcome."""
+
+    def test_each_call_takes_a_token(self, ec2_client):
+        limiter = Mock()
+        attach_rate_limiter(ec2_client, limiter)
+        respond_with(ec2_client, (200, EMPTY), (200, EMPTY))
+
+        ec2_client.describe_instances()
+        ec2_client.describe_instances()
+
+        assert [c.args for c in limiter.acquire.call_args_list] == [
+            ("ec2:DescribeInstances",),
+            ("ec2:DescribeInstances",),
+        ]
+        assert limiter.record_success.call_count == 2
+
+    def test_throttled_attempts_cut_the_rate(self, ec2_client):
+        limiter = Mock()
+        attach_rate_limiter(ec2_client, limiter)
+        respond_with(ec2_client, (503, THROTTLED), (200, EMPTY))
+
+        ec2_client.describe_instances()
+
+        # botocore retried the throttled attempt itself; both attempts took a token
+        assert limiter.acquire.call_count == 2
+        limiter.record_throttle.assert_called_once_with("ec2:DescribeInstances")
+        limiter.record_success.assert_called_once_with("ec2:DescribeInstances")
@@ -0,0 +1,252 @@
+"""Unit tests for batched post-termination resource cleanup."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from application.commands.request_handlers import CreateReturnRequestHandler
+from application.dto.commands import CreateReturnRequestCommand
+from application.queries.handlers import GetRequestHandler
+from domain.base.ports import ConfigurationPort
+from domain.request.request_types import RequestStatus
+from providers.aws.configuration.config import AWSProviderConfig
+from providers.aws.infrastructure.adapters.machine_adapter import (
+    AWSMachineAdapter,
+    ResourceCleanupPlan,
+)
+from providers.aws.strategy.aws_provider_strategy import AWSProviderStrategy
+from providers.base.strategy.provider_context import ProviderContext
+
+
+def client_error(code):
+    return ClientError({"Error": {"Code": code, "Message": code}}, "Delete")
+
+
+def volume(volume_id, instance_id, delete_on_termination=False):
+    return {
+        "VolumeId": volume_id,
+        "Attachments": [
+            {"InstanceId": instance_id, "DeleteOnTermination": delete_on_termination}
+        ],
+    }
+
+
+def nic(nic_id, delete_on_termination=False):
+    return {
+        "NetworkInterfaceId": nic_id,
+        "Attachment": {
+            "AttachmentId": f"attach-{nic_id}",
+            "DeleteOnTermination": delete_on_termination,
+        },
+    }
+
+
+class FakePaginator:
+    def __init__(self, result_key, items, page_size=2):
+        self.result_key = result_key
+        self.items = items
+        self.page_size = page_size
+        self.calls = []
+
+    def paginate(self, Filters):
+        self.calls.append(Filters)
+        wanted = set(Filters[0]["Values"])
+        matching = [item for item in self.items if _instance_of(item) in wanted]
+        for start in range(0, len(matching), self.page_size):
+            yield {self.result_key: matching[start : start + self.page_size]}
+
+
+def _instance_of(item):
+    if "Attachments" in item:
+        return item["Attachments"][0]["InstanceId"]
+    return item["NetworkInterfaceId"].replace("eni-", "i-")
+
+
+@pytest.fixture
+def ec2_client():
+    return Mock()
+
+
+@pytest.fixture
+def adapter(ec2_client):
+    return AWSMachineAdapter(Mock(ec2_client=ec2_client), Mock())
+
+
+@pytest.mark.unit
+class TestResourceCleanup:
+    """Cleanup of a return request is planned once and deleted concurrently."""
+
+    def test_plan_uses_one_filtered_describe_per_200_machines(self, adapter, ec2_client):
+        instance_ids = [f"i-{n:04x}" for n in range(300)]
+        volumes = FakePaginator(
+            "Volumes",
+            [volume(f"vol-{n:04x}", f"i-{n:04x}") for n in range(300)]
+            + [volume("vol-root", "i-0000", delete_on_termination=True)],
+        )
+        nics = FakePaginator(
+            "NetworkInterfaces",
+            [nic("eni-0001"), nic("eni-0002", delete_on_termination=True)],
+        )
+        ec2_client.get_paginator.side_effect = lambda name: {
+            "describe_volumes": volumes,
+            "describe_network_interfaces": nics,
+        }[name]
+
+        plan = adapter.plan_resource_cleanup(instance_ids, include_retained=True)
+
+        assert len(volumes.calls) == 2 and len(nics.calls) == 2
+        assert [len(filters[0]["Values"]) for filters in volumes.calls] == [200, 100]
+        assert len(plan.volume_ids) == 300 and "vol-root" not in plan.volume_ids
+        assert plan.network_interface_ids == ["eni-0001"]
+        assert plan.network_interface_attachments == ["attach-eni-0001"]
+
+    def test_retained_resources_are_kept_by_default(self, adapter, ec2_client):
+        plan = adapter.plan_resource_cleanup(["i-0001"])
+
+        ec2_client.get_paginator.assert_not_called()
+        assert plan == ResourceCleanupPlan()
+
+    def test_only_stragglers_in_use_are_retried(self, adapter, ec2_client):
+        attempts = {}
+
+        def delete_volume(VolumeId):
+            attempts[VolumeId] = attempts.get(VolumeId, 0) + 1
+            if VolumeId == "vol-busy" and attempts[VolumeId] < 3:
+                raise client_error("VolumeInUse")
+            if VolumeId == "vol-gone":
+                raise client_error("InvalidVolume.NotFound")
+            if VolumeId == "vol-denied":
+                raise client_error("UnauthorizedOperation")
+
+        ec2_client.delete_volume.side_effect = delete_volume
+        plan = ResourceCleanupPlan(
+            volume_ids=["vol-ok", "vol-busy", "vol-gone", "vol-denied"],
+            network_interface_ids=["eni-ok"],
+        )
+
+        with patch("time.sleep") as sleep:
+            results = adapter.execute_resource_cleanup(plan, max_workers=4)
+
+        assert attempts == {"vol-ok": 1, "vol-busy": 3, "vol-gone": 1, "vol-denied": 1}
+        assert sorted(results["volumes"]["success"]) == ["vol-busy", "vol-gone", "vol-ok"]
+        assert [f["id"] for f in results["volumes"]["failed"]] == ["vol-denied"]
+        assert results["network_interfaces"]["success"] == ["eni-ok"]
+        assert sleep.call_count == 2
+        ec2_client.detach_volume.assert_not_called()
+
+    def test_resources_still_in_use_remain_after_last_round(self, adapter, ec2_client):
+        ec2_client.delete_network_interface.side_effect = client_error(
+            "InvalidNetworkInterface.InUse"
+        )
+        plan = ResourceCleanupPlan(network_interface_ids=["eni-busy"])
+
+        with patch("time.sleep"):
+            results = adapter.execute_resource_cleanup(plan, max_rounds=3)
+
+        assert ec2_client.delete_network_interface.call_count == 3
+        assert results["network_interfaces"]["failed"] == []
+        assert results["remaining"] == {"volume_ids": [], "network_interface_ids": ["eni-busy"]}
+
+
+def return_handler(ec2_client, delete_retained_resources=False):
+    strategy = AWSProviderStrategy(
+        AWSProviderConfig(profile="test", delete_retained_resources=delete_retained_resources),
+        Mock(),
+    )
+    strategy._aws_client = Mock(ec2_client=ec2_client)
+    strategy._initialized = True
+    provider_context = ProviderContext(Mock())
+    provider_context.register_strategy(strategy)
+
+    config = Mock(get=Mock(return_value="aws"))
+    services = {ProviderContext: provider_context, ConfigurationPort: config}
+    request_repository = Mock(save=Mock(return_value=[]))
+    handler = CreateReturnRequestHandler(
+        request_repository,
+        Mock(find_by_id=Mock(return_value=None)),
+        None,
+        Mock(),
+        Mock(get=services.get),
+        Mock(),
+        Mock(),
+    )
+    return handler, request_repository, services
+
+
+def status_handler(services):
+    uow_factory = Mock()
+    uow_factory.create_unit_of_work.return_value.__enter__ = Mock(return_value=Mock())
+    uow_factory.create_unit_of_work.return_value.__exit__ = Mock(return_value=False)
+    return GetRequestHandler(uow_factory, Mock(), Mock(), Mock(get=services.get))
+
+
+@pytest.mark.unit
+class TestReturnRequestCleanup:
+    """Returning machines terminates them and cleans up what they leave behind."""
+
+    @pytest.fixture
+    def ec2_client(self):
+        ec2_client = Mock()
+        ec2_client.terminate_instances.side_effect = lambda InstanceIds: {
+            "TerminatingInstances": [{"InstanceId": i} for i in InstanceIds]
+        }
+        paginators = {
+            "describe_volumes": FakePaginator(
+                "Volumes", [volume("vol-0001", "i-0001"), volume("vol-0002", "i-0002")]
+            ),
+            "describe_network_interfaces": FakePaginator("NetworkInterfaces", [nic("eni-0001")]),
+        }
+        ec2_client.get_paginator.side_effect = paginators.__getitem__
+        return ec2_client
+
+    def return_machines(self, handler, machine_ids):
+        return asyncio.run(handler.handle(CreateReturnRequestCommand(machine_ids=machine_ids)))
+
+    def test_return_request_keeps_retained_resources_by_default(self, ec2_client):
+        handler, request_repository, _ = return_handler(ec2_client)
+
+        self.return_machines(handler, ["i-0001", "i-0002"])
+
+        ec2_client.terminate_instances.assert_called_once_with(InstanceIds=["i-0001", "i-0002"])
+        ec2_client.delete_network_interface.assert_not_called()
+        ec2_client.delete_volume.assert_not_called()
+        assert request_repository.save.call_args.args[0].status == RequestStatus.COMPLETED
+
+        assert "pending_cleanup" not in request_repository.save.call_args.args[0].metadata
+
+    def test_retained_resources_are_deleted_by_later_polls(self, ec2_client):
+        handler, request_repository, services = return_handler(
+            ec2_client, delete_retained_resources=True
+        )
+        ec2_client.delete_network_interface.side_effect = [
+            client_error("InvalidNetworkInterface.InUse"),
+            None,
+        ]
+
+        self.return_machines(handler, ["i-0001", "i-0002"])
+
+        # Returning does not wait for the terminating instances to let go
+        ec2_client.delete_volume.assert_not_called()
+        request = request_repository.save.call_args.args[0]
+        assert request.metadata["pending_cleanup"] == {
+            "volume_ids": ["vol-0001", "vol-0002"],
+            "network_interface_ids": ["eni-0001"],
+        }
+
+        poller = status_handler(services)
+        asyncio.run(poller._run_pending_cleanup(request))
+
+        assert sorted(
+            call.kwargs["VolumeId"] for call in ec2_client.delete_volume.call_args_list
+        ) == ["vol-0001", "vol-0002"]
+        assert request.metadata["pending_cleanup"] == {
+            "volume_ids": [],
+            "network_interface_ids": ["eni-0001"],
+        }
+
+        asyncio.run(poller._run_pending_cleanup(request))
+
+        assert ec2_client.delete_network_interface.call_count == 2
+        assert "pending_cleanup" not in request.metadata